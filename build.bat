@@ -4,7 +4,7 @@ pip install pyinstaller
 
 echo.
 echo Building HexDBC...
-pyinstaller --noconfirm --onefile --windowed --name "HexDBC" --icon "icon/hexdbc.ico" --paths "src" start.py
+pyinstaller --noconfirm --onefile --windowed --name "HexDBC" --icon "icon/hexdbc.ico" --paths "src" --add-data "src/hexdbc/resources/builtin_schemas.bin;hexdbc/resources" start.py
 
 echo.
 echo Build complete! The executable is in the 'dist' folder.
@@ -4,6 +4,12 @@ __author__ = "Hex + Contributers"
 
 
 def main():
+    import sys
+    from hexdbc.cli import CLI_COMMANDS
+    if len(sys.argv) > 1 and sys.argv[1] in CLI_COMMANDS:
+        from hexdbc.cli import run as run_cli
+        sys.exit(run_cli(sys.argv[1:]))
+
     from hexdbc.ui.main_window import run
     run()
 
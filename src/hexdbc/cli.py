@@ -0,0 +1,504 @@
+"""
+Command line entry points for HexDBC.
+
+`hexdbc <command> ...` runs one of these without starting the GUI:
+
+    hexdbc merge BASE OURS THEIRS -o OUT [--prefer ours|theirs] [--schema NAME] [--report FILE]
+    hexdbc sqlite-export FOLDER_OR_DBC... -o DATABASE
+    hexdbc sqlite-import DATABASE TABLE -o OUT
+    hexdbc csv-export DBC -o OUT.csv|OUT.tsv [--schema NAME]
+    hexdbc csv-import CSV -o OUT [--schema NAME] [--base DBC]
+    hexdbc arrow-export FOLDER_OR_DBC... -o DIR [--format parquet|feather]
+    hexdbc arrow-import FILE -o OUT
+    hexdbc sql-dump DBC -o OUT.sql [--base DBC] [--table NAME] [--insert] [--delete-first]
+                    [--batch N] [--dialect mysql|sqlite] [--schema NAME]
+    hexdbc mpq-pack OUT.MPQ FOLDER_OR_DBC... [--fresh]
+    hexdbc patch-make BASE NEW -o OUT.hxpatch [--schema NAME]
+    hexdbc patch-apply BASE PATCH -o OUT
+    hexdbc overlay-build BASE OVERLAY.hexdbc... -o OUT [--watch]
+    hexdbc overlay-export BASE NEW -o OUT.hexdbc [--fields-only] [--name NAME]
+    hexdbc refs FOLDER TABLE ID
+    hexdbc check-refs FOLDER TABLE...
+"""
+
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+CLI_COMMANDS = {"merge", "sqlite-export", "sqlite-import", "csv-export", "csv-import",
+                "arrow-export", "arrow-import", "sql-dump", "mpq-pack",
+                "patch-make", "patch-apply", "overlay-build",
+                "overlay-export", "refs", "check-refs"}
+
+
+def _cmd_merge(args) -> int:
+    from hexdbc.core.dbc_merge import merge_dbc
+    from hexdbc.core.parser import DBCParser, DBCWriter
+    from hexdbc.core.schema import SchemaManager
+
+    parser = DBCParser()
+    try:
+        base, ours, theirs = (parser.parse(Path(p)) for p in (args.base, args.ours, args.theirs))
+    except (OSError, ValueError) as e:
+        print(f"hexdbc merge: {e}", file=sys.stderr)
+        return 2
+
+    schema_name = args.schema or Path(args.ours).stem
+    schema = SchemaManager().get_schema(schema_name)
+
+    try:
+        result = merge_dbc(base, ours, theirs, schema, prefer=args.prefer)
+    except ValueError as e:
+        print(f"hexdbc merge: {e}", file=sys.stderr)
+        return 2
+
+    DBCWriter().write(result.dbc, Path(args.output))
+
+    report = result.format_report()
+    if args.report:
+        Path(args.report).write_text(report + "\n", encoding='utf-8')
+    print(report)
+
+    # Like git merge-file: non-zero when something needed resolving
+    return 1 if result.conflicts else 0
+
+
+def _cmd_sqlite_export(args) -> int:
+    import time
+    from hexdbc.core.parser import DBCParser
+    from hexdbc.core.sqlite_bridge import ExportSummary, SQLiteBridge
+
+    parser = DBCParser()
+    started = time.perf_counter()
+    summary = ExportSummary()
+    try:
+        with SQLiteBridge(Path(args.output)) as bridge:
+            for source in map(Path, args.sources):
+                if source.is_dir():
+                    part = bridge.export_folder(source, parser)
+                else:
+                    try:
+                        part = bridge.export_dbcs([(source.stem, parser.parse(source))])
+                    except (OSError, ValueError) as e:
+                        part = ExportSummary(errors={source.stem: str(e)})
+                summary.tables.update(part.tables)
+                summary.errors.update(part.errors)
+    except Exception as e:
+        print(f"hexdbc sqlite-export: {e}", file=sys.stderr)
+        return 2
+
+    for name, error in sorted(summary.errors.items()):
+        print(f"skipped {name}: {error}", file=sys.stderr)
+    records = sum(summary.tables.values())
+    print(f"{len(summary.tables)} tables, {records:,} records in {time.perf_counter() - started:.1f}s")
+    return 1 if summary.errors else 0
+
+
+def _cmd_sqlite_import(args) -> int:
+    from hexdbc.core.parser import DBCWriter
+    from hexdbc.core.sqlite_bridge import SQLiteBridge
+
+    try:
+        with SQLiteBridge(Path(args.database)) as bridge:
+            dbc = bridge.import_dbc(args.table)
+    except Exception as e:
+        print(f"hexdbc sqlite-import: {e}", file=sys.stderr)
+        return 2
+    DBCWriter().write(dbc, Path(args.output))
+    print(f"{args.table}: {dbc.header.record_count:,} records")
+    return 0
+
+
+def _cmd_csv_export(args) -> int:
+    from hexdbc.core.dbc_csv import write_csv
+    from hexdbc.core.parser import DBCParser
+    from hexdbc.core.schema import SchemaManager
+
+    source = Path(args.dbc)
+    try:
+        dbc = DBCParser().parse(source)
+        schema = SchemaManager().get_schema(args.schema or source.stem)
+        count = write_csv(dbc, Path(args.output), schema)
+    except (OSError, ValueError) as e:
+        print(f"hexdbc csv-export: {e}", file=sys.stderr)
+        return 2
+    print(f"{source.stem}: {count:,} records")
+    return 0
+
+
+def _cmd_csv_import(args) -> int:
+    from hexdbc.core.dbc_csv import convert_csv
+    from hexdbc.core.parser import DBCParser
+    from hexdbc.core.schema import SchemaManager
+
+    source = Path(args.csv)
+    try:
+        # Strings the base already holds keep their offsets
+        string_base = DBCParser().parse(Path(args.base)).string_block if args.base else None
+        schema = SchemaManager().get_schema(args.schema or source.stem)
+        header = convert_csv(source, Path(args.output), schema, string_base=string_base)
+    except (OSError, ValueError) as e:
+        print(f"hexdbc csv-import: {e}", file=sys.stderr)
+        return 2
+    print(f"{source.stem}: {header.record_count:,} records")
+    return 0
+
+
+def _cmd_arrow_export(args) -> int:
+    import time
+    from hexdbc.core import dbc_arrow
+    from hexdbc.core.parser import DBCParser
+    from hexdbc.core.schema import SchemaManager
+    from hexdbc.core.sqlite_bridge import ExportSummary
+
+    if not dbc_arrow.ARROW_AVAILABLE:
+        print("hexdbc arrow-export: pyarrow is not installed (pip install pyarrow)", file=sys.stderr)
+        return 2
+    suffix = f".{args.format}"
+    out_dir = Path(args.output)
+    parser = DBCParser()
+    schema_manager = SchemaManager()
+    started = time.perf_counter()
+    summary = ExportSummary()
+    try:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        for source in map(Path, args.sources):
+            if source.is_dir():
+                part = dbc_arrow.export_folder(source, out_dir, schema_manager, suffix, parser)
+                summary.tables.update(part.tables)
+                summary.errors.update(part.errors)
+                continue
+            try:
+                dbc = parser.parse(source)
+                schema = schema_manager.get_schema(source.stem)
+                if schema is None and dbc.records:
+                    schema = schema_manager.infer_schema(dbc, source.stem)
+                dbc_arrow.write_arrow(dbc, out_dir / f"{source.stem}{suffix}", schema, source.stem)
+                summary.tables[source.stem] = len(dbc.records)
+            except (OSError, ValueError) as e:
+                summary.errors[source.stem] = str(e)
+    except Exception as e:
+        print(f"hexdbc arrow-export: {e}", file=sys.stderr)
+        return 2
+
+    for name, error in sorted(summary.errors.items()):
+        print(f"skipped {name}: {error}", file=sys.stderr)
+    records = sum(summary.tables.values())
+    print(f"{len(summary.tables)} tables, {records:,} records in {time.perf_counter() - started:.1f}s")
+    return 1 if summary.errors else 0
+
+
+def _cmd_arrow_import(args) -> int:
+    from hexdbc.core.dbc_arrow import read_arrow
+    from hexdbc.core.parser import DBCWriter
+
+    try:
+        dbc = read_arrow(Path(args.file))
+    except Exception as e:
+        print(f"hexdbc arrow-import: {e}", file=sys.stderr)
+        return 2
+    DBCWriter().write(dbc, Path(args.output))
+    print(f"{Path(args.file).stem}: {dbc.header.record_count:,} records")
+    return 0
+
+
+def _cmd_sql_dump(args) -> int:
+    from hexdbc.core.parser import DBCParser
+    from hexdbc.core.schema import SchemaManager
+    from hexdbc.core.sql_dump import SQLDump, default_table_name
+
+    source = Path(args.dbc)
+    parser = DBCParser()
+    try:
+        dbc = parser.parse(source)
+        base = parser.parse(Path(args.base)) if args.base else None
+        schema = SchemaManager().get_schema(args.schema or source.stem)
+        dump = SQLDump(dbc, args.table or default_table_name(source.stem), schema, base,
+                       statement='INSERT' if args.insert else 'REPLACE', dialect=args.dialect,
+                       batch_rows=args.batch, delete_first=args.delete_first)
+        summary = dump.write(Path(args.output))
+    except (OSError, ValueError) as e:
+        print(f"hexdbc sql-dump: {e}", file=sys.stderr)
+        return 2
+    for record_id in summary.removed:
+        print(f"not in {source.name}: {record_id} (override tables cannot remove it)", file=sys.stderr)
+    print(f"{dump.table}: {summary.rows:,} records in {summary.statements:,} statements")
+    return 0
+
+
+def _cmd_mpq_pack(args) -> int:
+    import time
+    from hexdbc.core.mpq import MPQWriter
+    from hexdbc.core.parser import DBCParser
+
+    parser = DBCParser()
+    output = Path(args.output)
+    started = time.perf_counter()
+    try:
+        if args.fresh:
+            writer = MPQWriter()
+        else:
+            writer = MPQWriter.update(output)
+        with writer:
+            for source in map(Path, args.sources):
+                paths = sorted((p for p in source.iterdir() if p.suffix.lower() == '.dbc' and p.is_file()),
+                               key=lambda p: p.name.lower()) if source.is_dir() else [source]
+                for path in paths:
+                    writer.add_dbc(path.stem, parser.parse(path))
+            summary = writer.write(output)
+    except (OSError, ValueError) as e:
+        print(f"hexdbc mpq-pack: {e}", file=sys.stderr)
+        return 2
+    print(f"{output.name}: {len(summary.written)} files compressed, {len(summary.reused)} unchanged, "
+          f"{summary.size:,} bytes in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+def _cmd_patch_make(args) -> int:
+    from hexdbc.core.dbc_patch import DBCPatch, make_patch
+    from hexdbc.core.parser import DBCParser
+    from hexdbc.core.schema import SchemaManager
+
+    parser = DBCParser()
+    try:
+        base, new = parser.parse(Path(args.base)), parser.parse(Path(args.new))
+        schema = SchemaManager().get_schema(args.schema or Path(args.new).stem)
+        data = make_patch(base, new, schema)
+        Path(args.output).write_bytes(data)
+    except (OSError, ValueError) as e:
+        print(f"hexdbc patch-make: {e}", file=sys.stderr)
+        return 2
+    patch = DBCPatch.decode(data)
+    print(f"{len(patch.updated):,} changed, {len(patch.inserted):,} added, {len(patch.deleted):,} removed "
+          f"in {len(data):,} bytes")
+    return 0
+
+
+def _cmd_patch_apply(args) -> int:
+    from hexdbc.core.dbc_patch import apply_patch
+    from hexdbc.core.parser import DBCParser, DBCWriter
+
+    try:
+        dbc = apply_patch(DBCParser().parse(Path(args.base)), Path(args.patch).read_bytes())
+    except (OSError, ValueError) as e:
+        print(f"hexdbc patch-apply: {e}", file=sys.stderr)
+        return 2
+    DBCWriter().write(dbc, Path(args.output))
+    print(f"{Path(args.output).name}: {dbc.header.record_count:,} records")
+    return 0
+
+
+def _cmd_overlay_build(args) -> int:
+    import time
+    from hexdbc.core.overlay import OverlayStack
+    from hexdbc.core.parser import DBCParser, DBCWriter
+
+    try:
+        stack = OverlayStack(DBCParser().parse(Path(args.base)), args.overlays)
+    except (OSError, ValueError) as e:
+        print(f"hexdbc overlay-build: {e}", file=sys.stderr)
+        return 2
+    output = Path(args.output)
+    seen = None
+    while True:
+        try:
+            stamps = [path.stat().st_mtime_ns for path in stack.overlays]
+            if stamps != seen:
+                seen = stamps
+                started = time.perf_counter()
+                result = stack.build()
+                DBCWriter().write(result.dbc, output)
+                for name, errors in result.errors.items():
+                    for error in errors:
+                        print(f"{name}: {error}", file=sys.stderr)
+                print(f"{output.name}: {result.changed:,} changed, {result.added:,} added "
+                      f"({len(result.parsed)} of {len(stack.overlays)} overlays parsed) "
+                      f"in {time.perf_counter() - started:.2f}s")
+            if not args.watch:
+                return 1 if result.errors else 0
+            time.sleep(1.0)
+        except (OSError, ValueError) as e:
+            print(f"hexdbc overlay-build: {e}", file=sys.stderr)
+            if not args.watch:
+                return 2
+            time.sleep(1.0)
+        except KeyboardInterrupt:
+            return 0
+
+
+def _cmd_overlay_export(args) -> int:
+    from hexdbc.core.overlay import write_changes
+    from hexdbc.core.parser import DBCParser
+
+    parser = DBCParser()
+    try:
+        base, new = parser.parse(Path(args.base)), parser.parse(Path(args.new))
+        diff = write_changes(base, new, Path(args.output), args.name or Path(args.new).stem, args.fields_only)
+    except (OSError, ValueError) as e:
+        print(f"hexdbc overlay-export: {e}", file=sys.stderr)
+        return 2
+    if diff.removed:
+        print(f"{len(diff.removed):,} removed records are only listed in a comment; "
+              "building the overlay keeps them", file=sys.stderr)
+    print(f"{Path(args.output).name}: {len(diff.changed):,} changed, {len(diff.added):,} added")
+    return 0
+
+
+def _open_folder_cache(folder: Path):
+    from hexdbc.core.dbc_cache import DBCCache
+    from hexdbc.core.parser import DBCParser
+    from hexdbc.core.schema import SchemaManager
+
+    if not folder.is_dir():
+        raise ValueError(f"{folder} is not a folder")
+    cache = DBCCache(DBCParser(), SchemaManager())
+    cache.set_folder(folder)
+    return cache
+
+
+def _cmd_refs(args) -> int:
+    try:
+        cache = _open_folder_cache(Path(args.folder))
+    except ValueError as e:
+        print(f"hexdbc refs: {e}", file=sys.stderr)
+        return 2
+    references = cache.find_references_to(args.table, args.id)
+    for source_dbc, field_name, record_id in references:
+        print(f"{source_dbc}({record_id}).{field_name}")
+    print(f"{len(references):,} references to {args.table}({args.id})", file=sys.stderr)
+    return 0
+
+
+def _cmd_check_refs(args) -> int:
+    try:
+        cache = _open_folder_cache(Path(args.folder))
+    except ValueError as e:
+        print(f"hexdbc check-refs: {e}", file=sys.stderr)
+        return 2
+    total = 0
+    for table in args.tables:
+        if not cache.is_available(table):
+            print(f"skipped {table}: not in {args.folder}", file=sys.stderr)
+            continue
+        for record_id, field_name, value, target_dbc in cache.find_broken_references(table):
+            print(f"{table}({record_id}).{field_name} = {value}: no such {target_dbc} entry")
+            total += 1
+    print(f"{total:,} broken references", file=sys.stderr)
+    return 1 if total else 0
+
+
+def run(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    ap = argparse.ArgumentParser(prog="hexdbc", description="HexDBC command line tools.")
+    commands = ap.add_subparsers(dest="command", required=True)
+
+    merge = commands.add_parser("merge", help="three-way merge of DBC files by record and field")
+    merge.add_argument("base", help="common ancestor .dbc")
+    merge.add_argument("ours", help="our modified .dbc (its record order is kept)")
+    merge.add_argument("theirs", help="their modified .dbc")
+    merge.add_argument("-o", "--output", required=True, help="merged .dbc to write")
+    merge.add_argument("--prefer", choices=("ours", "theirs"), default="ours",
+                       help="side that wins field conflicts (default ours)")
+    merge.add_argument("--schema", help="schema name (default: name of the ours file)")
+    merge.add_argument("--report", help="also write the merge report to this file")
+    merge.set_defaults(func=_cmd_merge)
+
+    sqlite_export = commands.add_parser("sqlite-export", help="load DBC files into typed SQLite tables")
+    sqlite_export.add_argument("sources", nargs="+", help="DBC folders and/or .dbc files")
+    sqlite_export.add_argument("-o", "--output", required=True, help="SQLite database to write (tables are replaced)")
+    sqlite_export.set_defaults(func=_cmd_sqlite_export)
+
+    sqlite_import = commands.add_parser("sqlite-import", help="rebuild a DBC from its SQLite table")
+    sqlite_import.add_argument("database", help="database written by sqlite-export")
+    sqlite_import.add_argument("table", help="table (DBC name) to rebuild")
+    sqlite_import.add_argument("-o", "--output", required=True, help=".dbc to write")
+    sqlite_import.set_defaults(func=_cmd_sqlite_import)
+
+    csv_export = commands.add_parser("csv-export", help="write a DBC as CSV, or TSV for a .tsv output")
+    csv_export.add_argument("dbc", help=".dbc to export")
+    csv_export.add_argument("-o", "--output", required=True, help=".csv or .tsv to write")
+    csv_export.add_argument("--schema", help="schema name (default: name of the DBC file)")
+    csv_export.set_defaults(func=_cmd_csv_export)
+
+    csv_import = commands.add_parser("csv-import", help="rebuild a DBC from CSV or TSV")
+    csv_import.add_argument("csv", help=".csv or .tsv written by csv-export (or edited since)")
+    csv_import.add_argument("-o", "--output", required=True, help=".dbc to write")
+    csv_import.add_argument("--schema", help="schema name (default: name of the CSV file)")
+    csv_import.add_argument("--base", help="original .dbc whose string block is reused")
+    csv_import.set_defaults(func=_cmd_csv_import)
+
+    arrow_export = commands.add_parser("arrow-export", help="write DBC files as Parquet or Feather (needs pyarrow)")
+    arrow_export.add_argument("sources", nargs="+", help="DBC folders and/or .dbc files")
+    arrow_export.add_argument("-o", "--output", required=True, help="directory to write one file per DBC into")
+    arrow_export.add_argument("--format", choices=("parquet", "feather"), default="parquet",
+                              help="file format (default parquet)")
+    arrow_export.set_defaults(func=_cmd_arrow_export)
+
+    arrow_import = commands.add_parser("arrow-import", help="rebuild a DBC from Parquet or Feather (needs pyarrow)")
+    arrow_import.add_argument("file", help=".parquet or .feather written by arrow-export (or edited since)")
+    arrow_import.add_argument("-o", "--output", required=True, help=".dbc to write")
+    arrow_import.set_defaults(func=_cmd_arrow_import)
+
+    sql_dump = commands.add_parser("sql-dump", help="write records as batched INSERT/REPLACE statements")
+    sql_dump.add_argument("dbc", help=".dbc to dump")
+    sql_dump.add_argument("-o", "--output", required=True, help=".sql file to write")
+    sql_dump.add_argument("--base", help="only dump records added or changed since this .dbc")
+    sql_dump.add_argument("--table", help="table name (default: <name>_dbc, e.g. spell_dbc)")
+    sql_dump.add_argument("--insert", action="store_true", help="INSERT instead of REPLACE")
+    sql_dump.add_argument("--delete-first", action="store_true", help="DELETE each batch's IDs before inserting")
+    sql_dump.add_argument("--batch", type=int, default=500, help="rows per statement (default 500)")
+    sql_dump.add_argument("--dialect", choices=("mysql", "sqlite"), default="mysql",
+                          help="string escaping (default mysql)")
+    sql_dump.add_argument("--schema", help="schema name (default: name of the DBC file)")
+    sql_dump.set_defaults(func=_cmd_sql_dump)
+
+    mpq_pack = commands.add_parser("mpq-pack", help="pack DBC files into a patch MPQ under DBFilesClient")
+    mpq_pack.add_argument("output", help="archive to write, e.g. patch-4.MPQ (files already in it are kept)")
+    mpq_pack.add_argument("sources", nargs="+", help=".dbc files or folders of them")
+    mpq_pack.add_argument("--fresh", action="store_true", help="start from an empty archive")
+    mpq_pack.set_defaults(func=_cmd_mpq_pack)
+
+    patch_make = commands.add_parser("patch-make", help="write the changes between two versions of a DBC as a patch")
+    patch_make.add_argument("base", help="original .dbc")
+    patch_make.add_argument("new", help="changed .dbc")
+    patch_make.add_argument("-o", "--output", required=True, help=".hxpatch file to write")
+    patch_make.add_argument("--schema", help="schema name (default: name of the new file)")
+    patch_make.set_defaults(func=_cmd_patch_make)
+
+    patch_apply = commands.add_parser("patch-apply", help="apply a patch made by patch-make to its base DBC")
+    patch_apply.add_argument("base", help="the .dbc the patch was made from")
+    patch_apply.add_argument("patch", help=".hxpatch file")
+    patch_apply.add_argument("-o", "--output", required=True, help="patched .dbc to write")
+    patch_apply.set_defaults(func=_cmd_patch_apply)
+
+    overlay_build = commands.add_parser("overlay-build", help="apply sparse .hexdbc overlays to a base DBC")
+    overlay_build.add_argument("base", help="base .dbc")
+    overlay_build.add_argument("overlays", nargs="+", help=".hexdbc overlays, applied in order (later ones win)")
+    overlay_build.add_argument("-o", "--output", required=True, help=".dbc to write")
+    overlay_build.add_argument("--watch", action="store_true",
+                               help="keep running and rebuild whenever an overlay changes")
+    overlay_build.set_defaults(func=_cmd_overlay_build)
+
+    overlay_export = commands.add_parser("overlay-export", help="write the records a DBC adds or changes as an overlay")
+    overlay_export.add_argument("base", help="original .dbc")
+    overlay_export.add_argument("new", help="changed .dbc")
+    overlay_export.add_argument("-o", "--output", required=True, help=".hexdbc overlay to write")
+    overlay_export.add_argument("--fields-only", action="store_true",
+                                help="write only the fields that changed, not whole records")
+    overlay_export.add_argument("--name", help="table name for the schema (default: name of the new file)")
+    overlay_export.set_defaults(func=_cmd_overlay_export)
+
+    refs = commands.add_parser("refs", help="list the records in a folder that reference one entry")
+    refs.add_argument("folder", help="folder of .dbc files")
+    refs.add_argument("table", help="referenced table, e.g. SpellIcon")
+    refs.add_argument("id", type=int, help="ID of the referenced entry")
+    refs.set_defaults(func=_cmd_refs)
+
+    check_refs = commands.add_parser("check-refs", help="report references to entries that do not exist")
+    check_refs.add_argument("folder", help="folder of .dbc files")
+    check_refs.add_argument("tables", nargs="+", help="tables to check, e.g. Spell")
+    check_refs.set_defaults(func=_cmd_check_refs)
+
+    args = ap.parse_args(argv)
+    return args.func(args)
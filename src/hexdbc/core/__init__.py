@@ -1,12 +1,63 @@
-from hexdbc.core.parser import DBCParser, DBCWriter, DBCFile, DBCHeader, DBCRecord
-from hexdbc.core.schema import SchemaManager, SchemaDef, FieldDef, FieldType
-from hexdbc.core.hexdbc_format import HexDBCGenerator, HexDBCParser
-from hexdbc.core.dbc_cache import DBCCache
-from hexdbc.core.dbc_relations import get_reference, get_all_references, DBC_RELATIONS
+import importlib
+
+# Exports resolve on first access so startup only pays for the core
+# modules it actually touches.
+_EXPORTS = {
+    "DBCParser": "hexdbc.core.parser",
+    "DBCWriter": "hexdbc.core.parser",
+    "DBCFile": "hexdbc.core.parser",
+    "DBCHeader": "hexdbc.core.parser",
+    "DBCRecord": "hexdbc.core.parser",
+    "SchemaManager": "hexdbc.core.schema",
+    "SchemaDef": "hexdbc.core.schema",
+    "FieldDef": "hexdbc.core.schema",
+    "FieldType": "hexdbc.core.schema",
+    "HexDBCGenerator": "hexdbc.core.hexdbc_format",
+    "HexDBCParser": "hexdbc.core.hexdbc_format",
+    "HexDBCValidator": "hexdbc.core.hexdbc_validator",
+    "CompileCache": "hexdbc.core.compile_cache",
+    "DBCCache": "hexdbc.core.dbc_cache",
+    "FolderCatalog": "hexdbc.core.folder_catalog",
+    "MPQArchive": "hexdbc.core.mpq",
+    "MPQChain": "hexdbc.core.mpq",
+    "MPQWriter": "hexdbc.core.mpq",
+    "ColumnIndex": "hexdbc.core.column_index",
+    "RecordIndex": "hexdbc.core.record_index",
+    "RecordOutline": "hexdbc.core.record_outline",
+    "DBCDiff": "hexdbc.core.dbc_diff",
+    "merge_dbc": "hexdbc.core.dbc_merge",
+    "make_patch": "hexdbc.core.dbc_patch",
+    "apply_patch": "hexdbc.core.dbc_patch",
+    "OverlayStack": "hexdbc.core.overlay",
+    "SQLiteBridge": "hexdbc.core.sqlite_bridge",
+    "CSVReader": "hexdbc.core.dbc_csv",
+    "write_csv": "hexdbc.core.dbc_csv",
+    "read_csv": "hexdbc.core.dbc_csv",
+    "to_arrow": "hexdbc.core.dbc_arrow",
+    "from_arrow": "hexdbc.core.dbc_arrow",
+    "SQLDump": "hexdbc.core.sql_dump",
+    "MergeResult": "hexdbc.core.dbc_merge",
+    "EditJournal": "hexdbc.core.edit_journal",
+    "get_reference": "hexdbc.core.dbc_relations",
+    "get_all_references": "hexdbc.core.dbc_relations",
+    "DBC_RELATIONS": "hexdbc.core.dbc_relations",
+    "QueryEngine": "hexdbc.core.query",
+    "QuerySyntaxError": "hexdbc.core.query",
+}
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "DBCParser",
-    "DBCWriter", 
+    "DBCWriter",
     "DBCFile",
     "DBCHeader",
     "DBCRecord",
@@ -16,8 +67,33 @@ __all__ = [
     "FieldType",
     "HexDBCGenerator",
     "HexDBCParser",
+    "HexDBCValidator",
+    "CompileCache",
     "DBCCache",
+    "FolderCatalog",
+    "MPQArchive",
+    "MPQChain",
+    "MPQWriter",
+    "ColumnIndex",
+    "RecordIndex",
+    "RecordOutline",
+    "DBCDiff",
+    "merge_dbc",
+    "make_patch",
+    "apply_patch",
+    "OverlayStack",
+    "SQLiteBridge",
+    "CSVReader",
+    "write_csv",
+    "read_csv",
+    "to_arrow",
+    "from_arrow",
+    "SQLDump",
+    "MergeResult",
+    "EditJournal",
     "get_reference",
     "get_all_references",
     "DBC_RELATIONS",
+    "QueryEngine",
+    "QuerySyntaxError",
 ]
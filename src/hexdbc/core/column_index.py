@@ -0,0 +1,133 @@
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional
+
+from hexdbc.core.parser import DBCFile
+from hexdbc.core.schema import FieldType
+
+
+def typed_column(dbc: DBCFile, field_idx: int, field_type: FieldType) -> array:
+    """A column reinterpreted in its schema type (same bytes, no per-value conversion)."""
+    raw = dbc.column(field_idx)
+    if field_type == FieldType.FLOAT:
+        return array('f', raw.tobytes())
+    if field_type == FieldType.INT:
+        return array('i', raw.tobytes())
+    return raw
+
+
+class HashIndex:
+    """Equality index over raw uint32 values: value -> ascending row indices."""
+
+    def __init__(self, column: array):
+        first: Dict[int, int] = {}
+        more: Dict[int, List[int]] = {}
+        for row, value in enumerate(column):
+            if value in first:
+                more.setdefault(value, []).append(row)
+            else:
+                first[value] = row
+        # Most columns worth hashing are near-unique, so only duplicates get a list
+        self._first = first
+        self._more = more
+
+        # Dict tables plus boxed int keys/rows (small ints are shared, so this over-counts a bit)
+        int_size = sys.getsizeof(1 << 30)
+        self.memory_bytes = (
+            sys.getsizeof(first) + sys.getsizeof(more) + len(first) * 2 * int_size
+            + sum(sys.getsizeof(rows) + len(rows) * int_size for rows in more.values())
+        )
+
+    def equal(self, raw: int) -> List[int]:
+        row = self._first.get(raw)
+        if row is None:
+            return []
+        extra = self._more.get(raw)
+        return [row] + extra if extra else [row]
+
+    def first(self, raw: int) -> Optional[int]:
+        return self._first.get(raw)
+
+    def __contains__(self, raw: int) -> bool:
+        return raw in self._first
+
+    def __len__(self) -> int:
+        return len(self._first)
+
+
+class SortedIndex:
+    """Range index: row indices ordered by typed value, with the sorted keys alongside."""
+
+    def __init__(self, values: array):
+        if values.typecode == 'f':
+            rows = [i for i in range(len(values)) if values[i] == values[i]]  # drop NaN
+        else:
+            rows = range(len(values))
+        order = sorted(rows, key=values.__getitem__)
+        self._order = array('I', order)
+        self._keys = array(values.typecode, map(values.__getitem__, order))
+        self.memory_bytes = sys.getsizeof(self._order) + sys.getsizeof(self._keys)
+
+    def range(self, lo=None, hi=None, include_lo: bool = True, include_hi: bool = True) -> List[int]:
+        keys = self._keys
+        start = 0 if lo is None else (bisect_left(keys, lo) if include_lo else bisect_right(keys, lo))
+        end = len(keys) if hi is None else (bisect_right(keys, hi) if include_hi else bisect_left(keys, hi))
+        if start >= end:
+            return []
+        return sorted(self._order[start:end])
+
+    def equal(self, value) -> List[int]:
+        return self.range(value, value)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+
+class ColumnIndex:
+    """Secondary index over one DBC column, built lazily per access pattern.
+
+    Equality lookups build a HashIndex over the raw values; range lookups
+    build a SortedIndex over the schema-typed values. Satisfies the
+    index_provider protocol used by QueryEngine.
+    """
+
+    def __init__(self, dbc: DBCFile, field_idx: int, field_type: FieldType = FieldType.UINT):
+        self.dbc = dbc
+        self.field_idx = field_idx
+        self.field_type = field_type
+        self._hash: Optional[HashIndex] = None
+        self._sorted: Optional[SortedIndex] = None
+
+    @property
+    def hash(self) -> HashIndex:
+        if self._hash is None:
+            self._hash = HashIndex(self.dbc.column(self.field_idx))
+        return self._hash
+
+    @property
+    def sorted(self) -> SortedIndex:
+        if self._sorted is None:
+            self._sorted = SortedIndex(typed_column(self.dbc, self.field_idx, self.field_type))
+        return self._sorted
+
+    def equal(self, raw: int) -> List[int]:
+        return self.hash.equal(raw)
+
+    def first(self, raw: int) -> Optional[int]:
+        return self.hash.first(raw)
+
+    def contains(self, raw: int) -> bool:
+        return raw in self.hash
+
+    def range(self, lo=None, hi=None, include_lo: bool = True, include_hi: bool = True) -> List[int]:
+        return self.sorted.range(lo, hi, include_lo, include_hi)
+
+    @property
+    def memory_bytes(self) -> int:
+        size = 0
+        if self._hash is not None:
+            size += self._hash.memory_bytes
+        if self._sorted is not None:
+            size += self._sorted.memory_bytes
+        return size
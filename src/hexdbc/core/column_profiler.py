@@ -0,0 +1,143 @@
+import hashlib
+import struct
+from array import array
+from dataclasses import dataclass
+from itertools import chain
+from typing import List
+
+from hexdbc.core.parser import DBCFile
+from hexdbc.core.schema import FieldDef, FieldType, SchemaDef
+
+# Rows sampled per file; spread evenly across the record array
+SAMPLE_ROWS = 2048
+
+# IEEE-754 single exponents treated as "looks like real data" (~1e-8 .. ~1e10)
+FLOAT_EXP_MIN = 100
+FLOAT_EXP_MAX = 160
+# Hand-entered floats are short decimals; integers reinterpreted as floats rarely are
+FLOAT_DIGITS = 6
+
+_F32 = struct.Struct('<f')
+_U32 = struct.Struct('<I')
+
+STRING_THRESHOLD = 0.95
+FLOAT_THRESHOLD = 0.9
+SIGNED_THRESHOLD = 0.9
+
+
+@dataclass
+class ColumnProfile:
+    index: int
+    distinct: int           # distinct non-zero values in the sample
+    string_score: float     # share landing on a string start in the string block
+    float_score: float      # share that are short decimals with a plausible exponent
+    signed_score: float     # share of sign-bit values that are small negatives
+    type: FieldType = FieldType.UINT
+
+
+def sample_records(dbc: DBCFile, sample_rows: int = SAMPLE_ROWS) -> array:
+    """Pack an evenly strided sample of rows into one flat uint32 array."""
+    records = dbc.records
+    if not records:
+        return array('I')
+    width = len(records[0])
+    step = max(1, len(records) // sample_rows)
+    rows = [r for r in records[::step] if len(r) == width]
+    return array('I', chain.from_iterable(rows))
+
+
+def fingerprint(dbc: DBCFile, sample: array) -> str:
+    """Hash exactly what inference looks at: header, sampled rows, string block."""
+    h = hashlib.blake2b(digest_size=16)
+    hdr = dbc.header
+    h.update(struct.pack('<IIII', hdr.record_count, hdr.field_count,
+                         hdr.record_size, hdr.string_block_size))
+    h.update(sample.tobytes())
+    h.update(dbc.string_block)
+    return h.hexdigest()
+
+
+def looks_like_float(bits: int) -> bool:
+    """Sane magnitude and exactly written with at most FLOAT_DIGITS significant digits."""
+    if not FLOAT_EXP_MIN <= (bits >> 23) & 0xFF <= FLOAT_EXP_MAX:
+        return False
+    packed = _U32.pack(bits)
+    value = _F32.unpack(packed)[0]
+    return _F32.pack(float(f"{value:.{FLOAT_DIGITS}g}")) == packed
+
+
+def profile_columns(dbc: DBCFile, sample: array) -> List[ColumnProfile]:
+    """Score every column of a packed sample as string offset, float or signed int."""
+    if not dbc.records:
+        return []
+
+    width = len(dbc.records[0])
+    string_block = dbc.string_block
+    block_len = len(string_block)
+    profiles = []
+
+    for idx in range(width):
+        # Strided slice pulls the column out of the flat sample in C
+        distinct = set(sample[idx::width])
+        distinct.discard(0)
+        profile = ColumnProfile(idx, len(distinct), 0.0, 0.0, 0.0)
+        profiles.append(profile)
+
+        if idx == 0:
+            profile.type = FieldType.INT  # ID column
+            continue
+        if not distinct:
+            continue
+
+        count = len(distinct)
+
+        # String offsets point just past a NUL (or at 0 for "")
+        aligned = sum(1 for v in distinct if v < block_len and string_block[v - 1] == 0)
+        profile.string_score = aligned / count
+
+        # Floats: sane magnitude and a short decimal; ids and hashes near 1e9
+        # land in the same exponent range but need 7-9 digits
+        plausible = sum(1 for v in distinct if looks_like_float(v))
+        profile.float_score = plausible / count
+
+        # Signed ints: sign-bit values cluster just below 2^32 (-1, -2, ...)
+        negative = [v for v in distinct if v & 0x80000000]
+        if negative:
+            small = sum(1 for v in negative if v >= 0xFFFF0000)
+            profile.signed_score = small / len(negative)
+
+        # A column that is only ever 1 is more likely a count than the first string
+        is_string = profile.string_score >= STRING_THRESHOLD and (count > 1 or max(distinct) > 1)
+
+        if is_string and block_len > 1:
+            profile.type = FieldType.STRING
+        elif profile.float_score >= FLOAT_THRESHOLD:
+            profile.type = FieldType.FLOAT
+        elif negative and profile.signed_score >= SIGNED_THRESHOLD:
+            profile.type = FieldType.INT
+
+    return profiles
+
+
+def infer_schema(dbc: DBCFile, name: str = "Unknown", sample: array = None) -> SchemaDef:
+    """Build a SchemaDef with inferred column types for a table without a schema."""
+    if sample is None:
+        sample = sample_records(dbc)
+    profiles = profile_columns(dbc, sample)
+
+    fields = []
+    for profile in profiles:
+        description = ""
+        if profile.index > 0 and profile.distinct:
+            description = (
+                f"inferred {profile.type.name.lower()} "
+                f"(string {profile.string_score:.0%}, float {profile.float_score:.0%}, "
+                f"signed {profile.signed_score:.0%})"
+            )
+        fields.append(FieldDef(f"field_{profile.index}", profile.type, description))
+
+    # Header may claim more fields than the records carry (packed columns)
+    for i in range(len(fields), dbc.header.field_count):
+        fields.append(FieldDef(f"field_{i}", FieldType.UINT))
+
+    return SchemaDef(name=name, fields=fields)
@@ -0,0 +1,422 @@
+import hashlib
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from hexdbc.core.dbc_diff import string_texts
+from hexdbc.core.hexdbc_format import HexDBCParser
+from hexdbc.core.parser import DBCFile, DBCHeader
+from hexdbc.core.record_index import scan_record_headers
+from hexdbc.core.schema import SchemaDef
+
+CACHE_MAGIC = b'HXCC'
+CACHE_VERSION = 1
+CACHE_SUFFIX = '.hxcache'
+
+# Edited records closer together than this are re-parsed as one block of text
+MERGE_GAP = 8
+
+# magic, version, source key, context key, width, chunks, rows, string cells, headers, string block size
+_HEADER = struct.Struct('<4sH20s20sIIIIII')
+_DIGEST_SIZE = 16
+_DEAD_CELL = 0xFFFFFFFF  # A string overwritten in its record; it still holds its place in the block
+
+# Record starts as HexDBCParser sees them: a stripped line containing "(" that ends in "{"
+_RECORD_START_RE = re.compile(r'(?![^\S\n]*(?:#|@schema))[^\n]*\([^\n]*\{[^\S\n]*$')
+_RECORD_END_RE = re.compile(r'^[^\S\n]*\}[^\S\n]*$', re.MULTILINE)
+_DIRECTIVE_RE = re.compile(r'^[^\S\n]*@schema[^\n]*', re.MULTILINE)
+_SCHEMA_NAME_RE = re.compile(r'@schema\s+"([^"]+)"')
+_RECORD_ID_RE = re.compile(r'\w+\((\d+)\)\s*\{')
+
+
+@dataclass
+class CompiledSource:
+    dbc: DBCFile
+    errors: List[str] = field(default_factory=list)
+    reused: int = 0  # Records taken from the sidecar
+    parsed: int = 0  # Records parsed from text
+
+
+@dataclass
+class _Chunk:
+    """A record's text: its header line up to the next header."""
+    start: int
+    end: int
+    digest: bytes
+    width: int = 0  # Fields the record needs; 0 when the text yields no record
+    row: Optional[array] = None  # None until compiled
+    cells: List[Tuple[int, bytes]] = field(default_factory=list)  # (field or _DEAD_CELL, string) in block order
+
+
+@dataclass
+class _Sidecar:
+    key: bytes
+    context: bytes
+    width: int
+    digests: List[bytes]
+    widths: array
+    flat: array
+    cell_rows: array
+    cell_fields: array
+    cell_offsets: array
+    header_ids: array
+    header_lines: array
+    string_block: bytes
+
+
+def _encode(text: str) -> bytes:
+    return text.encode('utf-8', 'surrogatepass')
+
+
+def _u32(data, count: int) -> array:
+    values = array('I')
+    values.frombytes(data)
+    if len(values) != count:
+        raise ValueError("Truncated cache file")
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def _u32_bytes(values: array) -> bytes:
+    if sys.byteorder == 'big':
+        values = array('I', values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _string_at(block: bytes, offset: int) -> bytes:
+    end = block.find(b'\x00', offset)
+    return block[offset:end if end != -1 else len(block)]
+
+
+def _live_cells(row: array, cells: List[Tuple[int, int]], block: bytes) -> List[Tuple[int, bytes]]:
+    """Strings a record wrote, marking those a later assignment to the same field replaced."""
+    live = []
+    last = {field_idx: i for i, (field_idx, _) in enumerate(cells)}
+    for i, (field_idx, offset) in enumerate(cells):
+        alive = last[field_idx] == i and row[field_idx] == offset
+        live.append((field_idx if alive else _DEAD_CELL, _string_at(block, offset)))
+    return live
+
+
+class CompileCache:
+    """Compiles .hexdbc text to DBC through a binary sidecar per source file.
+
+    The sidecar holds the compiled records and string block, the record
+    header lines, and a digest of each record's text. Text that matches the
+    sidecar is not parsed at all; otherwise records whose text is unchanged
+    are spliced from the sidecar and only the edited ones are parsed. The
+    result is byte-identical to HexDBCParser.parse of the whole text.
+    """
+
+    def __init__(self, cache_dir: Path, parser: Optional[HexDBCParser] = None):
+        self.cache_dir = Path(cache_dir)
+        self.parser = parser or HexDBCParser()
+
+    def sidecar_path(self, source_path: Path) -> Path:
+        name = hashlib.sha1(_encode(str(Path(source_path).resolve()))).hexdigest()
+        return self.cache_dir / (name + CACHE_SUFFIX)
+
+    def discard(self, source_path: Path) -> None:
+        try:
+            os.remove(self.sidecar_path(source_path))
+        except OSError:
+            pass
+
+    def record_lines(self, code: str, source_path: Path) -> Optional[List[Tuple[int, int]]]:
+        """(record_id, 0-based line) of each header, if the sidecar was compiled from exactly this text."""
+        sidecar = self._read(source_path)
+        if sidecar is None:
+            return None
+        chunks, prelude = self._split(code)
+        if self._source_key(prelude, chunks) != sidecar.key:
+            return None
+        return list(zip(sidecar.header_ids, sidecar.header_lines))
+
+    def compile(self, code: str, source_path: Optional[Path] = None,
+                original_dbc: Optional[DBCFile] = None) -> CompiledSource:
+        """Compile code like HexDBCParser.parse(code, original_dbc), reusing source_path's sidecar."""
+        chunks, prelude = self._split(code)
+        if source_path is None or not chunks or self._has_directive(code, chunks[0].start):
+            # A directive after the first record switches schema midway; only a full parse follows that
+            return self._full_parse(code, original_dbc)
+
+        schema = self._prelude_schema(prelude)
+        context = self._context_key(prelude, schema, original_dbc)
+        key = self._source_key(prelude, chunks)
+        sidecar = self._read(source_path)
+        if sidecar is not None and sidecar.context != context:
+            sidecar = None
+
+        if sidecar is not None and sidecar.key == key:
+            dbc = DBCFile.from_flat(sidecar.flat, sidecar.width, sidecar.string_block)
+            return CompiledSource(dbc, reused=len(chunks))
+
+        reused = self._reuse(chunks, sidecar)
+        if not self._parse_changed(code, prelude, chunks, original_dbc if schema is None or not reused
+                                   else self._trimmer(original_dbc)):
+            return self._full_parse(code, original_dbc)
+
+        if original_dbc is not None:
+            width = original_dbc.header.field_count
+        else:
+            width = max(chunk.width for chunk in chunks)
+        if not width:
+            return self._full_parse(code, original_dbc)
+        dbc, cells = self._assemble(chunks, width)
+        try:
+            self._write(source_path, key, context, width, chunks, dbc, cells, scan_record_headers(code))
+        except OSError:
+            pass  # The compile itself succeeded; the next one just starts from scratch
+        return CompiledSource(dbc, reused=reused, parsed=len(chunks) - reused)
+
+    def _full_parse(self, code: str, original_dbc: Optional[DBCFile]) -> CompiledSource:
+        dbc = self.parser.parse(code, original_dbc)
+        return CompiledSource(dbc, self.parser.errors, parsed=len(dbc.records))
+
+    def _split(self, code: str) -> Tuple[List[_Chunk], str]:
+        # Record starts end in "{", which is rare elsewhere; only those lines are tried
+        starts = []
+        pos = code.find('{')
+        while pos != -1:
+            line_start = code.rfind('\n', 0, pos) + 1
+            line_end = code.find('\n', pos)
+            if line_end == -1:
+                line_end = len(code)
+            if _RECORD_START_RE.match(code, line_start, line_end):
+                starts.append(line_start)
+            pos = code.find('{', line_end)
+        ends = starts[1:] + [len(code)]
+        chunks = [_Chunk(start, end, hashlib.blake2b(_encode(code[start:end]), digest_size=_DIGEST_SIZE).digest())
+                  for start, end in zip(starts, ends)]
+        return chunks, code[:starts[0]] if starts else code
+
+    def _has_directive(self, code: str, pos: int) -> bool:
+        pos = code.find('@schema', pos)
+        while pos != -1:
+            line_start = code.rfind('\n', 0, pos) + 1
+            if not code[line_start:pos].strip():
+                return True
+            pos = code.find('@schema', pos + 1)
+        return False
+
+    def _source_key(self, prelude: str, chunks: List[_Chunk]) -> bytes:
+        digest = hashlib.sha1(_encode(prelude))
+        for chunk in chunks:
+            digest.update(chunk.digest)
+        return digest.digest()
+
+    def _prelude_schema(self, prelude: str) -> Optional[SchemaDef]:
+        """The schema the parser will be using when it reaches the first record."""
+        schema = None
+        for match in _DIRECTIVE_RE.finditer(prelude):
+            name = _SCHEMA_NAME_RE.search(match.group())
+            if name:
+                schema = self.parser.schema_manager.get_schema(name.group(1))
+        return schema
+
+    def _context_key(self, prelude: str, schema: Optional[SchemaDef], original_dbc: Optional[DBCFile]) -> bytes:
+        """Digest of everything besides record text that the compiled bytes depend on."""
+        digest = hashlib.sha1(struct.pack('<H', CACHE_VERSION))
+        digest.update(_encode(prelude))
+        if schema is not None:
+            digest.update(_encode(repr([(f.name, f.type.value, f.enum_name) for f in schema.fields])))
+            digest.update(_encode(repr(schema.enums)))
+        if original_dbc is not None:
+            header = original_dbc.header
+            digest.update(struct.pack('<4sIIII', header.magic, header.record_count, header.field_count,
+                                      header.record_size, header.string_block_size))
+            digest.update(_u32_bytes(original_dbc.flat()))
+            digest.update(original_dbc.string_block)
+        return digest.digest()
+
+    def _trimmer(self, original_dbc: Optional[DBCFile]):
+        """Original DBC cut down to the records of some text, so each small parse stays small.
+
+        Only valid with a known schema: without one the parser infers types from every record.
+        """
+        if original_dbc is None:
+            return None
+        by_id = {record[0]: record for record in original_dbc.records if record}
+        header = original_dbc.header
+
+        def trim(text: str) -> DBCFile:
+            ids = {int(match.group(1)) for match in _RECORD_ID_RE.finditer(text)}
+            records = [by_id[record_id] for record_id in ids if record_id in by_id]
+            return DBCFile(DBCHeader(header.magic, len(records), header.field_count, header.record_size,
+                                     header.string_block_size), records, original_dbc.string_block)
+        return trim
+
+    def _reuse(self, chunks: List[_Chunk], sidecar: Optional[_Sidecar]) -> int:
+        """Fill the chunks whose text is unchanged from the sidecar; returns how many were."""
+        if sidecar is None:
+            return 0
+        by_digest: Dict[bytes, int] = {}
+        for index, digest in enumerate(sidecar.digests):
+            by_digest.setdefault(digest, index)
+
+        # Rows follow chunk order, and string cells row order
+        row_of = []
+        rows = 0
+        for width in sidecar.widths:
+            row_of.append(rows if width else -1)
+            rows += 1 if width else 0
+        first_cell = [0] * (rows + 1)
+        for cell_row in sidecar.cell_rows:
+            first_cell[cell_row + 1] += 1
+        for row in range(rows):
+            first_cell[row + 1] += first_cell[row]
+
+        texts = string_texts(sidecar.string_block)
+        stride = sidecar.width
+        count = 0
+        for chunk in chunks:
+            index = by_digest.get(chunk.digest)
+            if index is None:
+                continue
+            count += 1
+            chunk.width = sidecar.widths[index]
+            row = row_of[index]
+            if row < 0:
+                chunk.row = array('I')
+                continue
+            chunk.row = sidecar.flat[row * stride:(row + 1) * stride]
+            chunk.cells = [(sidecar.cell_fields[i], texts[sidecar.cell_offsets[i]])
+                           for i in range(first_cell[row], first_cell[row + 1])]
+        return count
+
+    def _parse_changed(self, code: str, prelude: str, chunks: List[_Chunk], base) -> bool:
+        """Parse the chunks not taken from the sidecar; False if that cannot match a full parse."""
+        runs: List[List[int]] = []
+        for index, chunk in enumerate(chunks):
+            if chunk.row is not None:
+                continue
+            if runs and index - runs[-1][1] <= MERGE_GAP:
+                runs[-1][1] = index + 1
+            else:
+                runs.append([index, index + 1])
+
+        for first, last in runs:
+            run = chunks[first:last]
+            text = prelude + code[run[0].start:run[-1].end]
+            dbc = self.parser.parse(text, base(text) if callable(base) else base)
+            if self.parser.errors:
+                return False  # Errors are reported by the full parse, with their document lines
+
+            # A record is kept once its closing brace is read
+            closed = []
+            for chunk in run:
+                body = code.find('\n', chunk.start, chunk.end) + 1
+                if body and _RECORD_END_RE.search(code, body, chunk.end):
+                    closed.append(chunk)
+                chunk.width, chunk.row, chunk.cells = 0, array('I'), []
+            if len(closed) != len(dbc.records):
+                return False
+
+            block = dbc.string_block
+            cells: List[List[Tuple[int, int]]] = [[] for _ in closed]
+            for row, field_idx, offset in self.parser.string_cells:
+                cells[row].append((field_idx, offset))
+            if block.count(0) != 1 + len({offset for _, _, offset in self.parser.string_cells if offset}):
+                return False  # A string with an embedded NUL cannot be told apart in the block
+
+            widths = self.parser.record_widths
+            for row, chunk in enumerate(closed):
+                chunk.row = array('I', dbc.records[row])
+                chunk.width = widths[row] if widths else dbc.header.field_count
+                chunk.cells = _live_cells(chunk.row, cells[row], block)
+        return True
+
+    def _assemble(self, chunks: List[_Chunk], width: int) -> Tuple[DBCFile, Tuple[array, array, array]]:
+        """Join the chunks' rows, interning strings in the order a full parse would."""
+        block = bytearray(b'\x00')
+        offsets: Dict[bytes, int] = {b'': 0}
+        flat = array('I')
+        cell_rows, cell_fields, cell_offsets = array('I'), array('I'), array('I')
+        padding = array('I', [0]) * width
+        row = 0
+        for chunk in chunks:
+            if not chunk.width:
+                continue
+            values = chunk.row[:width]
+            if len(values) < width:
+                values.extend(padding[:width - len(values)])
+            for field_idx, text in chunk.cells:
+                offset = offsets.get(text)
+                if offset is None:
+                    offset = offsets[text] = len(block)
+                    block += text + b'\x00'
+                if field_idx != _DEAD_CELL:
+                    values[field_idx] = offset
+                cell_rows.append(row)
+                cell_fields.append(field_idx)
+                cell_offsets.append(offset)
+            flat.extend(values)
+            row += 1
+        return DBCFile.from_flat(flat, width, bytes(block)), (cell_rows, cell_fields, cell_offsets)
+
+    def _write(self, source_path: Path, key: bytes, context: bytes, width: int, chunks: List[_Chunk],
+               dbc: DBCFile, cells: Tuple[array, array, array], headers: List[Tuple[int, int]]) -> None:
+        cell_rows, cell_fields, cell_offsets = cells
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.sidecar_path(source_path)
+        tmp_path = path.with_suffix(CACHE_SUFFIX + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, key, context, width, len(chunks),
+                                 dbc.header.record_count, len(cell_rows), len(headers), len(dbc.string_block)))
+            f.write(b''.join(chunk.digest for chunk in chunks))
+            f.write(_u32_bytes(array('I', (chunk.width for chunk in chunks))))
+            f.write(_u32_bytes(dbc.flat()))
+            for values in (cell_rows, cell_fields, cell_offsets):
+                f.write(_u32_bytes(values))
+            f.write(_u32_bytes(array('I', (record_id for record_id, _ in headers))))
+            f.write(_u32_bytes(array('I', (line for _, line in headers))))
+            f.write(dbc.string_block)
+        os.replace(tmp_path, path)
+
+    def _read(self, source_path: Path) -> Optional[_Sidecar]:
+        try:
+            with open(self.sidecar_path(source_path), 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return self._unpack(mm)
+        except (OSError, ValueError, struct.error):
+            return None  # Missing, empty or from another version: compile from scratch
+
+    def _unpack(self, mm: mmap.mmap) -> _Sidecar:
+        magic, version, key, context, width, chunk_count, row_count, cell_count, header_count, block_size = \
+            _HEADER.unpack_from(mm)
+        if magic != CACHE_MAGIC or version != CACHE_VERSION:
+            raise ValueError("Not a compile cache file")
+        pos = _HEADER.size
+
+        def take(size: int) -> bytes:
+            nonlocal pos
+            data = mm[pos:pos + size]
+            pos += size
+            return data
+
+        digests = take(chunk_count * _DIGEST_SIZE)
+        sidecar = _Sidecar(
+            key=key,
+            context=context,
+            width=width,
+            digests=[digests[i:i + _DIGEST_SIZE] for i in range(0, len(digests), _DIGEST_SIZE)],
+            widths=_u32(take(chunk_count * 4), chunk_count),
+            flat=_u32(take(row_count * width * 4), row_count * width),
+            cell_rows=_u32(take(cell_count * 4), cell_count),
+            cell_fields=_u32(take(cell_count * 4), cell_count),
+            cell_offsets=_u32(take(cell_count * 4), cell_count),
+            header_ids=_u32(take(header_count * 4), header_count),
+            header_lines=_u32(take(header_count * 4), header_count),
+            string_block=take(block_size),
+        )
+        if len(sidecar.digests) != chunk_count or len(sidecar.string_block) != block_size:
+            raise ValueError("Truncated cache file")
+        return sidecar
@@ -0,0 +1,266 @@
+import base64
+import json
+import os
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+from hexdbc.core.dbc_diff import StringBlockBuilder, padded_flat, record_width, string_texts
+from hexdbc.core.parser import DBCFile, DBCHeader, DBCParser
+from hexdbc.core.schema import FieldType, SchemaDef, SchemaManager, field_columns
+from hexdbc.core.sqlite_bridge import ExportSummary
+
+# Tables are converted and written this many at a time; pyarrow releases the GIL while writing
+MAX_EXPORT_WORKERS = 4
+
+FORMATS = {'.parquet': 'parquet', '.feather': 'feather', '.arrow': 'feather'}
+
+# Keys of the table's schema metadata
+_META_NAME = b'hexdbc.name'
+_META_FIELD_COUNT = b'hexdbc.field_count'
+_META_RECORD_SIZE = b'hexdbc.record_size'
+_META_COLUMNS = b'hexdbc.columns'
+_META_STRING_BLOCK = b'hexdbc.string_block'
+# Per string field: rows whose offset the text alone would not give back
+_META_RAW = b'hexdbc.raw'
+
+_STRING_TYPES = (FieldType.STRING, FieldType.LOCSTRING)
+
+
+def _require_arrow() -> None:
+    if not ARROW_AVAILABLE:
+        raise ImportError("Parquet/Feather support needs pyarrow (pip install pyarrow)")
+
+
+def _arrow_type(field_type: FieldType):
+    if field_type == FieldType.FLOAT:
+        return pa.float32()
+    if field_type == FieldType.INT:
+        return pa.int32()
+    return pa.uint32()
+
+
+def _strings_column(dbc: DBCFile, column: array, count: int, exact: Dict[int, bool]):
+    """Dictionary-encoded texts, plus {row: offset} for cells only the offset restores."""
+    offsets = sorted(set(column))
+    position = {offset: i for i, offset in enumerate(offsets)}
+    indices = array('i', map(position.__getitem__, column))
+    dictionary = pa.array([dbc.get_string(offset) for offset in offsets], pa.string())
+    indices = pa.Array.from_buffers(pa.int32(), count, [None, pa.py_buffer(indices)])
+    raws = {}
+    if not all(exact.get(offset, False) for offset in offsets):
+        for row, offset in enumerate(column):
+            if not exact.get(offset, False):
+                raws[row] = offset
+    return pa.DictionaryArray.from_arrays(indices, dictionary), raws
+
+
+def _exact_offsets(block: bytes) -> Dict[int, bool]:
+    """Offsets a cell gets back from its text alone: first of their text, and valid UTF-8."""
+    exact = {}
+    first: Dict[bytes, int] = {}
+    for offset, raw in string_texts(block).items():
+        first.setdefault(raw, offset)
+        try:
+            raw.decode('utf-8')
+            exact[offset] = first[raw] == offset
+        except UnicodeDecodeError:
+            exact[offset] = False
+    exact[0] = True
+    return exact
+
+
+def to_arrow(dbc: DBCFile, schema: Optional[SchemaDef] = None, name: str = "") -> "pa.Table":
+    """Arrow table with one typed column per field.
+
+    Numeric columns share memory with a strided copy of the record buffer
+    (floats and signed ints are the same bits under another type); string
+    fields become dictionary columns of resolved text. The original string
+    block rides along in the metadata so from_arrow can rebuild the file.
+    """
+    _require_arrow()
+    width = record_width(dbc) if dbc.records else dbc.header.record_size // 4
+    columns = field_columns(schema, width)
+    flat = padded_flat(dbc, width)
+    count = len(dbc.records)
+
+    arrays = []
+    fields = []
+    exact = None
+    for field_idx, (column_name, field_type) in enumerate(columns):
+        column = flat[field_idx::width] if width > 1 else flat
+        metadata = None
+        if field_type in _STRING_TYPES:
+            if exact is None:
+                exact = _exact_offsets(dbc.string_block)
+            values, raws = _strings_column(dbc, column, count, exact)
+            if raws:
+                metadata = {_META_RAW: json.dumps(raws)}
+        else:
+            values = pa.Array.from_buffers(_arrow_type(field_type), count, [None, pa.py_buffer(column)])
+        arrays.append(values)
+        fields.append(pa.field(column_name, values.type, metadata=metadata))
+
+    metadata = {
+        _META_NAME: name,
+        _META_FIELD_COUNT: str(dbc.header.field_count),
+        _META_RECORD_SIZE: str(dbc.header.record_size),
+        _META_COLUMNS: json.dumps([[column_name, field_type.name] for column_name, field_type in columns]),
+        _META_STRING_BLOCK: base64.b64encode(dbc.string_block),
+    }
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields, metadata=metadata))
+
+
+def _column_types(table: "pa.Table") -> List[Tuple[str, FieldType]]:
+    """Field types of a table that was not written by to_arrow, from its Arrow types."""
+    columns = []
+    for arrow_field in table.schema:
+        arrow_type = arrow_field.type
+        if pa.types.is_dictionary(arrow_type):
+            arrow_type = arrow_type.value_type
+        if pa.types.is_floating(arrow_type):
+            field_type = FieldType.FLOAT
+        elif pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+            field_type = FieldType.STRING
+        elif pa.types.is_signed_integer(arrow_type):
+            field_type = FieldType.INT
+        else:
+            field_type = FieldType.UINT
+        columns.append((arrow_field.name, field_type))
+    return columns
+
+
+def _uint32_values(values, arrow_type) -> array:
+    """A numeric Arrow array as raw uint32 bits; nulls become 0."""
+    if values.type != arrow_type:
+        # Edits made elsewhere (pandas, duckdb) usually come back as 64-bit
+        values = values.cast(arrow_type, safe=False)
+    if values.null_count:
+        values = values.fill_null(0)
+    data = memoryview(values.buffers()[1])
+    result = array('I')
+    result.frombytes(data[values.offset * 4:(values.offset + len(values)) * 4])
+    return result
+
+
+def from_arrow(table: "pa.Table") -> DBCFile:
+    """Rebuild a DBC from an Arrow table; columns are matched by name and missing ones are 0."""
+    _require_arrow()
+    metadata = table.schema.metadata or {}
+    if _META_COLUMNS in metadata:
+        columns = [(column_name, FieldType[type_name])
+                   for column_name, type_name in json.loads(metadata[_META_COLUMNS])]
+        block = base64.b64decode(metadata.get(_META_STRING_BLOCK, b""))
+    else:
+        columns = _column_types(table)
+        block = None
+    width = len(columns)
+    count = table.num_rows
+    table = table.unify_dictionaries()
+    present = set(table.schema.names)
+
+    strings = StringBlockBuilder(block)
+    flat = array('I', [0]) * (width * count)
+    for field_idx, (column_name, field_type) in enumerate(columns):
+        if column_name not in present:
+            continue
+        values = table.column(column_name).combine_chunks()
+        if field_type in _STRING_TYPES:
+            texts = values.to_pylist()
+            restored: Dict[int, int] = {}
+            field_metadata = table.schema.field(column_name).metadata or {}
+            if _META_RAW in field_metadata and block is not None:
+                # Only cells left as written get their raw offsets back
+                for row, offset in json.loads(field_metadata[_META_RAW]).items():
+                    row = int(row)
+                    if row < count and texts[row] == _text_at(block, offset):
+                        restored[row] = offset
+            known: Dict[Optional[str], int] = {None: 0}
+            column = array('I')
+            for row, text in enumerate(texts):
+                offset = restored.get(row) if restored else None
+                if offset is None:
+                    # Restored cells are not interned, or their text would be appended to the block
+                    offset = known.get(text)
+                    if offset is None:
+                        offset = known[text] = strings.add(str(text).encode('utf-8'))
+                column.append(offset)
+        else:
+            column = _uint32_values(values, _arrow_type(field_type))
+        flat[field_idx::width] = column
+
+    string_block = strings.build()
+    dbc = DBCFile.from_flat(flat, width, string_block)
+    # Headers that disagree with the records are kept as they were
+    dbc.header = DBCHeader(b'WDBC', count, int(metadata.get(_META_FIELD_COUNT, width)),
+                           int(metadata.get(_META_RECORD_SIZE, width * 4)), len(string_block))
+    return dbc
+
+
+def _text_at(block: bytes, offset: int) -> str:
+    if offset == 0 or offset >= len(block):
+        return ""
+    end = block.find(b'\0', offset)
+    return block[offset:end if end != -1 else len(block)].decode('utf-8', errors='replace')
+
+
+def write_arrow(dbc: DBCFile, path: Path, schema: Optional[SchemaDef] = None, name: str = "") -> None:
+    """Write dbc as Parquet, or Feather for .feather/.arrow paths."""
+    table = to_arrow(dbc, schema, name or Path(path).stem)
+    if FORMATS.get(Path(path).suffix.lower()) == 'feather':
+        feather.write_feather(table, str(path))
+    else:
+        pq.write_table(table, str(path))
+
+
+def read_arrow(path: Path) -> DBCFile:
+    """Read a Parquet or Feather file back into a DBC."""
+    _require_arrow()
+    if FORMATS.get(Path(path).suffix.lower()) == 'feather':
+        table = feather.read_table(str(path))
+    else:
+        table = pq.read_table(str(path))
+    return from_arrow(table)
+
+
+def export_folder(folder: Path, out_dir: Path, schema_manager: Optional[SchemaManager] = None,
+                  suffix: str = '.parquet', parser: Optional[DBCParser] = None) -> ExportSummary:
+    """Write every *.dbc in folder to out_dir as name + suffix; files that fail are skipped and reported."""
+    _require_arrow()
+    schema_manager = schema_manager or SchemaManager()
+    parser = parser or DBCParser()
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths = sorted((Path(entry.path) for entry in os.scandir(folder)
+                    if entry.name.lower().endswith('.dbc') and entry.is_file()),
+                   key=lambda path: path.name.lower())
+
+    def export(path: Path) -> Tuple[str, int, str]:
+        name = path.stem
+        try:
+            dbc = parser.parse(path)
+            schema = schema_manager.get_schema(name)
+            if schema is None and dbc.records:
+                schema = schema_manager.infer_schema(dbc, name)
+            write_arrow(dbc, out_dir / f"{name}{suffix}", schema, name)
+        except (OSError, ValueError, pa.ArrowException) as e:
+            return name, -1, str(e)
+        return name, len(dbc.records), ""
+
+    summary = ExportSummary()
+    with ThreadPoolExecutor(max_workers=MAX_EXPORT_WORKERS) as pool:
+        for name, count, error in pool.map(export, paths):
+            if error:
+                summary.errors[name] = error
+            else:
+                summary.tables[name] = count
+    return summary
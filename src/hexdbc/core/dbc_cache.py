@@ -1,28 +1,57 @@
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Any, Tuple, Union
 
 from hexdbc.core.parser import DBCParser, DBCFile
-from hexdbc.core.schema import SchemaManager
+from hexdbc.core.schema import SchemaManager, FieldType
 from hexdbc.core.hexdbc_format import HexDBCGenerator
+from hexdbc.core.column_index import ColumnIndex
+from hexdbc.core.dbc_diff import record_width
+from hexdbc.core.dbc_relations import DBC_RELATIONS, get_reference
+
+if TYPE_CHECKING:
+    # Only needed once client MPQs are opened, so kept off the startup path
+    from hexdbc.core.mpq import MPQChain
+
+# Secondary indexes beyond this many bytes are evicted least-recently-used first
+DEFAULT_INDEX_BUDGET = 256 * 1024 * 1024
 
 
 class DBCCache:
-    def __init__(self, parser: DBCParser, schema_manager: SchemaManager):
+    def __init__(self, parser: DBCParser, schema_manager: SchemaManager,
+                 index_budget: int = DEFAULT_INDEX_BUDGET):
         self.parser = parser
         self.schema_manager = schema_manager
         self.generator = HexDBCGenerator(schema_manager)
         self.folder: Optional[Path] = None
+        self.archive: Optional["MPQChain"] = None  # Client MPQs read in place of a folder
+        self.index_budget = index_budget
         self._cache: Dict[str, DBCFile] = {}
         self._available_dbcs: set[str] = set()
-        self._indices: Dict[str, Dict[int, List[int]]] = {}
+        # (dbc_name, field_idx, field_type) -> index, most recently used last
+        self._indices: "OrderedDict[Tuple[str, int, FieldType], ColumnIndex]" = OrderedDict()
+
+    def set_folder(self, folder: Union[Path, "MPQChain", None], dbc_names: Optional[Iterable[str]] = None) -> None:
+        """Resolve references against folder or an MPQ chain; dbc_names skips the scan when the caller already listed it.
 
-    def set_folder(self, folder: Path) -> None:
-        self.folder = folder
+        The cache reads from the chain but does not own it; the caller closes it.
+        """
+        from hexdbc.core.mpq import MPQChain
+
+        if isinstance(folder, MPQChain):
+            self.folder, self.archive = None, folder
+        else:
+            self.folder, self.archive = folder, None
         self._cache.clear()
         self._available_dbcs.clear()
         self._indices.clear()
 
-        if folder and folder.is_dir():
+        if dbc_names is not None:
+            self._available_dbcs.update(dbc_names)
+        elif self.archive is not None:
+            # Known table names find DBCs that no listfile mentions
+            self._available_dbcs.update(self.archive.dbc_names(self.schema_manager.schemas))
+        elif folder and folder.is_dir():
             # Scan once so we know what's available
             for f in folder.glob("*.dbc"):
                 self._available_dbcs.add(f.stem)
@@ -32,6 +61,7 @@ class DBCCache:
         self._available_dbcs.clear()
         self._indices.clear()
         self.folder = None
+        self.archive = None
 
     def is_available(self, dbc_name: str) -> bool:
         return dbc_name in self._available_dbcs
@@ -41,21 +71,24 @@ class DBCCache:
         if dbc_name in self._cache:
             return self._cache[dbc_name]
 
-        if not self.folder or dbc_name not in self._available_dbcs:
+        if not (self.folder or self.archive) or dbc_name not in self._available_dbcs:
             return None
 
         # Try to load from disk
         try:
-            file_path = self.folder / f"{dbc_name}.dbc"
-            if not file_path.is_file():
-                return None
+            if self.archive is not None:
+                from hexdbc.core.mpq import dbc_path
+                dbc_file = self.parser.parse_bytes(self.archive.read(dbc_path(dbc_name)))
+            else:
+                file_path = self.folder / f"{dbc_name}.dbc"
+                if not file_path.is_file():
+                    return None
 
-            dbc_file = self.parser.parse(file_path)
+                dbc_file = self.parser.parse(file_path)
             self._cache[dbc_name] = dbc_file
 
             # Drop any existing index so it rebuilds next time
-            if dbc_name in self._indices:
-                del self._indices[dbc_name]
+            self._drop_indices(dbc_name)
 
             return dbc_file
 
@@ -65,39 +98,130 @@ class DBCCache:
         return None
 
     def add_open_dbc(self, dbc_name: str, dbc_file: DBCFile) -> None:
+        replaced = self._cache.get(dbc_name) is not dbc_file
         self._cache[dbc_name] = dbc_file
         self._available_dbcs.add(dbc_name)
 
         # Force index rebuild
-        if dbc_name in self._indices:
-            del self._indices[dbc_name]
-
-    def _ensure_index(self, dbc_name: str, dbc_file: DBCFile) -> None:
-
-        if dbc_name in self._indices:
-            return
+        if replaced:
+            self._drop_indices(dbc_name)
 
-        index: Dict[int, List[int]] = {}
-
-        for record in dbc_file.records:
-            if not record:
-                continue
+    def _drop_indices(self, dbc_name: str) -> None:
+        for key in [k for k in self._indices if k[0] == dbc_name]:
+            del self._indices[key]
 
-            # First field is ID
-            entry_id = record[0]
-            index[entry_id] = record
+    def _field_type(self, dbc_name: str, field_idx: int) -> FieldType:
+        schema = self.schema_manager.get_schema(dbc_name)
+        field_def = schema.get_field(field_idx) if schema else None
+        if field_def:
+            return FieldType.STRING if field_def.type == FieldType.LOCSTRING else field_def.type
+        return FieldType.INT if field_idx == 0 else FieldType.UINT
+
+    def get_column_index(self, dbc_name: str, field_idx: int,
+                         field_type: Optional[FieldType] = None) -> Optional[ColumnIndex]:
+        """Secondary index over one column, created on first use.
+
+        field_type is the type values are compared in; by default the one the
+        registered schema gives. Each type gets its own index.
+        """
+        if field_type is None:
+            field_type = self._field_type(dbc_name, field_idx)
+        key = (dbc_name, field_idx, field_type)
+        index = self._indices.get(key)
+        if index is not None:
+            self._indices.move_to_end(key)
+            return index
 
-        self._indices[dbc_name] = index
+        dbc_file = self.get_dbc(dbc_name)
+        if not dbc_file or not dbc_file.records or field_idx >= len(dbc_file.records[0]):
+            return None
 
-    def lookup_entry(self, dbc_name: str, entry_id: int) -> Optional[Dict[str, Any]]:
+        index = ColumnIndex(dbc_file, field_idx, field_type)
+        self._indices[key] = index
+        self._enforce_index_budget()
+        return index
 
-        dbc_file = self.get_dbc(dbc_name)
-        if not dbc_file:
+    def index_provider(self, dbc_name: str):
+        """Index source for QueryEngine over this cache's copy of dbc_name."""
+        def provide(field_idx: int, field_type: FieldType) -> Optional[ColumnIndex]:
+            if field_type in (FieldType.STRING, FieldType.LOCSTRING):
+                return None
+            # The engine's type may come from an inferred schema the cache knows nothing of
+            return self.get_column_index(dbc_name, field_idx, field_type)
+        return provide
+
+    def index_memory(self) -> int:
+        """Approximate bytes held by all built secondary indexes."""
+        return sum(index.memory_bytes for index in self._indices.values())
+
+    def _enforce_index_budget(self) -> None:
+        # Indexes fill in lazily, so re-check on each new index rather than on build
+        while len(self._indices) > 1 and self.index_memory() > self.index_budget:
+            self._indices.popitem(last=False)
+
+    def _find_record(self, dbc_name: str, entry_id: int) -> Optional[List[int]]:
+        index = self.get_column_index(dbc_name, 0)
+        if index is None:
+            return None
+        row = index.first(entry_id & 0xFFFFFFFF)
+        if row is None:
             return None
+        return index.dbc.records[row]
+
+    def find_references_to(self, target_dbc: str, entry_id: int) -> List[Tuple[str, str, int]]:
+        """Reverse FK lookup: (source_dbc, field_name, record_id) of every row pointing at entry_id."""
+        results: List[Tuple[str, str, int]] = []
+        for source_dbc in DBC_RELATIONS:
+            for field_idx, field_name in self._fk_fields(source_dbc, target_dbc):
+                index = self.get_column_index(source_dbc, field_idx)
+                if index is None:
+                    continue
+                records = index.dbc.records
+                for row in index.equal(entry_id & 0xFFFFFFFF):
+                    results.append((source_dbc, field_name, records[row][0]))
+        return results
+
+    def find_broken_references(self, dbc_name: str) -> List[Tuple[int, str, int, str]]:
+        """(record_id, field_name, value, target_dbc) for FK values with no target entry.
+
+        Zero is treated as "no reference". Targets not present in the folder are skipped.
+        """
+        dbc_file = self.get_dbc(dbc_name)
+        if not dbc_file or not dbc_file.records:
+            return []
+
+        broken: List[Tuple[int, str, int, str]] = []
+        ids = dbc_file.column(0)
+        width = record_width(dbc_file)
+        for target_dbc in set(DBC_RELATIONS.get(dbc_name, {}).values()):
+            target_index = self.get_column_index(target_dbc, 0)
+            if target_index is None:
+                continue
+            for field_idx, field_name in self._fk_fields(dbc_name, target_dbc):
+                if field_idx >= width:
+                    continue  # Fewer columns than the schema
+                column = dbc_file.column(field_idx)
+                # Check each distinct value once against the target's ID index
+                missing = {v for v in set(column) if v and not target_index.contains(v)}
+                if not missing:
+                    continue
+                for row, value in enumerate(column):
+                    if value in missing:
+                        broken.append((ids[row], field_name, value, target_dbc))
+        return broken
+
+    def _fk_fields(self, source_dbc: str, target_dbc: str) -> List[Tuple[int, str]]:
+        schema = self.schema_manager.get_schema(source_dbc)
+        if not schema or source_dbc not in DBC_RELATIONS:
+            return []
+        return [
+            (i, field_def.name) for i, field_def in enumerate(schema.fields)
+            if get_reference(source_dbc, field_def.name) == target_dbc
+        ]
 
-        self._ensure_index(dbc_name, dbc_file)
+    def lookup_entry(self, dbc_name: str, entry_id: int) -> Optional[Dict[str, Any]]:
 
-        record = self._indices[dbc_name].get(entry_id)
+        record = self._find_record(dbc_name, entry_id)
         if not record:
             return None
 
@@ -0,0 +1,261 @@
+import csv
+import os
+import struct
+import sys
+from array import array
+from itertools import chain
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from hexdbc.core.dbc_diff import StringBlockBuilder, padded_flat, record_width, string_texts
+from hexdbc.core.hexdbc_format import format_float
+from hexdbc.core.parser import DBCFile, DBCHeader, DBCParser
+from hexdbc.core.schema import FieldType, SchemaDef, field_columns
+
+# Rows converted per batch; memory use does not grow with the table
+CHUNK_ROWS = 4096
+
+# Strings are written with undecodable bytes escaped, so any block survives the trip
+_ENCODING = 'utf-8'
+_ERRORS = 'surrogateescape'
+_STRING_TYPES = (FieldType.STRING, FieldType.LOCSTRING)
+
+_F32 = struct.Struct('<f')
+_U32 = struct.Struct('<I')
+
+
+def delimiter_for(path: Path) -> str:
+    """Tab for .tsv/.tab files, comma otherwise."""
+    return '\t' if Path(path).suffix.lower() in ('.tsv', '.tab') else ','
+
+
+def _parse_int(text: str) -> int:
+    text = text.strip()
+    if not text:
+        return 0
+    lowered = text.lower()
+    if lowered.startswith(('0x', '-0x')):
+        return int(text, 16) & 0xFFFFFFFF
+    try:
+        return int(text) & 0xFFFFFFFF
+    except ValueError:
+        # Spreadsheets like to write whole numbers as "5.0"
+        value = float(text)
+        if not value.is_integer():
+            raise
+        return int(value) & 0xFFFFFFFF
+
+
+def _parse_float(text: str) -> int:
+    text = text.strip()
+    if not text:
+        return 0
+    if text.lower().startswith('0x'):
+        return int(text, 16) & 0xFFFFFFFF
+    try:
+        return _U32.unpack(_F32.pack(float(text)))[0]
+    except OverflowError:
+        raise ValueError(f"{text} does not fit in a 32-bit float")
+
+
+def _formatter(field_type: FieldType, block: bytes, texts: Dict[int, str]) -> Callable[[int], str]:
+    if field_type in _STRING_TYPES:
+        def string(offset: int) -> str:
+            text = texts.get(offset)
+            if text is None:
+                # Points into the middle of a string
+                end = block.find(b'\0', offset)
+                text = block[offset:end if end != -1 else len(block)].decode(_ENCODING, _ERRORS)
+            return text
+        return string
+    if field_type == FieldType.FLOAT:
+        return format_float
+    if field_type == FieldType.INT:
+        return lambda value: str(value - 0x100000000 if value >= 0x80000000 else value)
+    if field_type == FieldType.FLAGS:
+        return lambda value: f"0x{value:08X}" if value else "0"
+    return str
+
+
+def write_csv(dbc: DBCFile, path: Path, schema: Optional[SchemaDef] = None,
+              delimiter: Optional[str] = None) -> int:
+    """Write dbc as CSV (or TSV) with one column per field; returns the number of rows."""
+    width = record_width(dbc)
+    columns = field_columns(schema, width)
+    flat = padded_flat(dbc, width)
+    block = dbc.string_block
+    texts = {}
+    if any(field_type in _STRING_TYPES for _, field_type in columns):
+        texts = {offset: raw.decode(_ENCODING, _ERRORS) for offset, raw in string_texts(block).items()}
+    formatters = [_formatter(field_type, block, texts) for _, field_type in columns]
+
+    count = len(flat) // width if width else 0
+    with open(path, 'w', newline='', encoding=_ENCODING, errors=_ERRORS) as f:
+        writer = csv.writer(f, delimiter=delimiter or delimiter_for(path))
+        writer.writerow([name for name, _ in columns])
+        for start in range(0, count, CHUNK_ROWS):
+            chunk = flat[start * width:min(start + CHUNK_ROWS, count) * width]
+            formatted = []
+            for field_idx, format_value in enumerate(formatters):
+                # Values repeat a lot within a column; format each one once
+                cache: Dict[int, str] = {}
+                column = []
+                for value in chunk[field_idx::width]:
+                    text = cache.get(value)
+                    if text is None:
+                        text = cache[value] = format_value(value)
+                    column.append(text)
+                formatted.append(column)
+            writer.writerows(zip(*formatted))
+    return count
+
+
+class CSVReader:
+    """Converts CSV (or TSV) rows back into DBC records, a chunk at a time.
+
+    Columns are matched to fields by header name, so they may be reordered
+    or left out (missing fields are 0); field_N names any field by index.
+    Strings go into a deduplicated block built from string_base when given,
+    which keeps that block's layout for texts it already holds. CSV carries
+    text, not offsets: a record that pointed at a repeated copy of a text,
+    or into the tail of a longer string, comes back pointing at the text's
+    first whole copy, so such files read back with the same strings but
+    not byte for byte.
+    """
+
+    def __init__(self, path: Path, schema: Optional[SchemaDef] = None, delimiter: Optional[str] = None,
+                 string_base: Optional[bytes] = None):
+        self.path = Path(path)
+        self.schema = schema
+        self.delimiter = delimiter or delimiter_for(self.path)
+        self.strings = StringBlockBuilder(string_base)
+        self.width = 0
+        self.count = 0
+
+    def _layout(self, header: List[str]) -> List[int]:
+        """Field index of each CSV column."""
+        known = {name.lower(): field_idx
+                 for field_idx, (name, _) in enumerate(field_columns(self.schema, len(self.schema.fields)))
+                 } if self.schema else {}
+        indices = []
+        for name in header:
+            key = name.strip().lower()
+            field_idx = known.get(key)
+            if field_idx is None and key.startswith('field_') and key[6:].isdigit():
+                field_idx = int(key[6:])
+            if field_idx is None:
+                hint = "" if self.schema else " (without a schema, columns must be named field_N)"
+                raise ValueError(f"Unknown column {name!r}{hint}")
+            if field_idx in indices:
+                raise ValueError(f"Column {name!r} repeats field {field_idx}")
+            indices.append(field_idx)
+        return indices
+
+    def _string(self, text: str) -> int:
+        return self.strings.add(text.encode(_ENCODING, _ERRORS))
+
+    def chunks(self) -> Iterator[array]:
+        """Row-major uint32 values, up to CHUNK_ROWS records per chunk."""
+        with open(self.path, newline='', encoding='utf-8-sig', errors=_ERRORS) as f:
+            reader = csv.reader(f, delimiter=self.delimiter)
+            header = next(reader, None)
+            if header is None:
+                return
+            layout = self._layout(header)
+            # Dropped trailing columns still take up their fields
+            self.width = max(len(self.schema.fields) if self.schema else 0, max(layout, default=-1) + 1)
+            types = field_columns(self.schema, self.width)
+
+            rows: List[List[str]] = []
+            lines: List[int] = []
+            for row in chain(reader, [None]):
+                if row is not None:
+                    if not row:
+                        continue  # Blank line
+                    rows.append(row)
+                    lines.append(reader.line_num)
+                    if len(rows) < CHUNK_ROWS:
+                        continue
+                if not rows:
+                    break
+                yield self._convert(rows, lines, layout, types)
+                self.count += len(rows)
+                rows, lines = [], []
+
+    def _convert(self, rows: List[List[str]], lines: List[int], layout: List[int],
+                 types: List[Tuple[str, FieldType]]) -> array:
+        width = self.width
+        values = array('I', [0]) * (width * len(rows))
+        numbers = []
+        strings = []
+        for column, field_idx in enumerate(layout):
+            field_type = types[field_idx][1]
+            if field_type in _STRING_TYPES:
+                strings.append((field_idx, column))
+            else:
+                numbers.append((field_idx, column, _parse_float if field_type == FieldType.FLOAT else _parse_int))
+
+        for field_idx, column, parse in numbers:
+            # Values repeat a lot within a column; parse each one once
+            cache: Dict[str, int] = {}
+            for row_idx, row in enumerate(rows):
+                text = row[column] if column < len(row) else ""
+                value = cache.get(text)
+                if value is None:
+                    try:
+                        value = cache[text] = parse(text)
+                    except ValueError:
+                        raise ValueError(f"Line {lines[row_idx]}: invalid value {text!r} "
+                                         f"for {types[field_idx][0]}") from None
+                values[row_idx * width + field_idx] = value
+
+        if strings:
+            # Row by row, in field order: the block comes out as a full compile lays it out
+            strings.sort()
+            offsets: Dict[str, int] = {"": 0}
+            for row_idx, row in enumerate(rows):
+                base = row_idx * width
+                for field_idx, column in strings:
+                    text = row[column] if column < len(row) else ""
+                    offset = offsets.get(text)
+                    if offset is None:
+                        offset = offsets[text] = self._string(text)
+                    values[base + field_idx] = offset
+        return values
+
+
+def read_csv(path: Path, schema: Optional[SchemaDef] = None, delimiter: Optional[str] = None,
+             string_base: Optional[bytes] = None) -> DBCFile:
+    """Rebuild a DBC from CSV written by write_csv (or edited since)."""
+    reader = CSVReader(path, schema, delimiter, string_base)
+    flat = array('I')
+    for chunk in reader.chunks():
+        flat.extend(chunk)
+    return DBCFile.from_flat(flat, reader.width, reader.strings.build())
+
+
+def convert_csv(path: Path, dbc_path: Path, schema: Optional[SchemaDef] = None,
+                delimiter: Optional[str] = None, string_base: Optional[bytes] = None) -> DBCHeader:
+    """Stream CSV straight into a .dbc file, without holding the records in memory."""
+    reader = CSVReader(path, schema, delimiter, string_base)
+    dbc_path = Path(dbc_path)
+    # A bad row must not leave a half-written file in place of the old one
+    tmp_path = dbc_path.with_name(dbc_path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(b'\0' * DBCParser.HEADER_SIZE)  # Filled in once the counts are known
+            for chunk in reader.chunks():
+                if sys.byteorder == 'big':
+                    chunk.byteswap()
+                f.write(chunk.tobytes())
+            block = reader.strings.build()
+            f.write(block)
+            header = DBCHeader(b'WDBC', reader.count, reader.width, reader.width * 4, len(block))
+            f.seek(0)
+            f.write(struct.pack(DBCParser.HEADER_FORMAT, header.magic, header.record_count, header.field_count,
+                                header.record_size, header.string_block_size))
+        os.replace(tmp_path, dbc_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return header
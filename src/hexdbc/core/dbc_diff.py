@@ -0,0 +1,321 @@
+import struct
+from array import array
+from dataclasses import dataclass
+from itertools import accumulate, chain
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from hexdbc.core.parser import DBCFile
+from hexdbc.core.schema import FieldType, SchemaDef
+
+_STRING_TYPES = (FieldType.STRING, FieldType.LOCSTRING)
+
+# Rows compared per memcmp when scanning aligned runs; only unequal chunks are split
+CHUNK_ROWS = 64
+
+
+@dataclass
+class FieldChange:
+    field_idx: int
+    name: str
+    old: Any  # resolved value: str for strings, float for floats, int otherwise
+    new: Any
+
+
+@dataclass
+class RecordChange:
+    record_id: int
+    kind: str  # 'added', 'removed' or 'changed'
+    old_row: Optional[int]  # index into old.records
+    new_row: Optional[int]  # index into new.records
+
+
+def record_width(dbc: DBCFile) -> int:
+    return len(dbc.records[0]) if dbc.records else 0
+
+
+def padded_flat(dbc: DBCFile, width: int) -> array:
+    """Row-major uint32 values with every record padded (with 0) to width."""
+    flat = dbc.flat()
+    if len(flat) == width * len(dbc.records):
+        return flat
+    return array('I', chain.from_iterable(
+        r[:width] + [0] * (width - len(r)) if len(r) != width else r for r in dbc.records
+    ))
+
+
+def string_texts(block: bytes) -> Dict[int, bytes]:
+    """Offset -> raw bytes of every string that starts in a string block."""
+    parts = block.split(b'\0')
+    offsets = accumulate((len(p) + 1 for p in parts[:-1]), initial=0)
+    return dict(zip(offsets, parts))
+
+
+class StringBlockBuilder:
+    """Builds a deduplicated string block, one offset per distinct text.
+
+    Starting from an existing block keeps its layout: texts already in it
+    map to their first offset and only new texts are appended.
+    """
+
+    def __init__(self, block: Optional[bytes] = None):
+        self._block = bytearray(b'\0' if block is None else block)
+        self._offsets: Dict[bytes, int] = {}
+        for offset, raw in string_texts(bytes(self._block)).items():
+            self._offsets.setdefault(raw, offset)
+
+    def add(self, raw: bytes) -> int:
+        if not raw:
+            return 0  # Offset 0 reads as the empty string, whatever the block holds
+        offset = self._offsets.get(raw)
+        if offset is None:
+            if not self._block:
+                self._block.append(0)  # Offset 0 is the empty string
+            offset = self._offsets[raw] = len(self._block)
+            self._block += raw + b'\0'
+        return offset
+
+    def build(self) -> bytes:
+        return bytes(self._block)
+
+    def copy(self) -> "StringBlockBuilder":
+        """An independent builder in the same state, without rescanning the block."""
+        clone = StringBlockBuilder.__new__(StringBlockBuilder)
+        clone._block = bytearray(self._block)
+        clone._offsets = dict(self._offsets)
+        return clone
+
+
+class StringCanon:
+    """Maps string offsets from any number of DBCs onto shared canonical values.
+
+    The canonical value of a text is its first offset in the reference
+    block, so the reference file's own offsets mostly map to themselves.
+    Texts that are not in the reference get values past its end.
+    """
+
+    def __init__(self, reference: bytes):
+        self._reference_size = len(reference)
+        self._canon: Dict[bytes, int] = {}
+        for offset, text in string_texts(reference).items():
+            self._canon.setdefault(text, offset)
+
+    @property
+    def reference_size(self) -> int:
+        return self._reference_size
+
+    def texts(self) -> Dict[int, bytes]:
+        """Canonical value -> text, for every text seen so far."""
+        return {value: text for text, value in self._canon.items()}
+
+    def value(self, text: bytes) -> int:
+        value = self._canon.get(text)
+        if value is None:
+            value = self._reference_size + len(self._canon)
+            self._canon[text] = value
+        return value
+
+    def offset_map(self, block: bytes, offsets) -> Dict[int, int]:
+        """Canonical value for each offset into block."""
+        texts = string_texts(block)
+        result = {}
+        for offset in offsets:
+            text = texts.get(offset)
+            if text is None:
+                # Pointer into the middle of a string, or past the block (reads as "")
+                end = block.find(b'\0', offset) if offset < len(block) else offset
+                text = block[offset:end] if end >= 0 else block[offset:]
+            result[offset] = self.value(text)
+        return result
+
+
+def canonical_flat(dbc: DBCFile, width: int, str_cols: List[int], canon: StringCanon) -> array:
+    """dbc.flat() with string offsets replaced by canonical values (copied only if needed)."""
+    flat = padded_flat(dbc, width)
+    zeros = array('I', bytes(4 * len(dbc.records)))
+    cols = {}
+    for i in str_cols:
+        col = flat[i::width]
+        # Array equality is a memcmp; most locale columns are entirely empty
+        if col != zeros:
+            cols[i] = col
+
+    # One mapping over every offset in use
+    distinct = {0}
+    for col in cols.values():
+        distinct.update(col)
+    mapping = canon.offset_map(dbc.string_block, distinct)
+    moved = {offset for offset, value in mapping.items() if offset != value}
+    if not moved:
+        return flat
+
+    flat = array('I', flat)
+    remap = mapping.__getitem__
+    for i, col in cols.items():
+        if not moved.isdisjoint(col):
+            flat[i::width] = array('I', map(remap, col))
+    return flat
+
+
+def string_columns(schema: Optional[SchemaDef], width: int) -> List[int]:
+    if not schema:
+        return []
+    return [i for i, f in enumerate(schema.fields[:width]) if f.type in _STRING_TYPES]
+
+
+def resolve_value(dbc: DBCFile, field_type: FieldType, raw: int) -> Any:
+    if field_type in _STRING_TYPES:
+        return dbc.get_string(raw)
+    if field_type == FieldType.FLOAT:
+        return struct.unpack('<f', struct.pack('<I', raw & 0xFFFFFFFF))[0]
+    if field_type == FieldType.INT:
+        return raw - 0x100000000 if raw >= 0x80000000 else raw
+    return raw
+
+
+def id_rows(dbc: DBCFile) -> Dict[int, int]:
+    """Record ID -> row index; the first record wins when an ID repeats."""
+    if not dbc.records:
+        return {}
+    ids = dbc.column(0)
+    rows = dict(zip(reversed(ids), range(len(ids) - 1, -1, -1)))
+    return rows
+
+
+class DBCDiff:
+    """Record-level comparison of two DBCFiles, matching records by ID.
+
+    Rows are compared as packed bytes (with string offsets mapped to shared
+    canonical values when the string blocks differ), so identical records are
+    skipped in bulk. Field-level changes are only worked out on request.
+    """
+
+    def __init__(self, old: DBCFile, new: DBCFile, schema: Optional[SchemaDef] = None,
+                 canon: Optional[StringCanon] = None):
+        """Pass a shared canon to compare several diffs' rows with each other."""
+        self.old = old
+        self.new = new
+        self.schema = schema
+        self.width = width = max(record_width(old), record_width(new))
+
+        if canon is None and old.string_block == new.string_block:
+            # Same offsets mean the same strings
+            self._old_flat = padded_flat(old, width)
+            self._new_flat = padded_flat(new, width)
+        else:
+            canon = canon or StringCanon(old.string_block)
+            str_cols = string_columns(schema, width)
+            self._old_flat = canonical_flat(old, width, str_cols, canon)
+            self._new_flat = canonical_flat(new, width, str_cols, canon)
+
+        self._old_rows = old_rows = id_rows(old)
+        self._new_rows = new_rows = id_rows(new)
+
+        self.removed: List[int] = sorted(old_rows.keys() - new_rows.keys())
+        self.added: List[int] = sorted(new_rows.keys() - old_rows.keys())
+        self.changed: List[int] = sorted(self._find_changed())
+        self.unchanged_count = len(old_rows) - len(self.removed) - len(self.changed)
+
+    def _aligned_runs(self) -> Iterator[Tuple[int, int, int]]:
+        """(old_row, new_row, length) runs of matching IDs stored in the same order."""
+        if not self.old.records:
+            return
+        old_rows, new_rows = self._old_rows, self._new_rows
+        run_old = run_new = run_len = 0
+        for old_row, record_id in enumerate(self.old.column(0)):
+            new_row = new_rows.get(record_id)
+            if new_row is None or old_rows[record_id] != old_row:
+                continue
+            if run_len and old_row == run_old + run_len and new_row == run_new + run_len:
+                run_len += 1
+                continue
+            if run_len:
+                yield run_old, run_new, run_len
+            run_old, run_new, run_len = old_row, new_row, 1
+        if run_len:
+            yield run_old, run_new, run_len
+
+    def _find_changed(self) -> List[int]:
+        old_flat, new_flat, w = self._old_flat, self._new_flat, self.width
+        ids = self.old.column(0) if self.old.records else array('I')
+        changed = []
+        for old_start, new_start, length in self._aligned_runs():
+            for k in range(0, length, CHUNK_ROWS):
+                n = min(CHUNK_ROWS, length - k)
+                a, b = (old_start + k) * w, (new_start + k) * w
+                if old_flat[a:a + n * w] == new_flat[b:b + n * w]:
+                    continue
+                for r in range(n):
+                    if old_flat[a + r * w:a + (r + 1) * w] != new_flat[b + r * w:b + (r + 1) * w]:
+                        changed.append(ids[old_start + k + r])
+        return changed
+
+    @property
+    def identical(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.removed) + len(self.changed)
+
+    def changes(self) -> Iterator[RecordChange]:
+        """Every added, removed or changed record in ID order."""
+        kinds = [(record_id, 'removed') for record_id in self.removed]
+        kinds += [(record_id, 'added') for record_id in self.added]
+        kinds += [(record_id, 'changed') for record_id in self.changed]
+        kinds.sort()
+        for record_id, kind in kinds:
+            yield RecordChange(record_id, kind,
+                               self._old_rows.get(record_id), self._new_rows.get(record_id))
+
+    def field_name(self, field_idx: int) -> str:
+        field_def = self.schema.get_field(field_idx) if self.schema else None
+        return field_def.name if field_def else f"field_{field_idx}"
+
+    def field_type(self, field_idx: int) -> FieldType:
+        field_def = self.schema.get_field(field_idx) if self.schema else None
+        if field_def:
+            return field_def.type
+        return FieldType.INT if field_idx == 0 else FieldType.UINT
+
+    def canonical_row(self, record_id: int, side: str = 'new') -> Optional[array]:
+        """A record's values with string offsets in canonical form (see StringCanon)."""
+        flat, rows = (self._new_flat, self._new_rows) if side == 'new' else (self._old_flat, self._old_rows)
+        row = rows.get(record_id)
+        if row is None:
+            return None
+        return flat[row * self.width:(row + 1) * self.width]
+
+    def changed_fields(self, record_id: int) -> List[int]:
+        """Indices of fields that differ for a record present in both files."""
+        old_row = self._old_rows.get(record_id)
+        new_row = self._new_rows.get(record_id)
+        if old_row is None or new_row is None:
+            return []
+        w = self.width
+        old_vals = self._old_flat[old_row * w:(old_row + 1) * w]
+        new_vals = self._new_flat[new_row * w:(new_row + 1) * w]
+        return [i for i, (a, b) in enumerate(zip(old_vals, new_vals)) if a != b]
+
+    def field_changes(self, record_id: int) -> List[FieldChange]:
+        """Changed fields of a record with names and resolved old/new values."""
+        changes = []
+        for i in self.changed_fields(record_id):
+            old_record = self.old.records[self._old_rows[record_id]]
+            new_record = self.new.records[self._new_rows[record_id]]
+            field_type = self.field_type(i)
+            changes.append(FieldChange(
+                i, self.field_name(i),
+                resolve_value(self.old, field_type, old_record[i]) if i < len(old_record) else None,
+                resolve_value(self.new, field_type, new_record[i]) if i < len(new_record) else None,
+            ))
+        return changes
+
+    def record_values(self, record_id: int, side: str = 'new') -> List[Tuple[str, Any]]:
+        """(field name, resolved value) for a whole record on one side."""
+        dbc, rows = (self.new, self._new_rows) if side == 'new' else (self.old, self._old_rows)
+        row = rows.get(record_id)
+        if row is None:
+            return []
+        return [
+            (self.field_name(i), resolve_value(dbc, self.field_type(i), raw))
+            for i, raw in enumerate(dbc.records[row])
+        ]
@@ -0,0 +1,205 @@
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from hexdbc.core.dbc_diff import DBCDiff, StringCanon, record_width, resolve_value, string_columns
+from hexdbc.core.parser import DBCFile
+from hexdbc.core.schema import FieldType, SchemaDef
+
+MERGE_SIDES = ("ours", "theirs")
+
+
+@dataclass
+class MergeConflict:
+    record_id: int
+    kind: str  # 'field', 'add/add', 'modify/delete' (ours modified) or 'delete/modify'
+    field_idx: Optional[int] = None
+    field_name: str = ""
+    base: Any = None
+    ours: Any = None
+    theirs: Any = None
+    resolution: str = "ours"
+
+    def describe(self) -> str:
+        if self.field_idx is None:
+            what = "ours modified, theirs deleted" if self.kind == "modify/delete" else "ours deleted, theirs modified"
+            return f"{self.record_id}: {self.kind} ({what}) -> {self.resolution}"
+        base = "" if self.kind == "add/add" else f"base={self.base!r} "
+        return (f"{self.record_id}.{self.field_name}: {self.kind} "
+                f"{base}ours={self.ours!r} theirs={self.theirs!r} -> {self.resolution}")
+
+
+@dataclass
+class MergeResult:
+    dbc: DBCFile
+    conflicts: List[MergeConflict] = field(default_factory=list)
+    from_ours: int = 0     # records taken whole from ours (changed there, or on both sides identically)
+    from_theirs: int = 0   # records taken whole from theirs, or deleted because theirs deleted them
+    combined: int = 0      # records changed on both sides and merged field by field
+
+    def format_report(self) -> str:
+        lines = [
+            f"Merged {len(self.dbc.records)} records: {self.from_ours} from ours, "
+            f"{self.from_theirs} from theirs, {self.combined} combined, "
+            f"{len(self.conflicts)} conflicts"
+        ]
+        lines += [f"CONFLICT {c.describe()}" for c in self.conflicts]
+        return "\n".join(lines)
+
+
+class _ThreeWayMerge:
+    def __init__(self, base: DBCFile, ours: DBCFile, theirs: DBCFile,
+                 schema: SchemaDef, prefer: str):
+        self.base = base
+        self.ours = ours
+        self.theirs = theirs
+        self.prefer = prefer
+
+        # One canon for both diffs so ours and theirs rows compare directly
+        self.canon = StringCanon(base.string_block)
+        self.d_ours = DBCDiff(base, ours, schema, self.canon)
+        self.d_theirs = DBCDiff(base, theirs, schema, self.canon)
+        self.width = self.d_ours.width
+        self.str_cols = string_columns(schema, self.width)
+        self._texts: Optional[Dict[int, bytes]] = None
+
+        self.out = array('I')
+        self.result = MergeResult(dbc=None)
+
+    def run(self) -> MergeResult:
+        d_ours, d_theirs = self.d_ours, self.d_theirs
+        o_added, o_changed, o_removed = set(d_ours.added), set(d_ours.changed), set(d_ours.removed)
+        t_added, t_changed, t_removed = set(d_theirs.added), set(d_theirs.changed), set(d_theirs.removed)
+        result = self.result
+
+        # Ours drives record order
+        seen = set()
+        for record_id in (self.ours.column(0) if self.ours.records else ()):
+            if record_id in seen:
+                continue  # duplicate ID: the first record wins, as in DBCDiff
+            seen.add(record_id)
+            ours_row = d_ours.canonical_row(record_id, 'new')
+
+            if record_id in t_removed:
+                if record_id in o_changed:
+                    self._record_conflict(record_id, "modify/delete")
+                    if self.prefer == "ours":
+                        self.out.extend(ours_row)
+                else:
+                    result.from_theirs += 1
+            elif record_id in o_added and record_id in t_added:
+                self._merge_rows(record_id, None, ours_row, d_theirs.canonical_row(record_id, 'new'), "add/add")
+            elif record_id in o_changed and record_id in t_changed:
+                self._merge_rows(record_id, d_ours.canonical_row(record_id, 'old'), ours_row,
+                                 d_theirs.canonical_row(record_id, 'new'), "field")
+            elif record_id in t_changed:
+                self.out.extend(d_theirs.canonical_row(record_id, 'new'))
+                result.from_theirs += 1
+            else:
+                if record_id in o_changed or record_id in o_added:
+                    result.from_ours += 1
+                self.out.extend(ours_row)
+
+        # Deleted in ours: only survives if theirs changed it and wins the conflict
+        for record_id in sorted(o_removed):
+            if record_id in t_changed:
+                self._record_conflict(record_id, "delete/modify")
+                if self.prefer == "theirs":
+                    self.out.extend(d_theirs.canonical_row(record_id, 'new'))
+
+        # New in theirs only, in theirs' order
+        for record_id in (self.theirs.column(0) if self.theirs.records else ()):
+            if record_id in t_added and record_id not in o_added and record_id not in seen:
+                seen.add(record_id)
+                self.out.extend(d_theirs.canonical_row(record_id, 'new'))
+                result.from_theirs += 1
+
+        result.dbc = self._build_dbc()
+        return result
+
+    def _merge_rows(self, record_id: int, base_row: Optional[array],
+                    ours_row: array, theirs_row: array, kind: str) -> None:
+        if ours_row == theirs_row:
+            self.out.extend(ours_row)
+            self.result.from_ours += 1
+            return
+
+        merged = array('I', ours_row)
+        for i, (o, t) in enumerate(zip(ours_row, theirs_row)):
+            if o == t:
+                continue
+            b = base_row[i] if base_row is not None else None
+            if o == b:
+                merged[i] = t
+            elif t == b:
+                continue
+            else:
+                self.result.conflicts.append(MergeConflict(
+                    record_id, kind, i, self.d_ours.field_name(i),
+                    self._display(i, b), self._display(i, o), self._display(i, t), self.prefer,
+                ))
+                if self.prefer == "theirs":
+                    merged[i] = t
+        self.out.extend(merged)
+        self.result.combined += 1
+
+    def _record_conflict(self, record_id: int, kind: str) -> None:
+        self.result.conflicts.append(MergeConflict(record_id, kind, resolution=self.prefer))
+
+    def _display(self, field_idx: int, value: Optional[int]) -> Any:
+        if value is None:
+            return None
+        field_type = self.d_ours.field_type(field_idx)
+        if field_type in (FieldType.STRING, FieldType.LOCSTRING):
+            if self._texts is None:
+                self._texts = self.canon.texts()
+            return self._texts.get(value, b"").decode('utf-8', errors='replace')
+        return resolve_value(self.base, field_type, value)
+
+    def _build_dbc(self) -> DBCFile:
+        # Canonical values below the base block size are base offsets already;
+        # anything else is a new text that gets appended
+        base_size = self.canon.reference_size
+        block = bytearray(self.base.string_block or b'\0')
+        out, width = self.out, self.width
+        appended: Dict[int, int] = {}
+        texts = None
+
+        for i in self.str_cols:
+            col = out[i::width]
+            if not col or max(col) < base_size:
+                continue
+            if texts is None:
+                texts = self.canon.texts()
+            for value in set(col):
+                if value >= base_size and value not in appended:
+                    appended[value] = len(block)
+                    block += texts[value] + b'\0'
+            out[i::width] = array('I', [appended.get(v, v) for v in col])
+
+        return DBCFile.from_flat(out, width, bytes(block), field_count=self.ours.header.field_count)
+
+
+def merge_dbc(base: DBCFile, ours: DBCFile, theirs: DBCFile,
+              schema: Optional[SchemaDef] = None, prefer: str = "ours") -> MergeResult:
+    """Three-way merge of DBC records by ID and field.
+
+    A field only conflicts when ours and theirs both changed it from base to
+    different values; conflicts are resolved in favour of `prefer` and listed
+    in the result. Records changed on one side only are taken whole.
+    Without a schema, column types are inferred so string offsets can be
+    matched across the three string blocks.
+    """
+    if prefer not in MERGE_SIDES:
+        raise ValueError(f"prefer must be one of {MERGE_SIDES}, got {prefer!r}")
+
+    widths = {record_width(dbc) for dbc in (base, ours, theirs) if dbc.records}
+    if len(widths) > 1:
+        raise ValueError(f"Cannot merge DBCs with different record widths: {sorted(widths)}")
+
+    if schema is None:
+        from hexdbc.core.column_profiler import infer_schema
+        sample_from = next((dbc for dbc in (base, ours, theirs) if dbc.records), base)
+        schema = infer_schema(sample_from)
+
+    return _ThreeWayMerge(base, ours, theirs, schema, prefer).run()
@@ -0,0 +1,257 @@
+import struct
+import zlib
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
+
+from hexdbc.core.dbc_diff import DBCDiff, StringBlockBuilder, id_rows, padded_flat, record_width, string_columns
+from hexdbc.core.parser import DBCFile, DBCHeader
+from hexdbc.core.schema import SchemaDef
+
+PATCH_MAGIC = b'HXDP'
+PATCH_VERSION = 1
+PATCH_SUFFIX = '.hxpatch'
+
+# magic, version, base record count, base width, base string block size,
+# new record count, new field count, new record size, new width
+_HEADER = struct.Struct('<4sHIIIIIII')
+_COUNT = struct.Struct('<I')
+_PAIR = struct.Struct('<II')
+_UPDATE = struct.Struct('<IIH')  # record_id, base row, field count
+_FIELD = struct.Struct('<HII')  # field_idx, old, new
+
+Update = Tuple[int, int, List[Tuple[int, int, int]]]  # record_id, base row, (field_idx, old, new)
+
+
+@dataclass
+class DBCPatch:
+    """Changes that turn one version of a DBC into another, keyed by record ID.
+
+    Deletes and updates carry the base row each record was at, so applying
+    goes straight to it (checking the ID) instead of indexing the table.
+    Updates also carry the old values, which catches a patch being applied
+    to the wrong base. New strings are appended to the base string block.
+    """
+    base_count: int
+    base_width: int
+    base_block_size: int
+    header: DBCHeader  # Of the new version
+    width: int
+    appended: bytes = b""
+    deleted: List[Tuple[int, int]] = field(default_factory=list)  # (record_id, base row)
+    updated: List[Update] = field(default_factory=list)
+    inserted: List[Tuple[int, List[int]]] = field(default_factory=list)  # (new row, values), by row
+    order: List[int] = field(default_factory=list)  # Every new ID in order, only when rows were moved
+
+    def __len__(self) -> int:
+        return len(self.deleted) + len(self.updated) + len(self.inserted)
+
+    def encode(self) -> bytes:
+        header = self.header
+        parts = [_COUNT.pack(len(self.appended)), self.appended, _COUNT.pack(len(self.deleted))]
+        parts += [_PAIR.pack(record_id, row) for record_id, row in self.deleted]
+        parts.append(_COUNT.pack(len(self.updated)))
+        for record_id, row, fields in self.updated:
+            parts.append(_UPDATE.pack(record_id, row, len(fields)))
+            parts += [_FIELD.pack(*change) for change in fields]
+        parts.append(_COUNT.pack(len(self.inserted)))
+        for row, values in self.inserted:
+            parts.append(_COUNT.pack(row))
+            parts.append(struct.pack(f'<{self.width}I', *values))
+        parts.append(_COUNT.pack(len(self.order)))
+        parts.append(struct.pack(f'<{len(self.order)}I', *self.order))
+        return _HEADER.pack(PATCH_MAGIC, PATCH_VERSION, self.base_count, self.base_width, self.base_block_size,
+                            header.record_count, header.field_count, header.record_size,
+                            self.width) + zlib.compress(b"".join(parts), 9)
+
+    @classmethod
+    def decode(cls, data: bytes) -> "DBCPatch":
+        if len(data) < _HEADER.size:
+            raise ValueError("File too small to be a DBC patch")
+        (magic, version, base_count, base_width, base_block_size,
+         count, field_count, record_size, width) = _HEADER.unpack_from(data)
+        if magic != PATCH_MAGIC:
+            raise ValueError(f"Invalid DBC patch magic: {magic}")
+        if version != PATCH_VERSION:
+            raise ValueError(f"Unsupported DBC patch version: {version}")
+        try:
+            body = zlib.decompress(data[_HEADER.size:])
+        except zlib.error as e:
+            raise ValueError(f"Corrupt DBC patch: {e}") from None
+
+        patch = cls(base_count, base_width, base_block_size, None, width)
+        try:
+            pos = 0
+            (size,) = _COUNT.unpack_from(body, pos)
+            patch.appended = body[pos + 4:pos + 4 + size]
+            pos += 4 + size
+            (size,) = _COUNT.unpack_from(body, pos)
+            pos += 4
+            for _ in range(size):
+                patch.deleted.append(_PAIR.unpack_from(body, pos))
+                pos += _PAIR.size
+            (size,) = _COUNT.unpack_from(body, pos)
+            pos += 4
+            for _ in range(size):
+                record_id, row, fields = _UPDATE.unpack_from(body, pos)
+                pos += _UPDATE.size
+                changes = [_FIELD.unpack_from(body, pos + i * _FIELD.size) for i in range(fields)]
+                pos += fields * _FIELD.size
+                patch.updated.append((record_id, row, changes))
+            (size,) = _COUNT.unpack_from(body, pos)
+            pos += 4
+            values = struct.Struct(f'<I{width}I')
+            for _ in range(size):
+                row, *record = values.unpack_from(body, pos)
+                pos += values.size
+                patch.inserted.append((row, record))
+            (size,) = _COUNT.unpack_from(body, pos)
+            patch.order = list(struct.unpack_from(f'<{size}I', body, pos + 4))
+        except struct.error:
+            raise ValueError("Truncated DBC patch") from None
+        block_size = base_block_size + len(patch.appended)
+        patch.header = DBCHeader(b'WDBC', count, field_count, record_size, block_size)
+        return patch
+
+
+class _StringRemap:
+    """New-version string offsets -> offsets in the base block plus appended texts."""
+
+    def __init__(self, base: DBCFile, new: DBCFile):
+        self.new_block = new.string_block
+        self.strings = StringBlockBuilder(base.string_block)
+        self.base_size = len(base.string_block)
+        self._offsets: Dict[int, int] = {0: 0}
+
+    def __call__(self, offset: int) -> int:
+        result = self._offsets.get(offset)
+        if result is None:
+            block = self.new_block
+            end = block.find(b'\0', offset) if offset < len(block) else offset
+            raw = block[offset:end if end != -1 else len(block)]
+            result = self._offsets[offset] = self.strings.add(raw)
+        return result
+
+    def appended(self) -> bytes:
+        return self.strings.build()[self.base_size:]
+
+
+def make_patch(base: DBCFile, new: DBCFile, schema: Optional[SchemaDef] = None) -> bytes:
+    """Encoded patch from base to new.
+
+    When new's string block extends base's (as imports that start from
+    base's block leave it), offsets are kept and apply_patch gives back new byte
+    for byte. Otherwise string fields (from schema, or inferred) are matched
+    by text, and only texts base lacks are appended.
+    """
+    for dbc in (base, new):
+        if len(id_rows(dbc)) != len(dbc.records):
+            raise ValueError("Record IDs repeat; patches are keyed by ID")
+    width = record_width(new) if new.records else new.header.record_size // 4
+    remap = None
+    if new.string_block.startswith(base.string_block):
+        # Base offsets mean the same in new: compare raw values
+        diff = DBCDiff(base, new)
+        appended = new.string_block[len(base.string_block):]
+    else:
+        if schema is None:
+            from hexdbc.core.column_profiler import infer_schema
+            schema = infer_schema(new if new.records else base)
+        diff = DBCDiff(base, new, schema)
+        remap = _StringRemap(base, new)
+        appended = b""
+    str_cols = set(string_columns(schema, width)) if remap else set()
+
+    def values_of(row: int) -> List[int]:
+        values = new_flat[row * width:(row + 1) * width].tolist()
+        for i in str_cols:
+            values[i] = remap(values[i])
+        return values
+
+    new_flat = padded_flat(new, width)
+    base_flat = padded_flat(base, diff.width)
+    base_rows, new_rows = id_rows(base), id_rows(new)
+    patch = DBCPatch(len(base.records), record_width(base) if base.records else base.header.record_size // 4,
+                     len(base.string_block), None, width)
+    patch.deleted = [(record_id, base_rows[record_id]) for record_id in diff.removed]
+    for record_id in diff.changed:
+        base_row, new_row = base_rows[record_id], new_rows[record_id]
+        fields = [i for i in diff.changed_fields(record_id) if i < width]
+        if not fields:
+            continue  # Only fields the new version drops
+        values = values_of(new_row)
+        patch.updated.append((record_id, base_row,
+                              [(i, base_flat[base_row * diff.width + i], values[i]) for i in fields]))
+    patch.inserted = sorted((new_rows[record_id], values_of(new_rows[record_id])) for record_id in diff.added)
+
+    # Rows kept from base must stay in base order, or the patch lists the whole new order
+    added, removed = set(diff.added), set(diff.removed)
+    kept_base = [record_id for record_id in base.column(0) if record_id not in removed] if base.records else []
+    kept_new = [record_id for record_id in new.column(0) if record_id not in added] if new.records else []
+    if kept_base != kept_new:
+        patch.order = new.column(0).tolist()
+
+    patch.appended = remap.appended() if remap else appended
+    patch.header = DBCHeader(b'WDBC', len(new.records), new.header.field_count, new.header.record_size,
+                             len(base.string_block) + len(patch.appended))
+    return patch.encode()
+
+
+def _id_index(records: List[List[int]]) -> Dict[int, int]:
+    return dict(zip(map(itemgetter(0), records), range(len(records))))
+
+
+def _locate(records: List[List[int]], record_id: int, row: int, index: Dict[int, int]) -> int:
+    """Row of a record: the patch's row when it holds the ID, else from the index."""
+    if row < len(records) and records[row] and records[row][0] == record_id:
+        return row
+    if not index:
+        index.update(_id_index(records))  # Only when the base differs from the one the patch was made on
+    found = index.get(record_id)
+    if found is None:
+        raise ValueError(f"Record {record_id} is not in the base DBC")
+    return found
+
+
+def apply_patch(base: DBCFile, patch: bytes) -> DBCFile:
+    """Apply an encoded patch to base, which is left as it was.
+
+    Work is proportional to the patch: changed records are found through
+    their base rows, and only they are copied.
+    """
+    patch = DBCPatch.decode(patch)
+    if len(base.records) != patch.base_count or len(base.string_block) != patch.base_block_size:
+        raise ValueError(f"Patch is for a base with {patch.base_count} records and a "
+                         f"{patch.base_block_size}-byte string block, not {len(base.records)} and "
+                         f"{len(base.string_block)}")
+    records = list(base.records)
+    width = patch.width
+    if records and patch.base_width != width:
+        # Fields were added or dropped: every record changes
+        records = [(record + [0] * (width - len(record)))[:width] for record in records]
+    index: Dict[int, int] = {}
+
+    for record_id, row, fields in patch.updated:
+        row = _locate(records, record_id, row, index)
+        record = list(records[row])
+        for field_idx, old, new in fields:
+            current = record[field_idx] if field_idx < len(record) else 0
+            if current != old:
+                raise ValueError(f"Record {record_id}: field {field_idx} is {current}, the patch expects "
+                                 f"{old} (is this the right base?)")
+            record[field_idx] = new
+        records[row] = record
+    for row in sorted((_locate(records, record_id, row, index) for record_id, row in patch.deleted),
+                      reverse=True):
+        del records[row]
+    for row, values in patch.inserted:
+        records.insert(row, values)
+
+    if patch.order:
+        rows = _id_index(records)
+        records = [records[rows[record_id]] for record_id in patch.order]
+    if len(records) != patch.header.record_count:
+        raise ValueError(f"Patch gave {len(records)} records, expected {patch.header.record_count}")
+    header = DBCHeader(b'WDBC', len(records), patch.header.field_count, patch.header.record_size,
+                       patch.header.string_block_size)
+    return DBCFile(header=header, records=records, string_block=base.string_block + patch.appended)
@@ -0,0 +1,425 @@
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from time import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from hexdbc.core.dbc_diff import (
+    DBCDiff, id_rows, padded_flat, record_width, resolve_value, string_columns, string_texts,
+)
+from hexdbc.core.parser import DBCFile
+from hexdbc.core.schema import FieldType, SchemaDef
+
+OP_SET = 0     # field changed on a record that exists on both sides
+OP_ADD = 1     # record added: field 0 plus every non-default field
+OP_REMOVE = 2  # record removed: field 0 plus the old value of every non-default field
+
+_OP_MASK = 0x0F
+_STRING_FLAG = 0x80
+
+# (record_id, field_idx) packs into one int key; fields fit in 16 bits
+_FIELD_BITS = 16
+
+
+@dataclass
+class JournalEntry:
+    index: int
+    group: int
+    record_id: int
+    field_idx: int
+    op: int
+    old: Any  # raw uint32, or str for string fields
+    new: Any
+
+
+@dataclass
+class JournalGroup:
+    index: int
+    label: str
+    timestamp: float
+    start: int  # first entry
+    stop: int   # one past the last entry
+    undo_of: Optional[int] = None
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+
+class EditJournal:
+    """Append-only log of field edits made to a DBC since it was opened.
+
+    Entries are (record_id, field_idx, old, new) in parallel typed arrays,
+    roughly 20 bytes each, grouped into the operations that undo and the
+    history view work on. String fields are logged as interned text since
+    offsets change on every save. Undoing a group appends its inverse as a
+    new group rather than rewriting the log.
+    """
+
+    def __init__(self, baseline: DBCFile, schema: Optional[SchemaDef] = None):
+        self.baseline = baseline
+        self.schema = schema
+        self.width = record_width(baseline) or baseline.header.field_count
+        self._str_cols = frozenset(string_columns(schema, self.width))
+        self._base_rows: Optional[Dict[int, int]] = None
+
+        self._record_ids = array('I')
+        self._fields = array('H')
+        self._old = array('I')
+        self._new = array('I')
+        self._flags = array('B')
+
+        self._group_starts = array('I')
+        self._group_times = array('d')
+        self._group_undo_of = array('i')
+        self._group_labels: List[str] = []
+
+        self._texts: List[str] = []
+        self._text_ids: Dict[str, int] = {}
+
+        # Packed (record, field) -> entry holding its current value
+        self._latest: Dict[int, int] = {}
+        # Record ID -> OP_ADD / OP_REMOVE of its most recent add or remove
+        self._record_ops: Dict[int, int] = {}
+
+        self._undone: Set[int] = set()
+        self._saved_group = 0
+        self._visible_from = 0
+
+        # Called with the index of every new group (e.g. to persist it)
+        self.listeners: List[Callable[[int], None]] = []
+
+    def __len__(self) -> int:
+        return len(self._record_ids)
+
+    @property
+    def group_count(self) -> int:
+        return len(self._group_labels)
+
+    @property
+    def has_unsaved(self) -> bool:
+        return self._saved_group < self.group_count
+
+    @property
+    def memory_bytes(self) -> int:
+        arrays = (self._record_ids, self._fields, self._old, self._new, self._flags,
+                  self._group_starts, self._group_times, self._group_undo_of)
+        return sum(a.itemsize * len(a) for a in arrays) + sum(len(t) for t in self._texts)
+
+    def mark_saved(self) -> None:
+        self._saved_group = self.group_count
+
+    def clear(self) -> None:
+        """Hide everything logged so far from the history and from undo."""
+        self._visible_from = self.group_count
+
+    # Values
+
+    def field_name(self, field_idx: int) -> str:
+        field_def = self.schema.get_field(field_idx) if self.schema else None
+        return field_def.name if field_def else f"field_{field_idx}"
+
+    def field_type(self, field_idx: int) -> FieldType:
+        field_def = self.schema.get_field(field_idx) if self.schema else None
+        if field_def:
+            return field_def.type
+        return FieldType.INT if field_idx == 0 else FieldType.UINT
+
+    def display_value(self, field_idx: int, value: Any) -> Any:
+        """A logged value as the user sees it: float, signed int or text."""
+        if isinstance(value, str):
+            return value
+        return resolve_value(self.baseline, self.field_type(field_idx), value)
+
+    def row_from(self, dbc: DBCFile, record: List[int]) -> List[Any]:
+        """A record in journal form: raw uint32 values, strings as text."""
+        values = list(record[:self.width])
+        values += [0] * (self.width - len(values))
+        for i in self._str_cols:
+            values[i] = dbc.get_string(values[i])
+        return values
+
+    def _default_row(self, record_id: int) -> List[Any]:
+        values: List[Any] = [0] * self.width
+        for i in self._str_cols:
+            values[i] = ""
+        values[0] = record_id
+        return values
+
+    def _baseline_row(self, record_id: int) -> Optional[List[Any]]:
+        if self._base_rows is None:
+            self._base_rows = id_rows(self.baseline)
+        row = self._base_rows.get(record_id)
+        if row is None:
+            return None
+        return self.row_from(self.baseline, self.baseline.records[row])
+
+    def current_row(self, record_id: int) -> Optional[List[Any]]:
+        """A record's values with every logged change applied; None if it doesn't exist."""
+        op = self._record_ops.get(record_id)
+        if op == OP_REMOVE:
+            return None
+        values = self._default_row(record_id) if op == OP_ADD else self._baseline_row(record_id)
+        if values is None:
+            return None
+        latest = self._latest
+        key = record_id << _FIELD_BITS
+        for i in range(self.width):
+            entry = latest.get(key | i)
+            if entry is not None:
+                values[i] = self._decode(self._new[entry], self._flags[entry])
+        return values
+
+    def _encode(self, value: Any) -> int:
+        if isinstance(value, str):
+            text_id = self._text_ids.get(value)
+            if text_id is None:
+                text_id = self._text_ids[value] = len(self._texts)
+                self._texts.append(value)
+            return text_id
+        return value & 0xFFFFFFFF
+
+    def _decode(self, stored: int, flags: int) -> Any:
+        return self._texts[stored] if flags & _STRING_FLAG else stored
+
+    # Logging
+
+    def _append(self, record_id: int, field_idx: int, old: Any, new: Any, op: int) -> None:
+        index = len(self._record_ids)
+        self._record_ids.append(record_id)
+        self._fields.append(field_idx)
+        self._old.append(self._encode(old))
+        self._new.append(self._encode(new))
+        self._flags.append(op | (_STRING_FLAG if field_idx in self._str_cols else 0))
+        if op != OP_REMOVE:
+            self._latest[(record_id << _FIELD_BITS) | field_idx] = index
+
+    def _forget_fields(self, record_id: int) -> None:
+        key = record_id << _FIELD_BITS
+        for i in range(self.width):
+            self._latest.pop(key | i, None)
+
+    def _row_entries(self, record_id: int, old_row: Optional[List[Any]],
+                     new_row: Optional[List[Any]]) -> Iterator[Tuple[int, int, Any, Any]]:
+        """(field_idx, op, old, new) entries that turn old_row into new_row."""
+        if old_row is None and new_row is None:
+            return
+        if old_row is None or new_row is None:
+            op = OP_ADD if old_row is None else OP_REMOVE
+            default = self._default_row(record_id)
+            for i, value in enumerate(new_row if old_row is None else old_row):
+                if i == 0 or value != default[i]:
+                    yield (i, op, default[i], value) if op == OP_ADD else (i, op, value, default[i])
+            return
+        for i, (old, new) in enumerate(zip(old_row, new_row)):
+            if old != new:
+                yield i, OP_SET, old, new
+
+    def _log(self, record_id: int, field_idx: int, op: int, old: Any, new: Any) -> None:
+        # Field 0 comes first in every add/remove and resets the record
+        if field_idx == 0 and op != OP_SET:
+            self._forget_fields(record_id)
+            self._record_ops[record_id] = op
+        self._append(record_id, field_idx, old, new, op)
+
+    def _close_group(self, start: int, label: Optional[str], undo_of: Optional[int],
+                     timestamp: Optional[float] = None) -> Optional[int]:
+        if undo_of is not None:
+            self._undone.add(undo_of)
+        if len(self._record_ids) == start:
+            return None
+
+        group = self.group_count
+        self._group_starts.append(start)
+        self._group_times.append(time() if timestamp is None else timestamp)
+        self._group_undo_of.append(-1 if undo_of is None else undo_of)
+        self._group_labels.append(label or self._describe(start, len(self._record_ids)))
+        for listener in self.listeners:
+            listener(group)
+        return group
+
+    def capture(self, rows: Dict[int, Optional[List[Any]]], label: Optional[str] = None,
+                undo_of: Optional[int] = None) -> Optional[int]:
+        """Log the difference between the current state and new record values.
+
+        rows maps record ID -> values in journal form (see row_from), or None
+        for a record that no longer exists. Returns the new group, or None
+        when nothing actually changed.
+        """
+        start = len(self._record_ids)
+        for record_id, new_row in rows.items():
+            old_row = self.current_row(record_id)
+            for field_idx, op, old, new in self._row_entries(record_id, old_row, new_row):
+                self._log(record_id, field_idx, op, old, new)
+        return self._close_group(start, label, undo_of)
+
+    def replay(self, label: str, timestamp: float, undo_of: Optional[int],
+               entries: Iterable[Tuple[int, int, int, Any, Any]]) -> Optional[int]:
+        """Re-log a group exactly as recorded: (record_id, field_idx, op, old, new) entries."""
+        start = len(self._record_ids)
+        for record_id, field_idx, op, old, new in entries:
+            self._log(record_id, field_idx, op, old, new)
+        return self._close_group(start, label, undo_of, timestamp)
+
+    def capture_dbc(self, dbc: DBCFile, label: Optional[str] = None) -> Optional[int]:
+        """Log whatever separates the current state from a freshly parsed DBC."""
+        diff = DBCDiff(self.baseline, dbc, self.schema)
+        candidates = set(diff.added).union(diff.removed, diff.changed, self._record_ids)
+        rows_by_id = id_rows(dbc)
+        rows = {}
+        for record_id in sorted(candidates):
+            row = rows_by_id.get(record_id)
+            rows[record_id] = self.row_from(dbc, dbc.records[row]) if row is not None else None
+        return self.capture(rows, label)
+
+    def _describe(self, start: int, stop: int) -> str:
+        records = set(self._record_ids[start:stop])
+        if len(records) > 1:
+            return f"Edit {len(records)} records"
+        record_id = self._record_ids[start]
+        op = self._flags[start] & _OP_MASK
+        if op == OP_ADD:
+            return f"Add {record_id}"
+        if op == OP_REMOVE:
+            return f"Remove {record_id}"
+        if stop - start == 1:
+            return f"{self.field_name(self._fields[start])} of {record_id}"
+        return f"Edit {record_id} ({stop - start} fields)"
+
+    # Review
+
+    def _group_stop(self, group: int) -> int:
+        return self._group_starts[group + 1] if group + 1 < self.group_count else len(self._record_ids)
+
+    def group(self, group: int) -> JournalGroup:
+        undo_of = self._group_undo_of[group]
+        return JournalGroup(group, self._group_labels[group], self._group_times[group],
+                            self._group_starts[group], self._group_stop(group),
+                            undo_of if undo_of >= 0 else None)
+
+    def groups(self) -> List[JournalGroup]:
+        """Visible groups, oldest first."""
+        return [self.group(g) for g in range(self._visible_from, self.group_count)]
+
+    def entry(self, index: int) -> JournalEntry:
+        flags = self._flags[index]
+        return JournalEntry(
+            index, bisect_right(self._group_starts, index) - 1,
+            self._record_ids[index], self._fields[index], flags & _OP_MASK,
+            self._decode(self._old[index], flags), self._decode(self._new[index], flags),
+        )
+
+    def entries(self, group: int) -> List[JournalEntry]:
+        return [self.entry(i) for i in range(self._group_starts[group], self._group_stop(group))]
+
+    def is_undone(self, group: int) -> bool:
+        return group in self._undone
+
+    def touched_records(self, since_group: int = 0) -> Set[int]:
+        """IDs of every record with an entry in since_group or later."""
+        if since_group >= self.group_count:
+            return set()
+        return set(self._record_ids[self._group_starts[since_group]:])
+
+    # Undo
+
+    def last_undoable(self) -> Optional[int]:
+        """Most recent visible group that is not an undo and has not been undone."""
+        for group in range(self.group_count - 1, self._visible_from - 1, -1):
+            if group not in self._undone and self._group_undo_of[group] < 0:
+                return group
+        return None
+
+    def _rewind(self, start: int, stop: int) -> Dict[int, Optional[List[Any]]]:
+        """Current values of the records in entries [start, stop) with those entries reverted."""
+        rows: Dict[int, Optional[List[Any]]] = {}
+        for i in reversed(range(start, stop)):
+            record_id = self._record_ids[i]
+            flags = self._flags[i]
+            op = flags & _OP_MASK
+            if record_id not in rows:
+                rows[record_id] = self.current_row(record_id)
+            if op == OP_ADD:
+                rows[record_id] = None
+                continue
+            row = rows[record_id]
+            if row is None:
+                if op != OP_REMOVE:
+                    continue  # removed again later; nothing left to revert
+                row = rows[record_id] = self._default_row(record_id)
+            row[self._fields[i]] = self._decode(self._old[i], flags)
+        return rows
+
+    def undo_rows(self, group: int) -> Dict[int, Optional[List[Any]]]:
+        """Record values that reverse one group, applied on top of the current state.
+
+        Only the fields the group touched are reverted, so later edits to
+        other fields of the same records survive.
+        """
+        return self._rewind(self._group_starts[group], self._group_stop(group))
+
+    def net_entries(self, since_group: int = 0) -> List[Tuple[int, int, int, Any, Any]]:
+        """The fewest (record_id, field_idx, op, old, new) entries with the same
+        effect as every group from since_group on."""
+        if since_group >= self.group_count:
+            return []
+        before = self._rewind(self._group_starts[since_group], len(self._record_ids))
+        entries = []
+        for record_id in sorted(before):
+            for field_idx, op, old, new in self._row_entries(record_id, before[record_id],
+                                                             self.current_row(record_id)):
+                entries.append((record_id, field_idx, op, old, new))
+        return entries
+
+    # Saving
+
+    def build_dbc(self, order: Optional[Iterable[int]] = None) -> DBCFile:
+        """The baseline with every logged change applied.
+
+        order lists record IDs in output order; by default the baseline order
+        followed by added records. Untouched records are copied as-is with
+        their string offsets; new strings are appended to the baseline block.
+        """
+        baseline, width = self.baseline, self.width
+        touched = set(self._record_ids)
+        base_rows = id_rows(baseline)
+        if order is None:
+            ids = baseline.column(0) if baseline.records else array('I')
+            order = [record_id for record_id in dict.fromkeys(ids)]
+            order += [record_id for record_id, op in self._record_ops.items()
+                      if op == OP_ADD and record_id not in base_rows]
+
+        base_flat = padded_flat(baseline, width) if baseline.records else array('I')
+        block = bytearray(baseline.string_block or b'\0')
+        offsets: Optional[Dict[str, int]] = None
+        flat = array('I')
+        str_cols = sorted(self._str_cols)
+
+        for record_id in order:
+            if record_id not in touched:
+                row = base_rows.get(record_id)
+                if row is not None:
+                    flat.extend(base_flat[row * width:(row + 1) * width])
+                continue
+
+            values = self.current_row(record_id)
+            if values is None:
+                continue
+            if str_cols and offsets is None:
+                offsets = self._block_offsets(baseline.string_block)
+            for i in str_cols:
+                text = values[i]
+                offset = offsets.get(text)
+                if offset is None:
+                    offset = offsets[text] = len(block)
+                    block += text.encode('utf-8') + b'\0'
+                values[i] = offset
+            flat.extend(values)
+
+        return DBCFile.from_flat(flat, width, bytes(block), field_count=baseline.header.field_count)
+
+    @staticmethod
+    def _block_offsets(block: bytes) -> Dict[str, int]:
+        offsets: Dict[str, int] = {"": 0}
+        for offset, raw in string_texts(block).items():
+            offsets.setdefault(raw.decode('utf-8', errors='replace'), offset)
+        return offsets
@@ -0,0 +1,129 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from hexdbc.core.parser import DBCHeader, DBCParser
+from hexdbc.core.schema import SchemaManager
+
+# Header reads are I/O-bound; threads overlap them on slow or network drives
+MAX_HEADER_WORKERS = 16
+
+SCHEMA_MATCH = 'match'
+SCHEMA_MISMATCH = 'mismatch'
+SCHEMA_NONE = 'none'        # No built-in schema; one is inferred when the file is opened
+SCHEMA_INVALID = 'invalid'  # Header could not be read
+
+
+@dataclass
+class CatalogEntry:
+    path: Path
+    size: int
+    mtime_ns: int
+    header: Optional[DBCHeader] = None
+    error: str = ""
+    schema_fields: Optional[int] = None  # Field count of the table's schema, if it has one
+
+    @property
+    def name(self) -> str:
+        return self.path.stem
+
+    @property
+    def truncated(self) -> bool:
+        """The header promises more data than the file holds."""
+        header = self.header
+        if header is None:
+            return False
+        expected = DBCParser.HEADER_SIZE + header.record_count * header.record_size + header.string_block_size
+        return self.size < expected
+
+    @property
+    def schema_status(self) -> str:
+        if self.header is None:
+            return SCHEMA_INVALID
+        if self.schema_fields is None:
+            return SCHEMA_NONE
+        return SCHEMA_MATCH if self.schema_fields == self.header.field_count else SCHEMA_MISMATCH
+
+    def describe(self) -> str:
+        """Multi-line summary for a tooltip."""
+        lines = [f"{self.path.name} ({self.size:,} bytes)"]
+        if self.header is None:
+            lines.append(f"Unreadable: {self.error}")
+            return "\n".join(lines)
+        header = self.header
+        lines.append(f"{header.record_count:,} records × {header.field_count} fields "
+                     f"({header.record_size} bytes each), {header.string_block_size:,} bytes of strings")
+        status = self.schema_status
+        if status == SCHEMA_MISMATCH:
+            lines.append(f"Layout does not match the schema: {header.field_count} fields in the file, "
+                         f"{self.schema_fields} in the schema")
+        elif status == SCHEMA_NONE:
+            lines.append("No built-in schema; field types will be inferred")
+        if header.record_size != header.field_count * 4:
+            lines.append("Record size is not 4 bytes per field")
+        if self.truncated:
+            lines.append("File is shorter than its header says (truncated?)")
+        return "\n".join(lines)
+
+
+class FolderCatalog:
+    """Header-only summary of every DBC in a folder.
+
+    Only the 20-byte headers are read, in parallel threads. Entries are
+    cached per path and reused while the file's size and mtime are
+    unchanged, so rescanning a folder only touches files that changed.
+    """
+
+    def __init__(self, schema_manager: SchemaManager, parser: Optional[DBCParser] = None):
+        self.schema_manager = schema_manager
+        self.parser = parser or DBCParser()
+        self._cache: Dict[Path, CatalogEntry] = {}
+
+    def _read(self, path: Path, size: int, mtime_ns: int) -> CatalogEntry:
+        entry = CatalogEntry(path, size, mtime_ns)
+        try:
+            entry.header = self.parser.read_header(path)
+        except (OSError, ValueError) as e:
+            entry.error = str(e)
+        return entry
+
+    def scan(self, folder: Path) -> List[CatalogEntry]:
+        """Catalog the *.dbc files in folder, sorted by name."""
+        found: List[Tuple[Path, int, int]] = []
+        with os.scandir(folder) as it:
+            for dir_entry in it:
+                if not dir_entry.name.lower().endswith('.dbc'):
+                    continue
+                try:
+                    if not dir_entry.is_file():
+                        continue
+                    st = dir_entry.stat()
+                except OSError:
+                    continue
+                found.append((Path(dir_entry.path), st.st_size, st.st_mtime_ns))
+
+        entries: Dict[Path, CatalogEntry] = {}
+        stale = []
+        for path, size, mtime_ns in found:
+            cached = self._cache.get(path)
+            if cached is not None and (cached.size, cached.mtime_ns) == (size, mtime_ns):
+                entries[path] = cached
+            else:
+                stale.append((path, size, mtime_ns))
+
+        if stale:
+            workers = min(MAX_HEADER_WORKERS, len(stale))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for entry in pool.map(lambda args: self._read(*args), stale):
+                    entries[entry.path] = entry
+
+        for entry in entries.values():
+            # Schemas can be registered at any time, so this is not cached
+            entry.schema_fields = self.schema_manager.get_field_count(entry.name)
+        self._cache.update(entries)
+        return sorted(entries.values(), key=lambda entry: entry.path.name.lower())
+
+    def entry(self, path: Path) -> Optional[CatalogEntry]:
+        return self._cache.get(Path(path))
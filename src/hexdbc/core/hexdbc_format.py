@@ -1,18 +1,49 @@
+import math
 import struct
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, Iterator, List, Optional, Dict, Any, Tuple, Union
 
+from hexdbc.core.hexdbc_lexer import strip_comment
 from hexdbc.core.parser import DBCFile, DBCHeader
 from hexdbc.core.schema import SchemaManager, SchemaDef, FieldType, FieldDef
 
+if TYPE_CHECKING:
+    from hexdbc.core.dbc_diff import DBCDiff
+
+# Records per chunk yielded by generate_changes
+CHUNK_RECORDS = 256
+# Removed record IDs listed in a change file's header before it just counts them
+MAX_LISTED_REMOVED = 50
+
+_F32 = struct.Struct('<f')
+_U32 = struct.Struct('<I')
+
+
+def format_float(bits: int) -> str:
+    """Shortest decimal that reads back as the same float32; NaNs keep their raw bits as hex."""
+    value = _F32.unpack(_U32.pack(bits))[0]
+    if math.isnan(value):
+        return f"0x{bits:08X}"
+    if math.isinf(value):
+        return repr(value)
+    packed = _F32.pack(value)
+    for digits in range(6, 9):
+        text = f"{value:.{digits}g}"
+        if _F32.pack(float(text)) == packed:
+            return text
+    return f"{value:.9g}"
+
 
 class HexDBCGenerator:
     def __init__(self, schema_manager: Optional[SchemaManager] = None):
         # Use provided schema manager or create a new one
         self.schema_manager = schema_manager or SchemaManager()
+        # (record_id, 0-based header line) for the last generated text
+        self.record_lines: List[Tuple[int, int]] = []
     
     def generate(self, dbc: DBCFile, dbc_name: str = "Unknown") -> str:
         lines = []
+        record_lines = []
 
         # Header info
         lines.append(f"# {dbc_name}.dbc - Generated by HexDBC")
@@ -23,8 +54,8 @@ class HexDBCGenerator:
         # Fetch schema; fallback if missing
         schema = self.schema_manager.get_schema(dbc_name)
         if not schema:
-            schema = self.schema_manager.generate_fallback_schema(dbc.header.field_count, dbc_name)
-            lines.append(f"# Note: No built-in schema for {dbc_name}, using auto-generated fallback")
+            schema = self.schema_manager.generate_fallback_schema(dbc.header.field_count, dbc_name, dbc)
+            lines.append(f"# Note: No built-in schema for {dbc_name}, column types inferred from data")
             lines.append("")
 
         lines.append(f'@schema "{schema.name}"')
@@ -36,25 +67,101 @@ class HexDBCGenerator:
         # Generate each record
         for record_idx, record in enumerate(dbc.records):
             record_id = record[0] if record else record_idx
-            lines.append(f"{record_name}({record_id}) {{")
+            # Each earlier "}\n" item spans two lines
+            record_lines.append((record_id, len(lines) + record_idx))
+            self._append_record(lines, record_name, record_id, record, range(1, len(record)), schema, dbc)
 
-            for field_idx, value in enumerate(record):
-                if field_idx == 0:
-                    continue  # ID is in the record call
-
-                field_def = schema.get_field(field_idx) if field_idx < len(schema.fields) else None
-                field_name = field_def.name if field_def else f"field_{field_idx}"
-                field_type = field_def.type if field_def else FieldType.UINT
-
-                formatted_value = self._format_value(value, field_type, field_def, schema, dbc)
-
-                # Add description comment for unknown fields
-                comment = f"  # {field_def.description}" if field_def and field_def.description and field_def.name.startswith("Unknown") else ""
+        self.record_lines = record_lines
+        return "\n".join(lines)
 
-                lines.append(f"    {field_name} = {formatted_value}{comment}")
+    def _append_record(self, lines: List[str], record_name: str, record_id: int, record: List[int],
+                       fields: Iterator[int], schema: SchemaDef, dbc: DBCFile) -> None:
+        lines.append(f"{record_name}({record_id}) {{")
+
+        for field_idx in fields:
+            if field_idx == 0:
+                continue  # ID is in the record call
+            value = record[field_idx]
+
+            field_def = schema.get_field(field_idx) if field_idx < len(schema.fields) else None
+            field_name = field_def.name if field_def else f"field_{field_idx}"
+            field_type = field_def.type if field_def else FieldType.UINT
+
+            formatted_value = self._format_value(value, field_type, field_def, schema, dbc)
+
+            # Add description comment for unknown fields
+            comment = f"  # {field_def.description}" if field_def and field_def.description and field_def.name.startswith("Unknown") else ""
+
+            lines.append(f"    {field_name} = {formatted_value}{comment}")
+
+        lines.append("}\n")
+
+    def generate_changes(self, diff: "DBCDiff", dbc_name: str = "Unknown",
+                         changed_fields_only: bool = False) -> Iterator[str]:
+        """Sparse text of the records diff.new adds or changes, a chunk at a time.
+
+        Parsed over diff.old (e.g. as an overlay) it gives diff.new back,
+        except that records diff.new removed are still there: overlays
+        cannot remove records, so they are only listed in a comment.
+        With changed_fields_only, changed records hold just the fields
+        that differ; added records are always written whole.
+        """
+        dbc = diff.new
+        lines = [
+            f"# {dbc_name}.dbc - Changes generated by HexDBC",
+            f"# Changed: {len(diff.changed)}, Added: {len(diff.added)}",
+        ]
+        if diff.removed:
+            listed = ", ".join(map(str, diff.removed[:MAX_LISTED_REMOVED]))
+            more = f" and {len(diff.removed) - MAX_LISTED_REMOVED} more" if len(diff.removed) > MAX_LISTED_REMOVED else ""
+            lines.append(f"# Removed (NOT applied by this overlay; building it keeps them): {listed}{more}")
+        lines.append("")
 
-            lines.append("}\n")
+        schema = diff.schema or self.schema_manager.get_schema(dbc_name)
+        if not schema:
+            schema = self.schema_manager.generate_fallback_schema(dbc.header.field_count, dbc_name, dbc)
+        lines.append(f'@schema "{schema.name}"')
+        lines.append("")
 
+        record_name = self._get_record_name(dbc_name)
+        changes = [change for change in diff.changes() if change.kind != 'removed']
+        # In the order of the new file
+        changes.sort(key=lambda change: change.new_row)
+        for count, change in enumerate(changes, 1):
+            record = dbc.records[change.new_row]
+            if changed_fields_only and change.kind == 'changed':
+                fields = [i for i in diff.changed_fields(change.record_id) if i < len(record)]
+            else:
+                fields = range(1, len(record))
+            self._append_record(lines, record_name, change.record_id, record, fields, schema, dbc)
+            if count % CHUNK_RECORDS == 0:
+                yield "\n".join(lines) + "\n"
+                lines = []
+        if lines:
+            yield "\n".join(lines)
+
+    def format_field(self, field_idx: int, value: Any, schema: Optional[SchemaDef],
+                     dbc: Optional[DBCFile] = None) -> Tuple[str, str]:
+        """(field name, value text) as generate() writes them.
+
+        value is the raw uint32, or the text itself for string fields (then no
+        DBC is needed).
+        """
+        field_def = schema.get_field(field_idx) if schema and field_idx < len(schema.fields) else None
+        field_name = field_def.name if field_def else f"field_{field_idx}"
+        if isinstance(value, str):
+            escaped = value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r')
+            return field_name, f'"{escaped}"'
+        field_type = field_def.type if field_def else FieldType.UINT
+        return field_name, self._format_value(value, field_type, field_def, schema, dbc)
+
+    def format_record(self, dbc_name: str, values: List[Any], schema: Optional[SchemaDef]) -> str:
+        """One record block, as generate() writes it, from values in field order."""
+        lines = [f"{self._get_record_name(dbc_name)}({values[0]}) {{"]
+        for field_idx in range(1, len(values)):
+            field_name, text = self.format_field(field_idx, values[field_idx], schema)
+            lines.append(f"    {field_name} = {text}")
+        lines.append("}\n")
         return "\n".join(lines)
 
     def _get_record_name(self, dbc_name: str) -> str:
@@ -80,9 +187,12 @@ class HexDBCGenerator:
             return f'"{string_value}"'
 
         elif field_type == FieldType.FLOAT:
-            # Convert raw int bits to float
-            fval = struct.unpack('<f', struct.pack('<I', value))[0]
-            return f"{fval:.6g}"
+            text = format_float(value)
+            if text[-1] == "f":
+                # Infinities keep their bits, like NaNs; the parser reads hex as raw bits
+                return f"0x{value:08X}"
+            # "-0" would come back as the integer 0
+            return "-0.0" if text == "-0" else text
 
         elif field_type == FieldType.INT:
             # Handle signed int wraparound
@@ -106,13 +216,43 @@ class HexDBCParser:
         self.schema_manager = schema_manager or SchemaManager()
         self._current_schema: Optional[SchemaDef] = None
         self._errors: List[str] = []
+        # Bookkeeping of the last parse, for callers that splice compiled records
+        self.string_cells: List[Tuple[int, int, int]] = []  # (record, field, offset) in string block order
+        self.record_widths: List[int] = []  # Fields each record needs; only without an original DBC
 
     @property
     def errors(self) -> List[str]:
         return self._errors.copy()
 
     def parse(self, code: str, original_dbc: Optional[DBCFile] = None) -> DBCFile:
+        records, schema_name, field_count = self._parse_records(code, original_dbc)
+        # Convert parsed dicts into DBCFile
+        return self._build_dbc_file(records, original_dbc, schema_name, field_count)
+
+    def parse_fields(self, code: str, original_dbc: DBCFile) -> List[Tuple[int, Dict[int, Union[int, str]]]]:
+        """(record_id, {field index: value}) for only the fields the text sets.
+
+        Values are raw uint32s, except strings, which stay text. Fields are
+        numbered as in original_dbc, and ones past its width are dropped.
+        """
+        records, _, _ = self._parse_records(code, original_dbc)
+        field_count = original_dbc.header.field_count
+        indices = self._field_indices(field_count)
+        result = []
+        for record_data in records:
+            fields: Dict[int, Union[int, str]] = {}
+            for field_name, parsed_value in record_data.items():
+                if field_name == "_id":
+                    continue
+                field_idx = indices.get(field_name) or self._get_field_index(field_name)
+                if field_idx is not None and 0 < field_idx < field_count:
+                    fields[field_idx] = self._raw_value(field_idx, parsed_value)
+            result.append((record_data.get("_id", 0), fields))
+        return result
+
+    def _parse_records(self, code: str, original_dbc: Optional[DBCFile]) -> Tuple[List[Dict[str, Any]], str, int]:
         self._errors.clear()
+        self._current_schema = None  # Only this text's @schema directive applies
         lines = code.split("\n")
         records: List[Dict[str, Any]] = []
         current_record: Optional[Dict[str, Any]] = None
@@ -153,8 +293,10 @@ class HexDBCParser:
                 if field_name:
                     current_record[field_name] = field_value
 
-        # Convert parsed dicts into DBCFile
-        return self._build_dbc_file(records, original_dbc, schema_name, field_count)
+        # Unknown table: recover the same inferred types the generator used
+        if self._current_schema is None and original_dbc is not None and original_dbc.records:
+            self._current_schema = self.schema_manager.infer_schema(original_dbc, schema_name)
+        return records, schema_name, field_count
 
     def _parse_schema_directive(self, line: str) -> Optional[tuple]:
         import re
@@ -174,8 +316,7 @@ class HexDBCParser:
         return 0
 
     def _parse_field_assignment(self, line: str, line_num: int) -> tuple:
-        if "#" in line:
-            line = line[:line.index("#")]  # remove inline comments
+        line = strip_comment(line)  # a '#' inside a string is not a comment
         parts = line.split("=", 1)
         if len(parts) != 2:
             self._errors.append(f"Line {line_num}: Invalid assignment")
@@ -193,13 +334,14 @@ class HexDBCParser:
         # Hex (flags)
         if value_str.lower().startswith("0x"):
             try:
-                return ("uint", int(value_str, 16))
+                return ("hex", int(value_str, 16))
             except ValueError:
                 self._errors.append(f"Line {line_num}: Invalid hex value {value_str}")
                 return ("uint", 0)
 
-        # Float
-        if "." in value_str or "e" in value_str.lower():
+        # Float (enum names like SCHOOL_FIRE contain an "e" too)
+        identifier = value_str[:1].isalpha() or value_str[:1] == "_"
+        if not identifier and ("." in value_str or "e" in value_str.lower()):
             try:
                 return ("float", float(value_str))
             except ValueError:
@@ -207,7 +349,7 @@ class HexDBCParser:
                 return ("float", 0.0)
 
         # Enum (uppercase identifiers)
-        if value_str.isupper() or (value_str[0].isupper() and "_" in value_str):
+        if value_str.isupper() or (value_str[:1].isupper() and "_" in value_str):
             if self._current_schema:
                 for enum_name, enum_map in self._current_schema.enums.items():
                     for val, name in enum_map.items():
@@ -246,21 +388,19 @@ class HexDBCParser:
             return offset
 
         # Determine field count
+        self.string_cells = []
+        self.record_widths = []
         if original_dbc:
             actual_field_count = original_dbc.header.field_count
         else:
-            actual_field_count = max(
-                max((self._get_field_index(k) for k in r.keys() if k != "_id"), default=0) + 1
-                for r in records
-            ) if records else 1
+            # Every schema field, widened by any field_N beyond the schema
+            schema_width = len(self._current_schema.fields) if self._current_schema else 0
+            for r in records:
+                indices = (self._get_field_index(k) for k in r if k != "_id")
+                self.record_widths.append(max(schema_width, max((i for i in indices if i is not None), default=0) + 1))
+            actual_field_count = max(self.record_widths, default=max(schema_width, 1))
 
-        # Map field names to indices (schema first, then fallback)
-        field_name_to_index: Dict[str, int] = {}
-        if self._current_schema:
-            for i, field_def in enumerate(self._current_schema.fields):
-                field_name_to_index[field_def.name] = i
-        for i in range(actual_field_count):
-            field_name_to_index[f"field_{i}"] = i
+        field_name_to_index = self._field_indices(actual_field_count)
 
         # Map original DBC records if available
         original_records_by_id: Dict[int, List[int]] = {}
@@ -271,7 +411,7 @@ class HexDBCParser:
 
         dbc_records = []
 
-        for record_data in records:
+        for row, record_data in enumerate(records):
             record_id = record_data.get("_id", 0)
             fields = list(original_records_by_id.get(record_id, [0] * actual_field_count))
             fields[0] = record_id
@@ -287,15 +427,12 @@ class HexDBCParser:
                 if field_idx is None or not (0 <= field_idx < actual_field_count):
                     continue
 
-                value_type, value = parsed_value
-                if value_type == "string":
+                value = self._raw_value(field_idx, parsed_value)
+                if isinstance(value, str):
                     fields[field_idx] = get_string_offset(value)
-                elif value_type == "float":
-                    fields[field_idx] = struct.unpack("<I", struct.pack("<f", value))[0]
-                elif value_type == "int" and value < 0:
-                    fields[field_idx] = (value + 0x100000000) & 0xFFFFFFFF
+                    self.string_cells.append((row, field_idx, fields[field_idx]))
                 else:
-                    fields[field_idx] = value & 0xFFFFFFFF
+                    fields[field_idx] = value
 
             dbc_records.append(fields[:actual_field_count])
 
@@ -310,6 +447,33 @@ class HexDBCParser:
 
         return DBCFile(header=header, records=dbc_records, string_block=bytes(string_block))
 
+    def _field_indices(self, field_count: int) -> Dict[str, int]:
+        # Map field names to indices (schema first, then fallback)
+        field_name_to_index: Dict[str, int] = {}
+        if self._current_schema:
+            for i, field_def in enumerate(self._current_schema.fields):
+                field_name_to_index[field_def.name] = i
+        for i in range(field_count):
+            field_name_to_index[f"field_{i}"] = i
+        return field_name_to_index
+
+    def _raw_value(self, field_idx: int, parsed_value: Tuple[str, Any]) -> Union[int, str]:
+        """uint32 bits of a parsed value, or its text for a string."""
+        value_type, value = parsed_value
+
+        # Integral floats are written without a decimal point ("1"); hex stays raw bits
+        field_def = self._current_schema.get_field(field_idx) if self._current_schema else None
+        if field_def and field_def.type == FieldType.FLOAT and value_type in ("int", "uint"):
+            value_type, value = "float", float(value)
+
+        if value_type == "string":
+            return value
+        if value_type == "float":
+            return struct.unpack("<I", struct.pack("<f", value))[0]
+        if value_type == "int" and value < 0:
+            return (value + 0x100000000) & 0xFFFFFFFF
+        return value & 0xFFFFFFFF
+
     def _get_field_index(self, field_name: str) -> Optional[int]:
         import re
         match = re.match(r"field_(\d+)", field_name)
@@ -0,0 +1,46 @@
+import re
+from typing import Iterator, Tuple
+
+# Token kinds, in the order they win when rules overlap
+COMMENT = 'comment'
+STRING = 'string'
+DIRECTIVE = 'directive'
+VARIABLE = 'variable'
+FUNCTION = 'function'
+NUMBER = 'number'
+TYPE = 'type'
+
+_TOKEN_RE = re.compile(r'''
+    (?P<comment>\#.*)
+  | (?P<string>"[^"\\]*(?:\\.[^"\\]*)*"?)
+  | (?P<directive>@\w+)
+  | (?P<variable>\b\w+(?=\s*=))
+  | (?P<function>\b\w+(?=\s*\())
+  | (?P<number>(?<![\w.])(?:0[xX][0-9a-fA-F]+|-?\d+(?:\.\d*)?(?:[eE][+-]?\d+)?)\b)
+  | (?P<type>\b[A-Z][A-Z0-9_]+\b)
+  | \w+
+''', re.VERBOSE)
+
+Token = Tuple[int, int, str]  # start, length, kind
+
+
+def tokenize_line(line: str) -> Iterator[Token]:
+    """Highlightable tokens of one line of .hexdbc code, in a single left-to-right pass.
+
+    Plain words and punctuation are skipped. Nothing spans lines, so each
+    line can be lexed on its own.
+    """
+    for match in _TOKEN_RE.finditer(line):
+        kind = match.lastgroup
+        if kind is not None:
+            yield match.start(), match.end() - match.start(), kind
+
+
+def strip_comment(line: str) -> str:
+    """line without its trailing # comment; a # inside a string literal is kept."""
+    if '#' not in line:
+        return line
+    for start, _, kind in tokenize_line(line):
+        if kind == COMMENT:
+            return line[:start]
+    return line
@@ -0,0 +1,233 @@
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from hexdbc.core.hexdbc_lexer import strip_comment
+from hexdbc.core.record_index import parse_record_header, scan_record_headers
+from hexdbc.core.schema import FieldDef, FieldType, SchemaDef
+
+SEVERITY_ERROR = 'error'
+SEVERITY_WARNING = 'warning'
+
+_FIELD_NAME_RE = re.compile(r'^\w+$')
+_GENERIC_FIELD_RE = re.compile(r'^field_(\d+)$')
+
+_STRING_TYPES = (FieldType.STRING, FieldType.LOCSTRING)
+_INTEGER_TYPES = (FieldType.UINT, FieldType.INT, FieldType.FLAGS, FieldType.ENUM)
+_UNSIGNED_TYPES = (FieldType.UINT, FieldType.FLAGS, FieldType.ENUM)
+
+
+@dataclass
+class Diagnostic:
+    line: int  # 0-based; relative to the record header for record diagnostics
+    message: str
+    severity: str = SEVERITY_ERROR
+
+    @property
+    def is_error(self) -> bool:
+        return self.severity == SEVERITY_ERROR
+
+
+class HexDBCValidator:
+    """Checks .hexdbc text against a schema, one record block at a time.
+
+    Reports what HexDBCParser would silently drop or mis-store: unknown
+    fields and enum names, values of the wrong type, unclosed records and
+    stray text. Pure and thread-safe, so it can run off the UI thread.
+    """
+
+    def __init__(self, schema: Optional[SchemaDef] = None, field_count: Optional[int] = None):
+        self.schema = schema
+        self.field_count = field_count
+        self._fields: Dict[str, Tuple[int, FieldDef]] = {}
+        self._enum_names: Dict[str, Set[str]] = {}
+        self._all_enum_names: Set[str] = set()
+        if schema:
+            for field_idx, field_def in enumerate(schema.fields):
+                self._fields.setdefault(field_def.name, (field_idx, field_def))
+            for enum_name, enum_map in schema.enums.items():
+                names = set(enum_map.values())
+                self._enum_names[enum_name] = names
+                self._all_enum_names |= names
+
+    def _field(self, name: str) -> Tuple[bool, Optional[FieldDef]]:
+        """(known, definition) of a field name as the parser resolves it."""
+        found = self._fields.get(name)
+        if found:
+            return True, found[1]
+        match = _GENERIC_FIELD_RE.match(name)
+        if match:
+            field_idx = int(match.group(1))
+            known = self.field_count is None or field_idx < self.field_count
+            return known, self.schema.get_field(field_idx) if self.schema else None
+        # Without a schema or field count there is nothing to check names against
+        return self.schema is None and self.field_count is None, None
+
+    def check_value(self, value: str, field_def: Optional[FieldDef], field_name: str) -> Optional[Diagnostic]:
+        """Problem with one value, classified the way HexDBCParser reads it (line 0)."""
+        field_type = field_def.type if field_def else None
+        if not value:
+            return Diagnostic(0, f"{field_name} has no value")
+
+        if value.startswith('"'):
+            if len(value) < 2 or not value.endswith('"') or re.search(r'(?<!\\)(\\\\)*\\"$', value):
+                return Diagnostic(0, f"Unterminated string in {field_name}")
+            if field_type is not None and field_type not in _STRING_TYPES:
+                return Diagnostic(0, f"{field_name} is a {field_type.name.lower()} field, not a string")
+            return None
+
+        if field_type in _STRING_TYPES:
+            return Diagnostic(0, f"{field_name} expects a string, got {value}")
+
+        if value.lower().startswith("0x"):
+            try:
+                number = int(value, 16)
+            except ValueError:
+                return Diagnostic(0, f"Invalid hex value {value}")
+            if number > 0xFFFFFFFF:
+                return Diagnostic(0, f"{value} does not fit in 32 bits")
+            return None
+
+        identifier = value[0].isalpha() or value[0] == "_"
+        if not identifier and ("." in value or "e" in value.lower()):
+            try:
+                float(value)
+            except ValueError:
+                return Diagnostic(0, f"Invalid float value {value}")
+            if field_type in _INTEGER_TYPES:
+                return Diagnostic(0, f"{field_name} is an integer field, not a float")
+            return None
+
+        if value.isupper() or (value[0].isupper() and "_" in value):
+            enum_name = field_def.enum_name if field_def else None
+            names = self._enum_names.get(enum_name) if enum_name else None
+            if value not in (names if names is not None else self._all_enum_names):
+                return Diagnostic(0, f"Unknown enum value {value}" + (f" for {enum_name}" if enum_name else ""))
+            return None
+
+        try:
+            number = int(value)
+        except ValueError:
+            return Diagnostic(0, f"Invalid value {value}")
+        if not -0x80000000 <= number <= 0xFFFFFFFF:
+            return Diagnostic(0, f"{value} does not fit in 32 bits")
+        if number < 0 and field_type in _UNSIGNED_TYPES:
+            return Diagnostic(0, f"{field_name} is unsigned; {value} is stored as {number & 0xFFFFFFFF}",
+                              SEVERITY_WARNING)
+        return None
+
+    def check_record(self, text: str) -> List[Diagnostic]:
+        """Diagnostics for one record block, header through closing brace."""
+        lines = text.split("\n")
+        record_id = parse_record_header(lines[0]) if lines else None
+        if record_id is None:
+            return [Diagnostic(0, "Could not parse record ID")]
+
+        diagnostics = []
+        seen: Set[str] = set()
+        closed = False
+        for line_num in range(1, len(lines)):
+            line = lines[line_num].strip()
+            if not line or line.startswith("#"):
+                continue
+            if closed:
+                diagnostics.append(Diagnostic(line_num, "Text after the closing brace is ignored", SEVERITY_WARNING))
+                continue
+            if line == "}":
+                closed = True
+                continue
+
+            name, sep, value = strip_comment(line).partition("=")
+            name, value = name.strip(), value.strip()
+            if not sep:
+                diagnostics.append(Diagnostic(line_num, "Expected 'field = value'"))
+                continue
+            if not _FIELD_NAME_RE.match(name):
+                diagnostics.append(Diagnostic(line_num, f"Invalid field name '{name}'"))
+                continue
+
+            known, field_def = self._field(name)
+            if not known:
+                diagnostics.append(Diagnostic(line_num, f"Unknown field {name}; the value is ignored"))
+                continue
+            if name in seen:
+                diagnostics.append(Diagnostic(line_num, f"{name} is set more than once; the last value wins",
+                                              SEVERITY_WARNING))
+            seen.add(name)
+
+            problem = self.check_value(value, field_def, name)
+            if problem:
+                problem.line = line_num
+                diagnostics.append(problem)
+
+        if not closed:
+            diagnostics.insert(0, Diagnostic(0, f"Record {record_id} is not closed with '}}'; it will be dropped"))
+        return diagnostics
+
+    def check_text(self, code: str) -> Dict[Optional[int], List[Diagnostic]]:
+        """Diagnostics of a whole document by record ID (first block per ID).
+
+        Record diagnostics have lines relative to the record header; the
+        None key holds problems outside records, with document lines.
+        """
+        results: Dict[Optional[int], List[Diagnostic]] = {}
+        outside: List[Diagnostic] = []
+        lines = code.split("\n")
+        headers = scan_record_headers(code)
+        ends = [line for _, line in headers[1:]] + [len(lines)]
+
+        first_header = headers[0][1] if headers else len(lines)
+        outside.extend(self._check_outside(lines, 0, first_header))
+        for (record_id, start), end in zip(headers, ends):
+            # The record runs to its brace; anything after that belongs to no record
+            stop = start + 1
+            while stop < end and lines[stop].strip() != "}":
+                stop += 1
+            stop = min(stop + 1, end)
+            if record_id not in results:
+                results[record_id] = self.check_record("\n".join(lines[start:stop]))
+            outside.extend(self._check_outside(lines, stop, end))
+
+        if outside:
+            results[None] = outside
+        return results
+
+    def _check_outside(self, lines: List[str], start: int, stop: int) -> Iterable[Diagnostic]:
+        for line_num in range(start, stop):
+            line = lines[line_num].strip()
+            if line and not line.startswith("#") and not line.startswith("@schema"):
+                yield Diagnostic(line_num, "Text outside a record is ignored", SEVERITY_WARNING)
+
+
+class DiagnosticSet:
+    """A document's diagnostics, kept per record so an edit only replaces its records'."""
+
+    def __init__(self):
+        self._by_record: Dict[Optional[int], List[Diagnostic]] = {}
+
+    def replace_all(self, results: Dict[Optional[int], List[Diagnostic]]) -> None:
+        self._by_record = {key: diags for key, diags in results.items() if diags}
+
+    def update(self, results: Dict[Optional[int], List[Diagnostic]]) -> None:
+        """Replace the diagnostics of just these records; an empty list clears one."""
+        for key, diags in results.items():
+            if diags:
+                self._by_record[key] = diags
+            else:
+                self._by_record.pop(key, None)
+
+    def clear(self) -> None:
+        self._by_record.clear()
+
+    def items(self) -> Iterable[Tuple[Optional[int], Diagnostic]]:
+        for key, diags in self._by_record.items():
+            for diag in diags:
+                yield key, diag
+
+    def counts(self) -> Tuple[int, int]:
+        """(errors, warnings)."""
+        errors = sum(1 for _, diag in self.items() if diag.is_error)
+        return errors, sum(len(diags) for diags in self._by_record.values()) - errors
+
+    def __len__(self) -> int:
+        return sum(len(diags) for diags in self._by_record.values())
@@ -0,0 +1,727 @@
+import bz2
+import hashlib
+import mmap
+import os
+import re
+import struct
+import threading
+import zlib
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from hexdbc.core.parser import DBCFile, DBCWriter
+
+# Decompressed sectors kept per archive, least recently used dropped first
+SECTOR_CACHE_BYTES = 32 * 1024 * 1024
+
+# Sectors compressed per task when writing; zlib releases the GIL, so threads use every core
+COMPRESS_BATCH_SECTORS = 256
+DEFAULT_SECTOR_SHIFT = 3  # 4 KB sectors, as Blizzard's own archives use
+
+DBC_DIR = "DBFilesClient"
+
+_MAGIC = b'MPQ\x1a'
+_USER_DATA_MAGIC = b'MPQ\x1b'
+_HEADER = struct.Struct('<4sIIHHIIII')
+_HEADER_EXT = struct.Struct('<QHH')  # Format 1+: high bits of the table positions
+_USER_DATA = struct.Struct('<4sIII')
+
+_HASH_EMPTY = 0xFFFFFFFF
+_HASH_DELETED = 0xFFFFFFFE
+
+FLAG_IMPLODE = 0x00000100
+FLAG_COMPRESS = 0x00000200
+FLAG_ENCRYPTED = 0x00010000
+FLAG_FIX_KEY = 0x00020000
+FLAG_PATCH_FILE = 0x00100000
+FLAG_SINGLE_UNIT = 0x01000000
+FLAG_DELETE_MARKER = 0x02000000
+FLAG_SECTOR_CRC = 0x04000000
+FLAG_EXISTS = 0x80000000
+
+_COMPRESSION_ZLIB = 0x02
+_COMPRESSION_BZIP2 = 0x10
+_COMPRESSION_LZMA = 0x12  # A value of its own, not zlib | bzip2
+
+_LISTFILE = "(listfile)"
+_ATTRIBUTES = "(attributes)"
+_ATTRIBUTES_VERSION = 100
+_ATTRIBUTE_CRC32 = 0x1
+_ATTRIBUTE_FILETIME = 0x2
+_ATTRIBUTE_MD5 = 0x4
+
+_HASH_OFFSET, _HASH_NAME_A, _HASH_NAME_B, _HASH_FILE_KEY = range(4)
+_MASK = 0xFFFFFFFF
+
+
+def _build_crypt_table() -> List[int]:
+    table = [0] * 0x500
+    seed = 0x00100001
+    for index1 in range(0x100):
+        index2 = index1
+        for _ in range(5):
+            seed = (seed * 125 + 3) % 0x2AAAAB
+            high = (seed & 0xFFFF) << 16
+            seed = (seed * 125 + 3) % 0x2AAAAB
+            table[index2] = high | (seed & 0xFFFF)
+            index2 += 0x100
+    return table
+
+
+_CRYPT_TABLE = _build_crypt_table()
+
+
+def hash_string(name: str, hash_type: int) -> int:
+    """MPQ name hash; names are case-insensitive and use backslashes."""
+    seed1, seed2 = 0x7FED7FED, 0xEEEEEEEE
+    table, base = _CRYPT_TABLE, hash_type << 8
+    for ch in name.replace('/', '\\').upper().encode('latin-1', errors='replace'):
+        seed1 = table[base + ch] ^ ((seed1 + seed2) & _MASK)
+        seed2 = (ch + seed1 + seed2 + (seed2 << 5) + 3) & _MASK
+    return seed1
+
+
+def decrypt(data: bytes, key: int) -> bytes:
+    """Decrypt whole uint32s of data; trailing bytes are stored in the clear."""
+    words = array('I')
+    whole = len(data) & ~3
+    words.frombytes(data[:whole])
+    swap = struct.pack('=I', 1) != struct.pack('<I', 1)
+    if swap:
+        words.byteswap()
+    key_table = _CRYPT_TABLE[0x400:0x500]
+    seed = 0xEEEEEEEE
+    plain_words = []
+    append = plain_words.append
+    for word in words:
+        seed = (seed + key_table[key & 0xFF]) & _MASK
+        plain = word ^ ((key + seed) & _MASK)
+        key = ((((key ^ _MASK) << 21) + 0x11111111) | (key >> 11)) & _MASK
+        seed = (plain + seed + (seed << 5) + 3) & _MASK
+        append(plain)
+    words = array('I', plain_words)
+    if swap:
+        words.byteswap()
+    return words.tobytes() + data[whole:]
+
+
+def encrypt(data: bytes, key: int) -> bytes:
+    """Inverse of decrypt."""
+    words = array('I')
+    whole = len(data) & ~3
+    words.frombytes(data[:whole])
+    swap = struct.pack('=I', 1) != struct.pack('<I', 1)
+    if swap:
+        words.byteswap()
+    key_table = _CRYPT_TABLE[0x400:0x500]
+    seed = 0xEEEEEEEE
+    cipher_words = []
+    append = cipher_words.append
+    for plain in words:
+        seed = (seed + key_table[key & 0xFF]) & _MASK
+        append(plain ^ ((key + seed) & _MASK))
+        key = ((((key ^ _MASK) << 21) + 0x11111111) | (key >> 11)) & _MASK
+        seed = (plain + seed + (seed << 5) + 3) & _MASK
+    words = array('I', cipher_words)
+    if swap:
+        words.byteswap()
+    return words.tobytes() + data[whole:]
+
+
+def _decompress(data: bytes, expected: int) -> bytes:
+    mask = data[0]
+    if mask == _COMPRESSION_LZMA or mask & ~(_COMPRESSION_ZLIB | _COMPRESSION_BZIP2):
+        raise ValueError(f"Unsupported MPQ compression 0x{mask:02X}")
+    data = data[1:]
+    # Compressed last is decompressed first
+    if mask & _COMPRESSION_BZIP2:
+        data = bz2.decompress(data)
+    if mask & _COMPRESSION_ZLIB:
+        data = zlib.decompress(data)
+    if len(data) != expected:
+        raise ValueError(f"Sector decompressed to {len(data)} bytes, expected {expected}")
+    return data
+
+
+@dataclass
+class BlockEntry:
+    offset: int  # From the start of the archive
+    compressed_size: int
+    file_size: int
+    flags: int
+
+    @property
+    def exists(self) -> bool:
+        return bool(self.flags & FLAG_EXISTS)
+
+
+class MPQArchive:
+    """Read-only MPQ archive (formats 0 and 1, as used up to WotLK).
+
+    Files are found through the hash table and read sector by sector:
+    only the sectors a read covers are decrypted and decompressed, and
+    they stay in a shared LRU cache (SECTOR_CACHE_BYTES) for later reads.
+    zlib and bzip2 sectors are supported; PKWARE implode, LZMA and
+    incremental patch files are not.
+    """
+
+    def __init__(self, path: Path, locale: int = 0):
+        self.path = Path(path)
+        self.locale = locale
+        self._file = open(self.path, 'rb')
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{self.path.name}: empty file is not an MPQ archive")
+        self._lock = threading.Lock()
+        self._sectors: "OrderedDict[Tuple[int, int], bytes]" = OrderedDict()
+        self._sector_bytes = 0
+        self._sector_offsets: Dict[int, array] = {}
+        try:
+            self._read_tables()
+        except Exception:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        self._data.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _find_header(self) -> int:
+        data = self._data
+        # Headers sit on a 512-byte boundary, possibly after a user data block
+        for offset in range(0, len(data) - _HEADER.size + 1, 0x200):
+            magic = data[offset:offset + 4]
+            if magic == _MAGIC:
+                return offset
+            if magic == _USER_DATA_MAGIC:
+                _, _, header_offset, _ = _USER_DATA.unpack_from(data, offset)
+                if data[offset + header_offset:offset + header_offset + 4] == _MAGIC:
+                    return offset + header_offset
+        raise ValueError(f"{self.path.name}: not an MPQ archive")
+
+    def _read_tables(self) -> None:
+        data = self._data
+        self.archive_offset = base = self._find_header()
+        (_, header_size, _, self.format_version, sector_shift,
+         hash_pos, block_pos, hash_count, block_count) = _HEADER.unpack_from(data, base)
+        self.sector_size = 512 << sector_shift
+        hi_block_pos = 0
+        if self.format_version >= 1 and header_size >= _HEADER.size + _HEADER_EXT.size:
+            hi_block_pos, hash_pos_hi, block_pos_hi = _HEADER_EXT.unpack_from(data, base + _HEADER.size)
+            hash_pos |= hash_pos_hi << 32
+            block_pos |= block_pos_hi << 32
+
+        if hash_count & (hash_count - 1):
+            raise ValueError(f"{self.path.name}: hash table size {hash_count} is not a power of two")
+        # (name hash A, name hash B, locale | platform << 16, block index) per entry
+        self._hashes = self._table(base + hash_pos, hash_count, hash_string("(hash table)", _HASH_FILE_KEY))
+        self._hash_count = len(self._hashes) // 4
+
+        blocks = self._table(base + block_pos, block_count, hash_string("(block table)", _HASH_FILE_KEY))
+        high = array('H')
+        if hi_block_pos:
+            high.frombytes(data[base + hi_block_pos:base + hi_block_pos + 2 * block_count])
+        self.blocks = [
+            BlockEntry(blocks[i * 4] | ((high[i] << 32) if i < len(high) else 0),
+                       blocks[i * 4 + 1], blocks[i * 4 + 2], blocks[i * 4 + 3])
+            for i in range(len(blocks) // 4)
+        ]
+
+    def _table(self, position: int, count: int, key: int) -> array:
+        raw = self._data[position:position + count * 16]
+        # Protected archives overstate their table sizes; keep the entries that are there
+        raw = raw[:len(raw) & ~15]
+        words = array('I')
+        words.frombytes(decrypt(raw, key))
+        return words
+
+    def find(self, name: str) -> Optional[int]:
+        """Block index of a file, preferring this archive's locale, then neutral."""
+        count = self._hash_count
+        if not count:
+            return None
+        hashes = self._hashes
+        # A truncated table is probed as if it wrapped at its last whole entry
+        index = hash_string(name, _HASH_OFFSET) % count
+        name_a = hash_string(name, _HASH_NAME_A)
+        name_b = hash_string(name, _HASH_NAME_B)
+        found: Dict[int, int] = {}
+        for _ in range(count):
+            entry = index * 4
+            block_index = hashes[entry + 3]
+            if block_index == _HASH_EMPTY:
+                break
+            if block_index != _HASH_DELETED and hashes[entry] == name_a and hashes[entry + 1] == name_b:
+                found.setdefault(hashes[entry + 2] & 0xFFFF, block_index)
+            index = (index + 1) % count
+        for locale in (self.locale, 0):
+            block_index = found.get(locale)
+            if block_index is not None and block_index < len(self.blocks):
+                return block_index
+        return next((i for i in found.values() if i < len(self.blocks)), None)
+
+    def block(self, name: str) -> Optional[BlockEntry]:
+        index = self.find(name)
+        return self.blocks[index] if index is not None else None
+
+    def _file_key(self, name: str, block: BlockEntry) -> int:
+        key = hash_string(name.replace('/', '\\').rsplit('\\', 1)[-1], _HASH_FILE_KEY)
+        if block.flags & FLAG_FIX_KEY:
+            key = ((key + block.offset) ^ block.file_size) & _MASK
+        return key
+
+    def _offsets(self, index: int, block: BlockEntry, key: int) -> array:
+        """Start of each sector (and the end of the last) within the file's data."""
+        offsets = self._sector_offsets.get(index)
+        if offsets is not None:
+            return offsets
+        sectors = -(-block.file_size // self.sector_size)
+        if block.flags & (FLAG_COMPRESS | FLAG_IMPLODE):
+            count = sectors + 1 + (1 if block.flags & FLAG_SECTOR_CRC else 0)
+            start = self.archive_offset + block.offset
+            raw = self._data[start:start + count * 4]
+            if block.flags & FLAG_ENCRYPTED:
+                raw = decrypt(raw, (key - 1) & _MASK)
+            offsets = array('I')
+            offsets.frombytes(raw[:(sectors + 1) * 4])
+            if offsets.itemsize == 4 and struct.pack('=I', 1) != struct.pack('<I', 1):
+                offsets.byteswap()
+        else:
+            offsets = array('I', range(0, sectors * self.sector_size, self.sector_size))
+            offsets.append(block.compressed_size)
+        self._sector_offsets[index] = offsets
+        return offsets
+
+    def _sector(self, index: int, block: BlockEntry, sector: int, key: int) -> bytes:
+        cache_key = (index, sector)
+        data = self._sectors.get(cache_key)
+        if data is not None:
+            self._sectors.move_to_end(cache_key)
+            return data
+
+        start = self.archive_offset + block.offset
+        if block.flags & FLAG_SINGLE_UNIT:
+            raw = self._data[start:start + block.compressed_size]
+            expected = block.file_size
+        else:
+            offsets = self._offsets(index, block, key)
+            raw = self._data[start + offsets[sector]:start + offsets[sector + 1]]
+            expected = min(self.sector_size, block.file_size - sector * self.sector_size)
+        if block.flags & FLAG_ENCRYPTED:
+            raw = decrypt(raw, (key + sector) & _MASK)
+        if len(raw) < expected:
+            if block.flags & FLAG_IMPLODE:
+                raise ValueError("PKWARE-imploded MPQ files are not supported")
+            data = _decompress(raw, expected)
+        else:
+            data = bytes(raw[:expected])
+
+        self._sectors[cache_key] = data
+        self._sector_bytes += len(data)
+        while self._sector_bytes > SECTOR_CACHE_BYTES and len(self._sectors) > 1:
+            _, evicted = self._sectors.popitem(last=False)
+            self._sector_bytes -= len(evicted)
+        return data
+
+    def read(self, name: str, size: Optional[int] = None) -> bytes:
+        """A file's contents, or only its first size bytes (decompressing no more than that)."""
+        index = self.find(name)
+        if index is None:
+            raise FileNotFoundError(f"{name} is not in {self.path.name}")
+        return self.read_block(index, name, size)
+
+    def read_block(self, index: int, name: str, size: Optional[int] = None) -> bytes:
+        block = self.blocks[index]
+        if not block.exists or block.flags & FLAG_DELETE_MARKER:
+            raise FileNotFoundError(f"{name} is deleted in {self.path.name}")
+        if block.flags & FLAG_PATCH_FILE:
+            raise ValueError(f"{name} in {self.path.name} is an incremental patch, which is not supported")
+        size = block.file_size if size is None else min(size, block.file_size)
+        if size <= 0:
+            return b""
+        key = self._file_key(name, block) if block.flags & FLAG_ENCRYPTED else 0
+        with self._lock:
+            if block.flags & FLAG_SINGLE_UNIT:
+                return self._sector(index, block, 0, key)[:size]
+            last = (size - 1) // self.sector_size
+            data = b"".join(self._sector(index, block, sector, key) for sector in range(last + 1))
+        return data[:size]
+
+    def listfile(self) -> List[str]:
+        """Names from the archive's (listfile), if it has one."""
+        try:
+            text = self.read("(listfile)").decode('utf-8', errors='replace')
+        except (FileNotFoundError, ValueError):
+            return []
+        return [name.strip() for name in re.split(r'[\r\n;]+', text) if name.strip()]
+
+
+# Suffix of patch-N.MPQ: no suffix, then 2-9, then A-Z
+def _patch_rank(suffix: str) -> int:
+    if not suffix:
+        return 1
+    if suffix.isdigit():
+        return int(suffix)
+    return 10 + ord(suffix[0].upper()) - ord('A')
+
+
+_PATCH_RE = re.compile(r'^patch(?:-([a-z]{2}[A-Z]{2}))?(?:-(\w+))?$', re.IGNORECASE)
+_LOCALE_RE = re.compile(r'^[a-z]{2}[A-Z]{2}$')
+_BASE_ORDER = ('common', 'common-2', 'expansion', 'lichking',
+               'locale', 'speech', 'expansion-locale', 'expansion-speech', 'lichking-locale', 'lichking-speech')
+
+
+def archive_order(data_dir: Path, locale: Optional[str] = None) -> List[Path]:
+    """The client's MPQs under data_dir, lowest priority first.
+
+    Base archives come first, then patches by number (patch, patch-2 ...
+    patch-9, patch-A ... patch-Z); a locale patch beats the general patch
+    of the same number.
+    """
+    data_dir = Path(data_dir)
+    folders = [(data_dir, False)]
+    for child in sorted(data_dir.iterdir()) if data_dir.is_dir() else []:
+        if child.is_dir() and _LOCALE_RE.match(child.name) and (locale is None or child.name == locale):
+            folders.append((child, True))
+
+    keyed = []
+    for folder, in_locale in folders:
+        for path in folder.iterdir():
+            if path.suffix.lower() != '.mpq' or not path.is_file():
+                continue
+            stem = path.stem
+            match = _PATCH_RE.match(stem)
+            if match:
+                key = (1, _patch_rank(match.group(2) or ""), bool(match.group(1)) or in_locale, stem.lower())
+            else:
+                prefix = stem.lower()
+                if in_locale:
+                    prefix = prefix.rsplit('-', 1)[0]  # locale-enUS -> locale
+                order = _BASE_ORDER.index(prefix) if prefix in _BASE_ORDER else len(_BASE_ORDER)
+                key = (0, in_locale, order, stem.lower())
+            keyed.append((key, path))
+    keyed.sort(key=lambda item: item[0])
+    return [path for _, path in keyed]
+
+
+class MPQChain:
+    """Several archives read as one, later archives overriding earlier ones."""
+
+    def __init__(self, paths: Iterable[Path], locale: int = 0):
+        self.archives: List[MPQArchive] = []
+        try:
+            for path in paths:
+                self.archives.append(MPQArchive(path, locale))
+        except Exception:
+            self.close()
+            raise
+
+    @classmethod
+    def open(cls, path: Path, locale: Optional[str] = None) -> "MPQChain":
+        """A single .MPQ, or every MPQ of a client Data folder in patch order."""
+        path = Path(path)
+        if path.is_dir():
+            paths = archive_order(path, locale)
+            if not paths:
+                raise ValueError(f"No MPQ archives in {path}")
+            return cls(paths)
+        return cls([path])
+
+    def close(self) -> None:
+        for archive in self.archives:
+            archive.close()
+        self.archives = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def locate(self, name: str) -> Optional[Tuple[MPQArchive, int]]:
+        """The archive and block holding the current version of a file."""
+        for archive in reversed(self.archives):
+            index = archive.find(name)
+            if index is None:
+                continue
+            if archive.blocks[index].flags & FLAG_DELETE_MARKER:
+                return None  # Deleted by a patch
+            return archive, index
+        return None
+
+    def exists(self, name: str) -> bool:
+        return self.locate(name) is not None
+
+    def read(self, name: str, size: Optional[int] = None) -> bytes:
+        found = self.locate(name)
+        if found is None:
+            raise FileNotFoundError(f"{name} is not in the MPQ archives")
+        archive, index = found
+        return archive.read_block(index, name, size)
+
+    def names(self) -> List[str]:
+        """Every name listed by the archives' listfiles, without case duplicates."""
+        seen: Dict[str, str] = {}
+        for archive in self.archives:
+            for name in archive.listfile():
+                seen.setdefault(name.lower(), name)
+        return sorted(seen.values(), key=str.lower)
+
+    def dbc_names(self, candidates: Iterable[str] = ()) -> List[str]:
+        """DBC table names in the archives: listed ones, plus candidates found by hash lookup."""
+        prefix = DBC_DIR.lower() + '\\'
+        found: Dict[str, str] = {}
+        for name in self.names():
+            lowered = name.lower()
+            if lowered.startswith(prefix) and lowered.endswith('.dbc') and '\\' not in name[len(prefix):]:
+                stem = name[len(prefix):-4]
+                # Listfiles are not updated when a patch deletes a file
+                if stem.lower() not in found and self.exists(name):
+                    found[stem.lower()] = stem
+        # Patches often ship without a listfile
+        for name in candidates:
+            if name.lower() not in found and self.exists(dbc_path(name)):
+                found[name.lower()] = name
+        return sorted(found.values(), key=str.lower)
+
+
+def dbc_path(dbc_name: str) -> str:
+    """Archive path of a DBC table."""
+    return f"{DBC_DIR}\\{dbc_name}.dbc"
+
+
+def _read_attributes(archive: MPQArchive) -> Dict[int, Tuple[int, bytes]]:
+    """Block index -> (CRC32, MD5) from an archive's (attributes), when it records both."""
+    try:
+        data = archive.read(_ATTRIBUTES)
+    except (FileNotFoundError, ValueError):
+        return {}
+    if len(data) < 8:
+        return {}
+    version, flags = struct.unpack_from('<II', data)
+    if version != _ATTRIBUTES_VERSION or flags & (_ATTRIBUTE_CRC32 | _ATTRIBUTE_MD5) != (
+            _ATTRIBUTE_CRC32 | _ATTRIBUTE_MD5):
+        return {}
+    count = len(archive.blocks)
+    md5_position = 8 + 4 * count + (8 * count if flags & _ATTRIBUTE_FILETIME else 0)
+    if md5_position + 16 * count > len(data):
+        return {}
+    crcs = struct.unpack_from(f'<{count}I', data, 8)
+    return {i: (crcs[i], data[md5_position + 16 * i:md5_position + 16 * (i + 1)]) for i in range(count)}
+
+
+@dataclass
+class _Entry:
+    name: str
+    data: Optional[bytes] = None  # Contents to compress
+    md5: bytes = b""  # Empty for kept files whose archive has no (attributes)
+    crc32: int = 0
+    source: Optional[Tuple[MPQArchive, int]] = None  # Block copied as stored from an existing archive
+
+
+@dataclass
+class PackSummary:
+    written: List[str] = field(default_factory=list)  # Compressed for this archive
+    reused: List[str] = field(default_factory=list)  # Copied as stored from the previous archive
+    size: int = 0
+
+
+class MPQWriter:
+    """Builds a zlib-compressed MPQ (format 0, readable by every client).
+
+    Files are compressed sector by sector in a thread pool. Starting from
+    an existing archive keeps its files, and any file whose contents are
+    unchanged is copied over as stored instead of being recompressed, so
+    re-packing after editing one table only compresses that table. A
+    (listfile) and an (attributes) file with CRC32s and MD5s are added.
+    """
+
+    def __init__(self, sector_shift: int = DEFAULT_SECTOR_SHIFT, workers: Optional[int] = None):
+        self.sector_size = 512 << sector_shift
+        self.sector_shift = sector_shift
+        self.workers = workers or os.cpu_count() or 1
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._previous: Optional[MPQArchive] = None
+
+    @classmethod
+    def update(cls, path: Path, **kwargs) -> "MPQWriter":
+        """A writer holding the files of the archive at path (an empty one if it does not exist yet)."""
+        writer = cls(**kwargs)
+        path = Path(path)
+        if path.exists():
+            writer._load(MPQArchive(path))
+        return writer
+
+    def _load(self, archive: MPQArchive) -> None:
+        self._previous = archive
+        attributes = _read_attributes(archive)
+        for name in archive.listfile():
+            if name.lower() in (_LISTFILE, _ATTRIBUTES):
+                continue
+            index = archive.find(name)
+            if index is None or not archive.blocks[index].exists or archive.blocks[index].flags & FLAG_DELETE_MARKER:
+                continue
+            crc32, md5 = attributes.get(index, (0, b""))
+            self._entries[name.lower()] = _Entry(name, md5=md5, crc32=crc32, source=(archive, index))
+
+    def close(self) -> None:
+        if self._previous is not None:
+            self._previous.close()
+            self._previous = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def names(self) -> List[str]:
+        return [entry.name for entry in self._entries.values()]
+
+    def add(self, name: str, data: bytes) -> None:
+        """Add or replace a file (names are case-insensitive, as in the archive)."""
+        name = name.replace('/', '\\')
+        entry = _Entry(name, bytes(data), hashlib.md5(data).digest(), zlib.crc32(data))
+        old = self._entries.get(name.lower())
+        if old is not None and old.source is not None and old.source[0].blocks[old.source[1]].file_size == len(data):
+            archive, index = old.source
+            # Decompressing the old copy is still much cheaper than compressing the new one
+            if old.md5 == entry.md5 if old.md5 else archive.read_block(index, name) == entry.data:
+                entry.data, entry.source = None, old.source  # Unchanged: keep the stored block
+        self._entries[name.lower()] = entry
+
+    def add_dbc(self, dbc_name: str, dbc: DBCFile) -> None:
+        """Add a DBC table under DBFilesClient, as DBCWriter would write it."""
+        self.add(dbc_path(dbc_name), DBCWriter().to_bytes(dbc))
+
+    def remove(self, name: str) -> None:
+        self._entries.pop(name.replace('/', '\\').lower(), None)
+
+    def _stored_block(self, entry: _Entry) -> Optional[Tuple[bytes, BlockEntry]]:
+        """An existing block that can be copied byte for byte, if entry has one."""
+        if entry.source is None:
+            return None
+        archive, index = entry.source
+        block = archive.blocks[index]
+        if block.flags & (FLAG_FIX_KEY | FLAG_PATCH_FILE):
+            return None  # Encrypted with its position in the old archive, or not a whole file
+        start = archive.archive_offset + block.offset
+        return archive._data[start:start + block.compressed_size], block
+
+    def _compress(self, sectors: List[bytes]) -> List[bytes]:
+        packed = []
+        for sector in sectors:
+            compressed = zlib.compress(sector)
+            # Sectors that do not shrink are stored as they are
+            packed.append(b'\x02' + compressed if len(compressed) + 1 < len(sector) else sector)
+        return packed
+
+    def write(self, path: Path) -> PackSummary:
+        """Write the archive to path, replacing any file there once the new one is complete."""
+        path = Path(path)
+        summary = PackSummary()
+        entries = list(self._entries.values())
+        for entry in entries:
+            if entry.data is None and self._stored_block(entry) is None:
+                # Nothing to copy as stored; take the contents and compress them afresh
+                archive, index = entry.source
+                entry.data = archive.read_block(index, entry.name)
+                entry.md5, entry.crc32 = hashlib.md5(entry.data).digest(), zlib.crc32(entry.data)
+                entry.source = None
+        listfile = "\r\n".join(entry.name for entry in entries).encode('utf-8') + b"\r\n"
+        entries.append(_Entry(_LISTFILE, listfile, hashlib.md5(listfile).digest(), zlib.crc32(listfile)))
+
+        sector_size = self.sector_size
+        jobs = []
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for entry in entries:
+                if entry.data is None:
+                    jobs.append(None)
+                    continue
+                sectors = [entry.data[i:i + sector_size] for i in range(0, len(entry.data), sector_size)]
+                jobs.append([pool.submit(self._compress, sectors[i:i + COMPRESS_BATCH_SECTORS])
+                             for i in range(0, len(sectors), COMPRESS_BATCH_SECTORS)])
+
+            tmp_path = path.with_name(path.name + '.tmp')
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(b'\0' * _HEADER.size)
+                    blocks: List[BlockEntry] = []
+                    for entry, job in zip(entries, jobs):
+                        offset = f.tell()
+                        if job is None:
+                            stored, old = self._stored_block(entry)
+                            f.write(stored)
+                            blocks.append(BlockEntry(offset, len(stored), old.file_size, old.flags))
+                            summary.reused.append(entry.name)
+                            continue
+                        parts = [part for future in job for part in future.result()]
+                        table = array('I', [(len(parts) + 1) * 4])
+                        for part in parts:
+                            table.append(table[-1] + len(part))
+                        if struct.pack('=I', 1) != struct.pack('<I', 1):
+                            table.byteswap()
+                        f.write(table.tobytes())
+                        for part in parts:
+                            f.write(part)
+                        blocks.append(BlockEntry(offset, f.tell() - offset, len(entry.data),
+                                                 FLAG_EXISTS | FLAG_COMPRESS))
+                        if entry.name != _LISTFILE:
+                            summary.written.append(entry.name)
+
+                    # (attributes) comes last and describes every block, itself included as zeros
+                    count = len(entries) + 1
+                    attributes = struct.pack('<II', _ATTRIBUTES_VERSION, _ATTRIBUTE_CRC32 | _ATTRIBUTE_MD5)
+                    attributes += struct.pack(f'<{count}I', *([entry.crc32 for entry in entries] + [0]))
+                    attributes += b"".join(entry.md5 or b"\0" * 16 for entry in entries) + b"\0" * 16
+                    offset = f.tell()
+                    f.write(attributes)
+                    blocks.append(BlockEntry(offset, len(attributes), len(attributes), FLAG_EXISTS))
+                    entries.append(_Entry(_ATTRIBUTES))
+
+                    hash_count = 16
+                    while hash_count < 2 * len(entries):
+                        hash_count *= 2
+                    hashes = array('I', [_HASH_EMPTY]) * (4 * hash_count)
+                    for block_index, entry in enumerate(entries):
+                        index = hash_string(entry.name, _HASH_OFFSET) & (hash_count - 1)
+                        while hashes[index * 4 + 3] != _HASH_EMPTY:
+                            index = (index + 1) & (hash_count - 1)
+                        hashes[index * 4:index * 4 + 4] = array('I', [
+                            hash_string(entry.name, _HASH_NAME_A), hash_string(entry.name, _HASH_NAME_B),
+                            0, block_index])
+                    table_words = array('I')
+                    for block in blocks:
+                        table_words.extend((block.offset, block.compressed_size, block.file_size, block.flags))
+                    if struct.pack('=I', 1) != struct.pack('<I', 1):
+                        hashes.byteswap()
+                        table_words.byteswap()
+
+                    hash_pos = f.tell()
+                    f.write(encrypt(hashes.tobytes(), hash_string("(hash table)", _HASH_FILE_KEY)))
+                    block_pos = f.tell()
+                    f.write(encrypt(table_words.tobytes(), hash_string("(block table)", _HASH_FILE_KEY)))
+                    summary.size = f.tell()
+                    f.seek(0)
+                    f.write(_HEADER.pack(_MAGIC, _HEADER.size, summary.size, 0, self.sector_shift,
+                                         hash_pos, block_pos, hash_count, len(blocks)))
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+
+        # The old archive is still mapped (and copied from) until the new one is complete
+        self.close()
+        os.replace(tmp_path, path)
+        return summary
@@ -0,0 +1,135 @@
+import hashlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from hexdbc.core.dbc_diff import DBCDiff, StringBlockBuilder, id_rows, record_width
+from hexdbc.core.hexdbc_format import HexDBCGenerator, HexDBCParser
+from hexdbc.core.parser import DBCFile, DBCHeader
+
+OVERLAY_SUFFIX = '.hexdbc'
+
+_DIGEST_SIZE = 16
+
+Fields = Dict[int, Union[int, str]]  # field index -> raw value, or text for strings
+
+
+@dataclass
+class _Layer:
+    digest: bytes
+    records: List[Tuple[int, Fields]]
+    errors: List[str]
+
+
+@dataclass
+class OverlayResult:
+    dbc: DBCFile
+    errors: Dict[str, List[str]] = field(default_factory=dict)  # overlay -> parse errors
+    parsed: List[str] = field(default_factory=list)  # Overlays parsed for this build; the rest were cached
+    changed: int = 0  # Base records an overlay sets fields of
+    added: int = 0  # Records no base has
+
+
+class OverlayStack:
+    """A base DBC with sparse .hexdbc overlays applied on top, in order.
+
+    An overlay only lists the records it changes, and within them only the
+    fields it sets; later overlays win. Records are found through an ID
+    index of the base, so only the records the overlays touch are copied.
+    Each overlay's parse is kept by content digest, and a build only
+    re-parses overlays whose text changed since the last one.
+    """
+
+    def __init__(self, base: DBCFile, overlays: Iterable[Path] = (), parser: Optional[HexDBCParser] = None):
+        self.base = base
+        self.overlays: List[Path] = [Path(path) for path in overlays]
+        self.parser = parser or HexDBCParser()
+        self._layers: Dict[Path, _Layer] = {}
+        self._index: Optional[Dict[int, int]] = None
+        self._strings: Optional[StringBlockBuilder] = None
+
+    def _layer(self, path: Path, text: str, parsed: List[str]) -> _Layer:
+        digest = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=_DIGEST_SIZE).digest()
+        layer = self._layers.get(path)
+        if layer is None or layer.digest != digest:
+            records = self.parser.parse_fields(text, self.base)
+            layer = self._layers[path] = _Layer(digest, records, self.parser.errors)
+            parsed.append(str(path))
+        return layer
+
+    def build(self, texts: Optional[Dict[Path, str]] = None) -> OverlayResult:
+        """Base with every overlay applied; texts overrides what is on disk (e.g. unsaved edits)."""
+        texts = {Path(path): text for path, text in (texts or {}).items()}
+        result = OverlayResult(dbc=None)
+        layers = []
+        for path in self.overlays:
+            text = texts.get(path)
+            if text is None:
+                text = path.read_text(encoding='utf-8')
+            layer = self._layer(path, text, result.parsed)
+            if layer.errors:
+                result.errors[str(path)] = layer.errors
+            layers.append(layer)
+        # Overlays taken out of the stack are not worth keeping
+        for path in self._layers.keys() - set(self.overlays):
+            del self._layers[path]
+
+        base = self.base
+        if self._index is None:
+            self._index = id_rows(base)
+        index = self._index
+        width = record_width(base) if base.records else base.header.record_size // 4
+        records = list(base.records)
+        strings = None
+        copied = set()
+        added: Dict[int, int] = {}
+        for layer in layers:
+            for record_id, fields in layer.records:
+                row = index.get(record_id)
+                if row is None:
+                    row = added.get(record_id)
+                    if row is None:
+                        row = added[record_id] = len(records)
+                        records.append([record_id] + [0] * (width - 1))
+                        copied.add(row)
+                if row not in copied:
+                    records[row] = list(records[row])
+                    copied.add(row)
+                record = records[row]
+                for field_idx, value in fields.items():
+                    if isinstance(value, str):
+                        if strings is None:
+                            if self._strings is None:
+                                self._strings = StringBlockBuilder(base.string_block)
+                            strings = self._strings.copy()
+                        value = strings.add(value.encode('utf-8'))
+                    if field_idx < len(record):
+                        record[field_idx] = value
+
+        block = strings.build() if strings else base.string_block
+        header = DBCHeader(b'WDBC', len(records), base.header.field_count, base.header.record_size, len(block))
+        result.dbc = DBCFile(header=header, records=records, string_block=block)
+        result.added = len(added)
+        result.changed = len(copied) - len(added)
+        return result
+
+
+def write_changes(base: DBCFile, dbc: DBCFile, path: Path, dbc_name: str, changed_fields_only: bool = False,
+                  generator: Optional[HexDBCGenerator] = None) -> DBCDiff:
+    """Write the records dbc adds or changes over base as a sparse overlay; returns the diff.
+
+    Building the overlay over base gives dbc back except for removals:
+    records missing from dbc are only listed in a comment, and the build
+    keeps them.
+    """
+    generator = generator or HexDBCGenerator()
+    schema = generator.schema_manager.get_schema(dbc_name)
+    if schema is None:
+        sample = dbc if dbc.records else base
+        schema = generator.schema_manager.generate_fallback_schema(sample.header.field_count, dbc_name, sample)
+    # Matched by ID, rows compared in bulk; string fields are compared by text
+    diff = DBCDiff(base, dbc, schema)
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        for chunk in generator.generate_changes(diff, dbc_name, changed_fields_only):
+            f.write(chunk)
+    return diff
@@ -1,7 +1,11 @@
 import struct
-from dataclasses import dataclass
+import sys
+from array import array
+from dataclasses import dataclass, field
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 @dataclass
@@ -34,6 +38,51 @@ class DBCFile:
     records: List[List[int]]  # Each record is a list of uint32 values
     string_block: bytes
     source_path: Optional[Path] = None
+    # Column arrays built on demand; call invalidate_columns() after editing records in place
+    _columns: Dict[int, array] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _flat: Optional[array] = field(default=None, init=False, repr=False, compare=False)
+    
+    @classmethod
+    def from_flat(cls, flat: array, width: int, string_block: bytes,
+                  field_count: Optional[int] = None, source_path: Optional[Path] = None) -> "DBCFile":
+        """Build a DBCFile from row-major uint32 values."""
+        records = [flat[start:start + width].tolist() for start in range(0, len(flat), width)] if width else []
+        header = DBCHeader(
+            magic=b'WDBC',
+            record_count=len(records),
+            field_count=width if field_count is None else field_count,
+            record_size=width * 4,
+            string_block_size=len(string_block),
+        )
+        dbc = cls(header=header, records=records, string_block=string_block, source_path=source_path)
+        dbc._flat = flat
+        return dbc
+    
+    def flat(self) -> array:
+        """All records packed row-major into one uint32 array."""
+        if self._flat is None:
+            self._flat = array('I', chain.from_iterable(self.records))
+        return self._flat
+    
+    def column(self, field_idx: int) -> array:
+        """Return one field of every record as a packed uint32 array."""
+        col = self._columns.get(field_idx)
+        if col is None:
+            width = len(self.records[0]) if self.records else 0
+            if not 0 <= field_idx < width:
+                raise IndexError(f"Field index {field_idx} out of range (0-{width - 1})")
+            flat = self.flat()
+            if len(flat) == width * len(self.records):
+                col = flat[field_idx::width]
+            else:
+                # Ragged records: no fixed stride to slice with
+                col = array('I', map(itemgetter(field_idx), self.records))
+            self._columns[field_idx] = col
+        return col
+    
+    def invalidate_columns(self) -> None:
+        self._columns.clear()
+        self._flat = None
     
     def get_string(self, offset: int) -> str:
         if offset == 0 or offset >= len(self.string_block):
@@ -80,6 +129,17 @@ class DBCParser:
         
         return self.parse_bytes(data, file_path)
     
+    def read_header(self, file_path: Path) -> DBCHeader:
+        """Read only the 20-byte header of a DBC file."""
+        with open(file_path, 'rb') as f:
+            data = f.read(self.HEADER_SIZE)
+        if len(data) < self.HEADER_SIZE:
+            raise ValueError("File too small to be a valid DBC file")
+        header = DBCHeader(*struct.unpack(self.HEADER_FORMAT, data))
+        if not header.is_valid:
+            raise ValueError(f"Invalid DBC magic: {header.magic}")
+        return header
+    
     def parse_bytes(self, data: bytes, source_path: Optional[Path] = None) -> DBCFile:
         if len(data) < self.HEADER_SIZE:
             raise ValueError("File too small to be a valid DBC file")
@@ -107,31 +167,44 @@ class DBCParser:
         # Parse records
         records = []
         fields_per_record = header.record_size // 4
+        flat = None
         
-        for i in range(header.record_count):
-            offset = self.HEADER_SIZE + (i * header.record_size)
-            record_data = data[offset:offset + header.record_size]
-            
-            # Parse each field as uint32
-            fields = []
-            for j in range(fields_per_record):
-                field_offset = j * 4
-                if field_offset + 4 <= len(record_data):
-                    value = struct.unpack('<I', record_data[field_offset:field_offset + 4])[0]
-                    fields.append(value)
-            
-            records.append(fields)
+        if header.record_size % 4 == 0 and fields_per_record:
+            # Whole-word records: one copy into an array, then split into rows
+            flat = array('I', data[self.HEADER_SIZE:self.HEADER_SIZE + records_size])
+            if sys.byteorder == 'big':
+                flat.byteswap()
+            records = [
+                flat[start:start + fields_per_record].tolist()
+                for start in range(0, len(flat), fields_per_record)
+            ]
+        else:
+            for i in range(header.record_count):
+                offset = self.HEADER_SIZE + (i * header.record_size)
+                record_data = data[offset:offset + header.record_size]
+                
+                # Parse each field as uint32
+                fields = []
+                for j in range(fields_per_record):
+                    field_offset = j * 4
+                    if field_offset + 4 <= len(record_data):
+                        value = struct.unpack('<I', record_data[field_offset:field_offset + 4])[0]
+                        fields.append(value)
+                
+                records.append(fields)
         
         # Extract string block
         string_block_offset = self.HEADER_SIZE + records_size
         string_block = data[string_block_offset:string_block_offset + header.string_block_size]
         
-        return DBCFile(
+        dbc = DBCFile(
             header=header,
             records=records,
             string_block=string_block,
             source_path=source_path
         )
+        dbc._flat = flat
+        return dbc
 
 
 class DBCWriter:
@@ -147,8 +220,8 @@ class DBCWriter:
         # Build records data
         records_data = bytearray()
         for record in dbc.records:
-            for field in record:
-                records_data.extend(struct.pack('<I', field & 0xFFFFFFFF))
+            for value in record:
+                records_data.extend(struct.pack('<I', value & 0xFFFFFFFF))
         
         # Build header
         header_data = struct.pack(
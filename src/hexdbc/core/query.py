@@ -0,0 +1,335 @@
+import re
+import struct
+from array import array
+from dataclasses import dataclass
+from itertools import compress
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from hexdbc.core.column_index import typed_column
+from hexdbc.core.parser import DBCFile
+from hexdbc.core.schema import FieldType, SchemaDef
+
+# Query grammar:
+#   expr      := term ('or' term)*
+#   term      := factor ('and' factor)*
+#   factor    := 'not' factor | '(' expr ')' | predicate
+#   predicate := FIELD OP VALUE
+#   OP        := = == != < <= > >= ~ !~ &
+# '~' / '!~' are case-insensitive substring tests on string fields,
+# '&' is a non-zero bitmask test on integer fields.
+_TOKEN_RE = re.compile(r'''
+    \s*(?:
+        (?P<num>-?(?:0[xX][0-9a-fA-F]+|(?:\d+\.\d*|\.\d+|\d+)(?:[eE][-+]?\d+)?))
+      | (?P<str>"(?:[^"\\]|\\.)*")
+      | (?P<op>==|!=|<=|>=|!~|=|<|>|~|&|\(|\))
+      | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+    )''', re.VERBOSE)
+
+_KEYWORDS = {"and", "or", "not"}
+_STRING_OPS = {"=", "!=", "~", "!~"}
+_NUMERIC_OPS = {"=", "!=", "<", "<=", ">", ">=", "&"}
+_STRING_TYPES = (FieldType.STRING, FieldType.LOCSTRING)
+
+# Optional per-column index: index_provider(field_idx, field_type) returns None or an
+# object with equal(raw) and range(lo, hi, include_lo, include_hi), both returning
+# sorted row indices. Values are in the column's typed domain (signed/float/unsigned).
+IndexProvider = Callable[[int, FieldType], Any]
+
+
+class QuerySyntaxError(ValueError):
+    pass
+
+
+@dataclass
+class Predicate:
+    field_idx: int
+    field_type: FieldType
+    op: str
+    value: Union[int, float, str]
+
+
+@dataclass
+class BoolOp:
+    op: str  # 'and' / 'or'
+    left: Any
+    right: Any
+
+
+@dataclass
+class NotOp:
+    child: Any
+
+
+@dataclass
+class QueryResult:
+    rows: List[int]  # record indices into DBCFile.records, ascending
+    ids: List[int]   # field 0 of each matching record
+
+
+def _tokenize(text: str) -> List[tuple]:
+    tokens = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = _TOKEN_RE.match(text, pos)
+        if not match or match.end() == pos:
+            raise QuerySyntaxError(f"Unexpected character at {pos}: {text[pos:pos + 10]!r}")
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "name" and value.lower() in _KEYWORDS:
+            kind, value = "kw", value.lower()
+        tokens.append((kind, value))
+        pos = match.end()
+    return tokens
+
+
+class _QueryParser:
+    def __init__(self, text: str, engine: "QueryEngine"):
+        self.tokens = _tokenize(text)
+        self.pos = 0
+        self.engine = engine
+
+    def parse(self):
+        if not self.tokens:
+            raise QuerySyntaxError("Empty query")
+        node = self._expr()
+        if self.pos < len(self.tokens):
+            raise QuerySyntaxError(f"Unexpected {self.tokens[self.pos][1]!r}")
+        return node
+
+    def _peek(self, kind: str, value: Optional[str] = None) -> bool:
+        if self.pos >= len(self.tokens):
+            return False
+        tok_kind, tok_value = self.tokens[self.pos]
+        return tok_kind == kind and (value is None or tok_value == value)
+
+    def _take(self):
+        if self.pos >= len(self.tokens):
+            raise QuerySyntaxError("Unexpected end of query")
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def _expr(self):
+        node = self._term()
+        while self._peek("kw", "or"):
+            self._take()
+            node = BoolOp("or", node, self._term())
+        return node
+
+    def _term(self):
+        node = self._factor()
+        while self._peek("kw", "and"):
+            self._take()
+            node = BoolOp("and", node, self._factor())
+        return node
+
+    def _factor(self):
+        if self._peek("kw", "not"):
+            self._take()
+            return NotOp(self._factor())
+        if self._peek("op", "("):
+            self._take()
+            node = self._expr()
+            if not self._peek("op", ")"):
+                raise QuerySyntaxError("Missing ')'")
+            self._take()
+            return node
+        return self._predicate()
+
+    def _predicate(self) -> Predicate:
+        kind, name = self._take()
+        if kind != "name":
+            raise QuerySyntaxError(f"Expected field name, got {name!r}")
+        field_idx, field_type = self.engine.resolve_field(name)
+
+        kind, op = self._take()
+        if kind != "op" or op in ("(", ")"):
+            raise QuerySyntaxError(f"Expected operator after {name}, got {op!r}")
+        if op == "==":
+            op = "="
+
+        kind, raw = self._take()
+        if field_type in _STRING_TYPES:
+            if op not in _STRING_OPS:
+                raise QuerySyntaxError(f"Operator {op} not supported on string field {name}")
+            if kind != "str":
+                raise QuerySyntaxError(f"String field {name} needs a quoted value")
+            value = raw[1:-1].replace('\\"', '"').replace('\\\\', '\\')
+        else:
+            if op not in _NUMERIC_OPS:
+                raise QuerySyntaxError(f"Operator {op} not supported on numeric field {name}")
+            value = self._numeric_value(kind, raw, field_idx, name)
+            if op == "&" and (field_type == FieldType.FLOAT or not isinstance(value, int)):
+                raise QuerySyntaxError(f"Operator & needs an integer field and mask ({name})")
+            if field_type == FieldType.FLOAT:
+                # Compare against what float32 storage can actually hold
+                value = struct.unpack('<f', struct.pack('<f', float(value)))[0]
+            elif field_type != FieldType.INT and isinstance(value, int):
+                value &= 0xFFFFFFFF
+        return Predicate(field_idx, field_type, op, value)
+
+    def _numeric_value(self, kind: str, raw: str, field_idx: int, name: str):
+        if kind == "num":
+            if raw.lower().lstrip("-").startswith("0x"):
+                return int(raw, 16)
+            if any(c in raw for c in ".eE"):
+                return float(raw)
+            return int(raw)
+        if kind == "name":
+            enum_value = self.engine.resolve_enum(field_idx, raw)
+            if enum_value is not None:
+                return enum_value
+            raise QuerySyntaxError(f"Unknown enum value {raw} for {name}")
+        raise QuerySyntaxError(f"Numeric field {name} needs a number, got {raw}")
+
+
+class QueryEngine:
+    """Evaluates structured queries directly against DBCFile columns."""
+
+    def __init__(
+        self,
+        dbc: DBCFile,
+        schema: Optional[SchemaDef] = None,
+        index_provider: Optional[IndexProvider] = None,
+    ):
+        self.dbc = dbc
+        self.schema = schema
+        self.index_provider = index_provider
+        self._typed: Dict[int, array] = {}
+        self._width = len(dbc.records[0]) if dbc.records else dbc.header.field_count
+
+        self._field_names: Dict[str, int] = {"id": 0}
+        for i in range(self._width):
+            self._field_names[f"field_{i}"] = i
+        if schema:
+            for i, field_def in enumerate(schema.fields[:self._width]):
+                self._field_names[field_def.name.lower()] = i
+
+    def resolve_field(self, name: str) -> tuple:
+        field_idx = self._field_names.get(name.lower())
+        if field_idx is None:
+            raise QuerySyntaxError(f"Unknown field {name}")
+        return field_idx, self.field_type(field_idx)
+
+    def field_type(self, field_idx: int) -> FieldType:
+        if self.schema and field_idx < len(self.schema.fields):
+            field_type = self.schema.fields[field_idx].type
+            return FieldType.STRING if field_type == FieldType.LOCSTRING else field_type
+        return FieldType.INT if field_idx == 0 else FieldType.UINT
+
+    def resolve_enum(self, field_idx: int, value_name: str) -> Optional[int]:
+        if not self.schema:
+            return None
+        field_def = self.schema.get_field(field_idx)
+        enums = self.schema.enums
+        maps = [enums.get(field_def.enum_name, {})] if field_def and field_def.enum_name else enums.values()
+        for enum_map in maps:
+            for value, name in enum_map.items():
+                if name == value_name:
+                    return value
+        return None
+
+    def compile(self, text: str):
+        return _QueryParser(text, self).parse()
+
+    def execute(self, text: str) -> QueryResult:
+        rows = self._eval(self.compile(text), None)
+        ids = self.dbc.column(0) if self.dbc.records else array('I')
+        return QueryResult(rows=rows, ids=[ids[i] for i in rows])
+
+    def _typed_column(self, field_idx: int, field_type: FieldType) -> array:
+        col = self._typed.get(field_idx)
+        if col is None:
+            col = typed_column(self.dbc, field_idx, field_type)
+            self._typed[field_idx] = col
+        return col
+
+    def _eval(self, node, candidates: Optional[List[int]]) -> List[int]:
+        if isinstance(node, BoolOp):
+            left = self._eval(node.left, candidates)
+            if node.op == "and":
+                # Narrow the right side to rows that already matched
+                return self._eval(node.right, left) if left else []
+            right = self._eval(node.right, candidates)
+            return sorted(set(left).union(right))
+        if isinstance(node, NotOp):
+            excluded = set(self._eval(node.child, candidates))
+            base = candidates if candidates is not None else range(len(self.dbc.records))
+            return [i for i in base if i not in excluded]
+        return self._eval_predicate(node, candidates)
+
+    def _eval_predicate(self, pred: Predicate, candidates: Optional[List[int]]) -> List[int]:
+        if not self.dbc.records:
+            return []
+
+        if pred.field_type in _STRING_TYPES:
+            return self._eval_string(pred, candidates)
+
+        if candidates is None and self.index_provider is not None:
+            rows = self._eval_indexed(pred)
+            if rows is not None:
+                return rows
+
+        col = self._typed_column(pred.field_idx, pred.field_type)
+        test = self._numeric_test(pred.op, pred.value)
+        if candidates is None:
+            return list(compress(range(len(col)), map(test, col)))
+        return [i for i in candidates if test(col[i])]
+
+    def _eval_indexed(self, pred: Predicate) -> Optional[List[int]]:
+        if pred.op in ("!=", "&"):
+            return None
+        index = self.index_provider(pred.field_idx, pred.field_type)
+        if index is None:
+            return None
+        value = pred.value
+        if pred.op == "=":
+            raw = struct.unpack('<I', struct.pack('<f', value))[0] if pred.field_type == FieldType.FLOAT \
+                else int(value) & 0xFFFFFFFF
+            if pred.field_type != FieldType.FLOAT and value != int(value):
+                return []
+            return list(index.equal(raw))
+        if pred.op in ("<", "<="):
+            return list(index.range(None, value, True, pred.op == "<="))
+        return list(index.range(value, None, pred.op == ">=", True))
+
+    @staticmethod
+    def _numeric_test(op: str, value) -> Callable[[Any], Any]:
+        # Bound methods of the literal keep the per-row work in C
+        if op == "=":
+            return value.__eq__
+        if op == "!=":
+            return value.__ne__
+        if op == "<":
+            return value.__gt__
+        if op == "<=":
+            return value.__ge__
+        if op == ">":
+            return value.__lt__
+        if op == ">=":
+            return value.__le__
+        if op == "&":
+            mask = int(value)
+            return mask.__and__
+        raise QuerySyntaxError(f"Unsupported operator {op}")
+
+    def _eval_string(self, pred: Predicate, candidates: Optional[List[int]]) -> List[int]:
+        col = self.dbc.column(pred.field_idx)
+        offsets = set(col) if candidates is None else {col[i] for i in candidates}
+
+        # Resolve each distinct offset once instead of once per row
+        needle = pred.value.lower()
+        matching = set()
+        for offset in offsets:
+            text = self.dbc.get_string(offset)
+            if pred.op in ("~", "!~"):
+                hit = needle in text.lower()
+            else:
+                hit = text == pred.value
+            if hit != (pred.op in ("!=", "!~")):
+                matching.add(offset)
+
+        if candidates is None:
+            return list(compress(range(len(col)), map(matching.__contains__, col)))
+        return [i for i in candidates if col[i] in matching]
@@ -0,0 +1,145 @@
+import re
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# Record header lines as written by HexDBCGenerator, e.g. "spell(123) {"
+RECORD_HEADER_RE = re.compile(r'^[ \t]*\w+\((\d+)\)\s*\{', re.MULTILINE)
+
+
+def scan_record_headers(text: str) -> List[Tuple[int, int]]:
+    """(record_id, 0-based line) of every record header, in document order."""
+    headers = []
+    line = 0
+    last = 0
+    # Every header ends in "{", which is rare elsewhere: find those instead of
+    # trying the pattern at every line of the text
+    pos = text.find('{')
+    while pos != -1:
+        end = pos - 1
+        while end >= 0 and text[end].isspace():
+            end -= 1
+        if end >= 0 and text[end] == ')':
+            start = text.rfind('\n', 0, end) + 1
+            match = RECORD_HEADER_RE.match(text, start)
+            if match and match.end() == pos + 1:
+                line += text.count('\n', last, start)
+                last = start
+                headers.append((int(match.group(1)), line))
+        pos = text.find('{', pos + 1)
+    return headers
+
+
+def parse_record_header(line: str) -> Optional[int]:
+    """Record ID if the line is a record header, else None."""
+    match = RECORD_HEADER_RE.match(line)
+    return int(match.group(1)) if match else None
+
+
+class RecordIndex:
+    """Sorted set of record IDs, each pointing at the anchor(s) of its header.
+
+    Anchors are opaque to the index (the editor uses text cursors). When an
+    ID appears more than once, the first anchor added wins until removed.
+    """
+
+    def __init__(self):
+        self._ids: List[int] = []
+        self._anchors: Dict[int, List[Any]] = {}
+        self._duplicates: Set[int] = set()
+        # Free [start, end) ID runs below the max ID, rebuilt on demand after the set changes
+        self._gaps: Optional[Tuple[List[int], List[int]]] = None
+
+    def add(self, record_id: int, anchor: Any) -> None:
+        anchors = self._anchors.get(record_id)
+        if anchors is None:
+            self._anchors[record_id] = [anchor]
+            insort(self._ids, record_id)
+            self._gaps = None
+        else:
+            anchors.append(anchor)
+            self._duplicates.add(record_id)
+
+    def discard(self, record_id: int, anchor: Any) -> None:
+        anchors = self._anchors.get(record_id)
+        if not anchors:
+            return
+        for i, existing in enumerate(anchors):
+            if existing is anchor:
+                del anchors[i]
+                break
+        if len(anchors) < 2:
+            self._duplicates.discard(record_id)
+        if not anchors:
+            del self._anchors[record_id]
+            del self._ids[bisect_left(self._ids, record_id)]
+            self._gaps = None
+
+    def clear(self) -> None:
+        self._ids.clear()
+        self._anchors.clear()
+        self._duplicates.clear()
+        self._gaps = None
+
+    def get(self, record_id: int) -> Optional[Any]:
+        anchors = self._anchors.get(record_id)
+        return anchors[0] if anchors else None
+
+    def count(self, record_id: int) -> int:
+        return len(self._anchors.get(record_id, ()))
+
+    def anchors(self, record_id: int) -> List[Any]:
+        """Every anchor of an ID, first-added first."""
+        return list(self._anchors.get(record_id, ()))
+
+    @property
+    def duplicates(self) -> Set[int]:
+        """IDs with more than one anchor."""
+        return self._duplicates
+
+    def ceiling(self, record_id: int) -> Optional[int]:
+        """Smallest indexed ID >= record_id."""
+        pos = bisect_left(self._ids, record_id)
+        return self._ids[pos] if pos < len(self._ids) else None
+
+    @property
+    def ids(self) -> List[int]:
+        return self._ids
+
+    @property
+    def max_id(self) -> int:
+        """Highest indexed ID, or 0 when empty."""
+        return self._ids[-1] if self._ids else 0
+
+    def _gap_index(self) -> Tuple[List[int], List[int]]:
+        if self._gaps is None:
+            ids = self._ids
+            starts: List[int] = []
+            ends: List[int] = []
+            if ids and ids[0] > 0:
+                starts.append(0)
+                ends.append(ids[0])
+            for prev, cur in zip(ids, ids[1:]):
+                if cur - prev > 1:
+                    starts.append(prev + 1)
+                    ends.append(cur)
+            self._gaps = (starts, ends)
+        return self._gaps
+
+    def find_free_range(self, count: int = 1, start: int = 1) -> int:
+        """First ID >= start such that count consecutive IDs from it are all unused."""
+        start = max(start, 0)
+        if not self._ids or start > self._ids[-1]:
+            return start
+        starts, ends = self._gap_index()
+        # Only gaps ending after start can hold the range
+        for i in range(bisect_right(ends, start), len(starts)):
+            first = max(starts[i], start)
+            if ends[i] - first >= count:
+                return first
+        return self._ids[-1] + 1
+
+    def __contains__(self, record_id: object) -> bool:
+        return record_id in self._anchors
+
+    def __len__(self) -> int:
+        return len(self._ids)
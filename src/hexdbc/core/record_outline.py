@@ -0,0 +1,120 @@
+import re
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Optional
+
+from hexdbc.core.dbc_diff import record_width, string_texts
+from hexdbc.core.parser import DBCFile
+from hexdbc.core.schema import FieldType, SchemaDef
+
+_STRING_TYPES = (FieldType.STRING, FieldType.LOCSTRING)
+
+# Incremental filtering re-checks the previous matches one by one; past this
+# share of all records a single regex pass over the whole index is faster
+_NARROW_FRACTION = 8
+
+
+def name_field(schema: Optional[SchemaDef], width: int) -> Optional[int]:
+    """Field that best names a record: the first string field called Name*, else the first string field."""
+    if not schema:
+        return None
+    fields = [(i, f) for i, f in enumerate(schema.fields[:width]) if f.type in _STRING_TYPES and i > 0]
+    for field_idx, field_def in fields:
+        if field_def.name.lower().startswith("name"):
+            return field_idx
+    return fields[0][0] if fields else None
+
+
+class RecordOutline:
+    """Record IDs and display names of a DBC, with a substring filter.
+
+    Rows hold nothing but the record's index: IDs and name offsets are
+    columns of the binary records, and names are decoded only for the rows
+    being displayed. Filtering searches a lowercase "id name" line per
+    record, joined into one string and built on the first filter.
+    """
+
+    def __init__(self, dbc: DBCFile, schema: Optional[SchemaDef] = None):
+        self.dbc = dbc
+        width = record_width(dbc)
+        self.name_field = name_field(schema, width)
+        self.name_label = schema.fields[self.name_field].name if self.name_field is not None else ""
+        self._ids = dbc.column(0) if width else array('I')
+        self._names = dbc.column(self.name_field) if self.name_field is not None else None
+        self._index_text: Optional[str] = None
+        self._line_starts: Optional[array] = None
+        self._query = ""
+        self._rows: Optional[array] = None  # Matching record indices; None while unfiltered
+
+    @property
+    def record_count(self) -> int:
+        return len(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._rows) if self._rows is not None else len(self._ids)
+
+    def record_index(self, row: int) -> int:
+        return self._rows[row] if self._rows is not None else row
+
+    def record_id(self, row: int) -> int:
+        return self._ids[self.record_index(row)]
+
+    def name(self, row: int) -> str:
+        if self._names is None:
+            return ""
+        return self.dbc.get_string(self._names[self.record_index(row)])
+
+    def _build_index(self) -> None:
+        lowered = {}
+        if self._names is not None:
+            for offset, raw in string_texts(self.dbc.string_block).items():
+                lowered[offset] = raw.decode('utf-8', errors='replace').lower().replace("\n", " ")
+            names = []
+            for offset in self._names:
+                name = lowered.get(offset)
+                if name is None:
+                    # Points into the middle of another string (shared suffix)
+                    name = lowered[offset] = self.dbc.get_string(offset).lower().replace("\n", " ")
+                names.append(name)
+        else:
+            names = [""] * len(self._ids)
+        lines = [f"{record_id} {name}" for record_id, name in zip(self._ids, names)]
+        self._index_text = "\n".join(lines)
+        self._line_starts = array('I', accumulate((len(line) + 1 for line in lines[:-1]), initial=0))
+
+    @property
+    def query(self) -> str:
+        return self._query
+
+    def set_filter(self, query: str) -> None:
+        """Show only records whose "id name" contains query (case-insensitive)."""
+        query = query.strip().lower().replace("\n", " ")
+        if query == self._query:
+            return
+        previous, previous_rows = self._query, self._rows
+        self._query = query
+        if not query:
+            self._rows = None
+            return
+        if self._index_text is None:
+            self._build_index()
+
+        text = self._index_text
+        narrowing = previous and query.startswith(previous) and previous_rows is not None
+        if narrowing and len(previous_rows) * _NARROW_FRACTION < len(self._ids):
+            # Typing one more character: only earlier matches can still match
+            starts = self._line_starts
+            last = len(starts) - 1
+            rows = array('I')
+            for row in previous_rows:
+                end = starts[row + 1] - 1 if row < last else len(text)
+                if text.find(query, starts[row], end) != -1:
+                    rows.append(row)
+            self._rows = rows
+            return
+
+        # One match per matching line, starting at the line start
+        pattern = re.compile(r'^[^\n]*?' + re.escape(query), re.MULTILINE)
+        starts = self._line_starts
+        self._rows = array('I', (bisect_right(starts, m.start()) - 1 for m in pattern.finditer(text)))
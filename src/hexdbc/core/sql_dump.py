@@ -0,0 +1,157 @@
+import math
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from hexdbc.core.hexdbc_format import format_float
+from hexdbc.core.dbc_diff import DBCDiff, id_rows, padded_flat, record_width
+from hexdbc.core.parser import DBCFile
+from hexdbc.core.schema import FieldType, SchemaDef, field_columns
+
+DEFAULT_BATCH_ROWS = 500
+
+DIALECTS = ('mysql', 'sqlite')
+STATEMENTS = ('INSERT', 'REPLACE')
+
+_STRING_TYPES = (FieldType.STRING, FieldType.LOCSTRING)
+_SQL_TYPES = {FieldType.FLOAT: "FLOAT", FieldType.STRING: "TEXT", FieldType.LOCSTRING: "TEXT"}
+
+_F32 = struct.Struct('<f')
+_U32 = struct.Struct('<I')
+
+# MySQL reads backslash escapes in string literals unless NO_BACKSLASH_ESCAPES is set
+_MYSQL_ESCAPES = str.maketrans({
+    '\\': '\\\\', "'": "\\'", '\0': '\\0', '\n': '\\n', '\r': '\\r', '\x1a': '\\Z',
+})
+
+
+@dataclass
+class DumpSummary:
+    rows: int = 0
+    statements: int = 0
+    removed: List[int] = field(default_factory=list)  # IDs only in the base; override tables cannot drop them
+
+
+def default_table_name(dbc_name: str) -> str:
+    """Emulator override table for a DBC, e.g. Spell -> spell_dbc."""
+    return f"{dbc_name.lower()}_dbc"
+
+
+def quote_identifier(name: str) -> str:
+    # Backticks are MySQL's quotes, and SQLite accepts them too
+    return '`' + name.replace('`', '``') + '`'
+
+
+def quote_string(text: str, dialect: str = 'mysql') -> str:
+    if dialect == 'mysql':
+        return "'" + text.translate(_MYSQL_ESCAPES) + "'"
+    return "'" + text.replace("'", "''") + "'"
+
+
+def _literal(field_type: FieldType, dbc: DBCFile, dialect: str) -> Callable[[int], str]:
+    if field_type in _STRING_TYPES:
+        return lambda offset: quote_string(dbc.get_string(offset), dialect)
+    if field_type == FieldType.FLOAT:
+        def literal(bits: int) -> str:
+            if not math.isfinite(_F32.unpack(_U32.pack(bits))[0]):
+                return "NULL"  # Neither dialect has a literal for NaN or infinity
+            return format_float(bits)
+        return literal
+    if field_type == FieldType.INT:
+        return lambda value: str(value - 0x100000000 if value >= 0x80000000 else value)
+    return str
+
+
+def create_table_statement(table: str, columns: List[Tuple[str, FieldType]]) -> str:
+    """CREATE TABLE for a stand-in of an override table, keyed on the first column."""
+    definitions = [f"{quote_identifier(name)} {_SQL_TYPES.get(field_type, 'INTEGER')}"
+                   for name, field_type in columns]
+    if columns:
+        definitions.append(f"PRIMARY KEY ({quote_identifier(columns[0][0])})")
+    return f"CREATE TABLE IF NOT EXISTS {quote_identifier(table)} ({', '.join(definitions)});"
+
+
+class SQLDump:
+    """Batched multi-row INSERT/REPLACE statements for a DBC's records.
+
+    With a base DBC only added and changed records are dumped (matched by
+    ID); records the base has but dbc lacks are listed in the summary. With
+    delete_first each batch is preceded by a DELETE of its IDs, so plain
+    INSERTs can be re-run.
+    """
+
+    def __init__(self, dbc: DBCFile, table: str, schema: Optional[SchemaDef] = None,
+                 base: Optional[DBCFile] = None, statement: str = 'REPLACE', dialect: str = 'mysql',
+                 batch_rows: int = DEFAULT_BATCH_ROWS, delete_first: bool = False):
+        if statement not in STATEMENTS:
+            raise ValueError(f"Unknown statement {statement!r} (expected one of {', '.join(STATEMENTS)})")
+        if dialect not in DIALECTS:
+            raise ValueError(f"Unknown SQL dialect {dialect!r} (expected one of {', '.join(DIALECTS)})")
+        if batch_rows < 1:
+            raise ValueError("Batch size must be at least 1")
+        self.dbc = dbc
+        self.table = table
+        self.schema = schema
+        self.base = base
+        self.statement = statement
+        self.dialect = dialect
+        self.batch_rows = batch_rows
+        self.delete_first = delete_first
+        self.width = record_width(dbc)
+        self.columns = field_columns(schema, self.width)
+        self.summary = DumpSummary()
+
+    def _rows(self) -> List[int]:
+        """Row indices to dump, in file order."""
+        if self.base is None:
+            return list(range(len(self.dbc.records)))
+        diff = DBCDiff(self.base, self.dbc, self.schema)
+        self.summary.removed = diff.removed
+        new_rows = id_rows(self.dbc)
+        return sorted(new_rows[record_id] for record_id in diff.added + diff.changed)
+
+    def statements(self) -> Iterator[str]:
+        """Each statement of the dump, ending in ';' and without a trailing newline."""
+        self.summary = DumpSummary()
+        width = self.width
+        if not width:
+            return
+        rows = self._rows()
+        flat = padded_flat(self.dbc, width)
+        literals = [_literal(field_type, self.dbc, self.dialect) for _, field_type in self.columns]
+        # Values repeat a lot within a column; render each one once
+        caches: List[Dict[int, str]] = [{} for _ in literals]
+        table = quote_identifier(self.table)
+        column_list = ", ".join(quote_identifier(name) for name, _ in self.columns)
+        verb = "REPLACE INTO" if self.statement == 'REPLACE' else "INSERT INTO"
+        key = quote_identifier(self.columns[0][0])
+
+        for start in range(0, len(rows), self.batch_rows):
+            batch = rows[start:start + self.batch_rows]
+            tuples = []
+            for row in batch:
+                values = flat[row * width:(row + 1) * width]
+                rendered = []
+                for value, cache, literal in zip(values, caches, literals):
+                    text = cache.get(value)
+                    if text is None:
+                        text = cache[value] = literal(value)
+                    rendered.append(text)
+                tuples.append("(" + ",".join(rendered) + ")")
+            if self.delete_first:
+                ids = ",".join(caches[0][flat[row * width]] for row in batch)
+                yield f"DELETE FROM {table} WHERE {key} IN ({ids});"
+                self.summary.statements += 1
+            yield f"{verb} {table} ({column_list}) VALUES\n" + ",\n".join(tuples) + ";"
+            self.summary.statements += 1
+            self.summary.rows += len(batch)
+
+    def write(self, path: Path) -> DumpSummary:
+        """Stream the dump to path, one batch at a time."""
+        with open(path, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(f"-- {self.table}: {'changes' if self.base is not None else 'all records'}\n")
+            for statement in self.statements():
+                f.write(statement)
+                f.write("\n\n")
+        return self.summary
@@ -0,0 +1,292 @@
+import json
+import math
+import os
+import sqlite3
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from hexdbc.core.dbc_diff import StringBlockBuilder, record_width, string_texts
+from hexdbc.core.dbc_relations import get_all_references
+from hexdbc.core.parser import DBCFile, DBCHeader, DBCParser
+from hexdbc.core.schema import FieldType, SchemaDef, SchemaManager, field_columns
+
+META_TABLE = "_hexdbc_tables"
+RAW_TABLE = "_hexdbc_raw"
+ROW_COLUMN = "_row"  # Record position in the DBC
+
+# DBC files are parsed this many at a time while earlier ones are inserted
+MAX_PARSE_WORKERS = 4
+
+_SQL_TYPES = {
+    FieldType.UINT: "INTEGER",
+    FieldType.INT: "INTEGER",
+    FieldType.FLAGS: "INTEGER",
+    FieldType.ENUM: "INTEGER",
+    FieldType.FLOAT: "REAL",
+    FieldType.STRING: "TEXT",
+    FieldType.LOCSTRING: "TEXT",
+}
+
+_STRING_TYPES = (FieldType.STRING, FieldType.LOCSTRING)
+
+
+def quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+@dataclass
+class ExportSummary:
+    tables: Dict[str, int] = field(default_factory=dict)  # table -> rows
+    errors: Dict[str, str] = field(default_factory=dict)  # DBC name -> why it was skipped
+
+
+class SQLiteBridge:
+    """Typed SQLite tables for DBC files, and back.
+
+    Each DBC becomes one table with a column per field, typed from its
+    schema: integers, REAL floats and resolved TEXT strings, indexed on the
+    ID and on the fields DBC_RELATIONS links to other tables. Values SQLite
+    cannot hold exactly (NaN, -0.0, undecodable or shared strings) are kept
+    raw on the side, so importing an unedited table gives back the same DBC
+    byte for byte.
+    """
+
+    def __init__(self, db_path: Path, schema_manager: Optional[SchemaManager] = None):
+        self.db_path = Path(db_path)
+        self.schema_manager = schema_manager or SchemaManager()
+        # Transactions are managed explicitly so a bulk load is one commit
+        self.conn = sqlite3.connect(str(self.db_path), isolation_level=None)
+        self.conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {META_TABLE} (name TEXT PRIMARY KEY, field_count INTEGER, "
+            f"record_size INTEGER, columns TEXT, string_block BLOB)")
+        self.conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {RAW_TABLE} (name TEXT, row INTEGER, field INTEGER, raw INTEGER, "
+            f"typed, PRIMARY KEY (name, row, field)) WITHOUT ROWID")
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def tables(self) -> List[str]:
+        return [name for name, in self.conn.execute(f"SELECT name FROM {META_TABLE} ORDER BY name")]
+
+    def export_dbcs(self, dbcs: Iterable[Tuple[str, DBCFile]]) -> ExportSummary:
+        """Write each (name, DBC) as a table, replacing any table of that name, in one transaction."""
+        summary = ExportSummary()
+        # The database is a derived copy; a crash mid-load only means loading again
+        self.conn.execute("PRAGMA synchronous = OFF")
+        self.conn.execute("PRAGMA journal_mode = MEMORY")
+        self.conn.execute("BEGIN")
+        try:
+            for name, dbc in dbcs:
+                summary.tables[name] = self._export(name, dbc)
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return summary
+
+    def export_folder(self, folder: Path, parser: Optional[DBCParser] = None) -> ExportSummary:
+        """Load every *.dbc in folder; files that fail to parse are skipped and reported."""
+        parser = parser or DBCParser()
+        paths = sorted((Path(entry.path) for entry in os.scandir(folder)
+                        if entry.name.lower().endswith('.dbc') and entry.is_file()),
+                       key=lambda path: path.name.lower())
+        errors: Dict[str, str] = {}
+
+        def load(path: Path) -> Optional[DBCFile]:
+            try:
+                return parser.parse(path)
+            except (OSError, ValueError) as e:
+                errors[path.stem] = str(e)
+                return None
+
+        with ThreadPoolExecutor(max_workers=MAX_PARSE_WORKERS) as pool:
+            # map() yields in order, so inserting overlaps with parsing the next files
+            loaded = zip(paths, pool.map(load, paths))
+            summary = self.export_dbcs((path.stem, dbc) for path, dbc in loaded if dbc is not None)
+        summary.errors = errors
+        return summary
+
+    def _schema(self, name: str, dbc: DBCFile) -> Optional[SchemaDef]:
+        schema = self.schema_manager.get_schema(name)
+        if schema is None and dbc.records:
+            schema = self.schema_manager.infer_schema(dbc, name)
+        return schema
+
+    def _export(self, name: str, dbc: DBCFile) -> int:
+        width = record_width(dbc) if dbc.records else dbc.header.record_size // 4
+        columns = field_columns(self._schema(name, dbc), width, reserved=(ROW_COLUMN,))
+        flat = dbc.flat()
+        count = len(dbc.records)
+        if len(flat) != count * width:
+            raise ValueError(f"{name}: records are not all {width} fields wide")
+
+        raws: List[Tuple[str, int, int, int, object]] = []
+        values = []
+        strings = None
+        for field_idx, (_, field_type) in enumerate(columns):
+            column = flat[field_idx::width] if width > 1 else flat
+            if field_type in _STRING_TYPES:
+                if strings is None:
+                    strings = _StringResolver(dbc)
+                values.append(strings.resolve(name, field_idx, column, raws))
+            elif field_type == FieldType.FLOAT:
+                floats = array('f', column.tobytes())
+                for row, value in enumerate(floats):
+                    # SQLite stores NaN as NULL and -0.0 as 0.0
+                    if value == 0.0 and column[row] or math.isnan(value):
+                        raws.append((name, row, field_idx, column[row], None if math.isnan(value) else 0.0))
+                values.append(floats)
+            elif field_type == FieldType.INT:
+                values.append(array('i', column.tobytes()))
+            else:
+                values.append(column)
+
+        table = quote(name)
+        self.conn.execute(f"DROP TABLE IF EXISTS {table}")
+        self.conn.execute(f"DELETE FROM {RAW_TABLE} WHERE name = ?", (name,))
+        definitions = ", ".join(f"{quote(column)} {_SQL_TYPES[field_type]}" for column, field_type in columns)
+        self.conn.execute(f"CREATE TABLE {table} ({ROW_COLUMN} INTEGER PRIMARY KEY"
+                          + (f", {definitions}" if definitions else "") + ")")
+        placeholders = ", ".join("?" * (width + 1))
+        self.conn.executemany(f"INSERT INTO {table} VALUES ({placeholders})", zip(range(count), *values))
+        self.conn.executemany(f"INSERT INTO {RAW_TABLE} VALUES (?, ?, ?, ?, ?)", raws)
+        self.conn.execute(f"INSERT OR REPLACE INTO {META_TABLE} VALUES (?, ?, ?, ?, ?)", (
+            name, dbc.header.field_count, dbc.header.record_size,
+            json.dumps([[column, field_type.name] for column, field_type in columns]), dbc.string_block))
+
+        # Indexes go in after the rows: one sorted build instead of an update per insert
+        indexed = {0} if width else set()
+        references = get_all_references(name)
+        for field_idx, (column, _) in enumerate(columns):
+            if column in references:
+                indexed.add(field_idx)
+        for field_idx in sorted(indexed):
+            column = columns[field_idx][0]
+            self.conn.execute(f"CREATE INDEX {quote(f'{name}_{column}_idx')} ON {table} ({quote(column)})")
+        return count
+
+    def import_dbc(self, name: str) -> DBCFile:
+        """Rebuild a DBC from its table, edits included."""
+        meta = self.conn.execute(
+            f"SELECT field_count, record_size, columns, string_block FROM {META_TABLE} WHERE name = ?",
+            (name,)).fetchone()
+        if meta is None:
+            raise ValueError(f"No DBC table named {name}")
+        field_count, record_size, columns_json, string_block = meta
+        columns = [(column, FieldType[type_name]) for column, type_name in json.loads(columns_json)]
+        width = len(columns)
+
+        select = ", ".join([ROW_COLUMN] + [quote(column) for column, _ in columns])
+        rows = self.conn.execute(f"SELECT {select} FROM {quote(name)} ORDER BY {ROW_COLUMN}").fetchall()
+        row_ids = [row[0] for row in rows]
+        position = {row_id: i for i, row_id in enumerate(row_ids)}
+        # Only values left as exported get their raw bits back
+        raws: Dict[int, Dict[int, int]] = {}
+        for row_id, field_idx, raw, typed in self.conn.execute(
+                f"SELECT row, field, raw, typed FROM {RAW_TABLE} WHERE name = ?", (name,)):
+            row = position.get(row_id)
+            if row is not None and field_idx < width and rows[row][field_idx + 1] == typed:
+                raws.setdefault(field_idx, {})[row] = raw
+
+        strings = StringBlockBuilder(string_block or b"")
+        encoded = []
+        for (column, field_type), cells in zip(columns, list(zip(*rows))[1:]):
+            restored = raws.get(len(encoded), {})
+            if field_type in _STRING_TYPES:
+                if restored:
+                    # Restored cells must not be interned, or their text would be appended to the block
+                    cells = list(cells)
+                    for row in restored:
+                        cells[row] = None
+                values = _string_offsets(strings, cells)
+            elif field_type == FieldType.FLOAT:
+                try:
+                    values = array('f', cells)
+                except TypeError:
+                    values = array('f', map(_as_float, cells))
+                values = array('I', values.tobytes())
+            else:
+                try:
+                    values = array('I', cells)
+                except (TypeError, OverflowError):
+                    values = array('I', map(_as_int, cells))
+            for row, raw in restored.items():
+                values[row] = raw
+            encoded.append(values)
+
+        flat = array('I', chain.from_iterable(zip(*encoded))) if width else array('I')
+        records = [flat[start:start + width].tolist() for start in range(0, len(flat), width)] if width else []
+        block = strings.build()
+        header = DBCHeader(b'WDBC', len(records), field_count, record_size, len(block))
+        dbc = DBCFile(header=header, records=records, string_block=block)
+        dbc._flat = flat
+        return dbc
+
+
+def _as_int(value) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, float):
+        value = int(value)
+    elif not isinstance(value, int):
+        value = int(str(value), 0)
+    return value & 0xFFFFFFFF
+
+
+def _as_float(value) -> float:
+    if value is None:
+        return float('nan')
+    return float(value)
+
+
+class _StringResolver:
+    """Offset -> text of one DBC, noting offsets a text alone would not get back."""
+
+    def __init__(self, dbc: DBCFile):
+        self.dbc = dbc
+        self.texts: Dict[int, str] = {}
+        self.exact: Dict[int, bool] = {}
+        first: Dict[bytes, int] = {}
+        for offset, raw in string_texts(dbc.string_block).items():
+            text = raw.decode('utf-8', errors='replace')
+            first.setdefault(raw, offset)
+            self.texts[offset] = text
+            # Importing interns a text at its first offset in the block
+            self.exact[offset] = first[raw] == offset and text.encode('utf-8') == raw
+
+    def resolve(self, name: str, field_idx: int, column: array, raws: List) -> List[str]:
+        texts = self.texts
+        values = []
+        for row, offset in enumerate(column):
+            text = texts.get(offset)
+            if text is None:
+                # Points into the middle of a string, or past the block
+                text = self.dbc.get_string(offset)
+                raws.append((name, row, field_idx, offset, text))
+            elif not self.exact[offset]:
+                raws.append((name, row, field_idx, offset, text))
+            values.append(text)
+        return values
+
+
+def _string_offsets(strings: StringBlockBuilder, texts: Iterable) -> array:
+    """Offset of each text in the block being built; NULL cells become 0."""
+    known: Dict[object, int] = {None: 0}
+    values = array('I')
+    for text in texts:
+        offset = known.get(text)
+        if offset is None:
+            offset = known[text] = strings.add(str(text).encode('utf-8'))
+        values.append(offset)
+    return values
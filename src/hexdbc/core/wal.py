@@ -0,0 +1,303 @@
+import hashlib
+import os
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from hexdbc.core.edit_journal import EditJournal
+from hexdbc.core.parser import DBCFile
+from hexdbc.core.schema import SchemaDef
+
+WAL_MAGIC = b'HXWL'
+WAL_VERSION = 1
+WAL_SUFFIX = '.hxwal'
+
+# Appended records reach the disk at most this many seconds after being written
+SYNC_INTERVAL = 1.0
+# Logs are compacted once past this size and twice their last compacted size
+COMPACT_MIN_BYTES = 1 << 20
+
+_HEADER = struct.Struct('<4sHQqH')  # magic, version, source size, source mtime_ns, path length
+_FRAME = struct.Struct('<II')       # payload length, crc32 of payload
+_GROUP = struct.Struct('<diHI')     # timestamp, undo_of (-1: none), label length, entry count
+_ENTRY = struct.Struct('<IHB')      # record_id, field_idx, op (| _TEXT_FLAG for text values)
+_U32 = struct.Struct('<I')
+_TEXT_FLAG = 0x80
+
+_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | getattr(os, 'O_BINARY', 0)
+
+Entry = Tuple[int, int, int, Any, Any]  # record_id, field_idx, op, old, new
+
+
+@dataclass
+class WALGroup:
+    label: str
+    timestamp: float
+    undo_of: Optional[int]  # index of an earlier group in the same log
+    entries: List[Entry]
+
+
+@dataclass
+class WALContents:
+    source_path: Path
+    source_size: int
+    source_mtime_ns: int
+    groups: List[WALGroup]
+    valid_length: int  # bytes up to the end of the last intact record
+
+    def matches_source(self) -> bool:
+        """True if the source file is unchanged since the log was started."""
+        try:
+            st = self.source_path.stat()
+        except OSError:
+            return False
+        return (st.st_size, st.st_mtime_ns) == (self.source_size, self.source_mtime_ns)
+
+
+def wal_path_for(directory: Path, source_path: Path) -> Path:
+    """Log file for a source DBC; one per path, so reopening a file finds its log."""
+    digest = hashlib.sha1(str(Path(source_path).resolve()).encode('utf-8')).hexdigest()[:12]
+    return Path(directory) / f"{Path(source_path).stem}-{digest}{WAL_SUFFIX}"
+
+
+def _encode_header(source_path: Path) -> bytes:
+    st = source_path.stat()
+    path = str(source_path).encode('utf-8')
+    return _HEADER.pack(WAL_MAGIC, WAL_VERSION, st.st_size, st.st_mtime_ns, len(path)) + path
+
+
+def _encode_group(label: str, timestamp: float, undo_of: Optional[int], entries: List[Entry]) -> bytes:
+    raw_label = label.encode('utf-8')[:0xFFFF]
+    parts = [_GROUP.pack(timestamp, -1 if undo_of is None else undo_of, len(raw_label), len(entries)), raw_label]
+    for record_id, field_idx, op, old, new in entries:
+        if isinstance(old, str):
+            parts.append(_ENTRY.pack(record_id, field_idx, op | _TEXT_FLAG))
+            for text in (old, new):
+                raw = text.encode('utf-8')
+                parts.append(_U32.pack(len(raw)))
+                parts.append(raw)
+        else:
+            parts.append(_ENTRY.pack(record_id, field_idx, op))
+            parts.append(_U32.pack(old))
+            parts.append(_U32.pack(new))
+    payload = b''.join(parts)
+    return _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def _decode_group(payload: bytes) -> WALGroup:
+    timestamp, undo_of, label_len, count = _GROUP.unpack_from(payload, 0)
+    pos = _GROUP.size
+    label = payload[pos:pos + label_len].decode('utf-8', errors='replace')
+    pos += label_len
+    entries = []
+    for _ in range(count):
+        record_id, field_idx, op = _ENTRY.unpack_from(payload, pos)
+        pos += _ENTRY.size
+        if op & _TEXT_FLAG:
+            values = []
+            for _ in range(2):
+                (length,) = _U32.unpack_from(payload, pos)
+                pos += _U32.size
+                values.append(payload[pos:pos + length].decode('utf-8', errors='replace'))
+                pos += length
+            old, new = values
+        else:
+            old, new = struct.unpack_from('<II', payload, pos)
+            pos += 8
+        entries.append((record_id, field_idx, op & ~_TEXT_FLAG, old, new))
+    return WALGroup(label, timestamp, undo_of if undo_of >= 0 else None, entries)
+
+
+def read_wal(path: Path) -> WALContents:
+    """Parse a log, stopping at the first torn or corrupt record (e.g. from a crash)."""
+    data = Path(path).read_bytes()
+    if len(data) < _HEADER.size:
+        raise ValueError(f"Not a HexDBC recovery log: {path}")
+    magic, version, size, mtime_ns, path_len = _HEADER.unpack_from(data, 0)
+    if magic != WAL_MAGIC:
+        raise ValueError(f"Invalid recovery log magic: {magic}")
+    if version != WAL_VERSION:
+        raise ValueError(f"Unsupported recovery log version: {version}")
+    pos = _HEADER.size + path_len
+    source_path = Path(data[_HEADER.size:pos].decode('utf-8'))
+
+    groups = []
+    while pos + _FRAME.size <= len(data):
+        length, crc = _FRAME.unpack_from(data, pos)
+        payload = data[pos + _FRAME.size:pos + _FRAME.size + length]
+        if len(payload) != length or zlib.crc32(payload) != crc:
+            break
+        try:
+            groups.append(_decode_group(payload))
+        except (struct.error, UnicodeDecodeError):
+            break
+        pos += _FRAME.size + length
+    return WALContents(source_path, size, mtime_ns, groups, pos)
+
+
+def restore_journal(contents: WALContents, baseline: DBCFile, schema: Optional[SchemaDef] = None) -> EditJournal:
+    """Rebuild an EditJournal from a log against the (unchanged) source DBC."""
+    journal = EditJournal(baseline, schema)
+    for group in contents.groups:
+        journal.replay(group.label, group.timestamp, group.undo_of, group.entries)
+    return journal
+
+
+class WriteAheadLog:
+    """Crash-safe side file mirroring one tab's EditJournal.
+
+    Every new journal group is appended as one checksummed record, so an
+    edit costs a few bytes of I/O; fsyncs are batched to SYNC_INTERVAL.
+    Once the log grows past COMPACT_MIN_BYTES it is rewritten in a
+    background thread as the net change since the last save, and saving
+    the source starts a fresh log.
+    """
+
+    def __init__(self, path: Path, journal: EditJournal, source_path: Path,
+                 contents: Optional[WALContents] = None):
+        """Start a new log, or resume one whose contents were replayed into journal."""
+        self.path = Path(path)
+        self.journal = journal
+        self.source_path = Path(source_path)
+        self._lock = threading.Lock()
+        self._compactor: Optional[threading.Thread] = None
+        self._tail: Optional[List[Tuple[int, str, float, Optional[int], List[Entry]]]] = None
+        self._last_sync = time.monotonic()
+        self._dirty = False
+
+        if contents is None:
+            self._write_fresh(b'')
+            self._base_group = journal.group_count
+            self._ordinals: Dict[int, int] = {}
+            self._next_ordinal = 0
+        else:
+            # Drop any torn record so new ones follow intact data
+            with open(self.path, 'r+b') as f:
+                f.truncate(contents.valid_length)
+            self._base_group = 0
+            self._ordinals = {group: group for group in range(len(contents.groups))}
+            self._next_ordinal = len(contents.groups)
+        self._size = self.path.stat().st_size
+        self._compacted_size = self._size
+        self._fd = os.open(self.path, _OPEN_FLAGS)
+        journal.listeners.append(self._on_group)
+
+    def _write_fresh(self, body: bytes, tmp: Optional[Path] = None) -> None:
+        tmp = tmp or self.path.with_name(self.path.name + '.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(_encode_header(self.source_path) + body)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+    def _ordinal(self, group: Optional[int]) -> Optional[int]:
+        # Groups are numbered by position in the file, which compaction changes
+        return None if group is None else self._ordinals.get(group)
+
+    def _on_group(self, group: int) -> None:
+        info = self.journal.group(group)
+        entries = [(e.record_id, e.field_idx, e.op, e.old, e.new) for e in self.journal.entries(group)]
+        with self._lock:
+            self._ordinals[group] = self._next_ordinal
+            self._next_ordinal += 1
+            frame = _encode_group(info.label, info.timestamp, self._ordinal(info.undo_of), entries)
+            os.write(self._fd, frame)
+            self._size += len(frame)
+            self._dirty = True
+            if self._tail is not None:
+                self._tail.append((group, info.label, info.timestamp, info.undo_of, entries))
+        self.maybe_sync()
+        self._maybe_compact()
+
+    def maybe_sync(self) -> None:
+        """fsync if there are unsynced records and the last fsync was SYNC_INTERVAL ago."""
+        if self._dirty and time.monotonic() - self._last_sync >= SYNC_INTERVAL:
+            self.sync()
+
+    def sync(self) -> None:
+        with self._lock:
+            if self._dirty:
+                os.fsync(self._fd)
+                self._dirty = False
+            self._last_sync = time.monotonic()
+
+    def _maybe_compact(self) -> None:
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        if self._size < COMPACT_MIN_BYTES or self._size < 2 * self._compacted_size:
+            return
+        # Snapshot on this thread; the journal is not thread-safe
+        entries = self.journal.net_entries(self._base_group)
+        with self._lock:
+            self._tail = []
+        self._compactor = threading.Thread(target=self._compact, args=(entries,), daemon=True)
+        self._compactor.start()
+
+    def _compact(self, entries: List[Entry]) -> None:
+        tmp = self.path.with_name(self.path.name + '.compact')
+        body = _encode_group("Recovered edits", time.time(), None, entries) if entries else b''
+        with open(tmp, 'wb') as f:
+            f.write(_encode_header(self.source_path) + body)
+
+            with self._lock:
+                # Records appended while this ran go after the snapshot, renumbered
+                ordinals = {}
+                next_ordinal = 1 if entries else 0
+                for group, label, timestamp, undo_of, tail_entries in self._tail:
+                    ordinals[group] = next_ordinal
+                    next_ordinal += 1
+                    f.write(_encode_group(label, timestamp, ordinals.get(undo_of), tail_entries))
+                f.flush()
+                os.fsync(f.fileno())
+
+                # Windows cannot replace a file that is still open
+                os.close(self._fd)
+                os.replace(tmp, self.path)
+                self._fd = os.open(self.path, _OPEN_FLAGS)
+                self._size = self._compacted_size = self.path.stat().st_size
+                self._ordinals = ordinals
+                self._next_ordinal = next_ordinal
+                self._tail = None
+                self._dirty = False
+
+    def wait(self) -> None:
+        """Block until a running compaction has finished."""
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+        self._compactor = None
+
+    def rebase(self, source_path: Optional[Path] = None) -> None:
+        """Start over after the journal's changes were saved to source_path."""
+        self.wait()
+        if source_path is not None:
+            self.source_path = Path(source_path)
+        with self._lock:
+            os.close(self._fd)
+            self._write_fresh(b'')
+            self._fd = os.open(self.path, _OPEN_FLAGS)
+            self._size = self._compacted_size = self.path.stat().st_size
+            self._base_group = self.journal.group_count
+            self._ordinals = {}
+            self._next_ordinal = 0
+            self._dirty = False
+
+    def close(self, delete: bool = True) -> None:
+        """Stop logging; delete=True once nothing unsaved is left to recover."""
+        self.wait()
+        if self._on_group in self.journal.listeners:
+            self.journal.listeners.remove(self._on_group)
+        with self._lock:
+            if self._dirty:
+                os.fsync(self._fd)
+            os.close(self._fd)
+            self._fd = -1
+        if delete:
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
@@ -2,6 +2,7 @@ from pathlib import Path
 
 RESOURCES_DIR = Path(__file__).parent
 SCHEMAS_DIR = RESOURCES_DIR / "schemas"
+SCHEMA_TABLE_PATH = RESOURCES_DIR / "builtin_schemas.bin"
 
 
 def get_schema_path(schema_name: str) -> Path:
@@ -1,11 +1,32 @@
 """
 HexDBC UI Module - User interface components.
+
+Exports are resolved lazily so importing one UI module (e.g. the main
+window at startup) does not pull in every dialog.
 """
 
-from hexdbc.ui.main_window import HexDBCWindow, run
-from hexdbc.ui.editor import CodeEditor
-from hexdbc.ui.dialogs import AdvancedSearchDialog, AddEntryDialog
-from hexdbc.ui.theme import COLORS, get_stylesheet, get_editor_colors
+import importlib
+
+_EXPORTS = {
+    "HexDBCWindow": "hexdbc.ui.main_window",
+    "run": "hexdbc.ui.main_window",
+    "CodeEditor": "hexdbc.ui.editor",
+    "AdvancedSearchDialog": "hexdbc.ui.dialogs",
+    "AddEntryDialog": "hexdbc.ui.dialogs",
+    "COLORS": "hexdbc.ui.theme",
+    "get_stylesheet": "hexdbc.ui.theme",
+    "get_editor_colors": "hexdbc.ui.theme",
+}
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "HexDBCWindow",
@@ -1,21 +1,22 @@
 """
 Advanced dialogs for HexDBC editor.
-- AdvancedSearchDialog: Multi-field search with Find All
+- AdvancedSearchDialog: Multi-field search with Find All and structured queries
 - AddEntryDialog: Easy record creation with schema support
 - QuickJumpDialog: Quick ID-based navigation (Ctrl+I)
 - CommandPaletteDialog: Command launcher (Ctrl+Shift+P)
-- ChangeHistoryDialog: View edit history
-- FileComparisonDialog: Side-by-side file comparison
+- ChangeHistoryDialog: Review and undo recorded field changes
+- FileComparisonDialog: Text diff, or record-level diff when a .dbc is involved
+- MergeDialog: Three-way merge of DBC files by record and field
+- ProblemsDialog: Live list of validation problems
 """
 
 import re
-import difflib
 from datetime import datetime
 from typing import Optional, List, Tuple, Dict
 from pathlib import Path
 
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont
+from PySide6.QtGui import QColor, QFont
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QPushButton, QCheckBox, QListWidget, QListWidgetItem,
@@ -26,6 +27,21 @@ from PySide6.QtWidgets import (
 
 from hexdbc.ui.theme import COLORS
 from hexdbc.core.schema import SchemaManager, FieldType
+from hexdbc.core.record_index import scan_record_headers
+
+# Cap on rows added to result lists; QListWidget gets slow past a few thousand
+MAX_LISTED_RESULTS = 2000
+
+# Records rendered per page of a structural DBC comparison
+DIFF_PAGE_SIZE = 200
+
+
+def record_line_map(text: str) -> Dict[int, int]:
+    """Map record ID -> 1-based line number of its header in one pass over the text."""
+    line_map: Dict[int, int] = {}
+    for record_id, line in scan_record_headers(text):
+        line_map.setdefault(record_id, line + 1)
+    return line_map
 
 
 class AdvancedSearchDialog(QDialog):
@@ -34,10 +50,13 @@ class AdvancedSearchDialog(QDialog):
     # Signal emitted when user wants to go to a specific line
     goto_line = Signal(int)
     
-    def __init__(self, parent=None, editor=None):
+    def __init__(self, parent=None, editor=None, query_source=None):
         super().__init__(parent)
         self.editor = editor
         self.results: List[Tuple[int, str]] = []  # (line_number, preview)
+        # Callable returning (DBCFile, SchemaDef) for structured queries, or None
+        self.query_source = query_source
+        self._query_engine = None
         
         self.setWindowTitle("Advanced Search")
         self.setMinimumSize(600, 500)
@@ -94,9 +113,18 @@ class AdvancedSearchDialog(QDialog):
         self.case_sensitive = QCheckBox("Case Sensitive")
         self.regex_mode = QCheckBox("Regex")
         self.whole_word = QCheckBox("Whole Word")
+        self.query_mode = QCheckBox("Query")
+        self.query_mode.setToolTip(
+            'Structured query over record fields, e.g.\n'
+            'SpellIconID = 1 and Name_Lang_enUS ~ "Fire"\n'
+            'Operators: = != < <= > >= ~ (contains) !~ & (bitmask), and / or / not'
+        )
+        self.query_mode.setEnabled(self.query_source is not None)
+        self.query_mode.toggled.connect(self._on_query_mode_toggled)
         options_row.addWidget(self.case_sensitive)
         options_row.addWidget(self.regex_mode)
         options_row.addWidget(self.whole_word)
+        options_row.addWidget(self.query_mode)
         options_row.addStretch()
         search_layout.addLayout(options_row)
         
@@ -180,6 +208,60 @@ class AdvancedSearchDialog(QDialog):
             if not self.editor.findNext():
                 self.editor.findFirst(text, regex, case, word, True)
     
+    def _on_query_mode_toggled(self, checked: bool):
+        """Switch the input between text search and structured queries."""
+        for widget in (self.field_filter, self.case_sensitive, self.regex_mode, self.whole_word):
+            widget.setEnabled(not checked)
+        self.search_input.setPlaceholderText(
+            'e.g. SpellIconID = 1 and Name_Lang_enUS ~ "Fire"' if checked else "Search text or ID..."
+        )
+    
+    def _do_query(self):
+        """Run a structured query against the DBC columns and list matching records."""
+        from hexdbc.core.query import QueryEngine, QuerySyntaxError
+        
+        query = self.search_input.text().strip()
+        if not query:
+            self.status_label.setText("Enter a query")
+            return
+        
+        source = self.query_source() if self.query_source else None
+        if not source:
+            self.status_label.setText("No DBC data available for queries")
+            return
+        dbc, schema, index_provider = source
+        
+        # Reuse the engine (and its column arrays) while the data is unchanged
+        if self._query_engine is None or self._query_engine.dbc is not dbc:
+            self._query_engine = QueryEngine(dbc, schema, index_provider)
+        
+        try:
+            result = self._query_engine.execute(query)
+        except QuerySyntaxError as e:
+            self.status_label.setText(f"Query error: {e}")
+            return
+        
+        if hasattr(self.editor, 'find_record_line'):
+            # The editor keeps its own ID index; no need to scan the text
+            def find_line(record_id):
+                line = self.editor.find_record_line(record_id)
+                return line + 1 if line is not None else None
+        else:
+            content = self.editor.get_text() if hasattr(self.editor, 'get_text') else ""
+            find_line = record_line_map(content).get
+        
+        for record_id in result.ids[:MAX_LISTED_RESULTS]:
+            line_num = find_line(record_id)
+            label = f"ID {record_id}" + (f"  (line {line_num})" if line_num else "  (not in editor text)")
+            self.results.append((line_num or 0, label))
+            
+            item = QListWidgetItem(label)
+            item.setData(Qt.ItemDataRole.UserRole, line_num)
+            self.results_list.addItem(item)
+        
+        shown = "" if len(result.ids) <= MAX_LISTED_RESULTS else f" (showing first {MAX_LISTED_RESULTS})"
+        self.status_label.setText(f"Found {len(result.ids)} records{shown}")
+    
     def _do_find_all(self):
         """Find all occurrences and populate results list."""
         self.results.clear()
@@ -189,6 +271,10 @@ class AdvancedSearchDialog(QDialog):
             self.status_label.setText("No editor available")
             return
         
+        if self.query_mode.isChecked():
+            self._do_query()
+            return
+        
         search_text = self.search_input.text()
         if not search_text:
             self.status_label.setText("Enter search text")
@@ -277,7 +363,8 @@ class AddEntryDialog(QDialog):
         self.current_max_id = current_max_id
         self.dbc_name = dbc_name
         self.field_inputs = {}
-        self.existing_ids = existing_ids or set()  # Set of IDs that already exist
+        # IDs that already exist: a set, or the tab's RecordIndex (adds free-range search)
+        self.existing_ids = existing_ids if existing_ids is not None else set()
         
         self.setWindowTitle(f"Add New Entry - {dbc_name}" if dbc_name else "Add New Entry")
         self.setMinimumSize(500, 600)
@@ -337,6 +424,26 @@ class AddEntryDialog(QDialog):
         id_group_layout.addLayout(id_layout)
         id_group_layout.addWidget(self.id_warning_label)
         
+        # Free-range finder for reserving a block of consecutive IDs
+        if hasattr(self.existing_ids, 'find_free_range'):
+            range_layout = QHBoxLayout()
+            self.range_count_input = QSpinBox()
+            self.range_count_input.setRange(1, 100000)
+            self.range_count_input.setValue(10)
+            self.range_count_input.setToolTip("Number of consecutive free IDs to look for")
+            find_range_btn = QPushButton("Find Free Range")
+            find_range_btn.setAutoDefault(False)
+            find_range_btn.clicked.connect(self._find_free_range)
+            self.range_hint_label = QLabel("")
+            self.range_hint_label.setStyleSheet(f"color: {COLORS['text_secondary']};")
+            
+            range_layout.addWidget(QLabel("Block of"))
+            range_layout.addWidget(self.range_count_input)
+            range_layout.addWidget(find_range_btn)
+            range_layout.addWidget(self.range_hint_label)
+            range_layout.addStretch()
+            id_group_layout.addLayout(range_layout)
+        
         id_group = QGroupBox("Record ID")
         id_group.setStyleSheet(f"""
             QGroupBox {{
@@ -434,6 +541,17 @@ class AddEntryDialog(QDialog):
         # Store add button for enabling/disabling
         self.add_btn = add_btn
     
+    def _find_free_range(self):
+        """Jump the ID input to the lowest run of enough free IDs."""
+        count = self.range_count_input.value()
+        first = self.existing_ids.find_free_range(count, self.id_input.minimum())
+        last = first + count - 1
+        if last > self.id_input.maximum():
+            self.range_hint_label.setText("No free range that large")
+            return
+        self.id_input.setValue(first)
+        self.range_hint_label.setText(f"IDs {first}-{last} are free")
+    
     def _validate_id(self, value: int):
         """Validate if the ID already exists."""
         if value in self.existing_ids:
@@ -813,15 +931,18 @@ class CommandPaletteDialog(QDialog):
 
 
 class ChangeHistoryDialog(QDialog):
-    """Dialog to view change history for the current file."""
+    """Dialog to review the field changes recorded for the current file."""
+    
+    jump_to_id = Signal(int)
+    undo_requested = Signal()
     
-    def __init__(self, parent=None, changes: List[Dict] = None, file_name: str = ""):
+    def __init__(self, parent=None, journal=None, file_name: str = ""):
         super().__init__(parent)
-        self.changes = changes or []
+        self.journal = journal
         self.file_name = file_name
         
         self.setWindowTitle(f"Change History - {file_name}" if file_name else "Change History")
-        self.setMinimumSize(700, 500)
+        self.setMinimumSize(900, 560)
         self.setStyleSheet(f"""
             QDialog {{
                 background-color: {COLORS['bg_primary']};
@@ -830,6 +951,7 @@ class ChangeHistoryDialog(QDialog):
         """)
         
         self._init_ui()
+        self._populate()
     
     def _init_ui(self):
         layout = QVBoxLayout(self)
@@ -847,11 +969,13 @@ class ChangeHistoryDialog(QDialog):
         layout.addWidget(header)
         
         # Stats
-        stats = QLabel(f"Total changes: {len(self.changes)}")
-        stats.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 13px;")
-        layout.addWidget(stats)
+        self.stats_label = QLabel("")
+        self.stats_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 13px;")
+        layout.addWidget(self.stats_label)
+        
+        splitter = QSplitter(Qt.Orientation.Horizontal)
         
-        # Change list
+        # Change list, newest first
         self.change_list = QListWidget()
         self.change_list.setStyleSheet(f"""
             QListWidget {{
@@ -872,24 +996,34 @@ class ChangeHistoryDialog(QDialog):
                 background-color: {COLORS['bg_tertiary']};
             }}
         """)
+        self.change_list.currentItemChanged.connect(self._show_details)
+        self.change_list.itemDoubleClicked.connect(self._jump_to_change)
+        splitter.addWidget(self.change_list)
         
-        # Populate changes
-        for change in self.changes:
-            timestamp = change.get('timestamp', 'Unknown time')
-            change_type = change.get('type', 'edit')
-            description = change.get('description', 'No description')
-            
-            item_text = f"[{timestamp}] {change_type.upper()}: {description}"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, change)
-            self.change_list.addItem(item)
-        
-        layout.addWidget(self.change_list)
+        # Field-level detail of the selected change
+        self.details = QTextBrowser()
+        self.details.setStyleSheet(f"""
+            QTextBrowser {{
+                background-color: {COLORS['editor_bg']};
+                color: {COLORS['text_primary']};
+                border: 1px solid {COLORS['border_primary']};
+                border-radius: 6px;
+                font-family: 'Consolas', 'Courier New', monospace;
+                font-size: 12px;
+                padding: 8px;
+            }}
+        """)
+        splitter.addWidget(self.details)
+        splitter.setSizes([380, 520])
+        layout.addWidget(splitter, 1)
         
         # Buttons
         button_row = QHBoxLayout()
         button_row.addStretch()
         
+        undo_btn = QPushButton("Undo Last Change")
+        undo_btn.clicked.connect(self._undo)
+        
         clear_btn = QPushButton("Clear History")
         clear_btn.setStyleSheet(f"""
             QPushButton {{
@@ -902,10 +1036,81 @@ class ChangeHistoryDialog(QDialog):
         close_btn = QPushButton("Close")
         close_btn.clicked.connect(self.accept)
         
+        button_row.addWidget(undo_btn)
         button_row.addWidget(clear_btn)
         button_row.addWidget(close_btn)
         layout.addLayout(button_row)
     
+    def _populate(self):
+        """List recorded changes, newest first."""
+        self.change_list.clear()
+        self.details.clear()
+        groups = self.journal.groups() if self.journal else []
+        edits = sum(len(group) for group in groups)
+        self.stats_label.setText(f"Total changes: {len(groups)} ({edits} field edits)")
+        
+        for group in reversed(groups[-MAX_LISTED_RESULTS:]):
+            timestamp = datetime.fromtimestamp(group.timestamp).strftime("%H:%M:%S")
+            change_type = "undo" if group.undo_of is not None else "edit"
+            suffix = " (undone)" if self.journal.is_undone(group.index) else ""
+            item = QListWidgetItem(f"[{timestamp}] {change_type.upper()}: {group.label}{suffix}")
+            item.setData(Qt.ItemDataRole.UserRole, group.index)
+            self.change_list.addItem(item)
+    
+    def _show_details(self, item, previous=None):
+        """Show old -> new for each field of the selected change."""
+        import html
+        from hexdbc.core.edit_journal import OP_ADD, OP_REMOVE, OP_SET
+        
+        if item is None:
+            self.details.clear()
+            return
+        
+        entries = self.journal.entries(item.data(Qt.ItemDataRole.UserRole))
+        
+        def fmt(field_idx, value):
+            value = self.journal.display_value(field_idx, value)
+            if isinstance(value, float):
+                value = f"{value:.6g}"
+            elif isinstance(value, str):
+                value = f'"{value}"'
+            return html.escape(str(value))
+        
+        parts = ['<pre style="margin: 0; padding: 0;">']
+        record_id = None
+        for entry in entries[:MAX_LISTED_RESULTS]:
+            if entry.record_id != record_id:
+                record_id = entry.record_id
+                kind = {OP_ADD: " (added)", OP_REMOVE: " (removed)"}.get(entry.op, "")
+                parts.append(f'<span style="color: {COLORS["accent_cyan"]}; font-weight: bold;">ID {record_id}{kind}</span>')
+            if entry.field_idx == 0 and entry.op != OP_SET:
+                continue
+            name = html.escape(self.journal.field_name(entry.field_idx))
+            if entry.op == OP_ADD:
+                parts.append(f'<span style="color: {COLORS["accent_green"]};">+     {name} = {fmt(entry.field_idx, entry.new)}</span>')
+            elif entry.op == OP_REMOVE:
+                parts.append(f'<span style="color: {COLORS["accent_red"]};">-     {name} = {fmt(entry.field_idx, entry.old)}</span>')
+            else:
+                parts.append(
+                    f'<span style="color: {COLORS["text_secondary"]};">      {name}: </span>'
+                    f'<span style="color: {COLORS["accent_red"]};">{fmt(entry.field_idx, entry.old)}</span>'
+                    f'<span style="color: {COLORS["text_secondary"]};"> → </span>'
+                    f'<span style="color: {COLORS["accent_green"]};">{fmt(entry.field_idx, entry.new)}</span>'
+                )
+        if len(entries) > MAX_LISTED_RESULTS:
+            parts.append(f'... {len(entries) - MAX_LISTED_RESULTS} more')
+        parts.append('</pre>')
+        self.details.setHtml('\n'.join(parts))
+    
+    def _jump_to_change(self, item):
+        entries = self.journal.entries(item.data(Qt.ItemDataRole.UserRole))
+        if entries:
+            self.jump_to_id.emit(entries[0].record_id)
+    
+    def _undo(self):
+        self.undo_requested.emit()
+        self._populate()
+    
     def _clear_history(self):
         """Clear the change history."""
         reply = QMessageBox.question(
@@ -914,20 +1119,25 @@ class ChangeHistoryDialog(QDialog):
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         if reply == QMessageBox.StandardButton.Yes:
-            self.changes.clear()
-            self.change_list.clear()
+            self.journal.clear()
+            self._populate()
 
 
 class FileComparisonDialog(QDialog):
     """Side-by-side file comparison dialog."""
     
     def __init__(self, parent=None, file1_path: str = "", file2_path: str = "",
-                 content1: str = "", content2: str = ""):
+                 content1: str = "", content2: str = "", schema_manager=None, dbc1=None):
         super().__init__(parent)
         self.file1_path = file1_path
         self.file2_path = file2_path
         self.content1 = content1
         self.content2 = content2
+        self.schema_manager = schema_manager or SchemaManager()
+        # Already-parsed DBC for file 1 (e.g. the open tab), reused for structural diffs
+        self.dbc1 = dbc1
+        self._diff = None
+        self._pending_changes = None
         
         self.setWindowTitle("File Comparison")
         self.setMinimumSize(1000, 600)
@@ -1030,6 +1240,12 @@ class FileComparisonDialog(QDialog):
         """)
         layout.addWidget(self.diff_display, 1)
         
+        # Structural diffs are rendered a page at a time
+        self.more_btn = QPushButton("Show More")
+        self.more_btn.clicked.connect(self._render_diff_page)
+        self.more_btn.hide()
+        layout.addWidget(self.more_btn)
+        
         # Stats
         self.stats_label = QLabel("")
         self.stats_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 12px;")
@@ -1047,21 +1263,13 @@ class FileComparisonDialog(QDialog):
         """Select a file for comparison."""
         file_path, _ = QFileDialog.getOpenFileName(
             self, f"Select File {file_num}",
-            "", "HexDBC Text Files (*.hexdbc);;All Files (*.*)"
+            "", "DBC and HexDBC Files (*.dbc *.hexdbc);;DBC Files (*.dbc);;"
+                "HexDBC Text Files (*.hexdbc);;All Files (*.*)"
         )
         if file_path:
-            # Check if it's a binary DBC file
-            if file_path.lower().endswith('.dbc'):
-                QMessageBox.warning(
-                    self, "Binary File",
-                    "Binary .dbc files cannot be compared directly.\n\n"
-                    "Please open the DBC file in the editor first, then use File Comparison "
-                    "to compare the converted text."
-                )
-                return
-            
             if file_num == 1:
                 self.file1_path = file_path
+                self.dbc1 = None
                 self.file1_label.setText(Path(file_path).name)
             else:
                 self.file2_path = file_path
@@ -1073,6 +1281,14 @@ class FileComparisonDialog(QDialog):
             QMessageBox.warning(self, "Missing Files", "Please select both files to compare.")
             return
         
+        # Any binary side: compare records instead of text
+        if self.file1_path.lower().endswith('.dbc') or self.file2_path.lower().endswith('.dbc'):
+            try:
+                self._compare_structural()
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"Failed to compare files: {e}")
+            return
+        
         try:
             # Check file sizes first (warn if > 1MB)
             from pathlib import Path
@@ -1115,8 +1331,101 @@ class FileComparisonDialog(QDialog):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to compare files: {e}")
     
+    def _load_side(self, path: str, other=None):
+        """Read one side as a DBCFile; .hexdbc text is compiled against the other side."""
+        from hexdbc.core.parser import DBCParser
+        from hexdbc.core.hexdbc_format import HexDBCParser
+        
+        if path.lower().endswith('.dbc'):
+            return DBCParser().parse(Path(path))
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        return HexDBCParser(self.schema_manager).parse(text, other)
+    
+    def _compare_structural(self):
+        """Diff two DBCs record by record and show the first page of changes."""
+        from hexdbc.core.dbc_diff import DBCDiff
+        
+        binary1 = self.file1_path.lower().endswith('.dbc')
+        if binary1:
+            old = self.dbc1 or self._load_side(self.file1_path)
+            new = self._load_side(self.file2_path, old)
+        else:
+            new = self._load_side(self.file2_path)
+            old = self._load_side(self.file1_path, new)
+        
+        dbc_name = Path(self.file1_path if binary1 else self.file2_path).stem
+        schema = self.schema_manager.get_schema(dbc_name)
+        if not schema:
+            schema = self.schema_manager.infer_schema(old if old.records else new, dbc_name)
+        
+        self._diff = DBCDiff(old, new, schema)
+        diff = self._diff
+        self.stats_label.setText(
+            f"Records: +{len(diff.added)} added, -{len(diff.removed)} removed, "
+            f"~{len(diff.changed)} changed, {diff.unchanged_count} unchanged"
+        )
+        
+        if diff.identical:
+            self.more_btn.hide()
+            self.diff_display.setHtml(f'<p style="color: {COLORS["accent_green"]}; font-size: 14px; text-align: center; padding: 20px;">✓ All records are identical</p>')
+            return
+        
+        self._pending_changes = diff.changes()
+        self.diff_display.clear()
+        self._render_diff_page()
+    
+    def _render_diff_page(self):
+        """Append the next page of record changes; field diffs are computed only here."""
+        import html
+        from itertools import islice
+        
+        if self._pending_changes is None:
+            return
+        
+        diff = self._diff
+        page = list(islice(self._pending_changes, DIFF_PAGE_SIZE))
+        
+        def fmt(value):
+            if isinstance(value, float):
+                value = f"{value:.6g}"
+            elif isinstance(value, str):
+                value = f'"{value}"'
+            return html.escape(str(value))
+        
+        parts = ['<pre style="margin: 0; padding: 0;">']
+        for change in page:
+            if change.kind == 'added':
+                parts.append(f'<span style="background-color: #1a3a1a; color: {COLORS["accent_green"]}; font-weight: bold;">+ ID {change.record_id} (added)</span>')
+                for name, value in diff.record_values(change.record_id, 'new')[1:]:
+                    if value not in (0, "", 0.0):
+                        parts.append(f'<span style="color: {COLORS["accent_green"]};">+     {html.escape(name)} = {fmt(value)}</span>')
+            elif change.kind == 'removed':
+                parts.append(f'<span style="background-color: #3a1a1a; color: {COLORS["accent_red"]}; font-weight: bold;">- ID {change.record_id} (removed)</span>')
+            else:
+                parts.append(f'<span style="color: {COLORS["accent_cyan"]}; font-weight: bold;">~ ID {change.record_id}</span>')
+                for field_change in diff.field_changes(change.record_id):
+                    parts.append(
+                        f'<span style="color: {COLORS["text_secondary"]};">      {html.escape(field_change.name)}: </span>'
+                        f'<span style="color: {COLORS["accent_red"]};">{fmt(field_change.old)}</span>'
+                        f'<span style="color: {COLORS["text_secondary"]};"> → </span>'
+                        f'<span style="color: {COLORS["accent_green"]};">{fmt(field_change.new)}</span>'
+                    )
+        parts.append('</pre>')
+        self.diff_display.append('\n'.join(parts))
+        
+        if len(page) < DIFF_PAGE_SIZE:
+            self._pending_changes = None
+            self.more_btn.hide()
+        else:
+            self.more_btn.show()
+    
     def _show_diff(self):
         """Generate and display the diff."""
+        import difflib
+        
+        self.more_btn.hide()
+        
         lines1 = self.content1.splitlines(keepends=True)
         lines2 = self.content2.splitlines(keepends=True)
         
@@ -1156,3 +1465,228 @@ class FileComparisonDialog(QDialog):
             self.diff_display.setHtml('\n'.join(html_lines))
             self.stats_label.setText(f"Changes: +{additions} additions, -{deletions} deletions")
 
+
+
+class MergeDialog(QDialog):
+    """Three-way merge of DBC files by record and field."""
+    
+    merged = Signal(str)  # path of the written result
+    
+    def __init__(self, parent=None, schema_manager=None, ours_path: str = ""):
+        super().__init__(parent)
+        self.schema_manager = schema_manager or SchemaManager()
+        self.paths = {"base": "", "ours": ours_path, "theirs": ""}
+        self._labels: Dict[str, QLabel] = {}
+        
+        self.setWindowTitle("Merge DBC Files")
+        self.setMinimumSize(800, 560)
+        self.setStyleSheet(f"""
+            QDialog {{
+                background-color: {COLORS['bg_primary']};
+                color: {COLORS['text_primary']};
+            }}
+        """)
+        
+        self._init_ui()
+    
+    def _init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setSpacing(12)
+        layout.setContentsMargins(16, 16, 16, 16)
+        
+        header = QLabel("Merge DBC Files")
+        header.setStyleSheet(f"""
+            font-size: 18px;
+            font-weight: bold;
+            color: {COLORS['text_primary']};
+            padding-bottom: 8px;
+        """)
+        layout.addWidget(header)
+        
+        form = QFormLayout()
+        for side, title in (("base", "Base (common ancestor)"), ("ours", "Ours"), ("theirs", "Theirs")):
+            row = QHBoxLayout()
+            label = QLabel(Path(self.paths[side]).name if self.paths[side] else "No file selected")
+            label.setStyleSheet(f"color: {COLORS['text_secondary']};")
+            browse_btn = QPushButton("Browse...")
+            browse_btn.clicked.connect(lambda checked=False, s=side: self._select_file(s))
+            row.addWidget(label, 1)
+            row.addWidget(browse_btn)
+            self._labels[side] = label
+            form.addRow(f"{title}:", row)
+        
+        self.prefer_combo = QComboBox()
+        self.prefer_combo.addItem("Ours", "ours")
+        self.prefer_combo.addItem("Theirs", "theirs")
+        form.addRow("On conflict keep:", self.prefer_combo)
+        layout.addLayout(form)
+        
+        merge_btn = QPushButton("Merge and Save...")
+        merge_btn.setStyleSheet(f"""
+            QPushButton {{
+                background-color: {COLORS['accent_blue']};
+                border-color: {COLORS['accent_blue']};
+                font-weight: bold;
+                padding: 10px;
+            }}
+        """)
+        merge_btn.clicked.connect(self._merge)
+        layout.addWidget(merge_btn)
+        
+        self.report_display = QTextBrowser()
+        self.report_display.setStyleSheet(f"""
+            QTextBrowser {{
+                background-color: {COLORS['editor_bg']};
+                color: {COLORS['text_primary']};
+                border: 1px solid {COLORS['border_primary']};
+                border-radius: 6px;
+                font-family: 'Consolas', 'Courier New', monospace;
+                font-size: 12px;
+                padding: 8px;
+            }}
+        """)
+        layout.addWidget(self.report_display, 1)
+        
+        self.stats_label = QLabel("")
+        self.stats_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 12px;")
+        layout.addWidget(self.stats_label)
+        
+        close_row = QHBoxLayout()
+        close_row.addStretch()
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        close_row.addWidget(close_btn)
+        layout.addLayout(close_row)
+    
+    def _select_file(self, side: str):
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, f"Select {side.title()} File", "", "DBC Files (*.dbc);;All Files (*.*)"
+        )
+        if file_path:
+            self.paths[side] = file_path
+            self._labels[side].setText(Path(file_path).name)
+    
+    def _merge(self):
+        """Merge the three files and write the result where the user chooses."""
+        from hexdbc.core.dbc_merge import merge_dbc
+        from hexdbc.core.parser import DBCParser, DBCWriter
+        
+        if not all(self.paths.values()):
+            QMessageBox.warning(self, "Missing Files", "Please select base, ours and theirs files.")
+            return
+        
+        try:
+            parser = DBCParser()
+            base, ours, theirs = (parser.parse(Path(self.paths[s])) for s in ("base", "ours", "theirs"))
+            schema = self.schema_manager.get_schema(Path(self.paths["ours"]).stem)
+            result = merge_dbc(base, ours, theirs, schema, prefer=self.prefer_combo.currentData())
+        except Exception as e:
+            QMessageBox.critical(self, "Merge Failed", f"Failed to merge files: {e}")
+            return
+        
+        self._show_report(result)
+        
+        output_path, _ = QFileDialog.getSaveFileName(
+            self, "Save Merged DBC", self.paths["ours"], "DBC Files (*.dbc);;All Files (*.*)"
+        )
+        if not output_path:
+            return
+        try:
+            DBCWriter().write(result.dbc, Path(output_path))
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to write merged file: {e}")
+            return
+        self.merged.emit(output_path)
+    
+    def _show_report(self, result):
+        import html
+        
+        self.stats_label.setText(
+            f"{len(result.dbc.records)} records: {result.from_ours} from ours, "
+            f"{result.from_theirs} from theirs, {result.combined} combined, "
+            f"{len(result.conflicts)} conflicts"
+        )
+        if not result.conflicts:
+            self.report_display.setHtml(f'<p style="color: {COLORS["accent_green"]}; font-size: 14px; text-align: center; padding: 20px;">✓ Merged without conflicts</p>')
+            return
+        
+        parts = ['<pre style="margin: 0; padding: 0;">']
+        for conflict in result.conflicts[:MAX_LISTED_RESULTS]:
+            parts.append(f'<span style="color: {COLORS["accent_red"]};">CONFLICT</span> {html.escape(conflict.describe())}')
+        if len(result.conflicts) > MAX_LISTED_RESULTS:
+            parts.append(f'... {len(result.conflicts) - MAX_LISTED_RESULTS} more')
+        parts.append('</pre>')
+        self.report_display.setHtml('\n'.join(parts))
+
+
+class ProblemsDialog(QDialog):
+    """Live list of the validation problems in the current file."""
+    
+    jump_to_line = Signal(int)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        
+        self.setWindowTitle("Problems")
+        self.setMinimumSize(700, 400)
+        self.setStyleSheet(f"""
+            QDialog {{
+                background-color: {COLORS['bg_primary']};
+                color: {COLORS['text_primary']};
+            }}
+        """)
+        
+        layout = QVBoxLayout(self)
+        layout.setSpacing(12)
+        layout.setContentsMargins(16, 16, 16, 16)
+        
+        self.stats_label = QLabel("")
+        self.stats_label.setStyleSheet(f"color: {COLORS['text_secondary']}; font-size: 13px;")
+        layout.addWidget(self.stats_label)
+        
+        self.problem_list = QListWidget()
+        self.problem_list.setStyleSheet(f"""
+            QListWidget {{
+                background-color: {COLORS['bg_secondary']};
+                border: 1px solid {COLORS['border_primary']};
+                border-radius: 6px;
+                padding: 4px;
+                font-family: 'Consolas', 'Courier New', monospace;
+            }}
+            QListWidget::item {{
+                padding: 6px;
+                border-bottom: 1px solid {COLORS['border_secondary']};
+            }}
+            QListWidget::item:selected {{
+                background-color: {COLORS['accent_blue']};
+            }}
+        """)
+        self.problem_list.itemDoubleClicked.connect(self._jump_to_problem)
+        layout.addWidget(self.problem_list, 1)
+        
+        button_row = QHBoxLayout()
+        button_row.addStretch()
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        button_row.addWidget(close_btn)
+        layout.addLayout(button_row)
+    
+    def _jump_to_problem(self, item):
+        line = item.data(Qt.ItemDataRole.UserRole)
+        if line is not None:
+            self.jump_to_line.emit(line)
+    
+    def set_problems(self, file_name: str, problems: List[Tuple[int, bool, str]]):
+        """Show (0-based line, is_error, message) problems, sorted by line."""
+        self.setWindowTitle(f"Problems - {file_name}" if file_name else "Problems")
+        errors = sum(1 for _, is_error, _ in problems if is_error)
+        self.stats_label.setText(f"{errors} errors, {len(problems) - errors} warnings (double-click to go to the line)")
+        
+        self.problem_list.clear()
+        for line, is_error, message in problems[:MAX_LISTED_RESULTS]:
+            item = QListWidgetItem(f"{'✕' if is_error else '⚠'}  Line {line + 1}: {message}")
+            item.setForeground(QColor(COLORS['accent_red'] if is_error else COLORS['accent_orange']))
+            item.setData(Qt.ItemDataRole.UserRole, line)
+            self.problem_list.addItem(item)
+        if len(problems) > MAX_LISTED_RESULTS:
+            self.problem_list.addItem(f"... {len(problems) - MAX_LISTED_RESULTS} more")
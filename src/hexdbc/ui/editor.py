@@ -23,6 +23,20 @@ except ImportError:
         QSCI_AVAILABLE = False
 
 from hexdbc.ui.theme import get_editor_colors, COLORS
+from hexdbc.core.record_index import RecordIndex, parse_record_header, scan_record_headers
+from hexdbc.core import hexdbc_lexer
+
+# Edits spanning more blocks than this rebuild the record index from a text scan
+REINDEX_BLOCK_LIMIT = 2000
+
+# Quiet time after typing before edited records are reported for the change journal
+RECORD_EDIT_SETTLE_MS = 750
+
+# Diagnostic underlines are drawn for at most this many lines
+MAX_LINE_MARKERS = 1000
+
+# Scroll steps are coalesced so newly visible blocks are highlighted at most once per frame
+HIGHLIGHT_SCROLL_MS = 16
 
 
 if QSCI_AVAILABLE:
@@ -319,7 +333,7 @@ class CodeEditor(QsciScintilla if QSCI_AVAILABLE else QWidget):
         lexer = HexDBCLexer(self)
         self.setLexer(lexer)
     
-    def set_text(self, text: str):
+    def set_text(self, text: str, record_lines=None):
         """Set editor text content."""
         self.setText(text)
     
@@ -335,13 +349,30 @@ class CodeEditor(QsciScintilla if QSCI_AVAILABLE else QWidget):
         self.ensureCursorVisible()
         # Also use SendScintilla for more reliable scrolling
         self.SendScintilla(QsciScintilla.SCI_GOTOLINE, line)
+    
+    def find_record_line(self, record_id: int):
+        """0-based header line of a record, or None."""
+        for found_id, line in scan_record_headers(self.text()):
+            if found_id == record_id:
+                return line
+        return None
+    
+    def scroll_to_record(self, record_id: int) -> bool:
+        """Scroll to a record header; False if the ID is not in the text."""
+        line = self.find_record_line(record_id)
+        if line is None:
+            return False
+        self.scroll_to_line(line)
+        return True
 
 
 # Fallback plain text editor if QScintilla is not available
 if not QSCI_AVAILABLE:
     from PySide6.QtWidgets import QPlainTextEdit
-    from PySide6.QtGui import QSyntaxHighlighter, QTextCharFormat
-    import re
+    from PySide6.QtGui import QSyntaxHighlighter, QTextBlockUserData, QTextCharFormat, QTextCursor
+    
+    class _Highlighted(QTextBlockUserData):
+        """Marks a block that has been highlighted since its text was loaded."""
     
     class SimpleSyntaxHighlighter(QSyntaxHighlighter):
         """Simple syntax highlighter fallback for when QScintilla is unavailable."""
@@ -349,7 +380,6 @@ if not QSCI_AVAILABLE:
         def __init__(self, parent=None):
             super().__init__(parent)
             self._init_formats()
-            self._init_rules()
         
         def _init_formats(self):
             colors = get_editor_colors()
@@ -376,22 +406,35 @@ if not QSCI_AVAILABLE:
             self.type_format = QTextCharFormat()
             self.type_format.setForeground(QColor(colors['type']))
         
-        def _init_rules(self):
-            self.rules = [
-                (re.compile(r'#.*'), self.comment_format),
-                (re.compile(r'"[^"\\]*(\\.[^"\\]*)*"'), self.string_format),
-                (re.compile(r'\b0x[0-9a-fA-F]+\b'), self.number_format),
-                (re.compile(r'\b-?\d+\.?\d*\b'), self.number_format),
-                (re.compile(r'\b[A-Z][A-Z0-9_]+\b'), self.type_format),
-                (re.compile(r'\b\w+(?=\s*\()'), self.function_format),
-                (re.compile(r'\b\w+(?=\s*=)'), self.variable_format),
-                (re.compile(r'@\w+'), self.keyword_format),
-            ]
+            
+            self.formats = {
+                hexdbc_lexer.COMMENT: self.comment_format,
+                hexdbc_lexer.STRING: self.string_format,
+                hexdbc_lexer.DIRECTIVE: self.keyword_format,
+                hexdbc_lexer.VARIABLE: self.variable_format,
+                hexdbc_lexer.FUNCTION: self.function_format,
+                hexdbc_lexer.NUMBER: self.number_format,
+                hexdbc_lexer.TYPE: self.type_format,
+            }
         
         def highlightBlock(self, text):
-            for pattern, fmt in self.rules:
-                for match in pattern.finditer(text):
-                    self.setFormat(match.start(), match.end() - match.start(), fmt)
+            formats = self.formats
+            for start, length, kind in hexdbc_lexer.tokenize_line(text):
+                self.setFormat(start, length, formats[kind])
+            # Not the block state: Qt carries on into the next block whenever that changes
+            if self.currentBlockUserData() is None:
+                self.setCurrentBlockUserData(_Highlighted())
+        
+        def highlight_pending(self, block, last_block_number: int):
+            """Highlight the blocks from block through last_block_number that never were.
+            
+            Qt re-highlights blocks itself as they are edited, so a block
+            that already carries the _Highlighted marker is up to date and skipped.
+            """
+            while block.isValid() and block.blockNumber() <= last_block_number:
+                if block.userData() is None:
+                    self.rehighlightBlock(block)
+                block = block.next()
     
     class CodeEditor(QPlainTextEdit):
         """Fallback plain text editor when QScintilla is unavailable."""
@@ -400,6 +443,10 @@ if not QSCI_AVAILABLE:
         from PySide6.QtCore import Signal
         reference_hovered = Signal(str, str, int, object)  # (field_name, value_str, value_int, cursor_pos)
         reference_left = Signal()
+        # Record IDs whose text changed, once typing settles
+        records_edited = Signal(list)
+        # An edit too large to attribute to records (e.g. replacing the whole text)
+        bulk_edited = Signal()
         
         def __init__(self, parent=None):
             super().__init__(parent)
@@ -407,6 +454,7 @@ if not QSCI_AVAILABLE:
             self._dbc_name: str = ""  # Current DBC name for FK lookups
             self._hover_timer = None
             self._last_hover_field = None
+            self._line_markers = []  # (cursor on the marked line, message)
             
             colors = get_editor_colors()
             
@@ -427,8 +475,27 @@ if not QSCI_AVAILABLE:
             # Enable mouse tracking for hover
             self.setMouseTracking(True)
             
-            # Connect scroll to rehighlight visible content
+            # Highlight blocks as they scroll into view
+            from PySide6.QtCore import QTimer
+            self._scroll_timer = QTimer(self)
+            self._scroll_timer.setSingleShot(True)
+            self._scroll_timer.setInterval(HIGHLIGHT_SCROLL_MS)
+            self._scroll_timer.timeout.connect(self._deferred_rehighlight)
             self.verticalScrollBar().valueChanged.connect(self._on_scroll)
+            
+            # Record ID -> header cursor. Qt shifts cursor positions on every edit,
+            # so only the blocks an edit touches need re-scanning.
+            self.record_index = RecordIndex()
+            self._record_anchors = []  # (cursor, record_id) in document order
+            self.document().contentsChange.connect(self._on_contents_change)
+            
+            # Records touched since the last report to the change journal
+            self._edited_records = set()
+            self._bulk_edit = False
+            self._edit_timer = QTimer(self)
+            self._edit_timer.setSingleShot(True)
+            self._edit_timer.setInterval(RECORD_EDIT_SETTLE_MS)
+            self._edit_timer.timeout.connect(self.flush_record_edits)
         
         def set_dbc_name(self, name: str):
             """Set the current DBC name for FK lookups."""
@@ -438,8 +505,11 @@ if not QSCI_AVAILABLE:
             """Get the current DBC name."""
             return self._dbc_name
         
-        def set_text(self, text: str):
-            """Set text with deferred highlighting to prevent freeze on large files."""
+        def set_text(self, text: str, record_lines=None):
+            """Set text with deferred highlighting to prevent freeze on large files.
+            
+            record_lines is the generator's (record_id, line) list, if known.
+            """
             # Block signals to prevent highlighting during load
             self.highlighter.blockSignals(True)
             self.document().blockSignals(True)
@@ -450,32 +520,229 @@ if not QSCI_AVAILABLE:
             self.document().blockSignals(False)
             self.highlighter.blockSignals(False)
             
+            self._rebuild_record_index(text, record_lines)
+            self.discard_record_edits()
+            
             # Schedule a deferred rehighlight for visible content only
             from PySide6.QtCore import QTimer
             QTimer.singleShot(100, self._deferred_rehighlight)
         
         def _deferred_rehighlight(self):
-            """Rehighlight only visible blocks for performance."""
-            # Get visible area
+            """Highlight the visible blocks that have not been highlighted yet."""
             first_visible = self.firstVisibleBlock()
             if not first_visible.isValid():
                 return
             
-            # Rehighlight visible blocks only (approx 50-100 lines)
-            block = first_visible
-            count = 0
-            while block.isValid() and count < 100:
-                self.highlighter.rehighlightBlock(block)
-                block = block.next()
-                count += 1
+            # Every block takes at least one line, so no more than this many are visible
+            line_height = max(1, self.fontMetrics().lineSpacing())
+            visible_lines = self.viewport().height() // line_height + 2
+            self.highlighter.highlight_pending(first_visible, first_visible.blockNumber() + visible_lines)
         
         def _on_scroll(self, value):
-            """Rehighlight visible content when scrolling."""
-            self._deferred_rehighlight()
+            """Coalesce scroll steps; the timer is not restarted, so fast scrolling still updates every frame."""
+            if not self._scroll_timer.isActive():
+                self._scroll_timer.start()
         
         def get_text(self) -> str:
             return self.toPlainText()
         
+        def _rebuild_record_index(self, text: str, record_lines=None):
+            """Index every record header from scratch."""
+            self.record_index.clear()
+            self._record_anchors = []
+            doc = self.document()
+            headers = record_lines if record_lines is not None else scan_record_headers(text)
+            for record_id, line in headers:
+                block = doc.findBlockByNumber(line)
+                if block.isValid():
+                    cursor = QTextCursor(block)
+                    self._record_anchors.append((cursor, record_id))
+                    self.record_index.add(record_id, cursor)
+        
+        def _anchor_bound(self, position: int) -> int:
+            """Index of the first header anchor at or after position."""
+            anchors = self._record_anchors
+            lo, hi = 0, len(anchors)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if anchors[mid][0].position() < position:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            return lo
+        
+        def _on_contents_change(self, position: int, removed: int, added: int):
+            """Re-scan only the blocks an edit touched for record headers."""
+            doc = self.document()
+            first = doc.findBlock(position)
+            last = doc.findBlock(position + added)
+            if not last.isValid():
+                last = doc.lastBlock()
+            if not first.isValid():
+                first = last
+            
+            block_span = last.blockNumber() - first.blockNumber()
+            self._edit_timer.start()
+            if block_span > REINDEX_BLOCK_LIMIT:
+                self._bulk_edit = True
+                self._rebuild_record_index(self.toPlainText())
+                return
+            
+            # Anchors of headers that were deleted collapse into this range too
+            lo = self._anchor_bound(first.position())
+            hi = self._anchor_bound(last.position() + last.length())
+            if lo > 0:
+                # The record the edit starts in
+                self._edited_records.add(self._record_anchors[lo - 1][1])
+            for cursor, record_id in self._record_anchors[lo:hi]:
+                self.record_index.discard(record_id, cursor)
+                self._edited_records.add(record_id)
+            
+            fresh = []
+            block = first
+            for _ in range(block_span + 1):
+                record_id = parse_record_header(block.text())
+                if record_id is not None:
+                    cursor = QTextCursor(block)
+                    fresh.append((cursor, record_id))
+                    self.record_index.add(record_id, cursor)
+                    self._edited_records.add(record_id)
+                block = block.next()
+            self._record_anchors[lo:hi] = fresh
+        
+        def flush_record_edits(self):
+            """Report pending record edits now instead of waiting for typing to settle."""
+            self._edit_timer.stop()
+            bulk, edited = self._bulk_edit, self._edited_records
+            self._bulk_edit = False
+            self._edited_records = set()
+            if bulk:
+                self.bulk_edited.emit()
+            elif edited:
+                self.records_edited.emit(sorted(edited))
+        
+        def discard_record_edits(self):
+            """Drop pending record edits (the caller has accounted for them)."""
+            self._edit_timer.stop()
+            self._bulk_edit = False
+            self._edited_records = set()
+        
+        def record_ids(self):
+            """Record IDs in document order, duplicates included."""
+            return [record_id for _, record_id in self._record_anchors]
+        
+        def _record_blocks(self, record_id: int):
+            """Header block and closing-brace block of a record, or None."""
+            anchor = self.record_index.get(record_id)
+            if anchor is None:
+                return None
+            first = last = anchor.block()
+            block = first.next()
+            while block.isValid() and parse_record_header(block.text()) is None:
+                last = block
+                if block.text().strip() == "}":
+                    break
+                block = block.next()
+            return first, last
+        
+        def record_text(self, record_id: int):
+            """Text of one record block, header through closing brace, or None."""
+            blocks = self._record_blocks(record_id)
+            if blocks is None:
+                return None
+            first, last = blocks
+            lines = []
+            block = first
+            while True:
+                lines.append(block.text())
+                if block == last:
+                    break
+                block = block.next()
+            return "\n".join(lines)
+        
+        def set_record_fields(self, record_id: int, fields) -> bool:
+            """Rewrite (field name, value text) pairs in a record, keeping trailing comments."""
+            blocks = self._record_blocks(record_id)
+            if blocks is None:
+                return False
+            first, last = blocks
+            pending = dict(fields)
+            cursor = QTextCursor(self.document())
+            cursor.beginEditBlock()
+            block = first.next()
+            while pending and block.isValid() and block != last.next():
+                text = block.text()
+                name, sep, rest = text.partition("=")
+                field_name = name.strip()
+                if sep and field_name in pending:
+                    comment = rest[rest.index("#"):] if "#" in rest else ""
+                    cursor.setPosition(block.position())
+                    cursor.setPosition(block.position() + len(text), QTextCursor.MoveMode.KeepAnchor)
+                    line = f"{name.rstrip()} = {pending.pop(field_name)}"
+                    cursor.insertText(f"{line}  {comment}" if comment else line)
+                block = block.next()
+            if pending:
+                # Fields missing from the text go just above the closing brace
+                cursor.setPosition(last.position())
+                cursor.insertText("".join(f"    {name} = {value}\n" for name, value in pending.items()))
+            cursor.endEditBlock()
+            return True
+        
+        def remove_record(self, record_id: int) -> bool:
+            """Delete a record block and the blank line after it."""
+            blocks = self._record_blocks(record_id)
+            if blocks is None:
+                return False
+            first, last = blocks
+            end = last.next()
+            if end.isValid() and not end.text().strip():
+                end = end.next()
+            cursor = QTextCursor(self.document())
+            cursor.setPosition(first.position())
+            if end.isValid():
+                cursor.setPosition(end.position(), QTextCursor.MoveMode.KeepAnchor)
+            else:
+                cursor.movePosition(QTextCursor.MoveOperation.End, QTextCursor.MoveMode.KeepAnchor)
+            cursor.removeSelectedText()
+            return True
+        
+        def insert_record(self, record_id: int, text: str):
+            """Insert a record block before the next higher ID, or at the end."""
+            text = text.rstrip("\n") + "\n"
+            cursor = QTextCursor(self.document())
+            following = self.record_index.ceiling(record_id)
+            anchor = self.record_index.get(following) if following is not None else None
+            if anchor is not None:
+                cursor.setPosition(anchor.block().position())
+                cursor.insertText(text + "\n")
+            else:
+                # Keep one blank line between the last record and this one
+                last = self.document().lastBlock()
+                if last.text():
+                    prefix = "\n\n"
+                elif last.previous().isValid() and last.previous().text():
+                    prefix = "\n"
+                else:
+                    prefix = ""
+                cursor.movePosition(QTextCursor.MoveOperation.End)
+                cursor.insertText(prefix + text)
+        
+        def find_record_line(self, record_id: int):
+            """0-based header line of a record, or None."""
+            cursor = self.record_index.get(record_id)
+            return cursor.blockNumber() if cursor is not None else None
+        
+        def scroll_to_record(self, record_id: int) -> bool:
+            """Scroll to a record header; False if the ID is not in the text."""
+            anchor = self.record_index.get(record_id)
+            if anchor is None:
+                return False
+            cursor = self.textCursor()
+            cursor.setPosition(anchor.block().position())
+            self.setTextCursor(cursor)
+            self.ensureCursorVisible()
+            return True
+        
         def append_text(self, text: str):
             """Append text at the end efficiently without re-processing entire document."""
             from PySide6.QtGui import QTextCursor
@@ -493,6 +760,34 @@ if not QSCI_AVAILABLE:
             self.setTextCursor(cursor)
             self.ensureCursorVisible()
         
+        def set_line_markers(self, markers):
+            """Underline lines with problems; markers are (0-based line, is_error, message)."""
+            from PySide6.QtWidgets import QTextEdit
+            
+            selections = []
+            self._line_markers = []
+            doc = self.document()
+            for line, is_error, message in markers[:MAX_LINE_MARKERS]:
+                block = doc.findBlockByNumber(line)
+                if not block.isValid():
+                    continue
+                fmt = QTextCharFormat()
+                fmt.setUnderlineStyle(QTextCharFormat.UnderlineStyle.WaveUnderline)
+                fmt.setUnderlineColor(QColor(COLORS['accent_red'] if is_error else COLORS['accent_orange']))
+                # Cursors track their text through edits until the next validation
+                cursor = QTextCursor(block)
+                cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
+                selection = QTextEdit.ExtraSelection()
+                selection.format = fmt
+                selection.cursor = cursor
+                selections.append(selection)
+                self._line_markers.append((cursor, message))
+            self.setExtraSelections(selections)
+        
+        def _marker_message(self, block):
+            messages = [message for cursor, message in self._line_markers if cursor.block() == block]
+            return "\n".join(messages)
+        
         def mouseMoveEvent(self, event):
             """Handle mouse move to detect hover over FK values."""
             super().mouseMoveEvent(event)
@@ -507,6 +802,15 @@ if not QSCI_AVAILABLE:
             # Parse for field = value pattern
             field_info = self._parse_field_at_cursor(line_text, cursor.positionInBlock())
             
+            # Problems on the line, unless a reference tooltip is about to show
+            if self._line_markers and not field_info:
+                from PySide6.QtWidgets import QToolTip
+                message = self._marker_message(block)
+                if message:
+                    QToolTip.showText(self.mapToGlobal(event.pos()), message, self)
+                else:
+                    QToolTip.hideText()
+            
             if field_info:
                 field_name, value_str = field_info
                 # Only trigger if this is a new hover
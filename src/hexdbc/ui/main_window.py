@@ -4,33 +4,44 @@ Main window for HexDBC editor with multi-tab support.
 
 import os
 import re
-import webbrowser
 from pathlib import Path
 from typing import Optional, Dict, List
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QAction, QIcon, QKeySequence, QFont, QFontDatabase
+from PySide6.QtCore import Qt, QSize, QStandardPaths, QTimer
+from PySide6.QtGui import QAction, QColor, QIcon, QKeySequence, QFont, QFontDatabase
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QFileDialog, QMessageBox, QToolBar, QStatusBar, QSplitter,
     QTreeWidget, QTreeWidgetItem, QFrame, QApplication, QTabWidget,
-    QTabBar, QPushButton
+    QTabBar, QPushButton, QHeaderView, QInputDialog
 )
 
 from hexdbc.ui.editor import CodeEditor
 from hexdbc.core.parser import DBCParser, DBCWriter, DBCFile
+from hexdbc.core.compile_cache import CompileCache, CompiledSource
 from hexdbc.core.hexdbc_format import HexDBCGenerator, HexDBCParser
 from hexdbc.core.schema import SchemaManager
 from hexdbc.core.dbc_cache import DBCCache
 from hexdbc.core.dbc_relations import get_reference
-from hexdbc.ui.theme import get_stylesheet, COLORS
-from hexdbc.ui.dialogs import (
-    AdvancedSearchDialog, AddEntryDialog,
-    CommandPaletteDialog, FileComparisonDialog
+from hexdbc.core.record_index import RecordIndex, scan_record_headers
+from hexdbc.core.edit_journal import EditJournal
+from hexdbc.core.hexdbc_validator import HexDBCValidator, DiagnosticSet
+from hexdbc.core.record_outline import RecordOutline
+from hexdbc.core.folder_catalog import FolderCatalog, SCHEMA_MISMATCH, SCHEMA_INVALID
+from hexdbc.core.wal import (
+    WriteAheadLog, WALContents, WAL_SUFFIX, SYNC_INTERVAL, read_wal, restore_journal, wal_path_for
 )
-from hexdbc.ui.reference_tooltip import ReferenceTooltip
+from hexdbc.ui.theme import get_stylesheet, COLORS
+from hexdbc.ui.validation import ValidationWorker
+from hexdbc.ui.outline import OutlinePanel
+
+# Dialogs, the reference tooltip and webbrowser are imported on first use
+# so none of them sit between process start and the first paint.
+
+# Quiet time before edits the journal missed are caught up with a full parse
+JOURNAL_SYNC_MS = 3000
 
 
 @dataclass
@@ -40,7 +51,13 @@ class TabState:
     dbc_file: Optional[DBCFile] = None
     original_dbc_path: Optional[Path] = None
     is_modified: bool = False
-    change_history: List[Dict] = field(default_factory=list)  # Track changes
+    change_history: Optional[EditJournal] = None  # Field edits since the DBC was opened
+    journal_stale: bool = False  # Edits the journal missed (bulk edits, unparsable records)
+    record_index: Optional[RecordIndex] = None  # Live record IDs, kept current by the editor
+    wal: Optional[WriteAheadLog] = None  # Recovery log of the journal's unsaved changes
+    validator: Optional[HexDBCValidator] = None
+    diagnostics: Optional[DiagnosticSet] = None  # Latest validation results, per record
+    outline: Optional[RecordOutline] = None  # Built from dbc_file when the tab is first shown
 
 
 class ClosableTabBar(QTabBar):
@@ -73,20 +90,49 @@ class HexDBCWindow(QMainWindow):
         # DBC cache for cross-references (lazy loads DBCs from folder)
         self.dbc_cache = DBCCache(self.parser, self.schema_manager)
         
+        # Header summaries of folder files, reused while a file is unchanged
+        self.folder_catalog = FolderCatalog(self.schema_manager, self.parser)
+        
         # Current folder path
         self.current_folder: Optional[Path] = None
+        # Client MPQs the DBC cache reads references from, when opened instead of a folder
+        self.client_data = None
+        
+        # Compiled .hexdbc sources, so saving unchanged records skips parsing them
+        cache_dir = self._init_app_dir(QStandardPaths.StandardLocation.CacheLocation, "compiled")
+        self.compile_cache = CompileCache(cache_dir, self.hexdbc_parser) if cache_dir else None
+        
+        # Unsaved edits are logged here so they survive a crash
+        self.recovery_dir = self._init_app_dir(QStandardPaths.StandardLocation.AppDataLocation, "recovery")
+        self.wal_timer = QTimer(self)
+        self.wal_timer.setInterval(int(SYNC_INTERVAL * 1000))
+        self.wal_timer.timeout.connect(self._sync_wals)
+        self.wal_timer.start()
+        
+        # Bulk and unparsable edits only reach the journal (and the log) through a full parse
+        self.journal_sync_timer = QTimer(self)
+        self.journal_sync_timer.setSingleShot(True)
+        self.journal_sync_timer.setInterval(JOURNAL_SYNC_MS)
+        self.journal_sync_timer.timeout.connect(self._sync_stale_journals)
+        
+        # Edited records are re-validated off the UI thread
+        self.validation_worker = ValidationWorker(self)
+        self.validation_worker.finished.connect(self._on_validation_finished)
+        self.problems_dialog = None
         
         self._init_ui()
         
-        # Reference tooltip (created after UI init)
-        self.reference_tooltip = ReferenceTooltip(self)
-        self.reference_tooltip.navigate_requested.connect(self._on_reference_navigate)
+        # Reference tooltip (created on first FK hover)
+        self.reference_tooltip = None
         self._create_actions()
         self._create_menus()
         self._create_toolbar()
         self._create_statusbar()
         
         self._update_title()
+        
+        # Offer recovery once the window is up
+        QTimer.singleShot(0, self._recover_unsaved_edits)
     
     def _init_ui(self):
         """Initialize the user interface."""
@@ -136,6 +182,15 @@ class HexDBCWindow(QMainWindow):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
         
+        # Folder files on top, the current tab's record outline below
+        panel_splitter = QSplitter(Qt.Orientation.Vertical)
+        layout.addWidget(panel_splitter)
+        files = QWidget()
+        files_layout = QVBoxLayout(files)
+        files_layout.setContentsMargins(0, 0, 0, 0)
+        files_layout.setSpacing(0)
+        panel_splitter.addWidget(files)
+        
         # Header
         header = QLabel("  DBC Files")
         header.setStyleSheet(f"""
@@ -148,12 +203,17 @@ class HexDBCWindow(QMainWindow):
                 border-bottom: 1px solid {COLORS['border_primary']};
             }}
         """)
-        layout.addWidget(header)
+        files_layout.addWidget(header)
         
         # File tree
         self.file_tree = QTreeWidget()
         self.file_tree.setHeaderHidden(True)
         self.file_tree.setRootIsDecorated(False)
+        # Name, then record count
+        self.file_tree.setColumnCount(2)
+        self.file_tree.header().setStretchLastSection(False)
+        self.file_tree.header().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.file_tree.header().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
         self.file_tree.setStyleSheet(f"""
             QTreeWidget {{
                 background-color: {COLORS['bg_secondary']};
@@ -171,7 +231,12 @@ class HexDBCWindow(QMainWindow):
             }}
         """)
         self.file_tree.itemDoubleClicked.connect(self._on_file_double_clicked)
-        layout.addWidget(self.file_tree)
+        files_layout.addWidget(self.file_tree)
+        
+        self.outline_panel = OutlinePanel()
+        self.outline_panel.record_activated.connect(self._on_outline_activated)
+        panel_splitter.addWidget(self.outline_panel)
+        panel_splitter.setSizes([300, 500])
         
         return panel
     
@@ -255,7 +320,9 @@ class HexDBCWindow(QMainWindow):
         idx = self.tab_widget.currentIndex()
         return self.tab_states.get(idx)
     
-    def _create_new_tab(self, file_path: Path, code: str, dbc_file: Optional[DBCFile] = None) -> int:
+    def _create_new_tab(self, file_path: Path, code: str, dbc_file: Optional[DBCFile] = None,
+                        record_lines=None, change_history: Optional[EditJournal] = None,
+                        wal_contents: Optional[WALContents] = None) -> int:
         """Create a new editor tab and return its index."""
         # Check if file is already open
         for idx, state in self.tab_states.items():
@@ -265,7 +332,7 @@ class HexDBCWindow(QMainWindow):
         
         # Create new editor
         editor = CodeEditor()
-        editor.set_text(code)
+        editor.set_text(code, record_lines)
         
         # Set DBC name for FK lookups
         if file_path:
@@ -277,6 +344,11 @@ class HexDBCWindow(QMainWindow):
         if hasattr(editor, 'textChanged'):
             editor.textChanged.connect(lambda: self._on_editor_text_changed(editor))
         
+        # Settled record edits feed the tab's change journal
+        if hasattr(editor, 'records_edited'):
+            editor.records_edited.connect(lambda ids, e=editor: self._on_records_edited(e, ids))
+            editor.bulk_edited.connect(lambda e=editor: self._on_bulk_edited(e))
+        
         # Connect FK hover signals
         if hasattr(editor, 'reference_hovered'):
             editor.reference_hovered.connect(
@@ -315,12 +387,19 @@ class HexDBCWindow(QMainWindow):
         self.tab_widget.tabBar().setTabButton(idx, QTabBar.ButtonPosition.RightSide, close_btn)
         
         # Store state
-        self.tab_states[idx] = TabState(
+        if change_history is None:
+            change_history = self._new_journal(file_path, dbc_file)
+        state = TabState(
             file_path=file_path,
             dbc_file=dbc_file,
             original_dbc_path=file_path if file_path and file_path.suffix.lower() == '.dbc' else None,
-            is_modified=False
+            is_modified=False,
+            change_history=change_history,
+            record_index=getattr(editor, 'record_index', None)
         )
+        self.tab_states[idx] = state
+        self._start_wal(state, wal_contents)
+        self._start_validation(state, editor, code)
         
         # Switch to the new tab
         self.tab_widget.setCurrentIndex(idx)
@@ -347,6 +426,11 @@ class HexDBCWindow(QMainWindow):
                 self.tab_widget.setCurrentIndex(index)
                 self.save_file()
         
+        # Saved or discarded; nothing left to recover
+        if state and state.wal:
+            state.wal.close(delete=True)
+            state.wal = None
+        
         # Remove the tab
         self.tab_widget.removeTab(index)
         
@@ -394,6 +478,8 @@ class HexDBCWindow(QMainWindow):
             self.status_file.setText("Ready")
             self.status_stats.setText("")
         
+        self._update_problems_status()
+        self.outline_panel.set_outline(self._outline_for(state))
         self._update_title()
     
     def _on_editor_text_changed(self, editor: CodeEditor):
@@ -411,6 +497,304 @@ class HexDBCWindow(QMainWindow):
                     self._update_title()
                 break
     
+    def _state_for_editor(self, editor: CodeEditor) -> Optional[TabState]:
+        for idx in range(self.tab_widget.count()):
+            if self.tab_widget.widget(idx) is editor:
+                return self.tab_states.get(idx)
+        return None
+    
+    def _journal_schema(self, file_path: Optional[Path], dbc_file: DBCFile):
+        """The schema a tab's text was generated with."""
+        dbc_name = file_path.stem if file_path else "Unknown"
+        schema = self.schema_manager.get_schema(dbc_name)
+        if not schema:
+            schema = self.schema_manager.generate_fallback_schema(dbc_file.header.field_count, dbc_name, dbc_file)
+        return schema
+    
+    def _new_journal(self, file_path: Optional[Path], dbc_file: Optional[DBCFile]) -> Optional[EditJournal]:
+        """Change journal against a tab's DBC."""
+        if dbc_file is None:
+            return None
+        return EditJournal(dbc_file, self._journal_schema(file_path, dbc_file))
+    
+    def _init_app_dir(self, location_type, name: str) -> Optional[Path]:
+        location = QStandardPaths.writableLocation(location_type)
+        if not location:
+            return None
+        app_dir = Path(location) / name
+        try:
+            app_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return None
+        return app_dir
+    
+    def _start_wal(self, state: TabState, contents: Optional[WALContents] = None):
+        """Log a DBC tab's journal to its recovery file (resuming contents if given)."""
+        if self.recovery_dir is None or state.change_history is None or state.original_dbc_path is None:
+            return
+        path = wal_path_for(self.recovery_dir, state.original_dbc_path)
+        try:
+            state.wal = WriteAheadLog(path, state.change_history, state.original_dbc_path, contents)
+        except OSError as e:
+            state.wal = None
+            self.status_file.setText(f"Crash recovery unavailable: {e}")
+    
+    def _sync_wals(self):
+        for state in self.tab_states.values():
+            if state.wal:
+                try:
+                    state.wal.maybe_sync()
+                except OSError:
+                    pass
+    
+    def _recover_unsaved_edits(self):
+        """Offer to reopen DBCs whose unsaved edits were left in the recovery folder."""
+        if self.recovery_dir is None:
+            return
+        
+        recoverable = []
+        for path in sorted(self.recovery_dir.glob(f"*{WAL_SUFFIX}")):
+            try:
+                contents = read_wal(path)
+            except (OSError, ValueError):
+                contents = None
+            # Logs are only valid against the exact file they were started on
+            if contents and contents.groups and contents.matches_source():
+                recoverable.append((path, contents))
+            else:
+                path.unlink(missing_ok=True)
+        
+        if not recoverable:
+            return
+        
+        files_list = "\n".join(f"  • {contents.source_path.name}" for _, contents in recoverable[:5])
+        if len(recoverable) > 5:
+            files_list += f"\n  ... and {len(recoverable) - 5} more"
+        reply = QMessageBox.question(
+            self, "Recover Unsaved Edits",
+            f"HexDBC did not shut down cleanly. Unsaved edits were found for:\n\n{files_list}\n\n"
+            "Restore them?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.Discard
+        )
+        
+        for path, contents in recoverable:
+            if reply != QMessageBox.StandardButton.Yes:
+                path.unlink(missing_ok=True)
+                continue
+            try:
+                self._restore_tab(contents)
+            except Exception as e:
+                QMessageBox.critical(
+                    self, "Error", f"Failed to recover edits to {contents.source_path.name}:\n{e}"
+                )
+    
+    def _restore_tab(self, contents: WALContents):
+        """Reopen a DBC with a recovery log's edits applied, leaving them unsaved."""
+        source_path = contents.source_path
+        baseline = self.parser.parse(source_path)
+        journal = restore_journal(contents, baseline, self._journal_schema(source_path, baseline))
+        
+        dbc = journal.build_dbc()
+        self.dbc_cache.add_open_dbc(source_path.stem, dbc)
+        code = self.generator.generate(dbc, source_path.stem)
+        idx = self._create_new_tab(source_path, code, baseline, self.generator.record_lines,
+                                   change_history=journal, wal_contents=contents)
+        
+        state = self.tab_states[idx]
+        state.is_modified = True
+        self.tab_widget.setTabText(idx, source_path.name + " •")
+        self._update_title()
+        self.status_file.setText(f"Recovered unsaved edits: {source_path.name}")
+    
+    def _outline_for(self, state: Optional[TabState]) -> Optional[RecordOutline]:
+        if not state or state.dbc_file is None:
+            return None
+        if state.outline is None or state.outline.dbc is not state.dbc_file:
+            state.outline = RecordOutline(state.dbc_file, self._journal_schema(state.file_path, state.dbc_file))
+        return state.outline
+    
+    def _on_outline_activated(self, record_id: int):
+        editor = self._get_current_editor()
+        if editor and hasattr(editor, 'scroll_to_record'):
+            self._jump_to_entry(editor, record_id)
+    
+    def _start_validation(self, state: TabState, editor: CodeEditor, code: str):
+        """Validate a new tab's text in the background."""
+        if state.dbc_file is not None:
+            schema = self._journal_schema(state.file_path, state.dbc_file)
+            state.validator = HexDBCValidator(schema, state.dbc_file.header.field_count)
+        else:
+            # A .hexdbc file names its schema; the DBC's field count is unknown
+            match = re.search(r'^\s*@schema\s+"([^"]+)"', code[:4096], re.MULTILINE)
+            schema = self.schema_manager.get_schema(match.group(1)) if match else None
+            state.validator = HexDBCValidator(schema)
+        state.diagnostics = DiagnosticSet()
+        self.validation_worker.check_text(state, state.validator, code)
+    
+    def _validate_records(self, state: TabState, editor: CodeEditor, record_ids: List[int]):
+        if state.validator is None:
+            return
+        texts = {record_id: editor.record_text(record_id) for record_id in record_ids}
+        self.validation_worker.check_records(state, state.validator, texts)
+    
+    def _on_validation_finished(self, state: TabState, full: bool, results: Dict):
+        if state.diagnostics is None or not any(s is state for s in self.tab_states.values()):
+            return  # Tab closed meanwhile
+        if full:
+            state.diagnostics.replace_all(results)
+        else:
+            state.diagnostics.update(results)
+        
+        editor = self._editor_for_state(state)
+        if editor and hasattr(editor, 'set_line_markers'):
+            editor.set_line_markers(self._problems(state, editor))
+        if state is self._get_current_state():
+            self._update_problems_status()
+    
+    def _editor_for_state(self, state: TabState) -> Optional[CodeEditor]:
+        for idx, s in self.tab_states.items():
+            if s is state:
+                return self.tab_widget.widget(idx)
+        return None
+    
+    def _problems(self, state: TabState, editor: CodeEditor) -> List:
+        """(0-based line, is_error, message) for every problem in a tab, by line."""
+        problems = []
+        if state.diagnostics is not None:
+            for record_id, diag in state.diagnostics.items():
+                if record_id is None:
+                    problems.append((diag.line, diag.is_error, diag.message))
+                    continue
+                header_line = editor.find_record_line(record_id)
+                if header_line is not None:
+                    problems.append((header_line + diag.line, diag.is_error, diag.message))
+        
+        # Duplicates come straight from the editor's live index
+        record_index = getattr(editor, 'record_index', None)
+        if record_index is not None:
+            for record_id in record_index.duplicates:
+                anchors = record_index.anchors(record_id)
+                first_line = anchors[0].blockNumber()
+                for anchor in anchors[1:]:
+                    problems.append((anchor.blockNumber(), True,
+                                     f"Duplicate record ID {record_id} (first on line {first_line + 1})"))
+        problems.sort(key=lambda problem: problem[0])
+        return problems
+    
+    def _update_problems_status(self):
+        state = self._get_current_state()
+        editor = self._get_current_editor()
+        if not state or state.diagnostics is None or not editor:
+            self.status_problems.setText("")
+            if self.problems_dialog:
+                self.problems_dialog.set_problems("", [])
+            return
+        problems = self._problems(state, editor)
+        errors = sum(1 for _, is_error, _ in problems if is_error)
+        self.status_problems.setText(f"✕ {errors}  ⚠ {len(problems) - errors}")
+        if self.problems_dialog:
+            file_name = state.file_path.name if state.file_path else ""
+            self.problems_dialog.set_problems(file_name, problems)
+    
+    def _show_problems(self):
+        """Show the live problem list for the current tab."""
+        if self.problems_dialog is None:
+            from hexdbc.ui.dialogs import ProblemsDialog
+            self.problems_dialog = ProblemsDialog(self)
+            self.problems_dialog.jump_to_line.connect(self._jump_to_problem)
+        self._update_problems_status()
+        self.problems_dialog.show()  # Non-modal; it follows the current tab
+        self.problems_dialog.raise_()
+    
+    def _jump_to_problem(self, line: int):
+        editor = self._get_current_editor()
+        if not editor:
+            return
+        cursor = editor.textCursor()
+        cursor.setPosition(editor.document().findBlockByNumber(line).position())
+        editor.setTextCursor(cursor)
+        editor.ensureCursorVisible()
+        editor.setFocus()
+    
+    def _on_records_edited(self, editor: CodeEditor, record_ids: List[int]):
+        """Log the field changes in records the user just edited."""
+        state = self._state_for_editor(editor)
+        if state:
+            self._validate_records(state, editor, record_ids)
+        journal = state.change_history if state else None
+        if journal is None:
+            return
+        
+        rows = {}
+        texts = []
+        for record_id in record_ids:
+            text = editor.record_text(record_id)
+            if text is None:
+                rows[record_id] = None
+            else:
+                texts.append(text)
+        
+        if texts:
+            # Compile just these records; fields missing from the text keep their old values
+            dbc_name = state.file_path.stem if state.file_path else "Unknown"
+            snippet = f'@schema "{dbc_name}"\n' + "\n".join(texts)
+            parsed = self.hexdbc_parser.parse(snippet, state.dbc_file)
+            if self.hexdbc_parser.errors:
+                # Half-typed values: catch up with a full parse once typing stops
+                self._mark_journal_stale(state)
+            else:
+                for record in parsed.records:
+                    rows.setdefault(record[0], self._changed_text_only(
+                        journal, journal.row_from(parsed, record)))
+        
+        journal.capture(rows)
+    
+    def _changed_text_only(self, journal: EditJournal, values: List) -> List:
+        """Keep the logged value of every field whose text reads the same as before.
+
+        The snippet is re-parsed as a whole, so fields the user did not touch
+        come back from their text; only fields whose text changed get logged.
+        """
+        current = journal.current_row(values[0])
+        if current is None:
+            return values
+        for i, (old, new) in enumerate(zip(current, values)):
+            if old != new and not isinstance(old, str):
+                if (self.generator.format_field(i, old, journal.schema)
+                        == self.generator.format_field(i, new, journal.schema)):
+                    values[i] = old
+        return values
+    
+    def _on_bulk_edited(self, editor: CodeEditor):
+        state = self._state_for_editor(editor)
+        if state:
+            self._mark_journal_stale(state)
+            if state.validator is not None:
+                self.validation_worker.check_text(state, state.validator, editor.get_text())
+    
+    def _mark_journal_stale(self, state: TabState):
+        """Note edits the journal missed; logged tabs catch up once editing goes quiet."""
+        state.journal_stale = True
+        if state.wal:
+            self.journal_sync_timer.start()
+    
+    def _sync_stale_journals(self):
+        """Catch stale journals up so the recovery log holds every edit."""
+        for idx, state in list(self.tab_states.items()):
+            if state.journal_stale and state.wal:
+                self._sync_change_history(state, self.tab_widget.widget(idx))
+    
+    def _sync_change_history(self, state: TabState, editor: CodeEditor):
+        """Bring a tab's journal up to date with its text; returns the parsed DBC if one was needed."""
+        if hasattr(editor, 'flush_record_edits'):
+            editor.flush_record_edits()
+        if state.change_history is None or not state.journal_stale:
+            return None
+        dbc = self.hexdbc_parser.parse(editor.get_text(), state.dbc_file)
+        state.change_history.capture_dbc(dbc, "Other edits")
+        state.journal_stale = False
+        return dbc
+    
     def _create_actions(self):
         """Create menu/toolbar actions."""
         # File actions
@@ -422,6 +806,9 @@ class HexDBCWindow(QMainWindow):
         self.action_open_folder.setShortcut("Ctrl+Shift+O")
         self.action_open_folder.triggered.connect(self.open_folder)
         
+        self.action_open_client_data = QAction("Open Client Data (MPQ)...", self)
+        self.action_open_client_data.triggered.connect(self.open_client_data)
+        
         self.action_close_tab = QAction("Close Tab", self)
         self.action_close_tab.setShortcut("Ctrl+W")
         self.action_close_tab.triggered.connect(self._close_current_tab)
@@ -442,6 +829,27 @@ class HexDBCWindow(QMainWindow):
         self.action_export_hexdbc.setShortcut("Ctrl+Shift+E")
         self.action_export_hexdbc.triggered.connect(self.export_hexdbc)
         
+        self.action_export_changes = QAction("Export Changes as Overlay...", self)
+        self.action_export_changes.triggered.connect(self.export_changes)
+        
+        self.action_export_sqlite = QAction("Export Folder to SQLite...", self)
+        self.action_export_sqlite.triggered.connect(self.export_folder_sqlite)
+        
+        self.action_import_sqlite = QAction("Import Table from SQLite...", self)
+        self.action_import_sqlite.triggered.connect(self.import_table_sqlite)
+        
+        self.action_export_csv = QAction("Export to CSV/TSV...", self)
+        self.action_export_csv.triggered.connect(self.export_csv)
+        
+        self.action_import_csv = QAction("Import CSV/TSV...", self)
+        self.action_import_csv.triggered.connect(self.import_csv)
+        
+        self.action_export_sql = QAction("Export to SQL...", self)
+        self.action_export_sql.triggered.connect(self.export_sql)
+        
+        self.action_pack_mpq = QAction("Pack DBCs into Patch MPQ...", self)
+        self.action_pack_mpq.triggered.connect(self.pack_mpq)
+        
         self.action_exit = QAction("Exit", self)
         self.action_exit.setShortcut("Alt+F4")
         self.action_exit.triggered.connect(self.close)
@@ -475,6 +883,18 @@ class HexDBCWindow(QMainWindow):
         self.action_add_entry.setShortcut("Ctrl+N")
         self.action_add_entry.triggered.connect(self._show_add_entry)
         
+        self.action_quick_jump = QAction("Go to Entry...", self)
+        self.action_quick_jump.setShortcut("Ctrl+I")
+        self.action_quick_jump.triggered.connect(self._show_quick_jump)
+        
+        self.action_undo_field = QAction("Undo Field Change", self)
+        self.action_undo_field.setShortcut("Ctrl+Alt+Z")
+        self.action_undo_field.triggered.connect(self._undo_field_change)
+        
+        self.action_change_history = QAction("Change History...", self)
+        self.action_change_history.setShortcut("Ctrl+Shift+H")
+        self.action_change_history.triggered.connect(self._show_change_history)
+        
         # New navigation actions
         self.action_command_palette = QAction("Command Palette...", self)
         self.action_command_palette.setShortcut("Ctrl+Shift+P")
@@ -484,6 +904,13 @@ class HexDBCWindow(QMainWindow):
         self.action_file_comparison.setShortcut("Ctrl+D")
         self.action_file_comparison.triggered.connect(self._show_file_comparison)
         
+        self.action_merge = QAction("Merge DBC Files...", self)
+        self.action_merge.triggered.connect(self._show_merge)
+        
+        self.action_problems = QAction("Problems...", self)
+        self.action_problems.setShortcut("Ctrl+Shift+M")
+        self.action_problems.triggered.connect(self._show_problems)
+        
         # View actions
         self.action_zoom_in = QAction("Zoom In", self)
         self.action_zoom_in.setShortcut(QKeySequence.StandardKey.ZoomIn)
@@ -518,6 +945,7 @@ class HexDBCWindow(QMainWindow):
         file_menu = menubar.addMenu("File")
         file_menu.addAction(self.action_open)
         file_menu.addAction(self.action_open_folder)
+        file_menu.addAction(self.action_open_client_data)
         file_menu.addSeparator()
         file_menu.addAction(self.action_close_tab)
         file_menu.addSeparator()
@@ -525,6 +953,14 @@ class HexDBCWindow(QMainWindow):
         file_menu.addAction(self.action_save_as)
         file_menu.addAction(self.action_export_dbc)
         file_menu.addAction(self.action_export_hexdbc)
+        file_menu.addAction(self.action_export_changes)
+        file_menu.addSeparator()
+        file_menu.addAction(self.action_export_sqlite)
+        file_menu.addAction(self.action_import_sqlite)
+        file_menu.addAction(self.action_export_csv)
+        file_menu.addAction(self.action_import_csv)
+        file_menu.addAction(self.action_export_sql)
+        file_menu.addAction(self.action_pack_mpq)
         file_menu.addSeparator()
         file_menu.addAction(self.action_exit)
         
@@ -532,12 +968,15 @@ class HexDBCWindow(QMainWindow):
         edit_menu = menubar.addMenu("Edit")
         edit_menu.addAction(self.action_undo)
         edit_menu.addAction(self.action_redo)
+        edit_menu.addAction(self.action_undo_field)
+        edit_menu.addAction(self.action_change_history)
         edit_menu.addSeparator()
         edit_menu.addAction(self.action_cut)
         edit_menu.addAction(self.action_copy)
         edit_menu.addAction(self.action_paste)
         edit_menu.addSeparator()
         edit_menu.addAction(self.action_advanced_search)
+        edit_menu.addAction(self.action_quick_jump)
         edit_menu.addSeparator()
         edit_menu.addAction(self.action_add_entry)
         
@@ -548,6 +987,8 @@ class HexDBCWindow(QMainWindow):
         view_menu.addSeparator()
         view_menu.addAction(self.action_command_palette)
         view_menu.addAction(self.action_file_comparison)
+        view_menu.addAction(self.action_merge)
+        view_menu.addAction(self.action_problems)
         
         # Help menu
         help_menu = menubar.addMenu("Help")
@@ -608,9 +1049,14 @@ class HexDBCWindow(QMainWindow):
             }
         """)
         kofi_btn.setToolTip("Support HexDBC on Ko-fi")
-        kofi_btn.clicked.connect(lambda: webbrowser.open("https://ko-fi.com/hex23"))
+        kofi_btn.clicked.connect(self._open_kofi)
         toolbar.addWidget(kofi_btn)
     
+    def _open_kofi(self):
+        """Open the Ko-fi page in the default browser."""
+        import webbrowser
+        webbrowser.open("https://ko-fi.com/hex23")
+    
     def _create_statusbar(self):
         """Create the status bar."""
         self.statusbar = QStatusBar()
@@ -624,6 +1070,11 @@ class HexDBCWindow(QMainWindow):
         self.status_stats = QLabel("")
         self.statusbar.addPermanentWidget(self.status_stats)
         
+        # Validation errors / warnings in the current tab
+        self.status_problems = QLabel("")
+        self.status_problems.setToolTip("Errors and warnings (Ctrl+Shift+M)")
+        self.statusbar.addPermanentWidget(self.status_problems)
+        
         # Position label
         self.status_pos = QLabel("Ln 1, Col 1")
         self.statusbar.addPermanentWidget(self.status_pos)
@@ -672,33 +1123,101 @@ class HexDBCWindow(QMainWindow):
         if folder:
             self._populate_file_tree(Path(folder))
     
+    def open_client_data(self):
+        """Resolve references from a client's MPQ archives and open one of their DBCs."""
+        data_dir = QFileDialog.getExistingDirectory(self, "Select the Client's Data Folder")
+        if not data_dir:
+            return
+        
+        from hexdbc.core.mpq import MPQChain, dbc_path
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            chain = MPQChain.open(Path(data_dir))
+            names = chain.dbc_names(self.schema_manager.schemas)
+        except (OSError, ValueError) as e:
+            QMessageBox.critical(self, "Error", f"Failed to read MPQ archives:\n{e}")
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+        if not names:
+            chain.close()
+            QMessageBox.warning(self, "Warning", "No DBC files were found in the MPQ archives.")
+            return
+        
+        self._close_client_data()
+        self.client_data = chain
+        self.dbc_cache.set_folder(chain, names)
+        self.status_file.setText(f"Client data: {len(names)} DBCs in {len(chain.archives)} archives")
+        
+        name, ok = QInputDialog.getItem(self, "Open DBC from MPQ", "DBC:", names, 0, False)
+        if not ok:
+            return
+        # Only this table is extracted; tabs and crash recovery work on real files
+        suggested = (self.current_folder or Path(data_dir)) / f"{name}.dbc"
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Save Extracted DBC", str(suggested), "DBC Files (*.dbc);;All Files (*.*)"
+        )
+        if not file_path:
+            return
+        try:
+            Path(file_path).write_bytes(chain.read(dbc_path(name)))
+        except (OSError, ValueError) as e:
+            QMessageBox.critical(self, "Error", f"Failed to extract {name}.dbc:\n{e}")
+            return
+        self._load_dbc(Path(file_path))
+    
+    def _close_client_data(self):
+        if self.client_data is not None:
+            self.client_data.close()
+            self.client_data = None
+    
     def _populate_file_tree(self, folder: Path):
         """Populate the file tree with DBC files from a folder."""
         self.file_tree.clear()
         
+        try:
+            entries = self.folder_catalog.scan(folder)
+        except OSError as e:
+            QMessageBox.critical(self, "Error", f"Failed to read folder:\n{e}")
+            return
+        
         # Set folder for DBC cache (enables FK resolution)
         self.current_folder = folder
-        self.dbc_cache.set_folder(folder)
-        
-        dbc_files = sorted(folder.glob("*.dbc"), key=lambda p: p.name.lower())
-        
-        for dbc_file in dbc_files:
-            item = QTreeWidgetItem([dbc_file.stem])
-            item.setData(0, Qt.ItemDataRole.UserRole, str(dbc_file))
+        self.dbc_cache.set_folder(folder, (entry.name for entry in entries))
+        self._close_client_data()
+        
+        mismatched = 0
+        for entry in entries:
+            status = entry.schema_status
+            count = f"{entry.header.record_count:,}" if entry.header else "?"
+            item = QTreeWidgetItem([entry.name, count])
+            item.setData(0, Qt.ItemDataRole.UserRole, str(entry.path))
+            item.setTextAlignment(1, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            item.setForeground(1, QColor(COLORS['text_secondary']))
+            tooltip = entry.describe()
+            item.setToolTip(0, tooltip)
+            item.setToolTip(1, tooltip)
+            if status in (SCHEMA_MISMATCH, SCHEMA_INVALID):
+                # Flag tables whose layout the schema (or the parser) will not handle
+                mismatched += 1
+                item.setText(0, f"⚠ {entry.name}")
+                item.setForeground(0, QColor(COLORS['accent_red'] if status == SCHEMA_INVALID else COLORS['accent_orange']))
             self.file_tree.addTopLevelItem(item)
         
-        self.status_file.setText(f"Found {len(dbc_files)} DBC files in {folder.name}")
+        flagged = f" ({mismatched} flagged)" if mismatched else ""
+        self.status_file.setText(f"Found {len(entries)} DBC files in {folder.name}{flagged}")
     
     def _load_dbc(self, file_path: Path):
         """Load and convert a DBC file to hexdbc code in a new tab."""
         try:
             dbc_file = self.parser.parse(file_path)
+            self.dbc_cache.add_open_dbc(file_path.stem, dbc_file)
             
             # Generate hexdbc code
             code = self.generator.generate(dbc_file, file_path.stem)
             
-            # Create new tab
-            self._create_new_tab(file_path, code, dbc_file)
+            # Create new tab; the generator already knows where each record starts
+            self._create_new_tab(file_path, code, dbc_file, self.generator.record_lines)
             
             # Update status
             self.status_file.setText(f"Loaded: {file_path.name}")
@@ -713,8 +1232,9 @@ class HexDBCWindow(QMainWindow):
             with open(file_path, 'r', encoding='utf-8') as f:
                 code = f.read()
             
-            # Create new tab
-            self._create_new_tab(file_path, code, None)
+            # A sidecar compiled from this exact text already knows where the records are
+            record_lines = self.compile_cache.record_lines(code, file_path) if self.compile_cache else None
+            self._create_new_tab(file_path, code, None, record_lines)
             
             self.status_file.setText(f"Loaded: {file_path.name}")
             
@@ -792,38 +1312,77 @@ class HexDBCWindow(QMainWindow):
             if not editor:
                 return
             
-            code = editor.get_text()
-            dbc = self.hexdbc_parser.parse(code, state.dbc_file if state else None)
-            
-            if self.hexdbc_parser.errors:
-                errors = "\n".join(self.hexdbc_parser.errors[:5])
-                result = QMessageBox.warning(
-                    self, "Parse Warnings",
-                    f"The following issues were found:\n\n{errors}\n\nSave anyway?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-                )
-                if result != QMessageBox.StandardButton.Yes:
-                    return
+            # A complete journal already knows every change; skip re-parsing the text
+            dbc = self._build_from_journal(state, editor)
+            if dbc is None:
+                compiled = self._compile_text(state, editor.get_text())
+                dbc = compiled.dbc
+                
+                if compiled.errors:
+                    errors = "\n".join(compiled.errors[:5])
+                    result = QMessageBox.warning(
+                        self, "Parse Warnings",
+                        f"The following issues were found:\n\n{errors}\n\nSave anyway?",
+                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+                    )
+                    if result != QMessageBox.StandardButton.Yes:
+                        return
+                
+                if state and state.change_history is not None:
+                    state.change_history.capture_dbc(dbc, "Other edits")
+                    state.journal_stale = False
             
             self.writer.write(dbc, file_path)
+            self.dbc_cache.add_open_dbc(file_path.stem, dbc)
             
             if state:
                 state.file_path = file_path
                 state.original_dbc_path = file_path
                 state.dbc_file = dbc
                 state.is_modified = False
+                if state.change_history is None:
+                    state.change_history = self._new_journal(file_path, dbc)
+                state.change_history.mark_saved()
+                if state.wal and state.wal.source_path == file_path:
+                    state.wal.rebase(file_path)
+                else:
+                    if state.wal:
+                        state.wal.close(delete=True)
+                        state.wal = None
+                    self._start_wal(state)
             
             # Update tab title
             idx = self.tab_widget.currentIndex()
             self.tab_widget.setTabText(idx, file_path.name)
             
             self._update_title()
+            self.outline_panel.set_outline(self._outline_for(state))
             self.status_file.setText(f"Saved DBC: {file_path.name}")
             self.status_stats.setText(f"{dbc.header.record_count} records | {dbc.header.field_count} fields")
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save DBC:\n{e}")
     
+    def _compile_text(self, state: Optional[TabState], code: str) -> CompiledSource:
+        """Compile a tab's text, reusing what its sidecar already holds."""
+        original = state.dbc_file if state else None
+        if self.compile_cache is None:
+            dbc = self.hexdbc_parser.parse(code, original)
+            return CompiledSource(dbc, self.hexdbc_parser.errors)
+        return self.compile_cache.compile(code, state.file_path if state else None, original)
+    
+    def _build_from_journal(self, state: Optional[TabState], editor: CodeEditor) -> Optional[DBCFile]:
+        """The tab's DBC rebuilt from its journal, or None when only a full parse will do."""
+        if not state or state.change_history is None or not hasattr(editor, 'record_ids'):
+            return None
+        editor.flush_record_edits()
+        if state.journal_stale:
+            return None
+        order = editor.record_ids()
+        if len(order) != len(set(order)):
+            return None  # Repeated IDs are only kept by a full parse
+        return state.change_history.build_dbc(order)
+    
     def export_dbc(self):
         """Export the current hexdbc code to a DBC file."""
         state = self._get_current_state()
@@ -856,11 +1415,11 @@ class HexDBCWindow(QMainWindow):
             if not editor:
                 return
             
-            code = editor.get_text()
-            dbc = self.hexdbc_parser.parse(code, state.dbc_file if state else None)
+            compiled = self._compile_text(state, editor.get_text())
+            dbc = compiled.dbc
             
-            if self.hexdbc_parser.errors:
-                errors = "\n".join(self.hexdbc_parser.errors[:10])
+            if compiled.errors:
+                errors = "\n".join(compiled.errors[:10])
                 QMessageBox.warning(
                     self, "Parse Warnings",
                     f"The following issues were found:\n\n{errors}"
@@ -872,6 +1431,236 @@ class HexDBCWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to export DBC:\n{e}")
     
+    def export_folder_sqlite(self):
+        """Load every DBC of a folder into one SQLite database for ad-hoc queries."""
+        folder = self.current_folder
+        if folder is None:
+            chosen = QFileDialog.getExistingDirectory(self, "Select DBC Folder")
+            if not chosen:
+                return
+            folder = Path(chosen)
+        
+        db_path, _ = QFileDialog.getSaveFileName(
+            self, "Export Folder to SQLite", str(folder / f"{folder.name}.sqlite"),
+            "SQLite Databases (*.sqlite *.db);;All Files (*.*)"
+        )
+        if not db_path:
+            return
+        
+        from hexdbc.core.sqlite_bridge import SQLiteBridge
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            with SQLiteBridge(Path(db_path), self.schema_manager) as bridge:
+                summary = bridge.export_folder(folder, self.parser)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to export to SQLite:\n{e}")
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+        
+        records = sum(summary.tables.values())
+        message = f"Exported {len(summary.tables)} tables ({records:,} records) to {Path(db_path).name}"
+        if summary.errors:
+            skipped = "\n".join(f"{name}: {error}" for name, error in sorted(summary.errors.items())[:10])
+            QMessageBox.warning(self, "SQLite Export", f"{message}\n\nSkipped:\n{skipped}")
+        self.status_file.setText(message)
+    
+    def import_table_sqlite(self):
+        """Rebuild a DBC from a table of an exported SQLite database and open it."""
+        db_path, _ = QFileDialog.getOpenFileName(
+            self, "Import Table from SQLite", str(self.current_folder or ""),
+            "SQLite Databases (*.sqlite *.db);;All Files (*.*)"
+        )
+        if not db_path:
+            return
+        
+        from hexdbc.core.sqlite_bridge import SQLiteBridge
+        try:
+            with SQLiteBridge(Path(db_path), self.schema_manager) as bridge:
+                tables = bridge.tables()
+                if not tables:
+                    QMessageBox.warning(self, "Warning", "The database holds no exported DBC tables.")
+                    return
+                table, ok = QInputDialog.getItem(self, "Import Table", "Table:", tables, 0, False)
+                if not ok:
+                    return
+                dbc = bridge.import_dbc(table)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to import from SQLite:\n{e}")
+            return
+        
+        suggested = (self.current_folder or Path(db_path).parent) / f"{table}.dbc"
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Save Imported DBC", str(suggested), "DBC Files (*.dbc);;All Files (*.*)"
+        )
+        if not file_path:
+            return
+        try:
+            self.writer.write(dbc, Path(file_path))
+        except OSError as e:
+            QMessageBox.critical(self, "Error", f"Failed to save DBC:\n{e}")
+            return
+        self._load_dbc(Path(file_path))
+    
+    def export_csv(self):
+        """Write the current tab's DBC as CSV or TSV, one column per field."""
+        editor = self._get_current_editor()
+        state = self._get_current_state()
+        if not editor or not state or not state.file_path:
+            QMessageBox.warning(self, "Warning", "No file open to export.")
+            return
+        
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Export to CSV/TSV", str(state.file_path.with_suffix('.csv')),
+            "CSV Files (*.csv);;TSV Files (*.tsv);;All Files (*.*)"
+        )
+        if not file_path:
+            return
+        
+        from hexdbc.core.dbc_csv import write_csv
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            dbc = state.dbc_file
+            if dbc is None or state.is_modified:
+                dbc = self._compile_text(state, editor.get_text()).dbc
+            count = write_csv(dbc, Path(file_path), self._journal_schema(state.file_path, dbc))
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to export CSV:\n{e}")
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+        self.status_file.setText(f"Exported {count:,} records to: {Path(file_path).name}")
+    
+    def import_csv(self):
+        """Rebuild a DBC from CSV or TSV and open it."""
+        csv_path, _ = QFileDialog.getOpenFileName(
+            self, "Import CSV/TSV", str(self.current_folder or ""),
+            "Spreadsheets (*.csv *.tsv);;All Files (*.*)"
+        )
+        if not csv_path:
+            return
+        name = Path(csv_path).stem
+        
+        suggested = (self.current_folder or Path(csv_path).parent) / f"{name}.dbc"
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Save Imported DBC", str(suggested), "DBC Files (*.dbc);;All Files (*.*)"
+        )
+        if not file_path:
+            return
+        
+        from hexdbc.core.dbc_csv import convert_csv
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            # Strings the folder's copy already holds keep their offsets
+            original = self.dbc_cache.get_dbc(name)
+            convert_csv(Path(csv_path), Path(file_path), self.schema_manager.get_schema(name),
+                        string_base=original.string_block if original else None)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to import CSV:\n{e}")
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+        self._load_dbc(Path(file_path))
+    
+    def export_sql(self):
+        """Dump the current tab's records, or only those that differ from a base DBC, as SQL."""
+        editor = self._get_current_editor()
+        state = self._get_current_state()
+        if not editor or not state or not state.file_path:
+            QMessageBox.warning(self, "Warning", "No file open to export.")
+            return
+        
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Export to SQL", str(state.file_path.with_suffix('.sql')),
+            "SQL Files (*.sql);;All Files (*.*)"
+        )
+        if not file_path:
+            return
+        
+        base_path = None
+        reply = QMessageBox.question(
+            self, "Export to SQL",
+            "Only dump records that differ from a base DBC (such as the client's original)?\n\n"
+            "Choose No to dump every record.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            base_path, _ = QFileDialog.getOpenFileName(
+                self, "Select Base DBC", str(self.current_folder or state.file_path.parent),
+                "DBC Files (*.dbc);;All Files (*.*)"
+            )
+            if not base_path:
+                return
+        
+        from hexdbc.core.sql_dump import SQLDump, default_table_name
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            dbc = state.dbc_file
+            if dbc is None or state.is_modified:
+                dbc = self._compile_text(state, editor.get_text()).dbc
+            base = self.parser.parse(Path(base_path)) if base_path else None
+            name = state.file_path.stem
+            dump = SQLDump(dbc, default_table_name(name), self._journal_schema(state.file_path, dbc), base)
+            summary = dump.write(Path(file_path))
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to export SQL:\n{e}")
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+        
+        message = f"Exported {summary.rows:,} records to: {Path(file_path).name}"
+        if summary.removed:
+            QMessageBox.warning(
+                self, "Export to SQL",
+                f"{message}\n\n{len(summary.removed)} records of the base are missing here; "
+                "override tables cannot remove them."
+            )
+        self.status_file.setText(message)
+    
+    def pack_mpq(self):
+        """Pack DBC files into a patch MPQ, adding to the archive if it already exists."""
+        dbc_paths, _ = QFileDialog.getOpenFileNames(
+            self, "Select DBCs to Pack", str(self.current_folder or ""),
+            "DBC Files (*.dbc);;All Files (*.*)"
+        )
+        if not dbc_paths:
+            return
+        
+        # Files already in the archive are kept, so do not warn about replacing it
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Pack into Patch MPQ", str(Path(dbc_paths[0]).parent / "patch-4.MPQ"),
+            "MPQ Archives (*.mpq *.MPQ);;All Files (*.*)",
+            options=QFileDialog.Option.DontConfirmOverwrite
+        )
+        if not file_path:
+            return
+        
+        from hexdbc.core.mpq import MPQWriter
+        # Open tabs with unsaved edits are packed as they are in the editor
+        open_tabs = {state.file_path: idx for idx, state in self.tab_states.items() if state.file_path}
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            with MPQWriter.update(Path(file_path)) as writer:
+                for dbc_path in map(Path, dbc_paths):
+                    idx = open_tabs.get(dbc_path)
+                    state = self.tab_states.get(idx) if idx is not None else None
+                    if state is not None and state.is_modified:
+                        dbc = self._compile_text(state, self.tab_widget.widget(idx).get_text()).dbc
+                    else:
+                        dbc = self.parser.parse(dbc_path)
+                    writer.add_dbc(dbc_path.stem, dbc)
+                summary = writer.write(Path(file_path))
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to pack MPQ:\n{e}")
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+        
+        self.status_file.setText(
+            f"Packed {len(dbc_paths)} DBCs into {Path(file_path).name} "
+            f"({len(summary.written)} compressed, {len(summary.reused)} unchanged)"
+        )
+    
     def export_hexdbc(self):
         """Export the current code visualization to a HexDBC file."""
         editor = self._get_current_editor()
@@ -911,13 +1700,87 @@ class HexDBCWindow(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to export HexDBC:\n{e}")
     
+    def export_changes(self):
+        """Export only the records added or changed since the tab's DBC was opened, as a sparse .hexdbc."""
+        editor = self._get_current_editor()
+        state = self._get_current_state()
+        if not editor or not state or not state.original_dbc_path:
+            QMessageBox.warning(self, "Warning", "The current tab has no original DBC to compare with.")
+            return
+        
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Export Changes as Overlay",
+            str(state.original_dbc_path.with_name(f"{state.original_dbc_path.stem}-changes.hexdbc")),
+            "HexDBC Code Files (*.hexdbc);;All Files (*.*)"
+        )
+        if not file_path:
+            return
+        
+        reply = QMessageBox.question(
+            self, "Export Changes as Overlay",
+            "Only write the fields that changed?\n\nChoose No to write changed records whole.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        
+        from hexdbc.core.overlay import write_changes
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            base = self.parser.parse(state.original_dbc_path)
+            dbc = self._build_from_journal(state, editor)
+            if dbc is None:
+                dbc = self._compile_text(state, editor.get_text()).dbc
+            diff = write_changes(base, dbc, Path(file_path), state.original_dbc_path.stem,
+                                 changed_fields_only=reply == QMessageBox.StandardButton.Yes)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to export changes:\n{e}")
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+        
+        message = f"Exported {len(diff.changed)} changed and {len(diff.added)} added records to: {Path(file_path).name}"
+        if diff.removed:
+            QMessageBox.warning(
+                self, "Export Changes as Overlay",
+                f"{message}\n\n{len(diff.removed)} removed records are only listed in a comment; "
+                "overlays cannot remove records, so building this one keeps them."
+            )
+        self.status_file.setText(message)
+    
     def _show_advanced_search(self):
         """Show search dialog. Triggered by Ctrl+F."""
         editor = self._get_current_editor()
+        state = self._get_current_state()
         if editor:
-            dialog = AdvancedSearchDialog(self, editor)
+            from hexdbc.ui.dialogs import AdvancedSearchDialog
+            dialog = AdvancedSearchDialog(
+                self, editor,
+                query_source=lambda: self._get_query_source(state, editor)
+            )
             dialog.show()  # Non-modal so user can interact with editor
     
+    def _get_query_source(self, state: Optional[TabState], editor: CodeEditor):
+        """Return (DBCFile, schema, index_provider) reflecting a tab's current content for structured queries."""
+        if not state:
+            return None
+        
+        dbc_name = state.file_path.stem if state.file_path else "Unknown"
+        dbc = state.dbc_file
+        index_provider = None
+        if dbc is None or state.is_modified:
+            # Unsaved edits: query what the text would compile to
+            dbc = self.hexdbc_parser.parse(editor.get_text(), state.dbc_file)
+            if not dbc.records:
+                return None
+        else:
+            # Saved data lives in the cache, so its column indexes outlive the dialog
+            self.dbc_cache.add_open_dbc(dbc_name, dbc)
+            index_provider = self.dbc_cache.index_provider(dbc_name)
+        
+        schema = self.schema_manager.get_schema(dbc_name)
+        if not schema:
+            schema = self.schema_manager.generate_fallback_schema(dbc.header.field_count, dbc_name, dbc)
+        return dbc, schema, index_provider
+    
     def _show_add_entry(self):
         """Show add entry dialog."""
         editor = self._get_current_editor()
@@ -930,20 +1793,20 @@ class HexDBCWindow(QMainWindow):
         # Get current schema and max ID
         schema = None
         dbc_name = ""
-        max_id = 0
         
         if state and state.file_path:
             dbc_name = state.file_path.stem
             schema = self.schema_manager.get_schema(dbc_name)
         
-        # Parse editor content to find max ID and existing IDs
-        content = editor.get_text()
-        id_matches = re.findall(r'\w+\((\d+)\)\s*\{', content)
-        existing_ids = set(int(m) for m in id_matches)
-        if existing_ids:
-            max_id = max(existing_ids)
+        # The editor keeps the ID set current as headers come and go
+        existing_ids = state.record_index if state else None
+        if existing_ids is None:
+            existing_ids = RecordIndex()
+            for record_id, line in scan_record_headers(editor.get_text()):
+                existing_ids.add(record_id, line)
         
-        dialog = AddEntryDialog(self, schema, max_id, dbc_name, existing_ids)
+        from hexdbc.ui.dialogs import AddEntryDialog
+        dialog = AddEntryDialog(self, schema, existing_ids.max_id, dbc_name, existing_ids)
         if dialog.exec():
             # Insert the new entry at the end of the file
             code = dialog.get_code()
@@ -998,7 +1861,7 @@ class HexDBCWindow(QMainWindow):
             return
         
         # Show the tooltip
-        self.reference_tooltip.show_reference(
+        self._get_reference_tooltip().show_reference(
             source_dbc=dbc_name,
             field_name=field_name,
             value=value_int,
@@ -1007,9 +1870,18 @@ class HexDBCWindow(QMainWindow):
             position=cursor_pos
         )
     
+    def _get_reference_tooltip(self):
+        """Create the reference tooltip on first use."""
+        if self.reference_tooltip is None:
+            from hexdbc.ui.reference_tooltip import ReferenceTooltip
+            self.reference_tooltip = ReferenceTooltip(self)
+            self.reference_tooltip.navigate_requested.connect(self._on_reference_navigate)
+        return self.reference_tooltip
+    
     def _on_reference_leave(self):
         """Handle mouse leaving a FK field."""
-        self.reference_tooltip.schedule_hide(delay_ms=400)
+        if self.reference_tooltip is not None:
+            self.reference_tooltip.schedule_hide(delay_ms=400)
     
     def _on_reference_navigate(self, dbc_name: str, entry_id: int):
         """Handle navigation to a referenced DBC entry."""
@@ -1026,21 +1898,35 @@ class HexDBCWindow(QMainWindow):
         # Load the DBC in a new tab
         self._load_dbc(dbc_path)
         
-        # Find the line containing the entry ID and scroll to it
+        # Jump to the entry's record header
         editor = self._get_current_editor()
         if editor:
-            text = editor.get_text()
-            lines = text.split('\n')
-            
-            # Look for entry with matching ID
-            for i, line in enumerate(lines):
-                # Match entry header like "entry(123)" or "ID = 123"
-                if f'entry({entry_id})' in line or f'ID = {entry_id}' in line:
-                    editor.scroll_to_line(i)
-                    self.status_file.setText(f"Navigated to {dbc_name} entry {entry_id}")
-                    return
-            
-            self.status_file.setText(f"Opened {dbc_name}.dbc (entry {entry_id} not found in text)")
+            if editor.scroll_to_record(entry_id):
+                self.status_file.setText(f"Navigated to {dbc_name} entry {entry_id}")
+            else:
+                self.status_file.setText(f"Opened {dbc_name}.dbc (entry {entry_id} not found in text)")
+    
+    def _show_quick_jump(self):
+        """Show the jump-to-ID dialog. Triggered by Ctrl+I."""
+        editor = self._get_current_editor()
+        if not editor:
+            QMessageBox.warning(self, "Warning", "No file open.")
+            return
+        
+        from hexdbc.ui.dialogs import QuickJumpDialog
+        dialog = QuickJumpDialog(self)
+        dialog.jump_to_id.connect(lambda entry_id: self._jump_to_entry(editor, entry_id))
+        dialog.exec()
+    
+    def _jump_to_entry(self, editor: CodeEditor, entry_id: int):
+        """Scroll an editor to a record, or report the closest following ID."""
+        if editor.scroll_to_record(entry_id):
+            self.status_file.setText(f"Jumped to entry {entry_id}")
+            return
+        
+        next_id = editor.record_index.ceiling(entry_id) if hasattr(editor, 'record_index') else None
+        hint = f" (next ID is {next_id})" if next_id is not None else ""
+        self.status_file.setText(f"Entry {entry_id} not found{hint}")
     
     def _show_command_palette(self):
         """Show command palette for quick action access."""
@@ -1048,20 +1934,34 @@ class HexDBCWindow(QMainWindow):
         commands = {
             "Open File": ("Open a DBC or HexDBC file", self.action_open.trigger),
             "Open Folder": ("Open a folder containing DBC files", self.action_open_folder.trigger),
+            "Open Client Data": ("Read DBCs straight from the client's MPQ archives", self.action_open_client_data.trigger),
             "Save": ("Save the current file", self.action_save.trigger),
             "Save As": ("Save the current file with a new name", self.action_save_as.trigger),
             "Export to DBC": ("Export current file to DBC format", self.action_export_dbc.trigger),
             "Export to HexDBC": ("Export current file to HexDBC format", self.action_export_hexdbc.trigger),
+            "Export Changes as Overlay": ("Write only the records changed since the DBC was opened", self.action_export_changes.trigger),
+            "Export Folder to SQLite": ("Load every DBC of a folder into SQLite tables", self.action_export_sqlite.trigger),
+            "Import Table from SQLite": ("Rebuild a DBC from a SQLite table", self.action_import_sqlite.trigger),
+            "Export to CSV/TSV": ("Write the current DBC as a spreadsheet", self.action_export_csv.trigger),
+            "Import CSV/TSV": ("Rebuild a DBC from a spreadsheet", self.action_import_csv.trigger),
+            "Export to SQL": ("Dump records as INSERTs for a server's *_dbc table", self.action_export_sql.trigger),
+            "Pack into Patch MPQ": ("Write DBCs into a patch-X.MPQ for the client", self.action_pack_mpq.trigger),
             "Close Tab": ("Close the current tab", self.action_close_tab.trigger),
             "Search": ("Advanced search in current file", self.action_advanced_search.trigger),
             "Add New Entry": ("Add a new DBC entry", self.action_add_entry.trigger),
+            "Go to Entry": ("Jump to a record by ID", self.action_quick_jump.trigger),
             "Compare Files": ("Compare two DBC files", self.action_file_comparison.trigger),
+            "Merge DBC Files": ("Three-way merge of DBC files", self.action_merge.trigger),
             "Zoom In": ("Increase editor font size", self.action_zoom_in.trigger),
             "Zoom Out": ("Decrease editor font size", self.action_zoom_out.trigger),
             "Undo": ("Undo last change", self.action_undo.trigger),
             "Redo": ("Redo last undone change", self.action_redo.trigger),
+            "Undo Field Change": ("Revert the last recorded field change", self.action_undo_field.trigger),
+            "Change History": ("Review recorded field changes", self.action_change_history.trigger),
+            "Problems": ("List validation errors and warnings", self.action_problems.trigger),
         }
         
+        from hexdbc.ui.dialogs import CommandPaletteDialog
         dialog = CommandPaletteDialog(self, commands)
         dialog.exec()
     
@@ -1074,7 +1974,88 @@ class HexDBCWindow(QMainWindow):
         file1_path = str(state.file_path) if state and state.file_path else ""
         content1 = editor.get_text() if editor and hasattr(editor, 'get_text') else ""
         
-        dialog = FileComparisonDialog(self, file1_path=file1_path, content1=content1)
+        # An unmodified tab's parsed DBC can stand in for file 1 in record-level diffs
+        dbc1 = state.dbc_file if state and not state.is_modified else None
+        
+        from hexdbc.ui.dialogs import FileComparisonDialog
+        dialog = FileComparisonDialog(
+            self, file1_path=file1_path, content1=content1,
+            schema_manager=self.schema_manager, dbc1=dbc1
+        )
+        dialog.exec()
+    
+    def _undo_field_change(self):
+        """Revert the most recent recorded change, whatever text edits came after it."""
+        editor = self._get_current_editor()
+        state = self._get_current_state()
+        if not editor or not state or state.change_history is None or not hasattr(editor, 'set_record_fields'):
+            self.status_file.setText("No recorded changes to undo")
+            return
+        
+        self._sync_change_history(state, editor)
+        journal = state.change_history
+        group = journal.last_undoable()
+        if group is None:
+            self.status_file.setText("No recorded changes to undo")
+            return
+        
+        rows = journal.undo_rows(group)
+        self._apply_rows(state, editor, rows)
+        # The journal is told directly, so the editor's own report would be a duplicate
+        editor.discard_record_edits()
+        label = journal.group(group).label
+        journal.capture(rows, f"Undo: {label}", undo_of=group)
+        self.status_file.setText(f"Undid: {label}")
+    
+    def _apply_rows(self, state: TabState, editor: CodeEditor, rows: Dict):
+        """Rewrite records in the editor to the given journal-form values (None removes)."""
+        journal = state.change_history
+        dbc_name = state.file_path.stem if state.file_path else "Unknown"
+        for record_id, values in rows.items():
+            current = journal.current_row(record_id)
+            if values is None:
+                editor.remove_record(record_id)
+            elif current is None:
+                editor.insert_record(record_id, self.generator.format_record(dbc_name, values, journal.schema))
+            else:
+                fields = [
+                    self.generator.format_field(i, value, journal.schema)
+                    for i, value in enumerate(values) if value != current[i]
+                ]
+                if fields:
+                    editor.set_record_fields(record_id, fields)
+    
+    def _show_change_history(self):
+        """Show the recorded field changes for the current tab."""
+        editor = self._get_current_editor()
+        state = self._get_current_state()
+        if not editor or not state:
+            QMessageBox.warning(self, "Warning", "No file open.")
+            return
+        if state.change_history is None:
+            QMessageBox.information(self, "Change History",
+                                    "Changes are recorded for files opened from, or saved to, a .dbc.")
+            return
+        
+        self._sync_change_history(state, editor)
+        file_name = state.file_path.name if state.file_path else ""
+        
+        from hexdbc.ui.dialogs import ChangeHistoryDialog
+        dialog = ChangeHistoryDialog(self, state.change_history, file_name)
+        dialog.jump_to_id.connect(lambda record_id: editor.scroll_to_record(record_id))
+        dialog.undo_requested.connect(self._undo_field_change)
+        dialog.exec()
+    
+    def _show_merge(self):
+        """Show the three-way merge dialog, defaulting 'ours' to the current .dbc."""
+        state = self._get_current_state()
+        ours_path = ""
+        if state and state.file_path and state.file_path.suffix.lower() == '.dbc':
+            ours_path = str(state.file_path)
+        
+        from hexdbc.ui.dialogs import MergeDialog
+        dialog = MergeDialog(self, schema_manager=self.schema_manager, ours_path=ours_path)
+        dialog.merged.connect(lambda path: self._load_dbc(Path(path)))
         dialog.exec()
     
     
@@ -1103,6 +2084,13 @@ class HexDBCWindow(QMainWindow):
                 event.ignore()
                 return
         
+        # A clean exit leaves nothing to recover
+        for state in self.tab_states.values():
+            if state.wal:
+                state.wal.close(delete=True)
+                state.wal = None
+        self.validation_worker.shutdown()
+        
         event.accept()
 
 
@@ -0,0 +1,162 @@
+"""
+Record outline side panel.
+
+Lists every record of the current tab's DBC as "ID  name" through a
+virtual list model: rows are formatted on demand from the binary record
+arrays, so the view costs the same for 100 records as for 100,000.
+"""
+
+from typing import Optional
+
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QTimer, Signal
+from PySide6.QtWidgets import QLabel, QLineEdit, QListView, QVBoxLayout, QWidget
+
+from hexdbc.core.record_outline import RecordOutline
+from hexdbc.ui.theme import COLORS
+
+# Quiet time after a keystroke before the filter runs
+FILTER_DELAY_MS = 120
+
+
+class RecordOutlineModel(QAbstractListModel):
+    """Read-only list model over a RecordOutline."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.outline: Optional[RecordOutline] = None
+
+    def set_outline(self, outline: Optional[RecordOutline]):
+        self.beginResetModel()
+        self.outline = outline
+        self.endResetModel()
+
+    def set_filter(self, query: str):
+        if self.outline is None:
+            return
+        self.beginResetModel()
+        self.outline.set_filter(query)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.outline is None:
+            return 0
+        return len(self.outline)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or self.outline is None:
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            name = self.outline.name(row)
+            record_id = self.outline.record_id(row)
+            return f"{record_id}  {name}" if name else str(record_id)
+        if role == Qt.ItemDataRole.UserRole:
+            return self.outline.record_id(row)
+        if role == Qt.ItemDataRole.ToolTipRole and self.outline.name_label:
+            return f"{self.outline.name_label}: {self.outline.name(row)}"
+        return None
+
+
+class OutlinePanel(QWidget):
+    """Filterable list of the current DBC's records; activating one emits its ID."""
+
+    record_activated = Signal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+
+        header = QLabel("  Outline")
+        header.setStyleSheet(f"""
+            QLabel {{
+                background-color: {COLORS['bg_tertiary']};
+                color: {COLORS['text_primary']};
+                padding: 12px 8px;
+                font-size: 13px;
+                font-weight: 600;
+                border-bottom: 1px solid {COLORS['border_primary']};
+            }}
+        """)
+        layout.addWidget(header)
+
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("Filter by ID or name...")
+        self.filter_input.setClearButtonEnabled(True)
+        self.filter_input.setStyleSheet("QLineEdit { margin: 6px; padding: 6px; }")
+        self.filter_input.textChanged.connect(lambda: self._filter_timer.start())
+        self.filter_input.returnPressed.connect(self._activate_first)
+        layout.addWidget(self.filter_input)
+
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
+
+        self.model = RecordOutlineModel(self)
+        self.view = QListView()
+        self.view.setModel(self.model)
+        # Every row has the same height, so Qt never measures rows it is not drawing
+        self.view.setUniformItemSizes(True)
+        self.view.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.view.setStyleSheet(f"""
+            QListView {{
+                background-color: {COLORS['bg_secondary']};
+                border: none;
+                outline: none;
+                font-family: 'Consolas', 'Courier New', monospace;
+            }}
+            QListView::item {{
+                padding: 3px 8px;
+            }}
+            QListView::item:hover {{
+                background-color: {COLORS['bg_tertiary']};
+            }}
+            QListView::item:selected {{
+                background-color: {COLORS['accent_blue']};
+            }}
+        """)
+        self.view.activated.connect(self._on_activated)
+        self.view.clicked.connect(self._on_activated)
+        layout.addWidget(self.view, 1)
+
+        self.status = QLabel("")
+        self.status.setStyleSheet(f"color: {COLORS['text_secondary']}; padding: 4px 8px; font-size: 11px;")
+        layout.addWidget(self.status)
+
+    def set_outline(self, outline: Optional[RecordOutline]):
+        """Show another tab's outline, keeping the filter text."""
+        self._filter_timer.stop()
+        if outline is not None:
+            outline.set_filter(self.filter_input.text())
+        self.model.set_outline(outline)
+        self._update_status()
+
+    def _apply_filter(self):
+        self.model.set_filter(self.filter_input.text())
+        self._update_status()
+
+    def _update_status(self):
+        outline = self.model.outline
+        if outline is None:
+            self.status.setText("No binary records for this tab")
+        elif outline.query:
+            self.status.setText(f"{len(outline)} of {outline.record_count} records")
+        else:
+            self.status.setText(f"{outline.record_count} records")
+
+    def _on_activated(self, index):
+        record_id = index.data(Qt.ItemDataRole.UserRole)
+        if record_id is not None:
+            self.record_activated.emit(record_id)
+
+    def _activate_first(self):
+        if self._filter_timer.isActive():
+            self._filter_timer.stop()
+            self._apply_filter()
+        if self.model.rowCount() > 0:
+            index = self.model.index(0)
+            self.view.setCurrentIndex(index)
+            self._on_activated(index)
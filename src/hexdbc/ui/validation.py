@@ -0,0 +1,49 @@
+"""
+Background validation of .hexdbc text.
+
+Checks run on a single worker thread in submission order, so the results
+for a record always arrive newest-last; each result is delivered back on
+the UI thread through the finished signal.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from PySide6.QtCore import QObject, Signal
+
+from hexdbc.core.hexdbc_validator import HexDBCValidator
+
+
+class ValidationWorker(QObject):
+    """Runs HexDBCValidator checks off the UI thread."""
+
+    # (token, full, {record ID or None: [Diagnostic]}); full results replace everything
+    finished = Signal(object, bool, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hexdbc-validate")
+
+    def _submit(self, token, full: bool, check: Callable[[], Dict]):
+        def run():
+            try:
+                results = check()
+            except Exception:
+                # A validator bug must not take the editor down; the next edit retries
+                return
+            self.finished.emit(token, full, results)
+        self._executor.submit(run)
+
+    def check_text(self, token, validator: HexDBCValidator, code: str):
+        """Validate a whole document."""
+        self._submit(token, True, lambda: validator.check_text(code))
+
+    def check_records(self, token, validator: HexDBCValidator, texts: Dict[int, Optional[str]]):
+        """Validate some record blocks; None marks a record that no longer exists."""
+        self._submit(token, False, lambda: {
+            record_id: validator.check_record(text) if text is not None else []
+            for record_id, text in texts.items()
+        })
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
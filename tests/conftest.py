@@ -0,0 +1,95 @@
+import struct
+from array import array
+from itertools import chain
+from typing import Sequence, Union
+
+import pytest
+
+from hexdbc.core.parser import DBCFile, DBCWriter
+from hexdbc.core.schema import FieldDef, FieldType, SchemaDef, SchemaManager
+
+
+def float_bits(value: float) -> int:
+    return struct.unpack('<I', struct.pack('<f', value))[0]
+
+
+def build_dbc(rows: Sequence[Sequence[Union[int, str]]]) -> DBCFile:
+    """DBCFile from rows of raw uint32s; str cells are interned into the string block in order."""
+    block = bytearray(b"\x00")
+    offsets = {"": 0}
+    records = []
+    for row in rows:
+        record = []
+        for cell in row:
+            if isinstance(cell, str):
+                if cell not in offsets:
+                    offsets[cell] = len(block)
+                    block += cell.encode("utf-8") + b"\x00"
+                cell = offsets[cell]
+            record.append(cell)
+        records.append(record)
+    width = len(records[0]) if records else 0
+    return DBCFile.from_flat(array('I', chain.from_iterable(records)), width, bytes(block))
+
+
+def dbc_bytes(dbc: DBCFile) -> bytes:
+    return DBCWriter().to_bytes(dbc)
+
+
+def text_at(dbc: DBCFile, offset: int) -> bytes:
+    """Raw bytes of the string at offset, up to its NUL."""
+    return dbc.string_block[offset:].split(b"\0", 1)[0]
+
+
+WIDGET_SCHEMA = SchemaDef("Widget", [
+    FieldDef("ID", FieldType.INT),
+    FieldDef("Name", FieldType.STRING),
+    FieldDef("Speed", FieldType.FLOAT),
+    FieldDef("Flags", FieldType.FLAGS),
+    FieldDef("Delta", FieldType.INT),
+    FieldDef("Count", FieldType.UINT),
+])
+
+
+def widget_rows():
+    """Rows that exercise every lossy corner: long floats, NaN, -0.0, negative ints."""
+    return [
+        [1, "Fireball", 1074725673, 0x10, 0xFFFFFFFB, 7],
+        [2, "Frostbolt", 0x7FC00001, 0, 3, 1200888598],
+        [3, "Blink", 0x80000000, 0x80000000, 0, 0],
+        [5, "", float_bits(0.1), 1, 0x80000000, 0xFFFFFFFF],
+    ]
+
+
+def edited_widgets() -> DBCFile:
+    """widget_rows with a changed float and name, record 3 removed and record 9 added."""
+    rows = widget_rows()
+    rows[0][2] = float_bits(2.718281)
+    rows[1][1] = "Frostfire Bolt"
+    del rows[2]
+    rows.append([9, "Arcane Missiles", 1200888598, 0, 0xFFFFFFFF, 2])
+    return build_dbc(rows)
+
+
+@pytest.fixture
+def schemas() -> SchemaManager:
+    manager = SchemaManager()
+    manager.register_schema(WIDGET_SCHEMA)
+    return manager
+
+
+@pytest.fixture
+def widgets() -> DBCFile:
+    return build_dbc(widget_rows())
+
+
+@pytest.fixture
+def tricky_widgets() -> DBCFile:
+    """Widgets whose string block repeats a string, shares a suffix and holds invalid UTF-8."""
+    dbc = build_dbc(widget_rows())
+    block = dbc.string_block + b"Blink\0Bad \xff name\0"
+    repeated = len(dbc.string_block)
+    dbc.records[2][1] = repeated  # second copy of "Blink"
+    dbc.records[3][1] = dbc.records[0][1] + 4  # "ball", the tail of "Fireball"
+    dbc.records.append([6, repeated + 6, 0, 0, 0, 0])  # undecodable bytes
+    return DBCFile.from_flat(array('I', chain.from_iterable(dbc.records)), 6, block)
@@ -0,0 +1,33 @@
+from conftest import build_dbc
+
+from hexdbc.cli import run
+from hexdbc.core.parser import DBCWriter
+
+
+def _folder(tmp_path):
+    writer = DBCWriter()
+    # Item: ID, ClassID, ... ; items 10 and 11 are weapons (class 2), 12 points at a missing class
+    writer.write(build_dbc([[10, 2, 0, 0, 0, 0, 0, 0],
+                            [11, 2, 0, 0, 0, 0, 0, 0],
+                            [12, 9, 0, 0, 0, 0, 0, 0]]), tmp_path / "Item.dbc")
+    writer.write(build_dbc([[2] + [0] * 20, [4] + [0] * 20]), tmp_path / "ItemClass.dbc")
+    return tmp_path
+
+
+def test_refs_lists_every_referencing_record(tmp_path, capsys):
+    assert run(["refs", str(_folder(tmp_path)), "ItemClass", "2"]) == 0
+    assert capsys.readouterr().out.split() == ["Item(10).ClassID", "Item(11).ClassID"]
+
+
+def test_check_refs_reports_missing_targets(tmp_path, capsys):
+    assert run(["check-refs", str(_folder(tmp_path)), "Item"]) == 1
+    assert capsys.readouterr().out.strip() == "Item(12).ClassID = 9: no such ItemClass entry"
+
+
+def test_check_refs_skips_fields_a_short_table_lacks(tmp_path, capsys):
+    folder = _folder(tmp_path)
+    # Only ID and ClassID; the schema's DisplayInfoID (field 5) is missing
+    DBCWriter().write(build_dbc([[10, 2], [12, 9]]), folder / "Item.dbc")
+    DBCWriter().write(build_dbc([[1, 0]]), folder / "ItemDisplayInfo.dbc")
+    assert run(["check-refs", str(folder), "Item"]) == 1
+    assert capsys.readouterr().out.strip() == "Item(12).ClassID = 9: no such ItemClass entry"
@@ -0,0 +1,20 @@
+from conftest import dbc_bytes
+
+from hexdbc.core.compile_cache import CompileCache
+from hexdbc.core.hexdbc_format import HexDBCGenerator, HexDBCParser
+
+
+def test_compile_cache_matches_a_full_parse(tmp_path, schemas, widgets):
+    text = HexDBCGenerator(schemas).generate(widgets, "Widget")
+    source = tmp_path / "Widget.hexdbc"
+    (tmp_path / "cache").mkdir()
+    cache = CompileCache(tmp_path / "cache", HexDBCParser(schemas))
+
+    first = cache.compile(text, source, widgets)
+    again = cache.compile(text, source, widgets)
+    assert again.reused
+    assert dbc_bytes(first.dbc) == dbc_bytes(again.dbc) == dbc_bytes(widgets)
+
+    changed = text.replace('"Frostbolt"', '"Frostfire Bolt"')
+    spliced = cache.compile(changed, source, widgets)
+    assert dbc_bytes(spliced.dbc) == dbc_bytes(HexDBCParser(schemas).parse(changed, widgets))
@@ -0,0 +1,31 @@
+import pytest
+from conftest import WIDGET_SCHEMA, dbc_bytes, float_bits, text_at
+
+from hexdbc.core.dbc_csv import read_csv, write_csv
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".tsv"])
+def test_csv_round_trip_with_base_is_byte_identical(tmp_path, widgets, suffix):
+    path = tmp_path / ("Widget" + suffix)
+    write_csv(widgets, path, WIDGET_SCHEMA)
+    restored = read_csv(path, WIDGET_SCHEMA, string_base=widgets.string_block)
+    assert dbc_bytes(restored) == dbc_bytes(widgets)
+
+
+def test_csv_round_trip_keeps_texts_of_shared_strings(tmp_path, tricky_widgets):
+    path = tmp_path / "Widget.csv"
+    write_csv(tricky_widgets, path, WIDGET_SCHEMA)
+    restored = read_csv(path, WIDGET_SCHEMA, string_base=tricky_widgets.string_block)
+
+    assert len(restored.records) == len(tricky_widgets.records)
+    for old, new in zip(tricky_widgets.records, restored.records):
+        assert new[2:] == old[2:]
+        assert text_at(restored, new[1]) == text_at(tricky_widgets, old[1])
+
+
+def test_csv_without_trailing_columns_keeps_schema_width(tmp_path):
+    path = tmp_path / "Widget.csv"
+    path.write_text("ID,Name,Speed\n1,Fireball,1.5\n", encoding="utf-8")
+    restored = read_csv(path, WIDGET_SCHEMA)
+    assert restored.records == [[1, 1, float_bits(1.5), 0, 0, 0]]
+    assert restored.header.field_count == len(WIDGET_SCHEMA.fields)
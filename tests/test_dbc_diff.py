@@ -0,0 +1,64 @@
+import pytest
+from conftest import WIDGET_SCHEMA, build_dbc, edited_widgets, float_bits, widget_rows
+
+from hexdbc.core.dbc_diff import DBCDiff
+
+
+def test_identical_files_have_no_changes(widgets):
+    diff = DBCDiff(widgets, build_dbc(widget_rows()), WIDGET_SCHEMA)
+    assert diff.identical
+    assert len(diff) == 0
+    assert diff.unchanged_count == len(widgets.records)
+
+
+def test_added_removed_and_changed_records(widgets):
+    diff = DBCDiff(widgets, edited_widgets(), WIDGET_SCHEMA)
+    assert diff.added == [9]
+    assert diff.removed == [3]
+    assert diff.changed == [1, 2]
+    assert diff.unchanged_count == 1
+    assert [(c.record_id, c.kind) for c in diff.changes()] == [
+        (1, 'changed'), (2, 'changed'), (3, 'removed'), (9, 'added'),
+    ]
+
+
+def test_field_changes_resolve_values(widgets):
+    diff = DBCDiff(widgets, edited_widgets(), WIDGET_SCHEMA)
+    (speed,) = diff.field_changes(1)
+    assert (speed.field_idx, speed.name) == (2, "Speed")
+    assert speed.new == pytest.approx(2.718281)
+    (name,) = diff.field_changes(2)
+    assert (name.name, name.old, name.new) == ("Name", "Frostbolt", "Frostfire Bolt")
+
+
+def test_strings_compare_by_text_not_offset(widgets):
+    # Same texts interned in a different order: every offset moves, no record changes
+    rows = widget_rows()
+    shuffled = build_dbc([[0, "Blink", 0, 0, 0, 0]] + rows)
+    shuffled.records.pop(0)
+    diff = DBCDiff(widgets, shuffled, WIDGET_SCHEMA)
+    assert shuffled.string_block != widgets.string_block
+    assert diff.identical
+
+
+def test_reordered_records_are_unchanged(widgets):
+    diff = DBCDiff(widgets, build_dbc(widget_rows()[::-1]), WIDGET_SCHEMA)
+    assert diff.identical
+
+
+def test_changes_across_chunk_boundaries():
+    rows = [[i, f"name {i}", float_bits(i / 4), 0, 0, i] for i in range(1, 301)]
+    old = build_dbc(rows)
+    rows[64][5] = 0
+    rows[299][1] = "renamed"
+    diff = DBCDiff(old, build_dbc(rows), WIDGET_SCHEMA)
+    assert diff.changed == [65, 300]
+    assert diff.changed_fields(65) == [5]
+    assert diff.changed_fields(300) == [1]
+
+
+def test_record_values_for_each_side(widgets):
+    diff = DBCDiff(widgets, edited_widgets(), WIDGET_SCHEMA)
+    assert diff.record_values(3, 'old')[:2] == [("ID", 3), ("Name", "Blink")]
+    assert diff.record_values(3, 'new') == []
+    assert dict(diff.record_values(9))["Delta"] == -1
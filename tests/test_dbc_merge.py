@@ -0,0 +1,124 @@
+import pytest
+from conftest import WIDGET_SCHEMA, build_dbc, float_bits, widget_rows
+
+from hexdbc.core.dbc_merge import merge_dbc
+
+
+def by_id(dbc):
+    return {r[0]: r for r in dbc.records}
+
+
+def test_one_sided_changes_are_combined(widgets):
+    ours_rows = widget_rows()
+    ours_rows[0][5] = 8
+    theirs_rows = widget_rows()
+    theirs_rows[1][5] = 9
+    result = merge_dbc(widgets, build_dbc(ours_rows), build_dbc(theirs_rows), WIDGET_SCHEMA)
+    assert not result.conflicts
+    assert (result.from_ours, result.from_theirs) == (1, 1)
+    merged = by_id(result.dbc)
+    assert merged[1][5] == 8 and merged[2][5] == 9
+
+
+def test_field_conflict_and_theirs_only_insert(widgets):
+    ours_rows = widget_rows()
+    ours_rows[0][2] = float_bits(2.5)
+    theirs_rows = widget_rows()
+    theirs_rows[0][2] = float_bits(3.5)
+    theirs_rows[0][5] = 99  # non-conflicting field in the same record
+    theirs_rows.append([7, "Polymorph", 0, 0, 0, 4])
+
+    for prefer, speed in (("ours", 2.5), ("theirs", 3.5)):
+        result = merge_dbc(widgets, build_dbc(ours_rows), build_dbc(theirs_rows), WIDGET_SCHEMA, prefer)
+        (conflict,) = result.conflicts
+        assert (conflict.record_id, conflict.kind, conflict.field_name) == (1, "field", "Speed")
+        assert (conflict.ours, conflict.theirs, conflict.resolution) == (2.5, 3.5, prefer)
+        assert result.combined == 1
+        merged = by_id(result.dbc)
+        assert merged[1][2] == float_bits(speed)
+        assert merged[1][5] == 99
+        assert result.dbc.get_string(merged[7][1]) == "Polymorph"
+        assert [r[0] for r in result.dbc.records] == [1, 2, 3, 5, 7]
+    assert "CONFLICT 1.Speed: field base=" in result.format_report()
+
+
+def test_add_add(widgets):
+    ours = build_dbc(widget_rows() + [[8, "Same", 0, 0, 0, 1]])
+    theirs = build_dbc(widget_rows() + [[8, "Same", 0, 0, 0, 2]])
+    result = merge_dbc(widgets, ours, theirs, WIDGET_SCHEMA)
+    (conflict,) = result.conflicts
+    assert (conflict.record_id, conflict.kind, conflict.base) == (8, "add/add", None)
+    assert (conflict.ours, conflict.theirs) == (1, 2)
+    assert by_id(result.dbc)[8][5] == 1
+
+    # Adding the same record on both sides is not a conflict
+    result = merge_dbc(widgets, ours, ours, WIDGET_SCHEMA)
+    assert not result.conflicts
+    assert len(result.dbc.records) == 5
+
+
+@pytest.mark.parametrize("prefer, kept", [("ours", True), ("theirs", False)])
+def test_modify_delete(widgets, prefer, kept):
+    ours_rows = widget_rows()
+    ours_rows[2][5] = 5
+    theirs_rows = [r for r in widget_rows() if r[0] != 3]
+    result = merge_dbc(widgets, build_dbc(ours_rows), build_dbc(theirs_rows), WIDGET_SCHEMA, prefer)
+    (conflict,) = result.conflicts
+    assert (conflict.record_id, conflict.kind) == (3, "modify/delete")
+    assert "ours modified, theirs deleted" in conflict.describe()
+    assert (3 in by_id(result.dbc)) == kept
+
+
+@pytest.mark.parametrize("prefer, kept", [("ours", False), ("theirs", True)])
+def test_delete_modify(widgets, prefer, kept):
+    ours_rows = [r for r in widget_rows() if r[0] != 3]
+    theirs_rows = widget_rows()
+    theirs_rows[2][5] = 5
+    result = merge_dbc(widgets, build_dbc(ours_rows), build_dbc(theirs_rows), WIDGET_SCHEMA, prefer)
+    (conflict,) = result.conflicts
+    assert (conflict.record_id, conflict.kind) == (3, "delete/modify")
+    assert (3 in by_id(result.dbc)) == kept
+
+
+def test_unchanged_delete_is_taken(widgets):
+    theirs_rows = [r for r in widget_rows() if r[0] != 3]
+    result = merge_dbc(widgets, build_dbc(widget_rows()), build_dbc(theirs_rows), WIDGET_SCHEMA)
+    assert not result.conflicts
+    assert 3 not in by_id(result.dbc)
+
+
+def test_new_strings_are_appended_to_the_base_block(widgets):
+    ours_rows = widget_rows()
+    ours_rows[0][1] = "Pyroblast"
+    theirs_rows = widget_rows()
+    theirs_rows[1][1] = "Ice Lance"
+    theirs_rows.append([7, "Pyroblast", 0, 0, 0, 0])
+    result = merge_dbc(widgets, build_dbc(ours_rows), build_dbc(theirs_rows), WIDGET_SCHEMA)
+    assert not result.conflicts
+
+    block = result.dbc.string_block
+    assert block.startswith(widgets.string_block)
+    assert block.count(b"Pyroblast\0") == 1
+    merged = by_id(result.dbc)
+    names = {rid: result.dbc.get_string(r[1]) for rid, r in merged.items()}
+    assert names == {1: "Pyroblast", 2: "Ice Lance", 3: "Blink", 5: "", 7: "Pyroblast"}
+    # Untouched records keep their base offsets
+    assert merged[3][1] == widgets.records[2][1]
+
+
+def test_merge_infers_string_columns_without_a_schema(widgets):
+    ours_rows = widget_rows()
+    ours_rows[0][5] = 8
+    theirs_rows = widget_rows()
+    theirs_rows[1][1] = "Ice Lance"
+    result = merge_dbc(widgets, build_dbc(ours_rows), build_dbc(theirs_rows))
+    assert not result.conflicts
+    assert result.dbc.get_string(by_id(result.dbc)[2][1]) == "Ice Lance"
+
+
+def test_bad_input_is_rejected(widgets):
+    with pytest.raises(ValueError, match="prefer must be one of"):
+        merge_dbc(widgets, widgets, widgets, WIDGET_SCHEMA, prefer="base")
+    narrow = build_dbc([[1, 2]])
+    with pytest.raises(ValueError, match="different record widths"):
+        merge_dbc(widgets, narrow, widgets, WIDGET_SCHEMA)
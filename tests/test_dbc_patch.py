@@ -0,0 +1,24 @@
+from conftest import WIDGET_SCHEMA, build_dbc, dbc_bytes, edited_widgets, float_bits, widget_rows
+
+from hexdbc.core.dbc_patch import apply_patch, make_patch
+
+
+def test_patch_rebuilds_the_new_version(widgets):
+    new = edited_widgets()
+    rebuilt = apply_patch(widgets, make_patch(widgets, new, WIDGET_SCHEMA))
+    assert [r[0] for r in rebuilt.records] == [r[0] for r in new.records]
+    for got, want in zip(rebuilt.records, new.records):
+        assert got[2:] == want[2:]
+        assert rebuilt.get_string(got[1]) == new.get_string(want[1])
+
+
+def test_patch_over_an_extended_block_is_byte_identical(widgets):
+    new = build_dbc(widget_rows())
+    new.string_block = widgets.string_block + b"Frostfire Bolt\0"
+    new.records[1][1] = len(widgets.string_block)
+    new.records[0][2] = float_bits(2.718281)
+    new.header.string_block_size = len(new.string_block)
+    new.invalidate_columns()
+
+    rebuilt = apply_patch(widgets, make_patch(widgets, new, WIDGET_SCHEMA))
+    assert dbc_bytes(rebuilt) == dbc_bytes(new)
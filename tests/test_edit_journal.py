@@ -0,0 +1,70 @@
+from conftest import WIDGET_SCHEMA, float_bits
+
+from hexdbc.core.edit_journal import OP_ADD, OP_REMOVE, OP_SET, EditJournal
+from hexdbc.core.parser import DBCWriter
+from hexdbc.core.wal import WriteAheadLog, read_wal, restore_journal
+
+
+def _edit(journal):
+    """Three groups: a field change, an added record and a removal."""
+    row = journal.current_row(1)
+    row[2] = float_bits(2.5)
+    row[1] = "Pyroblast"
+    journal.capture({1: row}, "Edit 1")
+    journal.capture({9: [9, "New", 0, 0, 0, 3]})
+    journal.capture({3: None})
+
+
+def test_capture_logs_only_changed_fields(widgets):
+    journal = EditJournal(widgets, WIDGET_SCHEMA)
+    _edit(journal)
+
+    ops = [(e.record_id, e.field_idx, e.op) for g in journal.groups() for e in journal.entries(g.index)]
+    assert ops[:2] == [(1, 1, OP_SET), (1, 2, OP_SET)]
+    assert (9, 0, OP_ADD) in ops and (3, 0, OP_REMOVE) in ops
+    assert journal.capture({2: journal.current_row(2)}) is None  # nothing changed
+
+
+def test_build_dbc_applies_changes_and_undo_restores_the_baseline(widgets):
+    journal = EditJournal(widgets, WIDGET_SCHEMA)
+    _edit(journal)
+
+    built = journal.build_dbc()
+    assert [r[0] for r in built.records] == [1, 2, 5, 9]
+    assert built.records[0][2] == float_bits(2.5)
+    assert built.get_string(built.records[0][1]) == "Pyroblast"
+    # Untouched records keep their exact values and string offsets
+    assert built.records[1] == widgets.records[1]
+
+    while (group := journal.last_undoable()) is not None:
+        journal.capture(journal.undo_rows(group), undo_of=group)
+    assert DBCWriter().to_bytes(journal.build_dbc()) == DBCWriter().to_bytes(widgets)
+
+
+def test_wal_restores_the_same_journal(tmp_path, widgets):
+    source = tmp_path / "Widget.dbc"
+    DBCWriter().write(widgets, source)
+    journal = EditJournal(widgets, WIDGET_SCHEMA)
+    wal = WriteAheadLog(tmp_path / "Widget.wal", journal, source)
+    _edit(journal)
+    wal.close(delete=False)
+
+    contents = read_wal(tmp_path / "Widget.wal")
+    assert contents.matches_source()
+    restored = restore_journal(contents, widgets, WIDGET_SCHEMA)
+
+    assert [g.label for g in restored.groups()] == [g.label for g in journal.groups()]
+    assert DBCWriter().to_bytes(restored.build_dbc()) == DBCWriter().to_bytes(journal.build_dbc())
+
+
+def test_wal_stops_at_a_torn_record(tmp_path, widgets):
+    source = tmp_path / "Widget.dbc"
+    DBCWriter().write(widgets, source)
+    journal = EditJournal(widgets, WIDGET_SCHEMA)
+    wal = WriteAheadLog(tmp_path / "Widget.wal", journal, source)
+    _edit(journal)
+    wal.close(delete=False)
+
+    log = tmp_path / "Widget.wal"
+    log.write_bytes(log.read_bytes()[:-3])  # crash mid-write of the last group
+    assert len(read_wal(log).groups) == 2
@@ -0,0 +1,54 @@
+from conftest import build_dbc, float_bits
+
+from hexdbc.core.column_profiler import infer_schema
+from hexdbc.core.hexdbc_format import HexDBCGenerator, HexDBCParser, format_float
+from hexdbc.core.parser import DBCWriter
+from hexdbc.core.schema import FieldDef, FieldType, SchemaDef, SchemaManager
+
+
+def _unknown_table():
+    # id, timestamp-like uint, real float, name, signed int, odd float bits
+    return build_dbc([
+        [1, 1200888598, float_bits(1.5), "Fireball", 0xFFFFFFFF, 0x7FC00001],
+        [2, 1200888602, float_bits(0.1), "Frostbolt", 7, 0x7F800000],
+        [3, 1211111117, float_bits(2.5e-3), "Blink", 0xFFFFFFFE, 0x80000000],
+        [4, 1074725673, float_bits(3.14159), "Arcane Missiles", 12, float_bits(1 / 3)],
+    ])
+
+
+def test_inferred_types_leave_integers_alone():
+    types = [f.type for f in infer_schema(_unknown_table()).fields]
+    assert types[1] == FieldType.UINT
+    assert types[2] == FieldType.FLOAT
+    assert types[3] == FieldType.STRING
+    assert types[4] == FieldType.INT
+
+
+def test_open_and_save_inferred_table_is_byte_identical():
+    dbc = _unknown_table()
+    schemas = SchemaManager()
+    text = HexDBCGenerator(schemas).generate(dbc, "NoSuchTable")
+
+    saved = HexDBCParser(schemas).parse(text, dbc)
+
+    writer = DBCWriter()
+    assert writer.to_bytes(saved) == writer.to_bytes(dbc)
+
+
+def test_float_fields_keep_every_bit():
+    # > 6 significant digits, NaN payload, infinities, negative zero, 1/3
+    values = [1200888598, 1074725673, 0x7FC00001, 0x7F800000, 0xFF800000, 0x80000000, float_bits(1 / 3)]
+    dbc = build_dbc([[i, bits] for i, bits in enumerate(values, 1)])
+    schemas = SchemaManager()
+    schemas.register_schema(SchemaDef("Floats", [FieldDef("ID", FieldType.INT), FieldDef("Value", FieldType.FLOAT)]))
+
+    text = HexDBCGenerator(schemas).generate(dbc, "Floats")
+    saved = HexDBCParser(schemas).parse(text, dbc)
+
+    assert [r[1] for r in saved.records] == values
+
+
+def test_format_float_is_shortest_exact():
+    assert format_float(float_bits(1.5)) == "1.5"
+    assert format_float(float_bits(0.1)) == "0.1"
+    assert float(format_float(1200888598)) != float(format_float(1200888602))
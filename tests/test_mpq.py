@@ -0,0 +1,141 @@
+import os
+
+import pytest
+from conftest import dbc_bytes
+
+from hexdbc.core.mpq import MPQArchive, MPQChain, MPQWriter, archive_order, dbc_path
+from hexdbc.core.parser import DBCParser
+
+# Compresses well but spans several 512-byte sectors
+LARGE = b"".join(b"line %05d of the test file\n" % i for i in range(400))
+
+
+def write_archive(path, files, sector_shift=0):
+    writer = MPQWriter(sector_shift=sector_shift, workers=2)
+    for name, data in files.items():
+        writer.add(name, data)
+    return writer.write(path)
+
+
+def test_read_whole_and_partial_files(tmp_path):
+    path = tmp_path / "test.MPQ"
+    noise = os.urandom(700)  # Does not compress, so its sectors are stored as they are
+    write_archive(path, {"Data\\large.txt": LARGE, "Data\\noise.bin": noise, "empty.txt": b""})
+
+    with MPQArchive(path) as archive:
+        assert archive.read("Data\\large.txt") == LARGE
+        assert archive.read("data\\LARGE.TXT") == LARGE  # names are case-insensitive
+        assert archive.read("Data\\large.txt", 1000) == LARGE[:1000]
+        assert archive.read("Data\\noise.bin") == noise
+        assert archive.read("empty.txt") == b""
+        assert archive.block("Data\\large.txt").compressed_size < len(LARGE)
+        assert sorted(archive.listfile()) == ["Data\\large.txt", "Data\\noise.bin", "empty.txt"]
+        assert archive.find("missing.txt") is None
+        with pytest.raises(FileNotFoundError, match="missing.txt is not in test.MPQ"):
+            archive.read("missing.txt")
+
+
+def test_empty_file_is_not_an_archive(tmp_path):
+    path = tmp_path / "empty.MPQ"
+    path.write_bytes(b"")
+    with pytest.raises(ValueError, match="not an MPQ archive"):
+        MPQArchive(path)
+
+
+def test_archive_order(tmp_path):
+    for name in ("patch-2.MPQ", "common.MPQ", "patch.MPQ", "lichking.MPQ", "patch-A.MPQ", "readme.txt"):
+        (tmp_path / name).write_bytes(b"")
+    (tmp_path / "enUS").mkdir()
+    for name in ("locale-enUS.MPQ", "patch-enUS.MPQ"):
+        (tmp_path / "enUS" / name).write_bytes(b"")
+
+    order = [p.name for p in archive_order(tmp_path)]
+    assert order == ["common.MPQ", "lichking.MPQ", "locale-enUS.MPQ",
+                     "patch.MPQ", "patch-enUS.MPQ", "patch-2.MPQ", "patch-A.MPQ"]
+
+
+def test_chain_prefers_later_patches(tmp_path, widgets):
+    old_item = dbc_bytes(widgets)
+    widgets.records[0][5] = 8
+    new_item = dbc_bytes(widgets)
+    write_archive(tmp_path / "common.MPQ", {dbc_path("Item"): old_item, dbc_path("Spell"): LARGE})
+    write_archive(tmp_path / "patch.MPQ", {dbc_path("Item"): new_item})
+    # A later patch that does not ship the table leaves the override in place
+    write_archive(tmp_path / "patch-2.MPQ", {"other.txt": b"x"})
+
+    with MPQChain.open(tmp_path) as chain:
+        assert chain.read(dbc_path("Item")) == new_item
+        assert chain.read(dbc_path("Spell")) == LARGE
+        assert chain.dbc_names() == ["Item", "Spell"]
+        assert chain.dbc_names(["Item", "Talent"]) == ["Item", "Spell"]
+        assert not chain.exists(dbc_path("Talent"))
+        with pytest.raises(FileNotFoundError):
+            chain.read(dbc_path("Talent"))
+        dbc = DBCParser().parse_bytes(chain.read(dbc_path("Item")))
+        assert dbc.records[0][5] == 8
+
+
+def test_empty_data_folder(tmp_path):
+    with pytest.raises(ValueError, match="No MPQ archives"):
+        MPQChain.open(tmp_path)
+
+
+def stored_bytes(path, name):
+    with MPQArchive(path) as archive:
+        block = archive.block(name)
+        start = archive.archive_offset + block.offset
+        return archive._data[start:start + block.compressed_size]
+
+
+def test_update_reuses_unchanged_blocks(tmp_path, widgets):
+    path = tmp_path / "patch-4.MPQ"
+    summary = write_archive(path, {dbc_path("Spell"): LARGE, dbc_path("Item"): dbc_bytes(widgets)})
+    assert sorted(summary.written) == [dbc_path("Item"), dbc_path("Spell")]
+    assert summary.reused == []
+    assert summary.size == path.stat().st_size
+    spell_block = stored_bytes(path, dbc_path("Spell"))
+
+    widgets.records[0][5] = 8
+    with MPQWriter.update(path, sector_shift=0) as writer:
+        assert sorted(writer.names()) == [dbc_path("Item"), dbc_path("Spell")]
+        writer.add(dbc_path("Spell"), LARGE)  # same contents: the stored block is kept
+        writer.add_dbc("Item", widgets)
+        writer.add("Interface\\new.txt", b"new file")
+        summary = writer.write(path)
+
+    assert summary.reused == [dbc_path("Spell")]
+    assert summary.written == [dbc_path("Item"), "Interface\\new.txt"]
+    assert stored_bytes(path, dbc_path("Spell")) == spell_block
+    with MPQArchive(path) as archive:
+        assert archive.read(dbc_path("Spell")) == LARGE
+        assert archive.read(dbc_path("Item")) == dbc_bytes(widgets)
+        assert archive.read("Interface\\new.txt") == b"new file"
+
+
+def test_update_reuses_blocks_across_repeated_updates(tmp_path):
+    path = tmp_path / "patch.MPQ"
+    write_archive(path, {"a.txt": LARGE, "b.txt": b"one"})
+    for contents in (b"two", b"three"):
+        with MPQWriter.update(path, sector_shift=0) as writer:
+            writer.add("b.txt", contents)
+            summary = writer.write(path)
+        assert summary.reused == ["a.txt"]
+        with MPQArchive(path) as archive:
+            assert archive.read("a.txt") == LARGE
+            assert archive.read("b.txt") == contents
+
+
+def test_remove_and_fresh_archive(tmp_path):
+    path = tmp_path / "patch.MPQ"
+    write_archive(path, {"a.txt": b"a", "b.txt": b"b"})
+    with MPQWriter.update(path) as writer:
+        writer.remove("A.TXT")
+        writer.write(path)
+    with MPQArchive(path) as archive:
+        assert archive.find("a.txt") is None
+        assert archive.listfile() == ["b.txt"]
+    assert not (tmp_path / "patch.MPQ.tmp").exists()
+
+    # Updating an archive that does not exist yet starts from an empty one
+    with MPQWriter.update(tmp_path / "new.MPQ") as writer:
+        assert writer.names() == []
@@ -0,0 +1,36 @@
+from conftest import edited_widgets, float_bits
+
+from hexdbc.core.hexdbc_format import HexDBCGenerator, HexDBCParser
+from hexdbc.core.overlay import OverlayStack, write_changes
+
+
+def test_exported_overlay_rebuilds_every_change_but_removals(tmp_path, schemas, widgets):
+    new = edited_widgets()
+    overlay = tmp_path / "changes.hexdbc"
+    diff = write_changes(widgets, new, overlay, "Widget", changed_fields_only=True,
+                         generator=HexDBCGenerator(schemas))
+    assert diff.removed == [3]
+    assert "NOT applied" in overlay.read_text(encoding="utf-8")
+
+    built = OverlayStack(widgets, [overlay], HexDBCParser(schemas)).build().dbc
+
+    # Record 3 was removed, which an overlay cannot express; everything else matches
+    kept = [r for r in built.records if r[0] != 3]
+    assert [r[0] for r in kept] == [r[0] for r in new.records]
+    for got, want in zip(kept, new.records):
+        assert got[2:] == want[2:]
+        assert built.get_string(got[1]) == new.get_string(want[1])
+
+
+def test_overlays_stack_in_order(tmp_path, schemas, widgets):
+    first, second = tmp_path / "a.hexdbc", tmp_path / "b.hexdbc"
+    first.write_text('@schema "Widget"\nwidget(1) {\n    Speed = 1.5\n    Count = 4\n}\n', encoding="utf-8")
+    second.write_text('@schema "Widget"\nwidget(1) {\n    Speed = 2.5\n}\n'
+                      'widget(7) {\n    Name = "New"\n}\n', encoding="utf-8")
+
+    result = OverlayStack(widgets, [first, second], HexDBCParser(schemas)).build()
+
+    assert result.changed == 1 and result.added == 1
+    assert result.dbc.records[0][2:] == [float_bits(2.5), 0x10, 0xFFFFFFFB, 4]
+    assert result.dbc.get_string(result.dbc.records[-1][1]) == "New"
+    assert result.dbc.records[1:4] == widgets.records[1:4]
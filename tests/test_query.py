@@ -0,0 +1,85 @@
+import pytest
+from conftest import build_dbc, float_bits
+
+from hexdbc.core.dbc_cache import DBCCache
+from hexdbc.core.parser import DBCParser
+from hexdbc.core.query import QueryEngine, QuerySyntaxError
+from hexdbc.core.schema import FieldDef, FieldType, SchemaDef, SchemaManager
+
+SCHEMA = SchemaDef("Widget", [
+    FieldDef("ID", FieldType.INT),
+    FieldDef("Name", FieldType.STRING),
+    FieldDef("Speed", FieldType.FLOAT),
+    FieldDef("Delta", FieldType.INT),
+    FieldDef("Flags", FieldType.FLAGS),
+    FieldDef("School", FieldType.ENUM, enum_name="School"),
+], enums={"School": {0: "SCHOOL_NORMAL", 2: "SCHOOL_FIRE"}})
+
+
+@pytest.fixture
+def engine():
+    dbc = build_dbc([
+        [1, "Fireball", float_bits(1.5), 0xFFFFFFFF, 0x01, 2],
+        [2, "Frostbolt", float_bits(2.5), 3, 0x03, 0],
+        [3, "Fire Blast", float_bits(0.25), 0xFFFFFFF6, 0x00, 2],
+        [4, "Blink", float_bits(2.5), 0, 0x02, 0],
+    ])
+    return QueryEngine(dbc, SCHEMA)
+
+
+@pytest.mark.parametrize("query, ids", [
+    ("Speed > 2", [2, 4]),
+    ("Speed = 2.5", [2, 4]),
+    ("speed <= 1.5", [1, 3]),
+    ("Delta < 0", [1, 3]),
+    ("Delta >= -1", [1, 2, 4]),
+    ("Flags & 0x02", [2, 4]),
+    ("School = SCHOOL_FIRE", [1, 3]),
+    ('Name ~ "fire"', [1, 3]),
+    ('Name = "Blink"', [4]),
+    ('Name !~ "bol"', [1, 3, 4]),
+    ("ID != 2", [1, 3, 4]),
+    ("field_3 < 0", [1, 3]),
+    ("Speed > 1 and not (Delta = 0 or Delta = 3)", [1]),
+    ("Delta < 0 or Speed = 2.5", [1, 2, 3, 4]),
+])
+def test_typed_comparisons(engine, query, ids):
+    assert engine.execute(query).ids == ids
+
+
+@pytest.mark.parametrize("query, message", [
+    ("Nope = 1", "Unknown field Nope"),
+    ("Speed", "Unexpected end of query"),
+    ("Speed = ", "Unexpected end of query"),
+    ("(Speed = 1", "Missing ')'"),
+    ("Speed = 1 Delta", "Unexpected 'Delta'"),
+    ("Name > \"a\"", "Operator > not supported on string field Name"),
+    ("Name = 3", "String field Name needs a quoted value"),
+    ("Speed ~ \"a\"", "Operator ~ not supported on numeric field Speed"),
+    ("Speed & 1", "Operator & needs an integer field and mask"),
+    ("School = SCHOOL_FROST", "Unknown enum value SCHOOL_FROST for School"),
+    ("Speed = $", "Unexpected character"),
+    ("", "Empty query"),
+])
+def test_errors(engine, query, message):
+    with pytest.raises(QuerySyntaxError, match=message.replace("(", r"\(").replace(")", r"\)")):
+        engine.execute(query)
+
+
+def test_indexed_queries_match_a_scan_without_a_schema():
+    # No built-in schema: column 1 is inferred FLOAT, column 2 INT
+    rows = [[i, float_bits(i * 0.5), [0xFFFFFFFF, 4, 0xFFFFFFFE][i % 3], i * 10] for i in range(1, 7)]
+    dbc = build_dbc(rows)
+    schemas = SchemaManager()
+    schema = schemas.generate_fallback_schema(4, "NoSuchTable", dbc)
+    assert [f.type for f in schema.fields[1:3]] == [FieldType.FLOAT, FieldType.INT]
+
+    cache = DBCCache(DBCParser(), schemas)
+    cache.add_open_dbc("NoSuchTable", dbc)
+    scanned = QueryEngine(dbc, schema)
+    indexed = QueryEngine(dbc, schema, cache.index_provider("NoSuchTable"))
+
+    for query in ("field_1 > 2.0", "field_1 <= 1", "field_1 = 1.5", "field_2 < 0", "field_2 >= -1",
+                  "field_2 = -2", "field_3 > 25", "id = 4"):
+        assert indexed.execute(query).rows == scanned.execute(query).rows, query
+    assert cache.index_memory() > 0
@@ -0,0 +1,19 @@
+from conftest import build_dbc
+
+from hexdbc.core.record_outline import RecordOutline
+from hexdbc.core.schema import FieldDef, FieldType, SchemaDef
+
+SCHEMA = SchemaDef("Spell", [FieldDef("ID", FieldType.INT), FieldDef("Name", FieldType.STRING)])
+
+
+def test_filter_finds_names_that_share_a_suffix():
+    dbc = build_dbc([[1, "Fireball"], [2, "Frostbolt"]])
+    # Record 3 points at the "ball" tail of "Fireball"
+    dbc.records.append([3, dbc.records[0][1] + 4])
+    dbc.invalidate_columns()
+    outline = RecordOutline(dbc, SCHEMA)
+
+    outline.set_filter("ball")
+
+    assert [outline.record_id(row) for row in range(len(outline))] == [1, 3]
+    assert outline.name(1) == "ball"
@@ -0,0 +1,12 @@
+import pytest
+from conftest import dbc_bytes
+
+from hexdbc.core.sqlite_bridge import SQLiteBridge
+
+
+@pytest.mark.parametrize("fixture", ["widgets", "tricky_widgets"])
+def test_sqlite_round_trip_is_byte_identical(tmp_path, schemas, fixture, request):
+    dbc = request.getfixturevalue(fixture)
+    with SQLiteBridge(tmp_path / "client.sqlite", schemas) as bridge:
+        bridge.export_dbcs([("Widget", dbc)])
+        assert dbc_bytes(bridge.import_dbc("Widget")) == dbc_bytes(dbc)
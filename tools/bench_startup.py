@@ -0,0 +1,128 @@
+"""
+Startup benchmark for HexDBC.
+
+Launches the app in fresh interpreters and reports:
+  - cold start to first paint of the main window (wall clock, per run)
+  - the slowest imports on the way there, from `python -X importtime`
+
+Usage:
+    python tools/bench_startup.py [--runs N] [--top N] [--budget SECONDS]
+
+Set QT_QPA_PLATFORM=offscreen to run without a display (CI).
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+SRC = ROOT / 'src'
+
+# Mirrors start.py, then exits as soon as the window has painted once.
+CHILD = r'''
+import sys
+sys.path.insert(0, {src!r})
+
+from PySide6.QtCore import QEvent, QObject
+from PySide6.QtWidgets import QApplication
+
+app = QApplication(sys.argv)
+
+from hexdbc.ui.main_window import HexDBCWindow
+
+
+class FirstPaint(QObject):
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            print("FIRST_PAINT", flush=True)
+            app.quit()
+        return False
+
+
+window = HexDBCWindow()
+watcher = FirstPaint()
+window.installEventFilter(watcher)
+window.show()
+app.exec()
+'''
+
+
+def run_once(importtime: bool = False):
+    """Run one cold start; return (seconds to first paint, importtime stderr)."""
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ['-X', 'importtime']
+    cmd += ['-c', CHILD.format(src=str(SRC))]
+
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, env=env
+    )
+    elapsed = None
+    for line in proc.stdout:
+        if line.startswith('FIRST_PAINT'):
+            elapsed = time.perf_counter() - start
+    _, stderr = proc.communicate()
+
+    if elapsed is None:
+        raise RuntimeError(f"Window never painted:\n{stderr[-2000:]}")
+    return elapsed, stderr
+
+
+def parse_importtime(stderr: str) -> list:
+    """Return (cumulative_us, self_us, module) tuples from -X importtime output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3:
+            continue
+        self_us, cumulative_us, module = parts
+        rows.append((int(cumulative_us), int(self_us), module.rstrip()))
+    return rows
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Measure HexDBC cold start to first paint.")
+    ap.add_argument('--runs', type=int, default=5, help="timed launches (default 5)")
+    ap.add_argument('--top', type=int, default=15, help="slowest imports to list (default 15)")
+    ap.add_argument('--budget', type=float, default=1.0, help="first-paint budget in seconds")
+    args = ap.parse_args()
+
+    # Warm-up run so bytecode caches exist; results are for a cold interpreter,
+    # not a cold disk cache.
+    run_once()
+
+    timings = [run_once()[0] for _ in range(args.runs)]
+    _, stderr = run_once(importtime=True)
+    rows = parse_importtime(stderr)
+
+    median = statistics.median(timings)
+    print(f"First paint over {args.runs} runs: "
+          f"median {median * 1000:.0f} ms, "
+          f"min {min(timings) * 1000:.0f} ms, max {max(timings) * 1000:.0f} ms")
+
+    hexdbc_us = sum(r[1] for r in rows if r[2].strip().startswith('hexdbc'))
+    total_us = sum(r[1] for r in rows)
+    print(f"Import time: {total_us / 1000:.0f} ms total, {hexdbc_us / 1000:.0f} ms in hexdbc modules")
+
+    print("\nSlowest imports (self time):")
+    for cumulative_us, self_us, module in sorted(rows, key=lambda r: r[1], reverse=True)[:args.top]:
+        print(f"  {self_us / 1000:8.1f} ms  (cumulative {cumulative_us / 1000:8.1f} ms)  {module.strip()}")
+
+    if median > args.budget:
+        print(f"\nOVER BUDGET: {median:.2f}s > {args.budget:.2f}s")
+        sys.exit(1)
+    print(f"\nWithin budget ({args.budget:.2f}s)")
+
+
+if __name__ == '__main__':
+    main()
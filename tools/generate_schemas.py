@@ -1,6 +1,12 @@
+import sys
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from hexdbc.core.schema import FieldDef, FieldType, SchemaDef, pack_schema_table
+from hexdbc.resources import SCHEMA_TABLE_PATH
+
 # Localized string takes 17 fields (16 locales + flags)
 LOC_FIELDS = 17
 
@@ -90,98 +96,12 @@ def parse_xml_definitions(xml_path: Path) -> dict:
     return schemas
 
 
-def generate_schema_code(schemas: dict) -> str:
-    lines = []
-    lines.append('"""')
-    lines.append('DBC Schema definitions for WoW 3.3.5a (build 12340).')
-    lines.append('Auto-generated from WDBX definitions.')
-    lines.append('"""')
-    lines.append('')
-    lines.append('from dataclasses import dataclass, field')
-    lines.append('from enum import Enum, auto')
-    lines.append('from typing import Dict, List, Optional')
-    lines.append('')
-    lines.append('')
-    lines.append('class FieldType(Enum):')
-    lines.append('    """Field data types."""')
-    lines.append('    UINT = auto()')
-    lines.append('    INT = auto()')
-    lines.append('    FLOAT = auto()')
-    lines.append('    STRING = auto()')
-    lines.append('    LOCSTRING = auto()')
-    lines.append('    FLAGS = auto()')
-    lines.append('    ENUM = auto()')
-    lines.append('')
-    lines.append('')
-    lines.append('@dataclass')
-    lines.append('class FieldDef:')
-    lines.append('    """Field definition."""')
-    lines.append('    name: str')
-    lines.append('    type: FieldType = FieldType.UINT')
-    lines.append('    description: str = ""')
-    lines.append('    enum_name: Optional[str] = None')
-    lines.append('')
-    lines.append('')
-    lines.append('@dataclass')
-    lines.append('class SchemaDef:')
-    lines.append('    """Schema definition for a DBC file."""')
-    lines.append('    name: str')
-    lines.append('    fields: List[FieldDef] = field(default_factory=list)')
-    lines.append('    enums: Dict[str, Dict[int, str]] = field(default_factory=dict)')
-    lines.append('')
-    lines.append('    def get_field(self, index: int) -> Optional[FieldDef]:')
-    lines.append('        """Get field definition by index."""')
-    lines.append('        if 0 <= index < len(self.fields):')
-    lines.append('            return self.fields[index]')
-    lines.append('        return None')
-    lines.append('')
-    lines.append('')
-    lines.append('# Built-in schemas for WoW 3.3.5a DBCs')
-    lines.append('BUILTIN_SCHEMAS: Dict[str, SchemaDef] = {}')
-    lines.append('')
-    
-    # Generate schema for each table
+def build_schema_defs(schemas: dict) -> dict:
+    defs = {}
     for name, schema in sorted(schemas.items()):
-        lines.append('')
-        lines.append(f'# {name} - {schema["field_count"]} fields')
-        lines.append(f'BUILTIN_SCHEMAS["{name}"] = SchemaDef(')
-        lines.append(f'    name="{name}",')
-        lines.append('    fields=[')
-        
-        for f in schema['fields']:
-            ftype = f['type']
-            fname = f['name'].replace('"', '\\"')
-            lines.append(f'        FieldDef("{fname}", FieldType.{ftype}),')
-        
-        lines.append('    ]')
-        lines.append(')')
-    
-    lines.append('')
-    lines.append('')
-    lines.append('class SchemaManager:')
-    lines.append('    """Manages DBC schemas."""')
-    lines.append('')
-    lines.append('    def __init__(self):')
-    lines.append('        self.schemas = dict(BUILTIN_SCHEMAS)')
-    lines.append('')
-    lines.append('    def get_schema(self, dbc_name: str) -> Optional[SchemaDef]:')
-    lines.append('        """Get schema for a DBC file."""')
-    lines.append('        # Try exact match first')
-    lines.append('        if dbc_name in self.schemas:')
-    lines.append('            return self.schemas[dbc_name]')
-    lines.append('        # Try case-insensitive')
-    lines.append('        for name, schema in self.schemas.items():')
-    lines.append('            if name.lower() == dbc_name.lower():')
-    lines.append('                return schema')
-    lines.append('        return None')
-    lines.append('')
-    lines.append('    def generate_fallback_schema(self, field_count: int, name: str = "Unknown") -> SchemaDef:')
-    lines.append('        """Generate a fallback schema with generic field names."""')
-    lines.append('        fields = [FieldDef(f"field_{i}", FieldType.UINT) for i in range(field_count)]')
-    lines.append('        return SchemaDef(name=name, fields=fields)')
-    lines.append('')
-    
-    return '\n'.join(lines)
+        fields = [FieldDef(f['name'], FieldType[f['type']]) for f in schema['fields']]
+        defs[name] = SchemaDef(name=name, fields=fields)
+    return defs
 
 
 if __name__ == '__main__':
@@ -202,9 +122,8 @@ if __name__ == '__main__':
         if name in schemas:
             print(f"  {name}: {schemas[name]['field_count']} fields")
     
-    code = generate_schema_code(schemas)
+    data = pack_schema_table(build_schema_defs(schemas))
     
-    # Output to src/hexdbc/core/schema.py (relative to tools/)
-    output_path = script_dir.parent / 'src' / 'hexdbc' / 'core' / 'schema.py'
-    output_path.write_text(code, encoding='utf-8')
-    print(f"Generated {output_path}")
+    # Output to src/hexdbc/resources/builtin_schemas.bin, loaded lazily by SchemaManager
+    SCHEMA_TABLE_PATH.write_bytes(data)
+    print(f"Generated {SCHEMA_TABLE_PATH} ({len(data)} bytes)")